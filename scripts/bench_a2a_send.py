@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark round-trip latency of sequential local A2A sends.
+
+Serves a minimal ``/tasks/send-priority`` endpoint with uvicorn on a Unix
+socket and a TCP port, then times N sequential sends through:
+
+* ``unpooled`` — a fresh ``httpx.Client`` per UDS request and one-shot
+                 ``requests.post`` for TCP (pre-pool behaviour)
+* ``pooled``   — ``A2AClient.send_to_local``, which reuses keep-alive
+                 connections from ``synapse.http_pool``
+
+Usage:
+    python scripts/bench_a2a_send.py [--count N] [--transport uds|tcp]
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import requests
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.a2a_client import A2AClient  # noqa: E402
+
+TASK = {"task": {"id": "bench-task", "status": "working"}}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/tasks/send-priority")
+    async def send_priority(payload: dict, priority: int = 1) -> dict:
+        return TASK
+
+    return app
+
+
+def _serve(**kwargs: object) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(_app(), log_level="error", **kwargs))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _unpooled_send(endpoint: str, uds_path: str | None) -> None:
+    payload = {"message": {"role": "user", "parts": [{"type": "text", "text": "hi"}]}}
+    if uds_path:
+        transport = httpx.HTTPTransport(uds=uds_path)
+        with httpx.Client(transport=transport, timeout=10.0) as client:
+            client.post(
+                "http://localhost/tasks/send-priority?priority=1", json=payload
+            ).raise_for_status()
+    else:
+        requests.post(
+            f"{endpoint}/tasks/send-priority?priority=1", json=payload, timeout=10
+        ).raise_for_status()
+
+
+def _pooled_send(endpoint: str, uds_path: str | None) -> None:
+    task = A2AClient().send_to_local(
+        endpoint=endpoint,
+        message="hi",
+        uds_path=uds_path,
+        response_mode="silent",
+    )
+    if task is None:
+        raise RuntimeError("send failed")
+
+
+def _measure(
+    send: Callable[[str, str | None], None],
+    endpoint: str,
+    uds_path: str | None,
+    count: int,
+) -> list[float]:
+    send(endpoint, uds_path)  # warm-up
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        send(endpoint, uds_path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--transport", choices=("uds", "tcp"), default="uds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        uds_path: str | None = None
+        if args.transport == "uds":
+            uds_path = str(Path(tmp) / "agent.sock")
+            server = _serve(uds=uds_path)
+            endpoint = "http://localhost:9"
+        else:
+            port = _free_port()
+            server = _serve(host="127.0.0.1", port=port)
+            endpoint = f"http://127.0.0.1:{port}"
+
+        print(f"{args.count} sequential sends over {args.transport}")
+        for label, send in (("unpooled", _unpooled_send), ("pooled", _pooled_send)):
+            samples = sorted(_measure(send, endpoint, uds_path, args.count))
+            p99 = samples[int(len(samples) * 0.99) - 1]
+            print(
+                f"{label:>9}: mean {statistics.mean(samples):6.2f} ms  "
+                f"p50 {statistics.median(samples):6.2f} ms  p99 {p99:6.2f} ms"
+            )
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Benchmark fan-in to a busy agent: 409 + retry, the inbox, coalescing.
+
+S senders each send M messages at once to one agent that works on each
+message for ``--work-ms``. The agent is a stand-in controller behind the
+real A2A router; "done" is reported through the same status callback the
+PTY controller uses, so queued messages are dispatched as in production.
+
+* ``409-retry`` — inbox disabled (``max_depth=0``): a busy agent answers
+                  409 and the sender retries every ``--retry-ms``, like the
+                  workflow runner does with Retry-After (scaled down)
+* ``inbox``     — busy agents queue the message; one request per message
+* ``coalesced`` — inbox plus a ``--window-ms`` coalescing window: queued
+                  silent messages are injected together, one turn per batch
+
+Reports total time until every message was delivered to the agent, the
+mean and max wait from first send to delivery, the HTTP requests made and
+the agent turns (PTY injections) spent.
+
+Usage:
+    python scripts/bench_agent_inbox.py [--senders N] [--messages N]
+        [--work-ms MS] [--retry-ms MS] [--window-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.a2a_compat import create_a2a_router  # noqa: E402
+from synapse.inbox import AgentInbox  # noqa: E402
+
+AGENT_ID = "synapse-claude-8100"
+_MESSAGE_ID = re.compile(r"bench-(\d+)-(\d+)")
+
+
+class FakeAgent:
+    """Just enough of TerminalController for the router: one task at a time."""
+
+    def __init__(self, work_seconds: float) -> None:
+        self.work_seconds = work_seconds
+        self.status = "READY"
+        self.agent_ready = True
+        self.delivered: dict[str, float] = {}
+        self.turns = 0
+        self._callbacks: list[Callable[[str, str], None]] = []
+
+    def on_status_change(self, callback: Callable[[str, str], None]) -> None:
+        self._callbacks.append(callback)
+
+    def get_context(self) -> str:
+        return ""
+
+    def write(self, data: str, submit_seq: str | None = None) -> bool:
+        now = time.perf_counter()
+        for match in _MESSAGE_ID.finditer(data):
+            self.delivered[match.group(0)] = now
+        self.turns += 1
+        self.status = "PROCESSING"
+        threading.Timer(self.work_seconds, self._finish).start()
+        return True
+
+    def _finish(self) -> None:
+        self.status = "READY"
+        for callback in self._callbacks:
+            callback("PROCESSING", "READY")
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        return lambda *args, **kwargs: None
+
+
+def _run(
+    label: str,
+    senders: int,
+    messages: int,
+    work_ms: float,
+    retry_ms: float,
+    window_ms: float,
+) -> None:
+    agent = FakeAgent(work_ms / 1000)
+    app = FastAPI()
+    app.include_router(
+        create_a2a_router(
+            agent,  # type: ignore[arg-type]
+            "claude",
+            8100,
+            "\n",
+            AGENT_ID,
+            inbox=AgentInbox(AGENT_ID, max_depth=0 if label == "409-retry" else 200),
+            coalesce_window_ms=int(window_ms) if label == "coalesced" else 0,
+        )
+    )
+    requests = 0
+    sent_at: dict[str, float] = {}
+    lock = threading.Lock()
+
+    def sender(n: int) -> None:
+        nonlocal requests
+        with TestClient(app) as client:
+            for i in range(messages):
+                key = f"bench-{n}-{i}"
+                sent_at[key] = time.perf_counter()
+                payload = {
+                    "message": {
+                        "role": "user",
+                        "parts": [{"type": "text", "text": key}],
+                    },
+                    "metadata": {"response_mode": "silent"},
+                }
+                while True:
+                    response = client.post(
+                        "/tasks/send-priority?priority=3", json=payload
+                    )
+                    with lock:
+                        requests += 1
+                    if response.status_code != 409:
+                        response.raise_for_status()
+                        break
+                    time.sleep(retry_ms / 1000)
+
+    threads = [threading.Thread(target=sender, args=(n,)) for n in range(senders)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = senders * messages
+    while len(agent.delivered) < total:
+        time.sleep(0.01)
+    elapsed = max(agent.delivered.values()) - start
+
+    waits = [(agent.delivered[key] - sent_at[key]) * 1000 for key in sent_at]
+    print(
+        f"{label:>9}: all delivered in {elapsed:6.2f} s  "
+        f"wait mean {statistics.mean(waits):7.0f} ms  max {max(waits):7.0f} ms  "
+        f"{requests:4d} requests  {agent.turns:3d} turns"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--senders", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--work-ms", type=float, default=50.0)
+    parser.add_argument("--retry-ms", type=float, default=200.0)
+    parser.add_argument("--window-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        os.environ["SYNAPSE_HISTORY_ENABLED"] = "false"
+        os.environ["SYNAPSE_CANVAS_DB_PATH"] = str(Path(tmp) / "canvas.db")
+        print(
+            f"{args.senders} senders x {args.messages} messages, "
+            f"{args.work_ms:.0f} ms per message, retry every {args.retry_ms:.0f} ms"
+        )
+        for label in ("409-retry", "inbox", "coalesced"):
+            _run(
+                label,
+                args.senders,
+                args.messages,
+                args.work_ms,
+                args.retry_ms,
+                args.window_ms,
+            )
+
+
+if __name__ == "__main__":
+    main()
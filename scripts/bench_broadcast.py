@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark ``synapse broadcast`` latency against N recipients.
+
+Starts N+1 minimal agent servers with uvicorn on TCP (one sender, N
+recipients registered in a temporary registry). Each recipient answers
+``/tasks/send-priority`` after a fixed delay. Then it times a notify-mode
+broadcast through:
+
+* ``serial``   — probe and send to each recipient in turn, creating one
+                 sender-side task per send (pre-change behaviour)
+* ``parallel`` — ``cmd_broadcast``: concurrent probes and sends, with one
+                 parent task plus per-recipient children created up front
+
+Usage:
+    python scripts/bench_broadcast.py [--recipients N] [--delay SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _app(delay: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/tasks/send-priority")
+    async def send_priority(payload: dict, priority: int = 1) -> dict:
+        await asyncio.sleep(delay)
+        return {"task": {"id": str(uuid.uuid4()), "status": "working"}}
+
+    @app.post("/tasks/create")
+    async def create(payload: dict) -> dict:
+        children = [
+            {"id": str(uuid.uuid4()), "status": "working"}
+            for _ in payload.get("children") or []
+        ]
+        return {
+            "task": {"id": str(uuid.uuid4()), "status": "working"},
+            "children": children,
+        }
+
+    return app
+
+
+def _serve(port: int, delay: float) -> uvicorn.Server:
+    config = uvicorn.Config(_app(delay), host="127.0.0.1", port=port, log_level="error")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _serial_broadcast(sender_id: str) -> None:
+    from synapse.a2a_client import A2AClient
+    from synapse.registry import AgentRegistry, is_port_open, is_process_running
+    from synapse.tools.a2a_helpers import build_sender_info
+
+    reg = AgentRegistry()
+    sender_info = build_sender_info(sender_id)
+    assert isinstance(sender_info, dict)
+    client = A2AClient()
+    for agent_id, agent in reg.list_agents().items():
+        if agent_id == sender_id:
+            continue
+        if not is_process_running(agent["pid"]):
+            continue
+        if not is_port_open("localhost", agent["port"], timeout=1.0):
+            continue
+        client.send_to_local(
+            endpoint=agent["endpoint"],
+            message="bench",
+            sender_info=sender_info,
+            response_mode="notify",
+            registry=reg,
+            sender_agent_id=sender_id,
+            target_agent_id=agent_id,
+        )
+
+
+def _parallel_broadcast(sender_id: str) -> None:
+    from synapse.tools.a2a import cmd_broadcast
+
+    args = argparse.Namespace(
+        message="bench", priority=1, sender=sender_id, response_mode="notify"
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        cmd_broadcast(args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        os.environ["SYNAPSE_REGISTRY_DIR"] = tmp
+        os.environ["SYNAPSE_HISTORY_ENABLED"] = "false"
+        from synapse.registry import AgentRegistry
+
+        reg = AgentRegistry()
+        ports = [_free_port() for _ in range(args.recipients + 1)]
+        servers = [_serve(port, args.delay) for port in ports]
+        agent_ids = [reg.get_agent_id("claude", port) for port in ports]
+        for agent_id, port in zip(agent_ids, ports, strict=True):
+            reg.register(agent_id, "claude", port)
+        sender_id = agent_ids[0]
+
+        print(
+            f"notify broadcast to {args.recipients} recipients, "
+            f"{args.delay * 1000:.0f} ms per send"
+        )
+        for label, run in (
+            ("serial", _serial_broadcast),
+            ("parallel", _parallel_broadcast),
+        ):
+            run(sender_id)  # warm-up
+            samples = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                run(sender_id)
+                samples.append((time.perf_counter() - start) * 1000)
+            print(f"{label:>9}: mean {statistics.mean(samples):8.1f} ms")
+        for server in servers:
+            server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
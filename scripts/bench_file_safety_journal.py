@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark recording file modifications during a bulk refactor.
+
+Records N modifications spread over T threads (agents editing in
+parallel) through one FileSafetyManager and reports records per second:
+
+* ``direct``  — one INSERT and commit per ``record_modification`` under the
+                manager lock (the default)
+* ``journal`` — ``FileSafetyManager(journal=True)``: records are queued and
+                the background writer inserts each batch with ``executemany``
+                in one transaction; the final ``flush()`` is timed too
+
+Usage:
+    python scripts/bench_file_safety_journal.py [--records N] [--threads N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.file_safety import ChangeType, FileSafetyManager  # noqa: E402
+
+
+def _record(manager: FileSafetyManager, records: int, threads: int) -> float:
+    per_thread = records // threads
+
+    def work(worker: int) -> None:
+        for i in range(per_thread):
+            manager.record_modification(
+                f"/work/src/pkg_{worker}/module_{i}.py",
+                f"synapse-claude-{8100 + worker}",
+                "task-refactor",
+                ChangeType.MODIFY,
+                intent="Rename Foo to Bar",
+            )
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    manager.flush()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        print(f"{args.records} modifications from {args.threads} threads")
+        for label, journal in (("direct", False), ("journal", True)):
+            manager = FileSafetyManager(
+                db_path=str(Path(tmp) / f"{label}.db"), journal=journal
+            )
+            rate = _record(manager, args.records, args.threads)
+            assert manager.get_statistics()["total_modifications"] == args.records
+            print(f"{label:>8}: {rate:10.0f} records/s")
+            manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark FileSafetyManager lock and journal calls.
+
+Times, per call:
+
+* the edit loop an agent runs for each file (``acquire_lock``,
+  ``validate_write``, ``record_modification``, ``release_lock``) with
+  ``per-call`` connections (a new connection and PRAGMA per call, the
+  pre-change behaviour) versus ``cached`` per-thread connections
+* locking N files one ``acquire_lock`` at a time versus one
+  ``acquire_locks`` transaction
+* looking up the locks of N agents for ``synapse list`` with two
+  ``list_locks`` calls per agent versus one ``locks_by_holder`` query
+
+Usage:
+    python scripts/bench_file_safety_locks.py [--files N] [--agents N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.file_safety import ChangeType, FileSafetyManager  # noqa: E402
+
+
+class PerCallManager(FileSafetyManager):
+    """Closes its connection after every call, like the old implementation."""
+
+    def _release_connection(self, conn: sqlite3.Connection) -> None:  # type: ignore[override]
+        with self._db._connections_lock:
+            self._db._connections.pop(threading.get_ident(), None)
+        with contextlib.suppress(sqlite3.Error):
+            conn.close()
+
+
+def _edit_loop(manager: FileSafetyManager, files: int) -> float:
+    start = time.perf_counter()
+    for i in range(files):
+        path = f"/work/src/module_{i}.py"
+        manager.acquire_lock(path, "synapse-claude-8100")
+        manager.validate_write(path, "synapse-claude-8100")
+        manager.record_modification(
+            path, "synapse-claude-8100", "task-1", ChangeType.MODIFY, intent="Rename"
+        )
+        manager.release_lock(path, "synapse-claude-8100")
+    return (time.perf_counter() - start) / files * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--agents", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        print(f"edit loop, {args.files} files (us per file)")
+        for label, cls in (("per-call", PerCallManager), ("cached", FileSafetyManager)):
+            manager = cls(db_path=str(Path(tmp) / f"{label}.db"))
+            print(f"{label:>9}: {_edit_loop(manager, args.files):8.0f}")
+
+        manager = FileSafetyManager(db_path=str(Path(tmp) / "batch.db"))
+        paths = [f"/work/src/batch_{i}.py" for i in range(args.files)]
+        start = time.perf_counter()
+        for path in paths:
+            manager.acquire_lock(path, "synapse-claude-8100")
+        one_by_one = (time.perf_counter() - start) * 1000
+        manager.release_locks(paths, "synapse-claude-8100")
+        start = time.perf_counter()
+        manager.acquire_locks(paths, "synapse-claude-8100")
+        batched = (time.perf_counter() - start) * 1000
+        print(
+            f"lock {args.files} files (ms): acquire_lock x{args.files} "
+            f"{one_by_one:.1f}, acquire_locks {batched:.1f}"
+        )
+        manager.release_locks(paths, "synapse-claude-8100")
+
+        agents = [f"synapse-claude-{8100 + i}" for i in range(args.agents)]
+        for agent_id in agents:
+            manager.acquire_lock(f"/work/{agent_id}.py", agent_id, pid=os.getpid())
+        start = time.perf_counter()
+        for agent_id in agents:
+            manager.list_locks(pid=1, include_stale=False)
+            manager.list_locks(agent_name=agent_id, include_stale=False)
+        manager.get_stale_locks()
+        per_agent = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        manager.locks_by_holder()
+        grouped = (time.perf_counter() - start) * 1000
+        print(
+            f"list {args.agents} agents (ms): list_locks x2 {per_agent:.1f}, "
+            f"locks_by_holder {grouped:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
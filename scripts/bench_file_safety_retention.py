@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark file modification retention and reads on a year of history.
+
+Fills a temporary database with N modifications spread evenly over the
+last 365 days, then times ``cleanup_old_modifications(days=30)``,
+``get_recent_modifications`` and ``get_statistics`` against:
+
+* ``single``      — one ``file_modifications`` table; cleanup deletes row by
+                    row through the timestamp index (pre-partitioning
+                    layout, reproduced with plain SQL)
+* ``partitioned`` — ``FileSafetyManager`` with monthly partitions; cleanup
+                    drops whole months and stats read per-partition counts
+
+Usage:
+    python scripts/bench_file_safety_retention.py [--rows N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.file_safety import FileSafetyManager  # noqa: E402
+
+SINGLE_SCHEMA = """
+    CREATE TABLE file_modifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, task_id TEXT NOT NULL,
+        agent_name TEXT NOT NULL, file_path TEXT NOT NULL,
+        change_type TEXT NOT NULL, affected_lines TEXT, intent TEXT,
+        timestamp TEXT NOT NULL, metadata TEXT
+    );
+    CREATE INDEX idx_mods_file_path ON file_modifications(file_path);
+    CREATE INDEX idx_mods_task_id ON file_modifications(task_id);
+    CREATE INDEX idx_mods_timestamp ON file_modifications(timestamp);
+    CREATE INDEX idx_mods_agent_name ON file_modifications(agent_name);
+"""
+
+
+def _rows(rows: int):  # type: ignore[no-untyped-def]
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=365) / rows
+    for i in range(rows):
+        yield (
+            f"task-{i // 50}",
+            f"synapse-claude-{8100 + i % 10}",
+            f"/work/src/module_{i % 2000}.py",
+            "MODIFY" if i % 5 else "CREATE",
+            "Refactor",
+            (now - step * (rows - i)).isoformat(),
+        )
+
+
+def _fill(db_path: str, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO file_modifications (task_id, agent_name, file_path, "
+        "change_type, intent, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+        _rows(rows),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _ms(fn) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _single(db_path: str, rows: int) -> dict[str, float]:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SINGLE_SCHEMA)
+    conn.close()
+    _fill(db_path, rows)
+    conn = sqlite3.connect(db_path)
+
+    def recent() -> None:
+        conn.execute(
+            "SELECT * FROM file_modifications ORDER BY timestamp DESC LIMIT 50"
+        ).fetchall()
+
+    def stats() -> None:
+        for column in ("change_type", "agent_name", "file_path"):
+            conn.execute(
+                f"SELECT {column}, COUNT(*) FROM file_modifications GROUP BY {column}"
+            ).fetchall()
+
+    def cleanup() -> None:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        conn.execute("DELETE FROM file_modifications WHERE timestamp < ?", (cutoff,))
+        conn.commit()
+
+    timings = {"stats": _ms(stats), "recent": _ms(recent), "cleanup": _ms(cleanup)}
+    conn.close()
+    return timings
+
+
+def _partitioned(db_path: str, rows: int) -> dict[str, float]:
+    FileSafetyManager(db_path=db_path, retention_days=0).close()
+    _fill(db_path, rows)
+    # Reopening moves the finished months into partitions (the migration)
+    start = time.perf_counter()
+    manager = FileSafetyManager(db_path=db_path, retention_days=0)
+    print(f"  partition migration: {(time.perf_counter() - start):.1f} s")
+    timings = {
+        "stats": _ms(manager.get_statistics),
+        "recent": _ms(lambda: manager.get_recent_modifications(limit=50)),
+        "cleanup": _ms(lambda: manager.cleanup_old_modifications(days=30)),
+    }
+    manager.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        print(f"{args.rows} modifications over 365 days (ms)")
+        for label, run in (("single", _single), ("partitioned", _partitioned)):
+            timings = run(str(Path(tmp) / f"{label}.db"), args.rows)
+            print(
+                f"{label:>11}: "
+                + "  ".join(f"{name} {ms:9.1f}" for name, ms in timings.items())
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark the FileSafetyManager pre-write lock check.
+
+Holds N locks from live agents, then times ``is_locked_by_other`` (the
+``check_lock`` lookup behind ``validate_write``) per call with:
+
+* ``sqlite`` — a SELECT on the agent's connection per call, after deleting
+               expired locks and probing every lock holder's pid with
+               ``os.kill`` (the pre-cache behaviour)
+* ``cached`` — the in-process lock table, reloaded only when SQLite's
+               ``data_version`` reports a commit elsewhere
+
+Usage:
+    python scripts/bench_file_safety_validate.py [--locks N] [--checks N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.file_safety import FileSafetyManager  # noqa: E402
+
+
+class SQLiteManager(FileSafetyManager):
+    """Reads file_locks on every check and sweeps stale pids inline."""
+
+    def check_lock(
+        self, file_path: str, *, cleanup_stale: bool = True
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                self._cleanup_expired_locks_internal(cursor)
+                if cleanup_stale:
+                    self._cleanup_stale_locks_internal(cursor)
+                conn.commit()
+                cursor.execute(
+                    "SELECT * FROM file_locks WHERE file_path = ?",
+                    (self._normalize_path(file_path),),
+                )
+                row = cursor.fetchone()
+                return dict(row) if row else None
+            finally:
+                self._release_connection(conn)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locks", type=int, default=50)
+    parser.add_argument("--checks", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        print(f"{args.locks} locks held, {args.checks} checks (us per check)")
+        for label, cls in (("sqlite", SQLiteManager), ("cached", FileSafetyManager)):
+            manager = cls(db_path=str(Path(tmp) / f"{label}.db"))
+            for i in range(args.locks):
+                manager.acquire_lock(
+                    f"/work/src/locked_{i}.py",
+                    f"synapse-gemini-{8110 + i}",
+                    pid=os.getpid(),
+                )
+            start = time.perf_counter()
+            for i in range(args.checks):
+                manager.is_locked_by_other(
+                    f"/work/src/module_{i % 200}.py", "synapse-claude-8100"
+                )
+            per_check = (time.perf_counter() - start) / args.checks * 1e6
+            print(f"{label:>7}: {per_check:8.1f}")
+            manager.close()
+
+
+if __name__ == "__main__":
+    main()
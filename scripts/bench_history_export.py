@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark ``synapse history export`` on a large history.
+
+Fills a temporary history database with N observations, then exports all
+of them to a file and reports wall time and peak memory traced by
+``tracemalloc`` for:
+
+* ``buffered`` — fetch every row, build the whole JSON/CSV document as one
+                 string and write it (the pre-streaming behaviour)
+* ``streamed`` — ``HistoryManager.write_export`` straight to the file,
+                 reading the cursor in ``HISTORY_EXPORT_CHUNK_SIZE`` chunks
+
+Usage:
+    python scripts/bench_history_export.py [--rows N] [--format json|jsonl|csv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.history import _CSV_FIELDNAMES, HistoryManager, _csv_row  # noqa: E402
+
+OUTPUT = "Refactored the scheduler and added tests. " * 20
+
+
+def _fill(db_path: str, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO observations (session_id, agent_name, task_id, input, "
+        "output, status, metadata) VALUES ('bench', 'claude', ?, ?, ?, "
+        "'completed', ?)",
+        (
+            (f"task-{i}", "Run tests", OUTPUT, json.dumps({"attempt": i}))
+            for i in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _buffered(manager: HistoryManager, path: Path, export_format: str) -> None:
+    with sqlite3.connect(manager.db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT * FROM observations ORDER BY timestamp DESC"
+        ).fetchall()
+    observations: list[dict[str, Any]] = []
+    for row in rows:
+        obs = dict(row)
+        obs["metadata"] = json.loads(obs["metadata"]) if obs["metadata"] else {}
+        observations.append(obs)
+    if export_format == "csv":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=_CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(_csv_row(obs) for obs in observations)
+        text = buf.getvalue()
+    elif export_format == "jsonl":
+        text = "".join(json.dumps(obs, default=str) + "\n" for obs in observations)
+    else:
+        text = json.dumps(observations, indent=2, default=str)
+    path.write_text(text, encoding="utf-8")
+
+
+def _streamed(manager: HistoryManager, path: Path, export_format: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        manager.write_export(f, format=export_format)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=("json", "jsonl", "csv"), default="json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        manager = HistoryManager(db_path=str(Path(tmp) / "history.db"))
+        _fill(manager.db_path, args.rows)
+        print(f"{args.rows} observations, format={args.format}")
+
+        for label, export in (("buffered", _buffered), ("streamed", _streamed)):
+            path = Path(tmp) / f"export-{label}.{args.format}"
+            tracemalloc.start()
+            start = time.perf_counter()
+            export(manager, path, args.format)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size_mb = path.stat().st_size / 1e6
+            print(
+                f"{label:>8}: {elapsed:6.2f} s  peak {peak / 1e6:8.1f} MB  "
+                f"(file {size_mb:.1f} MB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
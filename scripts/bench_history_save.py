@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark history observation saves from many threads.
+
+Starts N threads that share one ``HistoryManager`` (as the A2A server's
+worker threads do) and call ``save_observation`` for a fixed duration,
+then reports aggregate observations saved per second for:
+
+* ``per-call``     — a fresh rollback-journal connection and commit per
+                     save under a process-wide lock (the pre-change path)
+* ``direct``       — ``HistoryManager()``; cached per-thread WAL
+                     connections, one commit per save
+* ``write-behind`` — ``HistoryManager(write_behind=True)``; saves are
+                     queued and group-committed in the background
+
+Usage:
+    python scripts/bench_history_save.py [--threads N] [--seconds S]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.history import _INSERT_OBSERVATION, HistoryManager  # noqa: E402
+
+OUTPUT = "Refactored the scheduler and added tests. " * 20
+
+
+def _per_call_saver(manager: HistoryManager):  # type: ignore[no-untyped-def]
+    lock = threading.RLock()
+    with sqlite3.connect(manager.db_path) as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+
+    def save(row: tuple[str | None, ...]) -> None:
+        with lock:
+            conn = sqlite3.connect(manager.db_path)
+            try:
+                conn.execute(_INSERT_OBSERVATION, row)
+                conn.commit()
+            finally:
+                conn.close()
+
+    return save
+
+
+def run(mode: str, threads: int, seconds: float) -> float:
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        manager = HistoryManager(
+            db_path=str(Path(tmp) / "history.db"),
+            write_behind=mode == "write-behind",
+        )
+        if mode == "per-call":
+            manager.close()
+            save = _per_call_saver(manager)
+        else:
+
+            def save(row: tuple[str | None, ...]) -> None:
+                session_id, agent_name, task_id, input_text, output_text, status, _ = (
+                    row
+                )
+                manager.save_observation(
+                    task_id=task_id,
+                    agent_name=agent_name,
+                    session_id=session_id,
+                    input_text=input_text,
+                    output_text=output_text,
+                    status=status,
+                )
+
+        ids = itertools.count()
+        counts = [0] * threads
+        barrier = threading.Barrier(threads + 1)
+        deadline = 0.0
+
+        def worker(index: int) -> None:
+            barrier.wait()
+            while time.perf_counter() < deadline:
+                task_id = f"task-{next(ids)}"
+                save(
+                    ("bench", "claude", task_id, "Run tests", OUTPUT, "completed", None)
+                )
+                counts[index] += 1
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for thread in workers:
+            thread.start()
+        deadline = time.perf_counter() + seconds
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        manager.close()
+        elapsed = time.perf_counter() - start
+        return sum(counts) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads, {args.seconds:.0f} s per mode")
+    for mode in ("per-call", "direct", "write-behind"):
+        rate = run(mode, args.threads, args.seconds)
+        print(f"{mode:>12}: {rate:10,.0f} observations/s")
+
+
+if __name__ == "__main__":
+    main()
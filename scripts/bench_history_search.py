@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark history keyword search on a large observations table.
+
+Fills a temporary history database with N synthetic observations, then
+times ``HistoryManager.search_observations`` and ``recall_observations``
+through:
+
+* ``scan`` — ``LOWER(input) LIKE '%kw%'`` over every row (pre-index
+             behaviour, forced by disabling the full-text index)
+* ``fts``  — the FTS5 index with BM25 ranking
+
+Also reports how long the one-time backfill of an existing database takes.
+
+Usage:
+    python scripts/bench_history_search.py [--rows N] [--queries N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.history import HistoryManager  # noqa: E402
+
+VOCABULARY = 20_000
+# Word frequency ranks to query: common, mid, rare; pairs use OR logic.
+QUERY_RANKS = [[50], [500], [5000], [300, 3000]]
+
+
+def _vocabulary() -> list[str]:
+    rng = random.Random(1)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words: set[str] = set()
+    while len(words) < VOCABULARY:
+        words.add("".join(rng.choices(letters, k=rng.randint(4, 9))))
+    return sorted(words)
+
+
+def _fill(db_path: str, rows: int, words: list[str]) -> None:
+    """Insert rows of Zipf-distributed words (a few common, most rare)."""
+    rng = random.Random(0)
+    weights = [1 / (i + 1) for i in range(len(words))]
+
+    def text(n: int) -> str:
+        return " ".join(rng.choices(words, weights, k=n))
+
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO observations (session_id, agent_name, task_id, input, "
+        "output, status) VALUES ('bench', 'claude', ?, ?, ?, 'completed')",
+        ((f"task-{i}", text(20), text(60)) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _time_query(manager: HistoryManager, keywords: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        manager.search_observations(keywords=keywords, limit=50)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        db_path = str(Path(tmp) / "history.db")
+        manager = HistoryManager(db_path=db_path)
+        words = _vocabulary()
+        _fill(db_path, args.rows, words)
+        queries = [[words[rank] for rank in ranks] for ranks in QUERY_RANKS]
+        task = f"Investigate {words[800]} stalls after {words[4000]} upgrade"
+        print(f"{args.rows} observations, median ms per search")
+
+        for label, fts in (("scan", False), ("fts", True)):
+            manager._fts_enabled = fts
+            timings = [
+                f"rank {'/'.join(map(str, ranks))}: "
+                f"{_time_query(manager, keywords, args.queries):7.1f}"
+                for ranks, keywords in zip(QUERY_RANKS, queries, strict=True)
+            ]
+            start = time.perf_counter()
+            manager.recall_observations(task)
+            timings.append(f"recall: {(time.perf_counter() - start) * 1000:7.1f}")
+            print(f"{label:>5}: " + "  ".join(timings))
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE observations_fts")
+        start = time.perf_counter()
+        HistoryManager(db_path=db_path)
+        print(f"backfill of existing DB: {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
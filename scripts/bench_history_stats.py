@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark ``synapse history stats`` queries on a large history.
+
+Fills a temporary history database with N observations spread over
+several agents and days (a third carrying token metadata), then times
+``get_statistics`` and ``get_token_statistics`` through:
+
+* ``scan``    — full-table aggregates and a metadata JSON scan (pre-rollup
+                behaviour, forced by disabling the rollups)
+* ``rollups`` — the incrementally maintained ``observation_rollups`` table
+
+Also reports how long the inserts took (the rollup triggers run on each
+one) and how long ``rebuild_statistics`` takes on the filled database.
+
+Usage:
+    python scripts/bench_history_stats.py [--rows N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.history import HistoryManager  # noqa: E402
+
+AGENTS = ("claude", "gemini", "codex", "opencode", "copilot")
+STATUSES = ("completed", "completed", "completed", "failed", "canceled")
+
+
+def _rows(count: int):  # type: ignore[no-untyped-def]
+    rng = random.Random(0)
+    for i in range(count):
+        metadata = None
+        if i % 3 == 0:
+            metadata = json.dumps(
+                {
+                    "sender_id": "synapse-claude-8100",
+                    "tokens": {
+                        "input_tokens": rng.randint(100, 5000),
+                        "output_tokens": rng.randint(50, 2000),
+                        "cost_usd": rng.random() / 10,
+                    },
+                }
+            )
+        yield (
+            rng.choice(AGENTS),
+            f"task-{i}",
+            "Implement the feature and run the tests " * 5,
+            "Done. All tests pass. " * 20,
+            rng.choice(STATUSES),
+            f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d} 12:00:00.000",
+            metadata,
+        )
+
+
+def _fill(db_path: str, rows: int) -> float:
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO observations (session_id, agent_name, task_id, input, "
+        "output, status, timestamp, metadata) VALUES ('bench', ?, ?, ?, ?, ?, ?, ?)",
+        _rows(rows),
+    )
+    conn.commit()
+    conn.close()
+    return time.perf_counter() - start
+
+
+def _time(fn, repeat: int) -> float:  # type: ignore[no-untyped-def]
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        db_path = str(Path(tmp) / "history.db")
+        manager = HistoryManager(db_path=db_path)
+        fill_s = _fill(db_path, args.rows)
+        print(f"{args.rows} observations inserted in {fill_s:.1f} s (with triggers)")
+        print("median ms per call")
+
+        for label, rollups in (("scan", False), ("rollups", True)):
+            manager._rollups_enabled = rollups
+            timings = [
+                f"stats: {_time(manager.get_statistics, args.repeat):8.1f}",
+                "stats -a claude: "
+                f"{_time(lambda: manager.get_statistics('claude'), args.repeat):8.1f}",
+                f"tokens: {_time(manager.get_token_statistics, args.repeat):8.1f}",
+            ]
+            print(f"{label:>8}: " + "  ".join(timings))
+
+        start = time.perf_counter()
+        manager.rebuild_statistics()
+        print(f"rebuild of existing DB: {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of serving N output-stream subscribers.
+
+Feeds synthetic PTY output into a ``TerminalController`` (no child
+process) and, after every chunk, lets N subscribers catch up the way the
+SSE/gRPC streams do:
+
+* ``polling`` — each subscriber calls ``get_context()`` and slices by the
+                length it has already seen (pre-broadcaster behaviour)
+* ``deltas``  — each subscriber drains its ``OutputBroadcaster`` queue
+
+Reports the subscriber-side CPU time per chunk, and the cost of the
+marker the A2A router records when a task starts, with the buffer full:
+``len(get_context())`` (previous behaviour) against ``output_offset``.
+
+Usage:
+    python scripts/bench_output_stream.py [--subscribers N] [--chunks N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CHUNK = b"\x1b[32m+\x1b[0m    assert compute(x, y) == expected  # test_module.py\n" * 16
+
+
+def run(mode: str, subscribers: int, chunks: int) -> float:
+    from synapse.controller import TerminalController
+
+    controller = TerminalController(command="true", idle_regex=r"\$")
+    streams = [controller.subscribe_output()[1] for _ in range(subscribers)]
+    seen = [0] * subscribers
+
+    elapsed = 0.0
+    for _ in range(chunks):
+        controller._append_output(CHUNK)
+        start = time.perf_counter()
+        for i, stream in enumerate(streams):
+            if mode == "polling":
+                context = controller.get_context()
+                if len(context) > seen[i]:
+                    _ = context[seen[i] :]
+                    seen[i] = len(context)
+            else:
+                for delta in stream.drain():
+                    _ = delta.text
+        elapsed += time.perf_counter() - start
+    return elapsed / chunks
+
+
+def marker_cost(chunks: int, repeat: int = 200) -> tuple[float, float]:
+    from synapse.controller import TerminalController
+
+    controller = TerminalController(command="true", idle_regex=r"\$")
+    for _ in range(chunks):
+        controller._append_output(CHUNK)
+    timings = []
+    for marker in (
+        lambda: len(controller.get_context()),
+        lambda: controller.output_offset,
+    ):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            marker()
+        timings.append((time.perf_counter() - start) / repeat)
+    return timings[0], timings[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=10)
+    parser.add_argument("--chunks", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.subscribers} subscribers, {args.chunks} chunks of {len(CHUNK)} B")
+    for mode in ("polling", "deltas"):
+        per_chunk = run(mode, args.subscribers, args.chunks)
+        print(f"{mode:>8}: {per_chunk * 1e6:9.1f} µs per chunk")
+    context_len, offset = marker_cost(args.chunks)
+    print(
+        f"task start marker: len(get_context()) {context_len * 1e6:9.1f} µs, "
+        f"output_offset {offset * 1e6:6.2f} µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
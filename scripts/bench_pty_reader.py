@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark PTY output throughput of TerminalController's reader loop.
+
+Spawns a child process under a real PTY that writes a burst of output
+(diff/test-log shaped lines) and measures how many MB/s the background
+reader handles end-to-end: append to the output/render buffers plus the
+idle/WAITING evaluation. Two reader loops are compared:
+
+* ``legacy``  — ``select.select`` + fixed 1 KiB ``os.read`` with the full
+                pipeline run per chunk (pre-selector behaviour)
+* ``batched`` — the current selector-based loop with adaptive reads and
+                one idle/WAITING evaluation per drained batch
+
+Usage:
+    python scripts/bench_pty_reader.py [--megabytes N] [--profile NAME]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import select
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SENTINEL = b"__SYNAPSE_BENCH_END__"
+
+CHILD_SCRIPT = """
+import sys, time
+line = b"+    assert compute(x, y) == expected  # tests/test_module.py::case\\n"
+total = int(sys.argv[1])
+out = sys.stdout.buffer
+written = 0
+while written < total:
+    out.write(line * 64)
+    written += len(line) * 64
+out.write(b"{sentinel}\\n")
+out.flush()
+time.sleep(60)
+"""
+
+
+def _legacy_monitor(controller) -> None:  # type: ignore[no-untyped-def]
+    """Reader loop as it was before selector-based draining."""
+    while controller.running and controller.process.poll() is None:
+        r, _, _ = select.select([controller.master_fd], [], [], 0.1)
+        if controller.master_fd in r:
+            try:
+                data = os.read(controller.master_fd, 1024)
+            except OSError:
+                break
+            if not data:
+                break
+            controller._append_output(data)
+            controller._check_idle_state(data)
+        else:
+            controller._check_idle_state(b"")
+
+
+def run(mode: str, size: int, profile: str) -> float:
+    from synapse.controller import TerminalController
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "burst.py"
+        script.write_text(CHILD_SCRIPT.format(sentinel=SENTINEL.decode()))
+        controller = TerminalController(
+            command=sys.executable,
+            args=[str(script), str(size)],
+            agent_type=profile,
+            waiting_detection={"regex": r"›\s+\d+\.", "require_idle": True},
+        )
+        if mode == "legacy":
+            controller._monitor_output = lambda: _legacy_monitor(controller)  # type: ignore[method-assign]
+
+        start = time.perf_counter()
+        controller.start()
+        try:
+            while True:
+                with controller.lock:
+                    done = SENTINEL in bytes(controller._output.tail(256))
+                if done:
+                    break
+                if not controller.thread or not controller.thread.is_alive():
+                    raise RuntimeError("reader loop exited before the sentinel")
+                time.sleep(0.005)
+            elapsed = time.perf_counter() - start
+        finally:
+            controller.stop(timeout=2.0)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=5.0)
+    parser.add_argument("--profile", default="codex", help="agent_type label")
+    args = parser.parse_args()
+
+    size = int(args.megabytes * 1024 * 1024)
+    print(f"burst: {args.megabytes:.1f} MB per run")
+    for mode in ("legacy", "batched"):
+        elapsed = run(mode, size, args.profile)
+        print(f"{mode:>8}: {args.megabytes / elapsed:8.2f} MB/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
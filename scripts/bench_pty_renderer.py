@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark full-screen vs incremental PtyRenderer rendering.
+
+Replays a PTY byte stream through ``PtyRenderer`` in 1 KiB chunks (the
+size ``TerminalController`` reads) and reports renders per second for:
+
+* ``full``        — every row re-rendered after every chunk (pre-dirty-row
+                    behaviour of ``render_text``)
+* ``incremental`` — ``pop_changed_text`` + ``render_text`` as used by
+                    ``IdleDetector.check_waiting_state``
+
+Usage:
+    python scripts/bench_pty_renderer.py [--replay FILE] [--chunk-size N]
+
+Without ``--replay`` a synthetic Codex/Claude-style stream is generated:
+a status spinner redrawn in place, streamed diff lines that scroll the
+screen, and a final approval prompt. ``--replay`` accepts a raw capture,
+e.g. one recorded with ``script -q -c codex capture.raw``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.pty_renderer import PtyRenderer  # noqa: E402
+
+COLUMNS = 120
+ROWS = 40
+
+
+def synthetic_stream(frames: int = 4000) -> bytes:
+    """Build a TUI-like byte stream with in-place redraws and scrolling."""
+    spinner = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    out: list[str] = ["\x1b[2J\x1b[H"]
+    for i in range(frames):
+        out.append(f"\x1b[{ROWS};1H\x1b[2K{spinner[i % len(spinner)]} Working ({i}s)")
+        if i % 3 == 0:
+            out.append(f"\x1b[{ROWS - 1};1H\r\n")
+            out.append(
+                f"\x1b[{ROWS - 2};1H+    line {i}: value = compute(x, y)  # diff"
+            )
+    out.append(f"\x1b[{ROWS - 3};1H  Would you like to run the following command?")
+    out.append(f"\x1b[{ROWS - 2};1H› 1. Yes, proceed")
+    return "".join(out).encode("utf-8")
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def bench_full(chunks: list[bytes]) -> float:
+    renderer = PtyRenderer(columns=COLUMNS, rows=ROWS)
+    start = time.perf_counter()
+    for chunk in chunks:
+        renderer.feed(chunk)
+        "\n".join(renderer._render_line(y)[0] for y in range(ROWS))
+    return time.perf_counter() - start
+
+
+def bench_incremental(chunks: list[bytes]) -> float:
+    renderer = PtyRenderer(columns=COLUMNS, rows=ROWS)
+    start = time.perf_counter()
+    for chunk in chunks:
+        renderer.feed(chunk)
+        renderer.pop_changed_text(context=2)
+        renderer.render_text()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replay", type=Path, help="raw PTY capture to replay")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    data = args.replay.read_bytes() if args.replay else synthetic_stream()
+    chunks = _chunks(data, args.chunk_size)
+    print(f"stream: {len(data)} bytes, {len(chunks)} chunks of {args.chunk_size}")
+
+    for label, fn in (("full", bench_full), ("incremental", bench_incremental)):
+        elapsed = fn(chunks)
+        print(f"{label:>12}: {len(chunks) / elapsed:10.1f} renders/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark N senders waiting at the readiness gate of a cold agent.
+
+N concurrent ``/tasks/send`` requests reach the real A2A router while the
+controller is not ready yet; readiness is signalled ``--ready-ms`` later.
+The default executor has Python's default size, min(32, CPUs + 4).
+
+* ``to_thread`` — each waiter parks an executor thread in
+                  ``wait_until_ready`` (pre-bridge behaviour)
+* ``async``     — waiters await ``wait_until_ready_async``
+
+Reports the peak thread count, how long an unrelated ``asyncio.to_thread``
+call (what e.g. the registry endpoints use) waits while the senders are
+parked, and the time from readiness until every send was answered.
+
+Usage:
+    python scripts/bench_readiness_gate.py [--senders N] [--ready-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.a2a_compat import create_a2a_router, task_store  # noqa: E402
+from synapse.controller import TerminalController  # noqa: E402
+
+PAYLOAD = {"message": {"role": "user", "parts": [{"type": "text", "text": "hi"}]}}
+
+
+async def _run(label: str, senders: int, ready_ms: float) -> None:
+    # Forget the previous run's working task, or the gate is skipped
+    with task_store._lock:
+        task_store._tasks.clear()
+    controller = TerminalController(command="echo", agent_id=None, agent_type="bench")
+    controller.status = "READY"
+    controller.write = MagicMock(return_value=True)  # type: ignore[method-assign]
+    if label == "to_thread":
+
+        async def wait_in_thread(timeout: float) -> bool:
+            return await asyncio.to_thread(controller.wait_until_ready, timeout)
+
+        controller.wait_until_ready_async = wait_in_thread  # type: ignore[method-assign]
+
+    app = FastAPI()
+    app.include_router(create_a2a_router(controller, "bench", 8100, "\n"))
+    peak_threads = threading.active_count()
+    ready_at = 0.0
+
+    def mark_ready() -> None:
+        nonlocal ready_at
+        ready_at = time.perf_counter()
+        controller._mark_agent_ready()
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        sends = [
+            asyncio.create_task(client.post("/tasks/send", json=PAYLOAD))
+            for _ in range(senders)
+        ]
+        await asyncio.sleep(0.05)
+        timer = threading.Timer(ready_ms / 1000, mark_ready)
+        timer.start()
+        start = time.perf_counter()
+        await asyncio.to_thread(lambda: None)
+        probe = time.perf_counter() - start
+        peak_threads = max(peak_threads, threading.active_count())
+        responses = await asyncio.gather(*sends)
+        answered = time.perf_counter() - ready_at
+        timer.join()
+
+    ok = sum(r.status_code == 200 for r in responses)
+    print(
+        f"{label:>9}: peak threads {peak_threads:3d}  "
+        f"unrelated to_thread waited {probe * 1000:7.1f} ms  "
+        f"all answered {answered * 1000:6.1f} ms after ready  ({ok}/{senders} ok)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--senders", type=int, default=200)
+    parser.add_argument("--ready-ms", type=float, default=500.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        os.environ["SYNAPSE_HISTORY_ENABLED"] = "false"
+        os.environ["SYNAPSE_CANVAS_DB_PATH"] = str(Path(tmp) / "canvas.db")
+        print(
+            f"{args.senders} senders, agent ready after {args.ready_ms:.0f} ms, "
+            f"default executor of {min(32, (os.cpu_count() or 1) + 4)} threads"
+        )
+        for label in ("to_thread", "async"):
+            asyncio.run(_run(label, args.senders, args.ready_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark registry status-update throughput with many concurrent agents.
+
+Starts N worker processes (one per simulated agent) that share a temporary
+registry directory and hammer ``update_status`` for a fixed duration,
+then reports aggregate status updates per second for:
+
+* ``durable``      — registry-wide flock + fsync per update (the pre-change
+                     ``_atomic_update`` path, still used for durable fields)
+* ``volatile``     — registry-wide + per-agent flock, no fsync
+                     (``update_status`` without write-behind)
+* ``write-behind`` — ``AgentRegistry(write_behind=True)``; updates are
+                     queued and coalesced into background writes
+
+Usage:
+    python scripts/bench_registry_status.py [--agents N] [--seconds S]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+STATUSES = ("READY", "PROCESSING", "WAITING")
+
+
+def _worker(mode: str, index: int, seconds: float, barrier, results) -> None:  # type: ignore[no-untyped-def]
+    from synapse.registry import AgentRegistry
+
+    registry = AgentRegistry(write_behind=mode == "write-behind")
+    agent_id = registry.get_agent_id("bench", 20000 + index)
+    registry.register(agent_id, "bench", 20000 + index)
+
+    def update(status: str) -> bool:
+        if mode == "durable":
+            return registry._atomic_update(
+                agent_id, lambda data: data.update(status=status), "status"
+            )
+        return registry.update_status(agent_id, status)
+
+    barrier.wait()
+    count = 0
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        update(STATUSES[count % len(STATUSES)])
+        count += 1
+    registry.flush()
+    results.put(count)
+
+
+def run(mode: str, agents: int, seconds: float) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SYNAPSE_REGISTRY_DIR"] = tmp
+        results: mp.Queue = mp.Queue()
+        # All agents register first, then start updating together.
+        barrier = mp.Barrier(agents)
+        procs = [
+            mp.Process(target=_worker, args=(mode, i, seconds, barrier, results))
+            for i in range(agents)
+        ]
+        for proc in procs:
+            proc.start()
+        total = sum(results.get() for _ in procs)
+        for proc in procs:
+            proc.join()
+    return total / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{args.agents} agents, {args.seconds:.1f}s per mode")
+    for mode in ("durable", "volatile", "write-behind"):
+        rate = run(mode, args.agents, args.seconds)
+        print(f"{mode:>12}: {rate:10.0f} status updates/s")
+
+
+if __name__ == "__main__":
+    main()
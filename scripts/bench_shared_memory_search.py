@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark shared memory search and listing on a large knowledge base.
+
+Fills a temporary memory database with N synthetic memories spread over
+the global/project/private scopes, then times ``SharedMemory.search``
+through:
+
+* ``scan`` — ``key/content/tags LIKE '%q%'`` over every row (pre-index
+             behaviour, forced by disabling the full-text index)
+* ``fts``  — the FTS5 trigram index with BM25 ranking
+
+and reports ``list_memories`` (by scope and by tag) and ``stats`` timings,
+which use the composite scope indexes and the ``memory_tags`` table.
+
+Usage:
+    python scripts/bench_shared_memory_search.py [--rows N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.shared_memory import SharedMemory  # noqa: E402
+
+VOCABULARY = 20_000
+TAGS = [f"tag-{i}" for i in range(200)]
+# Word frequency ranks to query: common, mid, rare.
+QUERY_RANKS = [50, 500, 5000]
+
+
+def _vocabulary() -> list[str]:
+    rng = random.Random(1)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words: set[str] = set()
+    while len(words) < VOCABULARY:
+        words.add("".join(rng.choices(letters, k=rng.randint(4, 9))))
+    return sorted(words)
+
+
+def _fill(db_path: str, rows: int, words: list[str]) -> None:
+    """Insert memories of Zipf-distributed words (a few common, most rare)."""
+    rng = random.Random(0)
+    cum_weights = list(itertools.accumulate(1 / (i + 1) for i in range(len(words))))
+
+    def row(i: int) -> tuple[str, ...]:
+        scope = rng.choice(("global", "global", "project", "private"))
+        return (
+            f"id-{i}",
+            f"{rng.choice(words)}-{i}",
+            " ".join(rng.choices(words, cum_weights=cum_weights, k=40)),
+            f"synapse-claude-{8100 + i % 10}",
+            scope,
+            f"/work/project-{i % 20}" if scope == "project" else None,
+            json.dumps(rng.sample(TAGS, 2)),
+        )
+
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO memories (id, key, content, author, scope, working_dir, "
+        "tags) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (row(i) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _time(fn, repeat: int) -> float:  # type: ignore[no-untyped-def]
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        db_path = str(Path(tmp) / "memory.db")
+        memory = SharedMemory(db_path=db_path)
+        words = _vocabulary()
+        start = time.perf_counter()
+        _fill(db_path, args.rows, words)
+        fill_s = time.perf_counter() - start
+        print(f"{args.rows} memories inserted in {fill_s:.1f} s (with triggers)")
+        print("median ms per call")
+
+        for label, fts in (("scan", False), ("fts", True)):
+            memory._fts_enabled = fts
+            timings = [
+                f"rank {rank}: "
+                f"{_time(lambda w=words[rank]: memory.search(w), args.repeat):7.1f}"
+                for rank in QUERY_RANKS
+            ]
+            print(f"{label:>5}: " + "  ".join(timings))
+
+        timings = [
+            f"list global: {_time(memory.list_memories, args.repeat):6.1f}",
+            "list project: "
+            + format(
+                _time(
+                    lambda: memory.list_memories(
+                        scope="project", working_dir="/work/project-3"
+                    ),
+                    args.repeat,
+                ),
+                "6.1f",
+            ),
+            "list --tags: "
+            + format(
+                _time(lambda: memory.list_memories(tags=["tag-7"]), args.repeat),
+                "6.1f",
+            ),
+            f"stats: {_time(memory.stats, args.repeat):6.1f}",
+        ]
+        print("  ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark connect-per-call against the shared synapse.db connections.
+
+Runs the same ObservationStore workload (one save and one count per
+iteration, as ObservationCollector does per task event) from T threads:
+
+* ``per-call`` — a fresh ``sqlite3.connect`` + ``PRAGMA journal_mode=WAL``
+                 for every call, closed afterwards (the old store pattern)
+* ``shared``   — ``SQLiteDatabase``: one cached connection per thread with
+                 WAL, ``synchronous=NORMAL``, busy timeout and statement cache
+
+Reports operations per second and how many "database is locked" errors
+surfaced to the caller.
+
+Usage:
+    python scripts/bench_sqlite_connections.py [--ops N] [--threads N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.db import SQLiteDatabase  # noqa: E402
+from synapse.observation import ObservationStore  # noqa: E402
+
+
+class PerCallDatabase(SQLiteDatabase):
+    """Opens and closes a connection around every call, like before synapse.db."""
+
+    def connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = self.row_factory
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        conn.close()
+
+
+def _run(store: ObservationStore, ops: int, threads: int) -> tuple[float, int]:
+    locked = 0
+    locked_lock = threading.Lock()
+
+    def worker(n: int) -> None:
+        nonlocal locked
+        for i in range(ops // threads):
+            try:
+                store.save(
+                    event_type="task_received",
+                    agent_id=f"synapse-claude-{8100 + n}",
+                    data={"task_id": f"task-{n}-{i}"},
+                )
+                store.count(agent_id=f"synapse-claude-{8100 + n}")
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                with locked_lock:
+                    locked += 1
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return ops / (time.perf_counter() - start), locked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=4_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="synapse-bench-") as tmp:
+        print(f"{args.ops} save+count iterations from {args.threads} threads")
+        for label in ("per-call", "shared"):
+            store = ObservationStore(db_path=str(Path(tmp) / f"{label}.db"))
+            if label == "per-call":
+                store._db.close()
+                store._db = PerCallDatabase(store.db_path, row_factory=sqlite3.Row)
+            rate, locked = _run(store, args.ops, args.threads)
+            print(f"{label:>9}: {rate:8.0f} ops/s, {locked} locked errors")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark TaskStore memory and lookups for a long-lived agent.
+
+Creates N tasks (each completed right away, like a busy agent answering
+messages) and reports, for an unbounded store and for the default
+TTL/cap-bounded one:
+
+* traced memory held by the store after N tasks (``tracemalloc``)
+* mean ``get_by_prefix`` time for 8-character prefixes
+* mean ``list_tasks(status="working", limit=50)`` time
+* mean time of the router's busy check, ``list_tasks(status="working")``
+  with one newly started task behind all the finished ones
+
+The unbounded store emulates the pre-eviction behaviour; its prefix lookup
+is compared against a linear scan over all IDs.
+
+Usage:
+    python scripts/bench_task_store.py [--tasks N] [--lookups N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.a2a_models import Message, TextPart  # noqa: E402
+from synapse.task_store import TaskStore  # noqa: E402
+
+
+def _fill(store: TaskStore, count: int) -> list[str]:
+    message = Message(parts=[TextPart(text="Review the diff and report issues")])
+    ids = []
+    for i in range(count):
+        task = store.create(message, context_id=f"ctx-{i % 100}")
+        store.update_status(task.id, "working")
+        if i % 100:  # keep 1% in progress
+            store.update_status(task.id, "completed")
+        ids.append(task.id)
+    return ids
+
+
+def _time(fn, repeat: int) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(label: str, store: TaskStore, count: int, lookups: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    ids = _fill(store, count)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    live = [task.id for task in store.list_tasks()]
+    prefixes = [random.choice(live)[:8] for _ in range(lookups)]
+    it = iter(prefixes * 2)
+    prefix_us = _time(lambda: store.get_by_prefix(next(it)), lookups)
+    list_us = _time(lambda: store.list_tasks(status="working", limit=50), 100)
+    for task in store.list_tasks(status="working"):
+        store.update_status(task.id, "completed")
+    busy = store.create(Message(parts=[TextPart(text="Current task")]))
+    store.update_status(busy.id, "working")
+    busy_us = _time(lambda: store.list_tasks(status="working"), 100)
+
+    print(
+        f"{label:>10}: {len(live):7d} tasks held, {current / 1e6:8.1f} MB, "
+        f"prefix {prefix_us:8.1f} µs, list(working) {list_us:8.1f} µs, "
+        f"busy check {busy_us:8.1f} µs"
+    )
+    if label == "unbounded":
+        scan = iter(prefixes)
+
+        def linear_scan() -> list[str]:
+            prefix = next(scan)
+            return [task_id for task_id in ids if task_id.startswith(prefix)]
+
+        scan_us = _time(linear_scan, min(lookups, 50))
+        print(f"{'':>10}  linear prefix scan over all IDs: {scan_us:8.1f} µs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.tasks} tasks")
+    run(
+        "unbounded",
+        TaskStore(finished_ttl=float("inf"), max_finished=sys.maxsize),
+        args.tasks,
+        args.lookups,
+    )
+    run("bounded", TaskStore(), args.tasks, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
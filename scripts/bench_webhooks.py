@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark webhook delivery of task events fired from a callback thread.
+
+Serves a minimal webhook receiver with uvicorn on a TCP port, registers it
+for ``task.completed`` and fires N events from one sync thread, as the PTY
+status callback does:
+
+* ``thread-per-event`` — a new thread running ``asyncio.run`` per event,
+                         with a new ``httpx.AsyncClient`` per delivery
+                         (pre-dispatcher behaviour)
+* ``dispatcher``       — ``WebhookDispatcher.submit`` onto one worker
+                         thread with a pooled client
+
+Reports the time the firing thread spends per event, the time until every
+event reached the receiver, the peak thread count and the TCP connections
+the receiver saw.
+
+Usage:
+    python scripts/bench_webhooks.py [--events N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synapse.webhooks import (  # noqa: E402
+    WebhookDispatcher,
+    WebhookEvent,
+    WebhookRegistry,
+    _build_request,
+)
+
+received: list[float] = []
+connections: set[int] = set()
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/hook")
+    async def hook(request: Request) -> dict:
+        received.append(time.perf_counter())
+        if request.client:
+            connections.add(request.client.port)
+        return {"ok": True}
+
+    return app
+
+
+def _serve(port: int) -> uvicorn.Server:
+    config = uvicorn.Config(_app(), host="127.0.0.1", port=port, log_level="error")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _thread_per_event(registry: WebhookRegistry) -> Callable[[dict], None]:
+    async def deliver(payload: dict) -> None:
+        event = WebhookEvent(event_type="task.completed", payload=payload)
+        for webhook in registry.get_webhooks_for_event(event.event_type):
+            body, headers = _build_request(webhook, event)
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                await client.post(webhook.url, content=body, headers=headers)
+
+    def fire(payload: dict) -> None:
+        threading.Thread(
+            target=lambda: asyncio.run(deliver(payload)), daemon=True
+        ).start()
+
+    return fire
+
+
+def _run(label: str, url: str, events: int) -> None:
+    registry = WebhookRegistry()
+    registry.register(url, events=["task.completed"])
+    dispatcher = WebhookDispatcher(registry=registry)
+    fire = (
+        _thread_per_event(registry)
+        if label == "thread-per-event"
+        else lambda payload: dispatcher.submit("task.completed", payload)
+    )
+    received.clear()
+    connections.clear()
+    peak_threads = threading.active_count()
+
+    start = time.perf_counter()
+    for i in range(events):
+        fire({"task_id": str(i)})
+        peak_threads = max(peak_threads, threading.active_count())
+    fired = time.perf_counter() - start
+    while len(received) < events:
+        peak_threads = max(peak_threads, threading.active_count())
+        time.sleep(0.001)
+    elapsed = max(received) - start
+    dispatcher.close()
+
+    print(
+        f"{label:>16}: fire {fired / events * 1e6:7.1f} µs/event  "
+        f"all delivered in {elapsed * 1000:7.1f} ms  "
+        f"peak threads {peak_threads:4d}  connections {len(connections):4d}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=500)
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = _serve(port)
+    url = f"http://127.0.0.1:{port}/hook"
+    print(f"{args.events} task.completed events fired from one thread")
+    for label in ("thread-per-event", "dispatcher"):
+        _run(label, url, args.events)
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -20,10 +20,12 @@ from urllib.parse import urljoin
 import httpx
 import requests
 
+from synapse import http_pool
 from synapse.config import (
     COMPLETED_TASK_STATES,
     REQUEST_TIMEOUT,
     TASK_POLL_INTERVAL,
+    TASK_WAIT_MAX_TIMEOUT,
 )
 from synapse.utils import get_iso_timestamp
 
@@ -50,6 +52,44 @@ def _resolve_polling_endpoint(
     return target_endpoint, target_uds_path, target_task_id
 
 
+def wait_for_task_update(
+    task_url: str,
+    uds_path: str | None = None,
+    wait: float = TASK_WAIT_MAX_TIMEOUT,
+    since_status: str | None = None,
+) -> dict[str, Any] | None:
+    """Long-poll ``{task_url}/wait`` and return the task payload.
+
+    The server holds the request until the task leaves ``submitted`` /
+    ``working`` (or, with *since_status*, until its status differs from it)
+    or *wait* seconds pass, so callers learn about completion immediately
+    instead of on the next poll tick.
+
+    Returns None when the server does not support long-polling (404/405),
+    in which case callers should fall back to plain ``GET`` polling. Other
+    HTTP and transport errors propagate.
+    """
+    params: dict[str, Any] = {"timeout": wait}
+    if since_status:
+        params["status"] = since_status
+    url = f"{task_url.rstrip('/')}/wait"
+    if uds_path:
+        uds_response = http_pool.get_client(uds_path).get(
+            url, params=params, timeout=httpx.Timeout(wait + 5.0, connect=0.2)
+        )
+        if uds_response.status_code in (404, 405):
+            return None
+        uds_response.raise_for_status()
+        return dict(uds_response.json())
+    http_response = http_pool.get_session().get(
+        url, params=params, timeout=(REQUEST_TIMEOUT[0], wait + 5.0)
+    )
+    if http_response.status_code in (404, 405):
+        return None
+    http_response.raise_for_status()
+    return dict(http_response.json())
+
+
 # ============================================================
 # Data Classes
 # ============================================================
@@ -267,6 +307,7 @@ class A2AClient:
         sender_agent_id: str | None = None,
         target_agent_id: str | None = None,
         extra_metadata: dict[str, Any] | None = None,
+        sender_task_id: str | None = None,
     ) -> A2ATask | None:
         """
         Send a message to a local Synapse agent using A2A protocol.
@@ -291,6 +332,9 @@ class A2AClient:
             sender_agent_id: Optional sender agent ID for transport display
             target_agent_id: Optional target agent ID for transport display
             extra_metadata: Optional additional metadata merged into the A2A request
+            sender_task_id: Optional task already created on the sender's server
+                (e.g. by create_broadcast_tasks) to receive the reply; when
+                omitted, one is created for wait/notify modes
 
         Returns:
             A2ATask if successful, None otherwise
@@ -338,51 +382,19 @@ class A2AClient:
             # IMPORTANT: Create task on SENDER's server (not in this process) so
             # the task persists after this CLI process exits. This enables --reply-to
             # to find the task when the receiver sends a response.
-            sender_task_id: str | None = None
             if response_mode in ("wait", "notify"):
-                sender_endpoint = (
-                    sender_info.get("sender_endpoint") if sender_info else None
-                )
-                sender_uds_path = (
-                    sender_info.get("sender_uds_path") if sender_info else None
-                )
-
-                if sender_endpoint:
-                    create_payload = {
-                        "message": asdict(a2a_message),
-                        "metadata": {
+                if not sender_task_id:
+                    created = self._create_sender_task(
+                        a2a_message,
+                        {
                             "response_mode": response_mode,
                             "direction": "outgoing",
                             "target_endpoint": endpoint,
                         },
-                    }
-
-                    # Try UDS first, fallback to HTTP
-                    if sender_uds_path and Path(sender_uds_path).exists():
-                        try:
-                            uds_url = "http://localhost/tasks/create"
-                            transport = httpx.HTTPTransport(uds=sender_uds_path)
-                            timeout_cfg = httpx.Timeout(10.0, connect=0.5)
-                            with httpx.Client(
-                                transport=transport, timeout=timeout_cfg
-                            ) as client:
-                                resp = client.post(uds_url, json=create_payload)
-                                resp.raise_for_status()
-                                sender_task_id = resp.json()["task"]["id"]
-                        except httpx.HTTPError:
-                            pass  # Fallback to HTTP below
-
-                    if not sender_task_id:
-                        # HTTP fallback
-                        try:
-                            create_url = f"{sender_endpoint.rstrip('/')}/tasks/create"
-                            create_response = requests.post(
-                                create_url, json=create_payload, timeout=self.timeout
-                            )
-                            create_response.raise_for_status()
-                            sender_task_id = create_response.json()["task"]["id"]
-                        except requests.exceptions.RequestException:
-                            pass  # Continue without sender_task_id
+                        sender_info,
+                    )
+                    if created:
+                        sender_task_id = created["task"]["id"]
 
                 if sender_task_id:
                     metadata["sender_task_id"] = sender_task_id
@@ -404,19 +416,21 @@ class A2AClient:
                                 f"http://localhost/tasks/send-priority?priority="
                                 f"{priority}"
                             )
-                            transport = httpx.HTTPTransport(uds=uds_path)
-                            timeout_cfg = httpx.Timeout(
-                                self._timeout_seconds, connect=0.2
+                            uds_response = http_pool.get_client(uds_path).post(
+                                uds_url,
+                                json=payload,
+                                timeout=httpx.Timeout(
+                                    self._timeout_seconds, connect=0.2
+                                ),
                             )
-                            with httpx.Client(
-                                transport=transport, timeout=timeout_cfg
-                            ) as client:
-                                uds_response = client.post(uds_url, json=payload)
-                                uds_response.raise_for_status()
-                                result = uds_response.json()
-                                task_data = result.get("task", result)
-                                break
+                            uds_response.raise_for_status()
+                            result = uds_response.json()
+                            task_data = result.get("task", result)
+                            break
                         except httpx.TransportError as exc:
+                            # Drop pooled connections; the agent may have
+                            # restarted behind a new socket.
+                            http_pool.discard_client(uds_path)
                             if idx == len(retries):
                                 logger.warning(
                                     "UDS transport failed after %d retries: %s",
@@ -465,7 +479,7 @@ class A2AClient:
                 # Use /tasks/send-priority for priority support
                 url = f"{endpoint.rstrip('/')}/tasks/send-priority?priority={priority}"
                 try:
-                    http_response = requests.post(
+                    http_response = http_pool.get_session().post(
                         url, json=payload, timeout=self.timeout
                     )
                     http_response.raise_for_status()
@@ -516,6 +530,7 @@ class A2AClient:
                     sender_agent_id=sender_agent_id,
                     target_agent_id=target_agent_id,
                     extra_metadata=extra_metadata,
+                    sender_task_id=sender_task_id,
                 )
 
             # At this point task_data is guaranteed to be non-None:
@@ -559,6 +574,133 @@ class A2AClient:
             logger.warning("Failed to send message to local agent: %s", e)
             return None
 
+    def _create_sender_task(
+        self,
+        a2a_message: A2AMessage,
+        metadata: dict[str, Any],
+        sender_info: dict[str, str] | None,
+        children: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | None:
+        """POST /tasks/create on the sender's own server (UDS first, then HTTP).
+
+        Returns:
+            The decoded CreateTaskResponse, or None if the sender has no
+            endpoint or both transports failed.
+        """
+        create_payload: dict[str, Any] = {
+            "message": asdict(a2a_message),
+            "metadata": metadata,
+        }
+        if children is not None:
+            create_payload["children"] = children
+        return self._post_to_sender("/tasks/create", create_payload, sender_info)
+
+    def _post_to_sender(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        sender_info: dict[str, str] | None,
+    ) -> dict[str, Any] | None:
+        """POST *payload* to *path* on the sender's own server (UDS first,
+        then HTTP) and return the decoded response, or None on failure."""
+        sender_endpoint = sender_info.get("sender_endpoint") if sender_info else None
+        if not sender_endpoint:
+            return None
+        sender_uds_path = sender_info.get("sender_uds_path") if sender_info else None
+
+        # Try UDS first, fallback to HTTP
+        if sender_uds_path and Path(sender_uds_path).exists():
+            try:
+                resp = http_pool.get_client(sender_uds_path).post(
+                    f"http://localhost{path}",
+                    json=payload,
+                    timeout=httpx.Timeout(10.0, connect=0.5),
+                )
+                resp.raise_for_status()
+                return dict(resp.json())
+            except httpx.HTTPError:
+                pass  # Fallback to HTTP below
+
+        try:
+            response = http_pool.get_session().post(
+                f"{sender_endpoint.rstrip('/')}{path}",
+                json=payload,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return dict(response.json())
+        except requests.exceptions.RequestException:
+            return None
+
+    def fail_sender_task(
+        self, task_id: str, reason: str, sender_info: dict[str, str] | None
+    ) -> bool:
+        """Mark a task on the sender's own server as failed.
+
+        Used for broadcast child tasks whose send failed, so no reply will
+        ever arrive and the parent can still settle.
+
+        Returns:
+            True if the sender's server recorded the failure.
+        """
+        payload = {"message": reason, "status": "failed"}
+        return (
+            self._post_to_sender(f"/tasks/{task_id}/reply", payload, sender_info)
+            is not None
+        )
+
+    def create_broadcast_tasks(
+        self,
+        message: str,
+        target_endpoints: list[str],
+        sender_info: dict[str, str] | None,
+        response_mode: str = "notify",
+        file_parts: list[dict] | None = None,
+    ) -> tuple[str | None, list[str | None]]:
+        """Create one parent task plus a child task per broadcast recipient.
+
+        All tasks are created on the sender's server in a single request.
+        Each child is passed to its recipient as ``sender_task_id`` so
+        replies are tracked per recipient; the parent completes once every
+        child has finished.
+
+        Returns:
+            ``(parent_task_id, child_task_ids)`` aligned with
+            *target_endpoints*; ``(None, [None, ...])`` when no response is
+            expected or the sender has no reachable server.
+        """
+        no_tasks: tuple[str | None, list[str | None]] = (
+            None,
+            [None] * len(target_endpoints),
+        )
+        if not target_endpoints or response_mode not in ("wait", "notify"):
+            return no_tasks
+
+        parts: list[dict[str, Any]] = [{"type": "text", "text": message}]
+        if file_parts:
+            parts.extend(file_parts)
+        created = self._create_sender_task(
+            A2AMessage(role="user", parts=parts),
+            {"response_mode": response_mode, "direction": "outgoing"},
+            sender_info,
+            children=[
+                {
+                    "response_mode": response_mode,
+                    "direction": "outgoing",
+                    "target_endpoint": endpoint,
+                }
+                for endpoint in target_endpoints
+            ],
+        )
+        if not created:
+            return no_tasks
+        children = created.get("children") or []
+        if len(children) != len(target_endpoints):
+            # Older sender server that ignores "children": fall back to
+            # per-send task creation.
+            return no_tasks
+        return created["task"]["id"], [child["id"] for child in children]
+
     def _wait_for_task_completion(
         self,
         get_task_url: Callable[[], str],
@@ -578,23 +720,26 @@ class A2AClient:
             A2ATask if completed, None on timeout
         """
         start_time = time.time()
+        long_poll = True
 
         while time.time() - start_time < timeout:
             try:
                 url = get_task_url()
-                if uds_path:
-                    transport = httpx.HTTPTransport(uds=uds_path)
-                    timeout_cfg = httpx.Timeout(self._timeout_seconds, connect=0.2)
-                    with httpx.Client(
-                        transport=transport, timeout=timeout_cfg
-                    ) as client:
-                        uds_response = client.get(url)
-                        uds_response.raise_for_status()
-                        data = uds_response.json()
-                else:
-                    http_response = requests.get(url, timeout=self.timeout)
-                    http_response.raise_for_status()
-                    data = http_response.json()
+                data = None
+                if long_poll:
+                    remaining = timeout - (time.time() - start_time)
+                    try:
+                        data = wait_for_task_update(
+                            url, uds_path, wait=min(remaining, TASK_WAIT_MAX_TIMEOUT)
+                        )
+                        # Servers without /wait (404/405) fall back to
+                        # interval polling.
+                        long_poll = data is not None
+                    except (requests.exceptions.RequestException, httpx.HTTPError):
+                        # Transient failure: poll once, long-poll again next round.
+                        data = None
+                if data is None:
+                    data = self._get_task_data(url, uds_path)
                 task = A2ATask.from_dict(data, fallback_id=task_id)
 
                 if task.status in COMPLETED_TASK_STATES:
@@ -610,6 +755,18 @@ class A2AClient:
 
         return None
 
+    def _get_task_data(self, url: str, uds_path: str | None) -> dict[str, Any]:
+        """Fetch a task's current state with a plain GET."""
+        if uds_path:
+            uds_response = http_pool.get_client(uds_path).get(
+                url, timeout=httpx.Timeout(self._timeout_seconds, connect=0.2)
+            )
+            uds_response.raise_for_status()
+            return dict(uds_response.json())
+        http_response = http_pool.get_session().get(url, timeout=self.timeout)
+        http_response.raise_for_status()
+        return dict(http_response.json())
+
     def _wait_for_local_completion(
         self, endpoint: str, task_id: str, timeout: int, uds_path: str | None = None
     ) -> A2ATask | None:
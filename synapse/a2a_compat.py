@@ -8,6 +8,7 @@ Google A2A Spec: https://a2a-protocol.org/latest/specification/
 """
 
 import asyncio
+import contextlib
 import hashlib
 import json
 import logging
@@ -21,7 +22,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -36,12 +37,17 @@ from synapse.a2a_client import get_client
 from synapse.a2a_formatting import format_artifact_text as _format_artifact_text
 from synapse.auth import require_auth
 from synapse.config import (
+    A2A_COALESCE_MAX_MESSAGES,
+    A2A_COALESCE_WINDOW_MS,
     AGENT_READY_TIMEOUT,
     CONTEXT_RECENT_SIZE,
+    TASK_WAIT_MAX_TIMEOUT,
+    TASK_WAIT_RECHECK_INTERVAL,
 )
 from synapse.controller import TerminalController
 from synapse.error_detector import detect_task_status
 from synapse.history import HistoryManager
+from synapse.inbox import AgentInbox
 from synapse.long_message import (
     LongMessageStore,
     format_file_reference,
@@ -67,6 +73,7 @@ from synapse.status import (
     WAITING_FOR_INPUT,
 )
 from synapse.terminal_jump import create_panes, detect_terminal_app
+from synapse.transport import TransportMessage
 from synapse.utils import (
     extract_file_parts,
     extract_text_from_parts,
@@ -75,7 +82,7 @@ from synapse.utils import (
     get_iso_timestamp,
 )
 from synapse.webhooks import (
-    dispatch_event,
+    get_webhook_dispatcher,
     get_webhook_registry,
 )
 
@@ -83,6 +90,7 @@ from . import __version__
 
 if TYPE_CHECKING:
     from synapse.a2a_client import ExternalAgent
+    from synapse.output_broadcast import OutputDelta, OutputSubscription
     from synapse.transport import MessageTransport
 
 # Re-export data models for backward compatibility
@@ -173,30 +181,16 @@ def _extract_sender_info(metadata: dict[str, Any] | None) -> SenderInfo:
 
 
 def _dispatch_task_event(event_type: str, payload: dict[str, Any]) -> None:
-    """Dispatch a task event asynchronously via webhook.
+    """Queue a task event for webhook delivery.
+
+    Safe to call from request handlers and from sync callback threads; the
+    webhook dispatcher's worker thread does the delivery.
 
     Args:
         event_type: Event type (e.g., "task.completed", "task.failed")
         payload: Event payload dict
     """
-    registry = get_webhook_registry()
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # Called from sync callback threads (no running event loop).
-        # Run dispatch in a dedicated daemon thread to avoid dropping events.
-        def _run_in_thread() -> None:
-            try:
-                asyncio.run(dispatch_event(registry, event_type, payload))
-            except Exception:
-                logger.exception(
-                    "Failed to dispatch webhook event in thread: %s", event_type
-                )
-
-        threading.Thread(target=_run_in_thread, daemon=True).start()
-        return
-
-    loop.create_task(dispatch_event(registry, event_type, payload))
+    get_webhook_dispatcher().submit(event_type, payload)
 
 
 def _convert_agent_to_info(agent: "ExternalAgent") -> "ExternalAgentInfo":
@@ -271,6 +265,18 @@ def _prepare_pty_message(
     return reference, True
 
 
+def _message_texts(request: SendMessageRequest) -> tuple[str, str]:
+    """Return (text content, PTY payload with file attachments) of a message."""
+    text_content = extract_text_from_parts(request.message.parts)
+    attachments_txt = format_file_parts_for_pty(
+        extract_file_parts(request.message.parts)
+    )
+    pty_payload_text = (
+        f"{text_content}\n\n{attachments_txt}" if attachments_txt else text_content
+    )
+    return text_content, pty_payload_text
+
+
 def map_synapse_status_to_a2a(synapse_status: str) -> TaskState:
     """Map Synapse status to Google A2A task state"""
     mapping: dict[str, TaskState] = {
@@ -343,14 +349,15 @@ def _save_task_to_history(
 
 # (TaskStore moved to synapse.task_store — re-exported above)
 
-# Global history manager
+# Global history manager. Completed-task saves are group-committed in the
+# background; server shutdown flushes them.
 _history_db_path = get_history_db_path()
-history_manager = HistoryManager.from_env(db_path=_history_db_path)
+history_manager = HistoryManager.from_env(db_path=_history_db_path, write_behind=True)
 
 # Logger for A2A operations
 logger = logging.getLogger(__name__)
 
-_CONTEXT_START_METADATA_KEY = "_context_start"
+_OUTPUT_OFFSET_METADATA_KEY = "_output_offset"
 _SENT_MESSAGE_METADATA_KEY = "_sent_message"
 _REPLY_ARTIFACTS_METADATA_KEY = "reply_artifacts"
 _REPLY_STATUS_METADATA_KEY = "reply_status"
@@ -392,9 +399,7 @@ def _sync_registry_input_required_tasks(
     if registry is None or not agent_id:
         return
     summaries: list[dict[str, str]] = []
-    for task in task_store.list_tasks():
-        if task.status != "input_required":
-            continue
+    for task in task_store.list_tasks(status="input_required"):
         summaries.append(
             {
                 "task_id": str(task.id),
@@ -487,16 +492,19 @@ def _strip_trivial_trailing_lines(text: str) -> str:
 
 
 def _select_response_context(
-    full_context: str, recent_context: str, metadata: dict[str, Any]
+    full_context: str,
+    recent_context: str,
+    metadata: dict[str, Any],
+    task_output: str | None = None,
 ) -> str:
-    """Choose the best response context, falling back when delta is only PTY noise."""
+    """Choose the best response context, falling back when delta is only PTY noise.
+
+    *task_output* is the output produced since the task started, if known.
+    """
     sent_msg = metadata.get(_SENT_MESSAGE_METADATA_KEY)
     candidates: list[str] = []
-    context_start = metadata.get(_CONTEXT_START_METADATA_KEY)
-    if isinstance(context_start, int) and 0 <= context_start <= len(full_context):
-        delta = full_context[context_start:]
-        if delta.strip():
-            candidates.append(delta)
+    if task_output and task_output.strip():
+        candidates.append(task_output)
     for candidate in (recent_context, full_context):
         if candidate and candidate not in candidates:
             candidates.append(candidate)
@@ -527,12 +535,11 @@ def _find_active_working_task() -> Task | None:
     Outgoing wait/notify tasks (direction=outgoing) are excluded since they
     represent tasks *sent* to other agents, not work this agent is doing.
     """
-    for task in task_store.list_tasks():
-        if task.status == "working":
-            meta = task.metadata or {}
-            if meta.get("direction") == "outgoing":
-                continue
-            return task
+    for task in task_store.list_tasks(status="working"):
+        meta = task.metadata or {}
+        if meta.get("direction") == "outgoing":
+            continue
+        return task
     return None
 
 
@@ -885,6 +892,8 @@ def create_a2a_router(
     transport: "MessageTransport | None" = None,
     approve_response: str = "",
     deny_response: str = "",
+    inbox: AgentInbox | None = None,
+    coalesce_window_ms: int = A2A_COALESCE_WINDOW_MS,
 ) -> APIRouter:
     """
     Create Google A2A compatible router.
@@ -899,6 +908,10 @@ def create_a2a_router(
         transport: Message transport for delivery (default: PTYTransport)
         approve_response: PTY response to accept a runtime permission prompt
         deny_response: PTY response to reject a runtime permission prompt
+        inbox: Queue for messages sent while the agent has a working task
+            (default: an in-memory AgentInbox)
+        coalesce_window_ms: Merge notify/silent messages arriving within
+            this window into one PTY injection (0 = off)
 
     Returns:
         FastAPI APIRouter with A2A endpoints
@@ -912,7 +925,40 @@ def create_a2a_router(
         from synapse.transport import PTYTransport
 
         transport = PTYTransport(controller, get_long_message_store(), submit_seq)
-    router = APIRouter(tags=["Google A2A Compatible"])
+
+    # Event loop serving the endpoints. Queued messages are started on it
+    # from the controller's status-callback thread, so PTY injection and
+    # reply-target persistence never run on a throwaway loop.
+    server_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _bind_server_loop() -> None:
+        nonlocal server_loop
+        server_loop = asyncio.get_running_loop()
+
+    router = APIRouter(tags=["Google A2A Compatible"], on_startup=[_bind_server_loop])
+    # Created while the server is starting up (lifespan)
+    with contextlib.suppress(RuntimeError):
+        server_loop = asyncio.get_running_loop()
+
+    if inbox is None:
+        inbox = AgentInbox(agent_id)
+    # Serializes "is the agent busy?" with starting or queueing a task, so
+    # request handlers and the dispatcher never start two tasks at once.
+    dispatch_lock = threading.Lock()
+    # Coalescing window state: open while the first message of a burst
+    # waits, plus references to the pending drains so they are not GC'd
+    coalesce_window_open = False
+    coalesce_drains: set[asyncio.Task[None]] = set()
+
+    if history_manager.enabled:
+        # Finished tasks evicted from memory are spilled to history; tasks
+        # already saved on completion are skipped as duplicates.
+        def _spill_evicted_task(task: Task) -> None:
+            _save_task_to_history(
+                task, agent_id=agent_id, agent_name=agent_type, task_status=task.status
+            )
+
+        task_store.on_evict = _spill_evicted_task
 
     def _run_async_from_sync(coro: Any) -> None:
         """Dispatch an async coroutine from a sync callback thread."""
@@ -1136,30 +1182,23 @@ def create_a2a_router(
             return None
 
         metadata = task.metadata or {}
+        # None once the start of the task's output was trimmed from the
+        # context; the task delta is skipped then
+        task_output = None
+        start_offset = metadata.get(_OUTPUT_OFFSET_METADATA_KEY)
+        if isinstance(start_offset, int) and controller is not None:
+            since = controller.output_since(start_offset)
+            if isinstance(since, str):
+                task_output = since
         response_context = _select_response_context(
-            full_context, recent_context, metadata
+            full_context, recent_context, metadata, task_output
         )
         output_summary = response_context[:200]
 
         status, error = detect_task_status(response_context)
-        if status == "failed" and error:
-            task_store.set_error(
-                task_id,
-                TaskErrorModel(code=error.code, message=error.message, data=error.data),
-            )
-            _dispatch_task_event(
-                "task.failed",
-                {
-                    "task_id": task_id,
-                    "error": {"code": error.code, "message": error.message},
-                },
-            )
-            _sync_registry_rate_limited_status(error.code)
-        else:
-            task_store.update_status(task_id, "completed")
-            _dispatch_task_event("task.completed", {"task_id": task_id})
 
-        # Add artifacts from parsed output
+        # Attach artifacts before publishing the terminal status so long-poll
+        # waiters woken by the status change see the complete result.
         if response_context and status != "failed":
             segments = parse_output(response_context)
             if segments:
@@ -1180,6 +1219,23 @@ def create_a2a_router(
                     task_id, Artifact(type="text", data=response_context)
                 )
 
+        if status == "failed" and error:
+            task_store.set_error(
+                task_id,
+                TaskErrorModel(code=error.code, message=error.message, data=error.data),
+            )
+            _dispatch_task_event(
+                "task.failed",
+                {
+                    "task_id": task_id,
+                    "error": {"code": error.code, "message": error.message},
+                },
+            )
+            _sync_registry_rate_limited_status(error.code)
+        else:
+            task_store.update_status(task_id, "completed")
+            _dispatch_task_event("task.completed", {"task_id": task_id})
+
         # Compound signal: clear task active to allow READY transition (#314)
         if controller:
             controller.clear_task_active()
@@ -1210,21 +1266,14 @@ def create_a2a_router(
     if controller:
 
         def _has_non_permission_input_required_task() -> bool:
-            for task in task_store.list_tasks():
-                if task.status != "input_required":
-                    continue
+            for task in task_store.list_tasks(status="input_required"):
                 metadata = task.metadata or {}
                 if not isinstance(metadata.get("permission"), dict):
                     return True
             return False
 
         def _has_only_terminal_tasks() -> bool:
-            tasks = task_store.list_tasks()
-            if not tasks:
-                return False
-            return all(
-                task.status in ("completed", "failed", "canceled") for task in tasks
-            )
+            return task_store.only_finished()
 
         def _is_permission_waiting_status(new_status: str) -> bool:
             if new_status == WAITING:
@@ -1264,9 +1313,7 @@ def create_a2a_router(
         def _on_status_change(old: str, new: str) -> None:
             _drain_pending_terminal_preview_clear(old, new)
             if new == WAITING:
-                for task in task_store.list_tasks():
-                    if task.status != "working":
-                        continue
+                for task in task_store.list_tasks(status="working"):
                     metadata = task.metadata or {}
                     permission = _build_permission_metadata(metadata)
                     now = time.time()
@@ -1317,11 +1364,9 @@ def create_a2a_router(
                 return
 
             if old == WAITING:
-                for task in task_store.list_tasks():
+                for task in task_store.list_tasks(status="input_required"):
                     metadata = task.metadata or {}
-                    if task.status == "input_required" and isinstance(
-                        metadata.get("permission"), dict
-                    ):
+                    if isinstance(metadata.get("permission"), dict):
                         task_store.update_status(task.id, "working")
                 # Fall through to the READY/DONE finalization below so
                 # that WAITING → READY completes working tasks normally.
@@ -1330,9 +1375,7 @@ def create_a2a_router(
 
             if new not in (READY, DONE):
                 return
-            for task in task_store.list_tasks():
-                if task.status != "working":
-                    continue
+            for task in task_store.list_tasks(status="working"):
                 tid = task.id
                 metadata = task.metadata or {}
                 resp_mode = _resolve_response_mode(metadata)
@@ -1365,24 +1408,292 @@ def create_a2a_router(
                         )
                         _run_async_from_sync(coro)
             _sync_registry_input_wait_status(new)
+            _dispatch_queued()
 
         controller.on_status_change(_on_status_change)
 
+    def _agent_busy() -> bool:
+        """Whether a new message has to wait: a task is working or queued."""
+        return len(inbox) > 0 or _find_active_working_task() is not None
+
+    def _create_message_task(
+        request: SendMessageRequest,
+        text_content: str,
+        task_id: str | None = None,
+    ) -> Task:
+        task_metadata = dict(request.metadata or {})
+        task_metadata[_SENT_MESSAGE_METADATA_KEY] = text_content[
+            :SENT_MESSAGE_COMPARE_LEN
+        ]
+        return task_store.create(
+            request.message, request.context_id, metadata=task_metadata, task_id=task_id
+        )
+
+    def _begin_task(task: Task) -> None:
+        """Mark *task* as the one the agent works on. Caller holds dispatch_lock."""
+        assert controller is not None
+        # Where this task's output begins; turned into text only when the
+        # task is finalized
+        output_offset = getattr(controller, "output_offset", None)
+        if isinstance(output_offset, int):
+            task_store.update_metadata(
+                task.id, _OUTPUT_OFFSET_METADATA_KEY, output_offset
+            )
+        task_store.update_status(task.id, "working")
+        # Compound signal: mark task active to suppress premature READY (#314)
+        controller.set_task_active()
+
+    def _coalescable(request: SendMessageRequest, priority: int) -> bool:
+        """Whether a message may share one PTY injection with others."""
+        return (
+            coalesce_window_ms > 0
+            and priority < 5
+            and _resolve_response_mode(request.metadata or {}) in ("notify", "silent")
+        )
+
+    def _admit_task(
+        request: SendMessageRequest, text_content: str, priority: int, coalesce: bool
+    ) -> tuple[Task, bool]:
+        """Create the task for a message and either start or queue it.
+
+        A message arriving while the agent has a working task (or older
+        messages are still queued) goes to the inbox instead of the PTY;
+        priority >= 5 interrupts are never queued. Coalescable messages are
+        always queued so the dispatcher can inject a burst of them together.
+
+        Returns:
+            (task, queued)
+
+        Raises:
+            HTTPException: 409 if the message would be queued but the inbox
+                is full
+        """
+        with dispatch_lock:
+            if priority < 5 and (coalesce or _agent_busy()):
+                if len(inbox) >= inbox.max_depth:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=(
+                            f"Agent inbox is full ({len(inbox)} queued). "
+                            "Retry after it drains."
+                        ),
+                        headers={"Retry-After": "2"},
+                    )
+                task = _create_message_task(request, text_content)
+                inbox.push(task.id, priority, request.model_dump(mode="json"))
+                logger.info(
+                    "Queued task %s (priority %d, %d in inbox)",
+                    task.id[:8],
+                    priority,
+                    len(inbox),
+                )
+                return task, True
+            task = _create_message_task(request, text_content)
+            _begin_task(task)
+            return task, False
+
+    def _claim_queued() -> list[tuple[Task, SendMessageRequest, int]]:
+        """Pop the next queued message if the agent is ready and idle.
+
+        With coalescing on, a notify/silent message at the head takes the
+        notify/silent messages queued directly behind it along, up to
+        A2A_COALESCE_MAX_MESSAGES. Returns an empty list if nothing starts.
+        """
+        if controller is None:
+            return []
+        claimed: list[tuple[Task, SendMessageRequest, int]] = []
+        with dispatch_lock:
+            if not controller.agent_ready or _find_active_working_task():
+                return []
+            while len(claimed) < A2A_COALESCE_MAX_MESSAGES:
+                queued = inbox.pop(
+                    (
+                        lambda m: _coalescable(
+                            SendMessageRequest(**m.request), m.priority
+                        )
+                    )
+                    if claimed
+                    else None
+                )
+                if queued is None:
+                    break
+                task = task_store.get(queued.task_id)
+                if task is None or task.status != "submitted":
+                    continue  # canceled (or evicted) while queued
+                request = SendMessageRequest(**queued.request)
+                _begin_task(task)
+                claimed.append((task, request, queued.priority))
+                if not _coalescable(request, queued.priority):
+                    break
+        return claimed
+
+    async def _drain_inbox() -> None:
+        """Start the next queued message, skipping any that fail to deliver."""
+        while claimed := _claim_queued():
+            try:
+                await _start_tasks(claimed)
+                return
+            except HTTPException as e:
+                logger.warning(
+                    "Failed to deliver queued task(s) %s: %s",
+                    ", ".join(task.id[:8] for task, _, _ in claimed),
+                    e.detail,
+                )
+
+    def _dispatch_queued() -> None:
+        """Deliver the next queued message; called when the agent turns READY."""
+        if not len(inbox):
+            return
+        loop = server_loop
+        if loop is None or not loop.is_running():
+            # The next request (or status change) on a live loop drains it
+            logger.warning(
+                "No running server loop; %d queued message(s) wait", len(inbox)
+            )
+            return
+        asyncio.run_coroutine_threadsafe(_drain_inbox(), loop)
+
+    def _open_coalesce_window() -> None:
+        """Drain the inbox once the coalescing window closes.
+
+        The first coalescable message of a burst opens the window; messages
+        arriving before it closes queue behind it and go out together.
+        """
+        nonlocal coalesce_window_open
+        if coalesce_window_open:
+            return
+        coalesce_window_open = True
+
+        async def _close_window() -> None:
+            nonlocal coalesce_window_open
+            await asyncio.sleep(coalesce_window_ms / 1000)
+            coalesce_window_open = False
+            await _drain_inbox()
+
+        drain = asyncio.get_running_loop().create_task(_close_window())
+        coalesce_drains.add(drain)
+        drain.add_done_callback(coalesce_drains.discard)
+
+    def _fail_started_tasks(tasks: list[Task]) -> None:
+        assert controller is not None
+        controller.clear_task_active()
+        for task in tasks:
+            task_store.update_status(task.id, "failed")
+        _clear_terminal_task_preview()
+
+    async def _start_tasks(started: list[tuple[Task, SendMessageRequest, int]]) -> None:
+        """Deliver messages to the agent. Their tasks are already working.
+
+        Several (coalesced) messages go out as one PTY injection, and all of
+        their tasks complete when that turn finishes.
+
+        Raises:
+            HTTPException: If delivery failed (the tasks are marked failed)
+        """
+        assert controller is not None
+        tasks = [task for task, _, _ in started]
+        try:
+            messages: list[TransportMessage] = []
+            for task, request, priority in started:
+                text_content, pty_payload_text = _message_texts(request)
+                # Update current task preview in registry (for synapse list display)
+                # Note: update_current_task handles truncation internally
+                if registry and agent_id and not messages:
+                    registry.update_current_task(agent_id, text_content)
+
+                # Priority 5 = interrupt first
+                if priority >= 5:
+                    controller.interrupt()
+
+                # Push sender info to reply stack for simplified reply routing
+                # Store when response_mode is "wait" or "notify" (sender expects a reply)
+                metadata = request.metadata or {}
+                response_mode = _resolve_response_mode(metadata)
+                sender_info = _extract_sender_info(request.metadata)
+                controller.record_task_received(
+                    message=text_content,
+                    sender=sender_info.sender_id,
+                    priority=priority,
+                )
+                if (
+                    response_mode in ("wait", "notify")
+                    and sender_info.has_reply_target()
+                    and sender_info.sender_id
+                ):
+                    reply_stack = get_reply_stack()
+                    reply_entry = sender_info.to_reply_stack_entry()
+                    reply_entry["receiver_task_id"] = task.id
+                    reply_entry["message_preview"] = text_content[:80]
+                    reply_entry["received_at"] = datetime.now(timezone.utc).isoformat()
+                    reply_stack.set(sender_info.sender_id, reply_entry)
+                    if agent_id:
+                        try:
+                            await asyncio.to_thread(
+                                save_reply_target, agent_id, reply_entry
+                            )
+                        except Exception as e:
+                            logger.warning(
+                                "Failed to persist reply target for %s: %s",
+                                agent_id,
+                                e,
+                            )
+                messages.append(
+                    TransportMessage(
+                        task.id,
+                        pty_payload_text,
+                        response_mode=response_mode,
+                        sender_id=sender_info.sender_id,
+                        sender_name=sender_info.sender_name,
+                    )
+                )
+
+            # Deliver message via transport (PTY by default, Channel in future)
+            if transport is None:
+                written = False
+            elif len(messages) > 1:
+                written = transport.deliver_batch(messages)
+            else:
+                message = messages[0]
+                written = transport.deliver(
+                    message.task_id,
+                    message.content,
+                    response_mode=message.response_mode,
+                    sender_id=message.sender_id,
+                    sender_name=message.sender_name,
+                )
+            if not written:
+                _fail_started_tasks(tasks)
+                raise HTTPException(
+                    status_code=500,
+                    detail="Failed to send: agent process not running",
+                )
+        except HTTPException:
+            raise  # Re-raise our own HTTPException from write check above
+        except Exception as e:
+            _fail_started_tasks(tasks)  # Release on any preparation/send failure
+            msg = f"Failed to send: {e!s}"
+            raise HTTPException(status_code=500, detail=msg) from e
+
+    # Messages restored from a persistent inbox after a restart get their
+    # tasks back under the same IDs, so senders polling them keep working.
+    for queued in inbox.items():
+        if task_store.get(queued.task_id) is None:
+            restored = SendMessageRequest(**queued.request)
+            _create_message_task(
+                restored, _message_texts(restored)[0], task_id=queued.task_id
+            )
+
     async def _send_task_message(
         request: SendMessageRequest, priority: int = 3
     ) -> SendMessageResponse:
         """Create a task and send message to controller with optional priority."""
+        # Queue drains go to the loop that last accepted a message
+        await _bind_server_loop()
         # Extract text from message parts
-        text_content = extract_text_from_parts(request.message.parts)
+        text_content, pty_payload_text = _message_texts(request)
         if not text_content:
             raise HTTPException(status_code=400, detail="No text content in message")
 
-        file_parts = extract_file_parts(request.message.parts)
-        attachments_txt = format_file_parts_for_pty(file_parts)
-        pty_payload_text = (
-            f"{text_content}\n\n{attachments_txt}" if attachments_txt else text_content
-        )
-
         metadata = request.metadata or {}
         in_reply_to = metadata.get("in_reply_to")
 
@@ -1586,24 +1897,13 @@ def create_a2a_router(
         if not controller:
             raise HTTPException(status_code=503, detail="Agent not running")
 
-        active_task = _find_active_working_task()
-        if active_task and priority < 5:
-            raise HTTPException(
-                status_code=409,
-                detail=(
-                    "Agent already has a working task "
-                    f"({active_task.id[:8]}). Retry after it completes."
-                ),
-                headers={"Retry-After": "2"},
-            )
-
         # Readiness Gate: wait for agent initialization to complete.
-        # Priority >= 5 (emergency interrupt) bypasses the gate.
-        # Offload blocking Event.wait to a thread to avoid stalling the event loop.
-        if priority < 5 and not controller.agent_ready:
-            ready = await asyncio.to_thread(
-                controller.wait_until_ready, timeout=AGENT_READY_TIMEOUT
-            )
+        # Priority >= 5 (emergency interrupt) bypasses the gate, and so do
+        # messages that will be queued behind a working task anyway.
+        # Waiting holds no thread, so a burst of senders at a cold agent does
+        # not exhaust the default executor.
+        if priority < 5 and not controller.agent_ready and not _agent_busy():
+            ready = await controller.wait_until_ready_async(AGENT_READY_TIMEOUT)
             if not ready:
                 raise HTTPException(
                     status_code=503,
@@ -1611,91 +1911,21 @@ def create_a2a_router(
                     headers={"Retry-After": "5"},
                 )
 
-        # Create task with metadata (may include sender info)
-        task_metadata = dict(request.metadata or {})
-        task_metadata[_CONTEXT_START_METADATA_KEY] = len(controller.get_context())
-        task_metadata[_SENT_MESSAGE_METADATA_KEY] = text_content[
-            :SENT_MESSAGE_COMPARE_LEN
-        ]
-        task = task_store.create(
-            request.message, request.context_id, metadata=task_metadata
-        )
-
-        # Update to working
-        task_store.update_status(task.id, "working")
-
-        # Compound signal: mark task active to suppress premature READY (#314)
-        controller.set_task_active()
-
-        try:
-            # Update current task preview in registry (for synapse list display)
-            # Note: update_current_task handles truncation internally
-            if registry and agent_id:
-                registry.update_current_task(agent_id, text_content)
-
-            # Priority 5 = interrupt first
-            if priority >= 5:
-                controller.interrupt()
-
-            # Push sender info to reply stack for simplified reply routing
-            # Store when response_mode is "wait" or "notify" (sender expects a reply)
-            metadata = request.metadata or {}
-            response_mode = _resolve_response_mode(metadata)
-            sender_info = _extract_sender_info(request.metadata)
-            controller.record_task_received(
-                message=text_content,
-                sender=sender_info.sender_id,
-                priority=priority,
-            )
-            if (
-                response_mode in ("wait", "notify")
-                and sender_info.has_reply_target()
-                and sender_info.sender_id
-            ):
-                reply_stack = get_reply_stack()
-                reply_entry = sender_info.to_reply_stack_entry()
-                reply_entry["receiver_task_id"] = task.id
-                reply_entry["message_preview"] = text_content[:80]
-                reply_entry["received_at"] = datetime.now(timezone.utc).isoformat()
-                reply_stack.set(sender_info.sender_id, reply_entry)
-                if agent_id:
-                    try:
-                        await asyncio.to_thread(
-                            save_reply_target, agent_id, reply_entry
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to persist reply target for %s: %s", agent_id, e
-                        )
-
-            # Deliver message via transport (PTY by default, Channel in future)
-            written = (
-                transport.deliver(
-                    task.id,
-                    pty_payload_text,
-                    response_mode=response_mode,
-                    sender_id=sender_info.sender_id,
-                    sender_name=sender_info.sender_name,
-                )
-                if transport
-                else False
-            )
-            if not written:
-                controller.clear_task_active()
-                task_store.update_status(task.id, "failed")
-                _clear_terminal_task_preview()
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to send: agent process not running",
-                )
-        except HTTPException:
-            raise  # Re-raise our own HTTPException from write check above
-        except Exception as e:
-            controller.clear_task_active()  # Release on any preparation/send failure
-            task_store.update_status(task.id, "failed")
-            _clear_terminal_task_preview()
-            msg = f"Failed to send: {e!s}"
-            raise HTTPException(status_code=500, detail=msg) from e
+        coalesce = _coalescable(request, priority)
+        task, queued = _admit_task(request, text_content, priority, coalesce)
+        if coalesce:
+            _open_coalesce_window()
+        elif queued:
+            # The agent may have gone idle since the busy check; if so the
+            # queue head (not necessarily this message) starts now.
+            await _drain_inbox()
+        else:
+            try:
+                await _start_tasks([(task, request, priority)])
+            except HTTPException:
+                # The agent is still idle, so start what queued behind it
+                await _drain_inbox()
+                raise
 
         # Get updated task
         updated_task = task_store.get(task.id)
@@ -1865,8 +2095,19 @@ def create_a2a_router(
         sender's server before sending to the target agent. The task is
         created in "working" status, waiting for the reply via --reply-to.
 
+        With ``children`` (broadcast), a parent task and one child task per
+        recipient are created in one call; each recipient replies to its own
+        child and the parent finishes once every child has.
+
         Requires authentication when SYNAPSE_AUTH_ENABLED=true.
         """
+        if request.children is not None:
+            parent, children = task_store.create_with_children(
+                request.message,
+                request.metadata,
+                request.children,
+            )
+            return CreateTaskResponse(task=parent, children=children)
         task = task_store.create(
             request.message,
             metadata=request.metadata,
@@ -2238,20 +2479,63 @@ def create_a2a_router(
 
         return task
 
+    @router.get("/tasks/{task_id}/wait", response_model=Task)
+    async def wait_task(  # noqa: B008
+        task_id: str,
+        timeout: float = TASK_WAIT_MAX_TIMEOUT,
+        status: str | None = None,
+        _: Any = Depends(require_auth),
+    ) -> Task:
+        """
+        Long-poll a task until its status changes (Synapse extension).
+
+        Without ``status``, returns once the task leaves ``submitted`` /
+        ``working`` (terminal or ``input_required``). With ``status``,
+        returns as soon as the task's status differs from it. Returns the
+        current task when ``timeout`` (capped at ``TASK_WAIT_MAX_TIMEOUT``)
+        elapses first. Requires authentication when SYNAPSE_AUTH_ENABLED=true.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(max(timeout, 0.0), TASK_WAIT_MAX_TIMEOUT)
+        while True:
+            # Same view (and controller-state fallback) as GET /tasks/{id}.
+            task = await get_task(task_id, None)
+            if status is not None:
+                if task.status != status:
+                    return task
+            elif task.status not in ("submitted", "working"):
+                return task
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return task
+            await task_store.wait_for_change(
+                task_id, task.status, min(remaining, TASK_WAIT_RECHECK_INTERVAL)
+            )
+
     @router.get("/tasks", response_model=list[Task])
     async def list_tasks(  # noqa: B008
-        context_id: str | None = None, _: Any = Depends(require_auth)
+        context_id: str | None = None,
+        status: TaskState | None = None,
+        limit: int | None = Query(default=None, ge=1),
+        offset: int = Query(default=0, ge=0),
+        _: Any = Depends(require_auth),
     ) -> list[Task]:
-        """List all tasks, optionally filtered by context. Requires authentication."""
-        return task_store.list_tasks(context_id)
+        """
+        List tasks in creation order, optionally filtered by context and
+        status and paginated with ``limit`` / ``offset``.
+        Requires authentication when SYNAPSE_AUTH_ENABLED=true.
+        """
+        return task_store.list_tasks(
+            context_id, status=status, limit=limit, offset=offset
+        )
 
     @router.post("/tasks/{task_id}/cancel")
     async def cancel_task(
         task_id: str,
         mode: str = "auto",
         repeat: int = 1,
-        _: Any = Depends(require_auth),
-    ) -> dict[str, str]:  # noqa: B008
+        _: Any = Depends(require_auth),  # noqa: B008
+    ) -> dict[str, str]:
         """
         Cancel a running task.
 
@@ -2267,8 +2551,11 @@ def create_a2a_router(
                 status_code=400, detail=f"Cannot cancel task in {task.status} state"
             )
 
+        # A message still in the inbox never reached the CLI: just drop it
+        queued = inbox.remove(task_id) is not None
+
         # Interrupt the CLI
-        if controller:
+        if controller and not queued:
             resolved_mode, resolved_repeat = _resolve_interrupt_mode(
                 controller,
                 mode=mode,
@@ -2287,7 +2574,10 @@ def create_a2a_router(
                 controller.interrupt()
 
         task_store.update_status(task_id, "canceled")
-        _clear_terminal_task_preview()
+        if not queued:
+            _clear_terminal_task_preview()
+            # An idle agent gets no READY transition to start the next one
+            await _drain_inbox()
 
         # Dispatch webhook for canceled task
         _dispatch_task_event("task.canceled", {"task_id": task_id})
@@ -2304,74 +2594,172 @@ def create_a2a_router(
 
         return {"status": "canceled", "task_id": task_id}
 
+    # --------------------------------------------------------
+    # Agent inbox (Synapse extension)
+    # --------------------------------------------------------
+
+    @router.get("/inbox")
+    async def list_inbox(_: Any = Depends(require_auth)) -> dict[str, Any]:  # noqa: B008
+        """List messages queued while the agent is busy, in delivery order."""
+        now = time.time()
+        items = []
+        for position, queued in enumerate(inbox.items(), start=1):
+            message = queued.request.get("message") or {}
+            text = " ".join(
+                str(part.get("text", ""))
+                for part in message.get("parts") or []
+                if isinstance(part, dict)
+            )
+            sender = _extract_sender_info(queued.request.get("metadata"))
+            items.append(
+                {
+                    "position": position,
+                    "task_id": queued.task_id,
+                    "priority": queued.priority,
+                    "enqueued_at": datetime.fromtimestamp(
+                        queued.enqueued_at, timezone.utc
+                    ).isoformat(),
+                    "wait_seconds": round(queued.wait_seconds(now), 3),
+                    "sender_id": sender.sender_id,
+                    "preview": text[:80],
+                }
+            )
+        return {**inbox.stats(), "items": items}
+
+    @router.delete("/inbox/{task_id}")
+    async def cancel_queued_task(
+        task_id: str,
+        _: Any = Depends(require_auth),  # noqa: B008
+    ) -> dict[str, str]:
+        """Drop a queued message before it reaches the agent."""
+        if task_id not in inbox:
+            raise HTTPException(status_code=404, detail="Task is not queued")
+        return await cancel_task(task_id, _=None)
+
     # --------------------------------------------------------
     # SSE Streaming
     # --------------------------------------------------------
 
     @router.get("/tasks/{task_id}/subscribe")
     async def subscribe_to_task(  # noqa: B008
-        task_id: str, _: Any = Depends(require_auth)
+        task_id: str,
+        after: int | None = None,
+        last_event_id: str | None = Header(default=None),
+        _: Any = Depends(require_auth),
     ) -> StreamingResponse:
         """
         Subscribe to task output via Server-Sent Events.
 
         Streams CLI output in real-time until task completes.
         Event types:
-        - output: New CLI output data
+        - output: New CLI output data (``seq`` is also sent as the SSE ``id``)
         - status: Task status change
         - done: Task completed (final event)
+
+        The first output event is a snapshot of the current context unless
+        the client resumes with ``Last-Event-ID`` (or ``?after=<seq>``) and
+        the missed output is still retained, in which case only the missed
+        deltas are replayed.
         Requires authentication when SYNAPSE_AUTH_ENABLED=true.
         """
         task = task_store.get(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
 
+        resume_after = after
+        if resume_after is None and last_event_id and last_event_id.isdigit():
+            resume_after = int(last_event_id)
+
+        def output_event(data: str, seq: int, snapshot: bool = False) -> str:
+            evt: dict[str, object] = {"type": "output", "data": data, "seq": seq}
+            if snapshot:
+                evt["snapshot"] = True
+            return f"id: {seq}\ndata: {json.dumps(evt)}\n\n"
+
+        async def wait_for_activity(
+            subscription: "OutputSubscription | None", status: TaskState
+        ) -> list["OutputDelta"]:
+            """Wait for new output or a task status change."""
+            waiters: list[asyncio.Future[Any]] = [
+                asyncio.ensure_future(
+                    task_store.wait_for_change(
+                        task_id, status, TASK_WAIT_RECHECK_INTERVAL
+                    )
+                )
+            ]
+            output_waiter: asyncio.Future[list[OutputDelta]] | None = None
+            if subscription is not None:
+                output_waiter = asyncio.ensure_future(
+                    subscription.wait_async(TASK_WAIT_RECHECK_INTERVAL)
+                )
+                waiters.append(output_waiter)
+            try:
+                done, _ = await asyncio.wait(
+                    waiters, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+            if output_waiter is not None and output_waiter in done:
+                return output_waiter.result()
+            return []
+
         async def event_generator() -> "AsyncGenerator[str, None]":
-            last_len = 0
             last_status = task.status
+            subscription = None
+            if controller:
+                snapshot, subscription = controller.subscribe_output(resume_after)
+                if snapshot:
+                    yield output_event(
+                        snapshot, subscription.start_sequence, snapshot=True
+                    )
+            pending: list[OutputDelta] = []
 
-            while True:
-                current_task = task_store.get(task_id)
-                if not current_task:
-                    err = {"type": "error", "message": "Task not found"}
-                    yield f"data: {json.dumps(err)}\n\n"
-                    break
-
-                # Check for status change
-                if current_task.status != last_status:
-                    last_status = current_task.status
-                    evt = {"type": "status", "status": current_task.status}
-                    yield f"data: {json.dumps(evt)}\n\n"
-
-                # Stream new output if controller is available
-                if controller:
-                    context = controller.get_context()
-                    if len(context) > last_len:
-                        new_content = context[last_len:]
-                        last_len = len(context)
-                        evt = {"type": "output", "data": new_content}
+            try:
+                while True:
+                    current_task = task_store.get(task_id)
+                    if not current_task:
+                        err = {"type": "error", "message": "Task not found"}
+                        yield f"data: {json.dumps(err)}\n\n"
+                        break
+
+                    # Check for status change
+                    if current_task.status != last_status:
+                        last_status = current_task.status
+                        evt = {"type": "status", "status": current_task.status}
                         yield f"data: {json.dumps(evt)}\n\n"
 
-                # Check for terminal states
-                if current_task.status in ("completed", "failed", "canceled"):
-                    # Send final task state with artifacts and error
-                    final_data: dict[str, object] = {
-                        "type": "done",
-                        "status": current_task.status,
-                        "artifacts": [
-                            {"type": a.type, "data": a.data}
-                            for a in current_task.artifacts
-                        ],
-                    }
-                    if current_task.error:
-                        final_data["error"] = {
-                            "code": current_task.error.code,
-                            "message": current_task.error.message,
+                    # Stream output deltas published since the last event
+                    if subscription is not None:
+                        pending.extend(subscription.drain())
+                        for delta in pending:
+                            if delta.text:
+                                yield output_event(delta.text, delta.seq)
+                        pending = []
+
+                    # Check for terminal states
+                    if current_task.status in ("completed", "failed", "canceled"):
+                        # Send final task state with artifacts and error
+                        final_data: dict[str, object] = {
+                            "type": "done",
+                            "status": current_task.status,
+                            "artifacts": [
+                                {"type": a.type, "data": a.data}
+                                for a in current_task.artifacts
+                            ],
                         }
-                    yield f"data: {json.dumps(final_data)}\n\n"
-                    break
-
-                await asyncio.sleep(0.1)
+                        if current_task.error:
+                            final_data["error"] = {
+                                "code": current_task.error.code,
+                                "message": current_task.error.message,
+                            }
+                        yield f"data: {json.dumps(final_data)}\n\n"
+                        break
+
+                    pending = await wait_for_activity(subscription, last_status)
+            finally:
+                if subscription is not None:
+                    subscription.close()
 
         return StreamingResponse(
             event_generator(),
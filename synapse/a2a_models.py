@@ -104,16 +104,22 @@ class HistoryUpdateRequest(BaseModel):
 
 
 class CreateTaskRequest(BaseModel):
-    """Request to create a task (without sending to PTY)."""
+    """Request to create a task (without sending to PTY).
+
+    ``children`` (one metadata dict per child) makes the task a parent:
+    used by broadcast to track each recipient's reply separately.
+    """
 
     message: Message
     metadata: dict[str, Any] | None = None
+    children: list[dict[str, Any]] | None = None
 
 
 class CreateTaskResponse(BaseModel):
-    """Response with created task."""
+    """Response with created task (and its children, if requested)."""
 
     task: Task
+    children: list[Task] = []
 
 
 class AgentSkill(BaseModel):
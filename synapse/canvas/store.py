@@ -15,6 +15,7 @@ import threading
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from synapse.db import SQLiteDatabase
 from synapse.paths import get_canvas_db_path
 
 logger = logging.getLogger(__name__)
@@ -36,13 +37,19 @@ class CanvasStore:
         )
         self.card_ttl = card_ttl
         self._lock = threading.RLock()
+        self._db = SQLiteDatabase(self.db_path, row_factory=sqlite3.Row)
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's cached SQLite connection (WAL, busy timeout)."""
+        return self._db.connection()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Call at shutdown, once no other thread is using this store.
+        """
+        self._db.close()
 
     def _init_db(self) -> None:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -86,7 +93,7 @@ class CanvasStore:
                 except sqlite3.OperationalError:
                     pass  # Columns already exist
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def _now_utc(self) -> str:
         return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
@@ -173,7 +180,7 @@ class CanvasStore:
                 ).fetchone()
                 return self._row_to_dict(row)
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def upsert_card(
         self,
@@ -256,7 +263,7 @@ class CanvasStore:
                         template_data=template_data,
                     )
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def get_card(self, card_id: str) -> dict | None:
         """Retrieve a card by card_id."""
@@ -270,7 +277,7 @@ class CanvasStore:
                     return None
                 return self._row_to_dict(row)
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def list_cards(
         self,
@@ -306,7 +313,7 @@ class CanvasStore:
                 rows = conn.execute(query, params).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def delete_card(self, card_id: str, agent_id: str) -> bool:
         """Delete a card. Returns False if not found or ownership check fails."""
@@ -327,7 +334,7 @@ class CanvasStore:
                 conn.commit()
                 return True
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def clear_all(self, agent_id: str | None = None) -> int:
         """Clear all cards or cards for a specific agent. Returns count deleted."""
@@ -343,7 +350,7 @@ class CanvasStore:
                 conn.commit()
                 return cursor.rowcount
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def list_tips(self) -> list[dict]:
         """List cards tagged with 'tip'. Returns list of card dicts."""
@@ -360,7 +367,7 @@ class CanvasStore:
                 ).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def consume_tip(self, card_id: str) -> bool:
         """Delete a tip card by ID (no ownership check). Returns True if deleted."""
@@ -374,7 +381,7 @@ class CanvasStore:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def cleanup_expired(self) -> int:
         """Remove expired cards from the database. Returns count removed."""
@@ -389,7 +396,7 @@ class CanvasStore:
                 conn.commit()
                 return cursor.rowcount
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def count(self) -> int:
         """Return total number of non-expired cards."""
@@ -403,4 +410,4 @@ class CanvasStore:
                 ).fetchone()
                 return int(row[0])
             finally:
-                conn.close()
+                self._db.release(conn)
@@ -2317,7 +2317,8 @@ def cmd_run_interactive(
 
     # Create registry and agent ID before settings/bootstrap work so we can
     # switch to file logging before any startup warnings are emitted.
-    registry = AgentRegistry()
+    # Status churn from the controller is coalesced via write-behind.
+    registry = AgentRegistry(write_behind=True)
     agent_id = registry.get_agent_id(profile, port)
 
     # Reconfigure logging for interactive agent startup: suppress stderr
@@ -3968,22 +3969,38 @@ History is enabled by default (v0.3.13+). To disable: SYNAPSE_HISTORY_ENABLED=fa
     p_hist_stats.add_argument(
         "--agent", "-a", help="Show statistics for specific agent only"
     )
+    p_hist_stats.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute statistics rollups from all task history first",
+    )
     p_hist_stats.set_defaults(func=cmd_history_stats)
 
     # history export
     p_hist_export = history_subparsers.add_parser(
-        "export", help="Export task history to JSON or CSV"
+        "export", help="Export task history to JSON, JSON Lines or CSV"
     )
     p_hist_export.add_argument(
         "--format",
         "-f",
-        choices=["json", "csv"],
+        choices=["json", "jsonl", "csv"],
         default="json",
         help="Export format (default: json)",
     )
     p_hist_export.add_argument(
         "--agent", "-a", help="Export only observations from specific agent"
     )
+    p_hist_export.add_argument(
+        "--status", help="Export only observations with this status"
+    )
+    p_hist_export.add_argument(
+        "--since",
+        help="Export observations at or after this time (YYYY-MM-DD[ HH:MM:SS])",
+    )
+    p_hist_export.add_argument(
+        "--until",
+        help="Export observations before this time (YYYY-MM-DD[ HH:MM:SS])",
+    )
     p_hist_export.add_argument(
         "--limit",
         "-n",
@@ -3993,7 +4010,13 @@ History is enabled by default (v0.3.13+). To disable: SYNAPSE_HISTORY_ENABLED=fa
     p_hist_export.add_argument(
         "--output",
         "-o",
-        help="Output file path (default: stdout)",
+        help="Output file path (default: stdout); a .gz suffix compresses",
+    )
+    p_hist_export.add_argument(
+        "--gzip",
+        "-z",
+        action="store_true",
+        help="Gzip-compress the export",
     )
     p_hist_export.set_defaults(func=cmd_history_export)
 
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import gzip
 import json
 import os
 import sqlite3
 import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 HISTORY_DISABLED_MSG = "History is disabled. Enable with: SYNAPSE_HISTORY_ENABLED=true"
 
@@ -330,6 +333,12 @@ def cmd_history_stats(args: argparse.Namespace) -> None:
         print(HISTORY_DISABLED_MSG)
         return
 
+    if getattr(args, "rebuild", False):
+        if manager.rebuild_statistics():
+            print("Rebuilt statistics rollups from task history.")
+        else:
+            print("Statistics rollups are unavailable; computing from full history.")
+
     stats = manager.get_statistics(agent_name=args.agent if args.agent else None)
 
     if not stats or stats["total_tasks"] == 0:
@@ -407,8 +416,27 @@ def cmd_history_stats(args: argparse.Namespace) -> None:
         print(f"(Filtered by agent: {args.agent})")
 
 
+@contextlib.contextmanager
+def _open_export_stream(output: str | None, compress: bool) -> Iterator[TextIO]:
+    """Open the export destination (file or stdout) as a text stream."""
+    if output:
+        if compress:
+            with gzip.open(output, "wt", encoding="utf-8", newline="") as f:
+                yield f
+        else:
+            with open(output, "w", encoding="utf-8", newline="") as f:
+                yield f
+    elif compress:
+        with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="") as f:
+            yield f
+    else:
+        yield sys.stdout
+
+
 def cmd_history_export(args: argparse.Namespace) -> None:
-    """Export task history in specified format."""
+    """Export task history in specified format, streaming rows as they are read."""
+    from synapse.history import EXPORT_FORMATS
+
     manager = _get_history_manager()
 
     if not manager.enabled:
@@ -416,23 +444,33 @@ def cmd_history_export(args: argparse.Namespace) -> None:
         return
 
     export_format = args.format.lower()
-    if export_format not in ("json", "csv"):
-        print(f"Error: Invalid format '{export_format}'. Use 'json' or 'csv'.")
+    if export_format not in EXPORT_FORMATS:
+        print(
+            f"Error: Invalid format '{export_format}'. "
+            f"Use {', '.join(repr(f) for f in EXPORT_FORMATS)}."
+        )
         sys.exit(1)
 
-    exported_data = manager.export_observations(
-        format=export_format,
-        agent_name=args.agent if args.agent else None,
-        limit=args.limit if args.limit else None,
-    )
+    compress = bool(getattr(args, "gzip", False)) or (args.output or "").endswith(".gz")
+    try:
+        with _open_export_stream(args.output, compress) as out:
+            count = manager.write_export(
+                out,
+                format=export_format,
+                agent_name=args.agent if args.agent else None,
+                limit=args.limit if args.limit else None,
+                status=getattr(args, "status", None),
+                since=getattr(args, "since", None),
+                until=getattr(args, "until", None),
+            )
+            if export_format == "json" and out is sys.stdout:
+                out.write("\n")
+    except OSError as e:
+        print(f"Error writing to file: {e}", file=sys.stderr)
+        sys.exit(1)
+    except sqlite3.Error as e:
+        print(f"Error reading history: {e}", file=sys.stderr)
+        sys.exit(1)
 
     if args.output:
-        try:
-            with open(args.output, "w") as f:
-                f.write(exported_data)
-            print(f"Exported to {args.output}")
-        except OSError as e:
-            print(f"Error writing to file: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        print(exported_data)
+        print(f"Exported {count} observations to {args.output}")
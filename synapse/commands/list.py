@@ -90,6 +90,10 @@ class ListCommand:
         agents = registry.list_agents()
         file_safety = FileSafetyManager.from_env()
         show_file_safety = file_safety.enabled
+        # One query for every agent's locks instead of one or two per agent.
+        locks_by_holder: dict[str, Any] = (
+            file_safety.locks_by_holder() if show_file_safety else {}
+        )
 
         # Reuse the agents snapshot for orphan detection + opportunistic
         # cleanup so `synapse list` walks the registry directory once
@@ -151,13 +155,9 @@ class ListCommand:
 
             if show_file_safety:
                 # Try PID first, then fall back to agent_id for CLI-acquired locks
-                locks = (
-                    file_safety.list_locks(pid=pid, include_stale=False) if pid else []
-                )
+                locks = locks_by_holder["by_pid"].get(pid, []) if pid else []
                 if not locks and agent_id:
-                    locks = file_safety.list_locks(
-                        agent_name=agent_id, include_stale=False
-                    )
+                    locks = locks_by_holder["by_agent"].get(agent_id, [])
                 first_lock_path = locks[0].get("file_path") if locks else None
                 agent_data["editing_file"] = (
                     os.path.basename(first_lock_path) if first_lock_path else "-"
@@ -179,7 +179,7 @@ class ListCommand:
         # Get stale locks
         stale_locks: list[dict[str, Any]] = []
         if show_file_safety:
-            stale_locks = file_safety.get_stale_locks()
+            stale_locks = locks_by_holder["stale"]
 
         return agents_list, stale_locks, show_file_safety
 
@@ -635,19 +635,23 @@ def _workflow_background_worker(
             raise WorkflowError(f"Workflow '{workflow_name}' not found.")
 
         async def _run() -> None:
+            from synapse import http_pool
             from synapse.workflow_runner import get_run, run_workflow
 
-            run_id = await run_workflow(
-                wf,
-                continue_on_error=continue_on_error,
-                sender_info=sender_info,
-            )
-            conn.send(("ok", run_id))
-            while True:
-                run = get_run(run_id)
-                if run is None or run.status != "running":
-                    return
-                await asyncio.sleep(0.1)
+            try:
+                run_id = await run_workflow(
+                    wf,
+                    continue_on_error=continue_on_error,
+                    sender_info=sender_info,
+                )
+                conn.send(("ok", run_id))
+                while True:
+                    run = get_run(run_id)
+                    if run is None or run.status != "running":
+                        return
+                    await asyncio.sleep(0.1)
+            finally:
+                await http_pool.aclose_async_clients()
 
         asyncio.run(_run())
     except (
@@ -40,6 +40,14 @@ AGENT_READY_TIMEOUT: int = 30
 # Poll interval when waiting for task completion
 TASK_POLL_INTERVAL: float = 1.0
 
+# Upper bound for a single GET /tasks/{id}/wait long-poll; clients waiting
+# longer simply re-issue the request.
+TASK_WAIT_MAX_TIMEOUT: float = 30.0
+
+# While a long-poll is parked, re-run the GET /tasks/{id} controller check
+# at this interval in case a status callback was missed.
+TASK_WAIT_RECHECK_INTERVAL: float = 1.0
+
 # ============================================================
 # Buffer Size Constants
 # ============================================================
@@ -55,12 +63,148 @@ IDLE_CHECK_WINDOW: int = 10000
 # Maximum bytes for a single PTY write (macOS/Linux kernel buffer size)
 PTY_WRITE_MAX: int = 4096
 
+# Adaptive PTY read sizes: reads start at PTY_READ_MIN and double on every
+# read while output keeps arriving, up to PTY_READ_MAX.
+PTY_READ_MIN: int = 1024
+PTY_READ_MAX: int = 65536
+
+# Upper bound on bytes drained from the PTY before the idle/WAITING
+# evaluation runs, so status updates stay timely during long bursts.
+PTY_READ_BATCH_MAX: int = 262144
+
 # Recent context size for error detection and artifact generation
 CONTEXT_RECENT_SIZE: int = 3000
 
 # Context size for API response
 API_RESPONSE_CONTEXT_SIZE: int = 2000
 
+# Characters of recent PTY output deltas kept for stream subscribers that
+# reconnect with a sequence number (SSE Last-Event-ID / gRPC from_sequence).
+OUTPUT_STREAM_HISTORY_CHARS: int = 65536
+
+# Per-subscriber queue of pending output deltas; a subscriber that falls
+# further behind loses its oldest deltas (visible as a sequence gap).
+OUTPUT_STREAM_QUEUE_MAX: int = 256
+
+# ============================================================
+# Registry Constants
+# ============================================================
+
+# Coalescing window for write-behind registry updates of volatile fields
+# (status, transport, task preview, summary). Updates queued within this
+# window are applied to the agent's registry file in a single write.
+REGISTRY_WRITE_BEHIND_DELAY: float = 0.05
+
+# Registry writers bump the index generation, so readers skip the directory
+# scan while it is unchanged. They still rescan at least this often to pick
+# up registry files edited outside AgentRegistry.
+REGISTRY_INDEX_RESCAN_INTERVAL: float = 1.0
+
+# ============================================================
+# Broadcast Constants
+# ============================================================
+
+# Max recipients `synapse broadcast` probes and sends to concurrently
+BROADCAST_MAX_WORKERS: int = 16
+
+# ============================================================
+# Task Store Constants
+# ============================================================
+
+# Seconds a finished (completed/failed/canceled) task stays in memory
+TASK_STORE_FINISHED_TTL: float = 3600.0
+
+# Max finished tasks kept in memory; the oldest are evicted first
+TASK_STORE_MAX_FINISHED: int = 1000
+
+# ============================================================
+# Agent Inbox Constants
+# ============================================================
+
+# Max messages queued for a busy agent; beyond this /tasks/send answers
+# 409 with Retry-After as it did before the inbox existed
+AGENT_INBOX_MAX_DEPTH: int = 200
+
+# Notify/silent messages arriving within this many milliseconds are merged
+# into one PTY injection (one agent turn). 0 disables coalescing; the
+# server reads SYNAPSE_A2A_COALESCE_MS
+A2A_COALESCE_WINDOW_MS: int = 0
+
+# Max messages merged into one coalesced injection
+A2A_COALESCE_MAX_MESSAGES: int = 10
+
+# ============================================================
+# Webhook Delivery Constants
+# ============================================================
+
+# Max webhook deliveries pending at once (queued, in flight or waiting
+# for a retry); events beyond this are dropped with a warning
+WEBHOOK_MAX_PENDING: int = 1000
+
+# Max concurrent requests to one webhook URL
+WEBHOOK_MAX_PER_URL: int = 4
+
+# Seconds before each retry of a failed delivery (the last one repeats)
+WEBHOOK_RETRY_DELAYS: tuple[float, ...] = (1.0, 2.0, 4.0)
+
+# Delivery records kept for GET /webhooks/deliveries
+WEBHOOK_MAX_RECORDED_DELIVERIES: int = 100
+
+# ============================================================
+# SQLite Constants
+# ============================================================
+
+# Seconds a connection waits on a locked database before raising
+# "database is locked" (SQLite busy timeout)
+SQLITE_BUSY_TIMEOUT: float = 10.0
+
+# Compiled statements cached per connection (sqlite3 default: 128)
+SQLITE_STATEMENT_CACHE_SIZE: int = 256
+
+# With query timing enabled, statements slower than this are logged
+SQLITE_SLOW_QUERY_MS: float = 100.0
+
+# ============================================================
+# History Constants
+# ============================================================
+
+# Coalescing window for write-behind history saves. Observations saved
+# within this window are inserted in a single transaction (group commit).
+HISTORY_WRITE_BEHIND_DELAY: float = 0.05
+
+# Queued write-behind saves that make the saving thread commit the batch
+# itself instead of waiting for the background writer
+HISTORY_WRITE_BEHIND_MAX_PENDING: int = 1000
+
+# Failed write-behind commits retried (the delay doubles each time) before
+# the queued saves are dropped and logged
+HISTORY_WRITE_BEHIND_MAX_RETRIES: int = 8
+
+# SQLite page cache per cached history connection, in KiB
+HISTORY_CACHE_SIZE_KB: int = 8192
+
+# Rows fetched per round trip when streaming a history export
+HISTORY_EXPORT_CHUNK_SIZE: int = 500
+
+# ============================================================
+# File Safety Constants
+# ============================================================
+
+# Seconds between background sweeps that delete expired file locks and
+# locks held by processes that are no longer running
+FILE_SAFETY_SWEEP_INTERVAL: float = 30.0
+
+# Coalescing window for the journaled modification log. Modifications
+# recorded within this window are inserted in a single transaction.
+FILE_SAFETY_JOURNAL_DELAY: float = 0.05
+
+# Queued modifications that wake the journal writer before the window ends
+FILE_SAFETY_JOURNAL_MAX_PENDING: int = 1000
+
+# Failed journal commits retried (the delay doubles each time) before the
+# queued modifications are dropped and logged
+FILE_SAFETY_JOURNAL_MAX_RETRIES: int = 8
+
 # ============================================================
 # Compound Signal Constants
 # ============================================================
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import codecs
 import contextlib
 import fcntl
@@ -8,7 +9,7 @@ import math
 import os
 import pty
 import re
-import select
+import selectors
 import shlex
 import shutil
 import signal
@@ -33,6 +34,9 @@ from synapse.config import (
     IDLE_CHECK_WINDOW,
     OUTPUT_BUFFER_MAX,
     POST_WRITE_IDLE_DELAY,
+    PTY_READ_BATCH_MAX,
+    PTY_READ_MAX,
+    PTY_READ_MIN,
     STARTUP_DELAY,
     TASK_PROTECTION_TIMEOUT,
     WRITE_PROCESSING_DELAY,
@@ -42,6 +46,7 @@ from synapse.idle_detector import IdleDetector
 from synapse.learnings import format_project_learnings_section
 from synapse.long_message import format_file_reference, get_long_message_store
 from synapse.mcp.server import MCP_INSTRUCTIONS_DEFAULT_URI
+from synapse.output_broadcast import OutputBroadcaster, OutputSubscription
 from synapse.pty_renderer import PtyRenderer
 from synapse.registry import AgentRegistry
 from synapse.settings import get_settings
@@ -106,6 +111,207 @@ def strip_ansi(text: str) -> str:
     return text
 
 
+_RENDER_CONTROL_RE = re.compile(r"[\r\n\b]")
+# Control characters a terminal would not print (everything but \t and \n).
+_NONPRINTING_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+
+def render_delta(text: str) -> str:
+    """Render one chunk of PTY output for stream subscribers.
+
+    Strips ANSI sequences, then applies carriage returns and backspaces
+    within the chunk the way the terminal would (a bare ``\r`` drops the
+    text before it on that line) and removes other control characters.
+    An overwrite that spans two chunks cannot be undone here; the
+    already-sent text stays.
+    """
+    text = strip_ansi(text)
+    if "\r" not in text and "\b" not in text:
+        return _NONPRINTING_RE.sub("", text)
+    lines = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        # A trailing \r has not overwritten anything yet.
+        line = line.rstrip("\r").rsplit("\r", 1)[-1]
+        if "\b" in line:
+            chars: list[str] = []
+            for ch in line:
+                if ch != "\b":
+                    chars.append(ch)
+                elif chars:
+                    chars.pop()
+            line = "".join(chars)
+        lines.append(line)
+    return _NONPRINTING_RE.sub("", "\n".join(lines))
+
+
+# An escape sequence cut off at the end of a PTY read: a lone ESC, a CSI
+# still missing its final byte, an unterminated OSC or a charset prefix.
+_INCOMPLETE_ESCAPE_RE = re.compile(r"\x1b(?:\[[?]?[0-9;]*|\][^\x07\x1b]*|[()])?\Z")
+_ESCAPE_CARRY_MAX = 256
+
+
+def _split_incomplete_escape(text: str) -> tuple[str, str]:
+    """Split *text* into a publishable head and a trailing partial escape
+    sequence to prepend to the next chunk."""
+    match = _INCOMPLETE_ESCAPE_RE.search(text, max(0, len(text) - _ESCAPE_CARRY_MAX))
+    if match is None:
+        return text, ""
+    return text[: match.start()], text[match.start() :]
+
+
+class _ByteRing:
+    """Fixed-capacity byte buffer that keeps the most recent *capacity* bytes.
+
+    Backed by a ``bytearray`` twice the capacity. Appends write at the
+    tail index; when the tail reaches the end of the backing store the
+    live window is compacted to the front, so appends are amortized O(1)
+    per byte regardless of how full the buffer is. The live window is
+    always contiguous, which lets ``tail()`` hand out zero-copy views.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_tail")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._buf = bytearray(capacity * 2)
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def append(self, data: bytes) -> None:
+        size = len(data)
+        if not size:
+            return
+        capacity = self._capacity
+        if size >= capacity:
+            self._buf[:capacity] = data[-capacity:]
+            self._head, self._tail = 0, capacity
+            return
+        if self._tail + size > len(self._buf):
+            keep = min(self._tail - self._head, capacity - size)
+            self._buf[:keep] = self._buf[self._tail - keep : self._tail]
+            self._head, self._tail = 0, keep
+        self._buf[self._tail : self._tail + size] = data
+        self._tail += size
+        if self._tail - self._head > capacity:
+            self._head = self._tail - capacity
+
+    def tail(self, size: int | None = None) -> memoryview:
+        """Return a view of the last *size* bytes (all bytes if ``None``).
+
+        The view aliases the backing store and is only valid until the
+        next ``append``; callers must hold the owner's lock while using it.
+        """
+        start = self._head if size is None else max(self._head, self._tail - size)
+        return memoryview(self._buf)[start : self._tail]
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buf[self._head : self._tail])
+
+    def clear(self) -> None:
+        self._head = self._tail = 0
+
+
+class _RenderBuffer:
+    """Line-editing model of PTY text backing ``get_context()``.
+
+    Completed lines are UTF-8 encoded into a ``_ByteRing``; only the line
+    under the cursor is kept as a mutable list of characters so bare
+    ``\r`` (clear line) and ``\b`` (cursor left) can rewrite it in place.
+    At most *capacity* characters are returned by ``getvalue()``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        # UTF-8 needs up to 4 bytes per character.
+        self._lines = _ByteRing(capacity * 4)
+        self._line: list[str] = []
+        self._cursor = 0
+        self.pending_cr = False
+        # UTF-8 bytes of completed lines so far; never decreases, even when
+        # the ring trims old lines
+        self.committed = 0
+
+    def feed(self, text: str) -> None:
+        """Apply decoded PTY text, normalizing carriage returns."""
+        # If a \r was deferred from the previous chunk, resolve it now.
+        if self.pending_cr:
+            self.pending_cr = False
+            # CRLF split across chunks — \n is handled normally below.
+            if not text.startswith("\n"):
+                self.carriage_return()
+
+        pos = 0
+        for match in _RENDER_CONTROL_RE.finditer(text):
+            idx = match.start()
+            self._put(text[pos:idx])
+            pos = idx + 1
+            ch = text[idx]
+            if ch == "\n":
+                # Commit everything left of the cursor; the character
+                # under the cursor is overwritten by the newline.
+                committed = ("".join(self._line[: self._cursor]) + "\n").encode()
+                self._lines.append(committed)
+                self.committed += len(committed)
+                del self._line[: self._cursor + 1]
+                self._cursor = 0
+            elif ch == "\b":
+                if self._cursor > 0:
+                    self._cursor -= 1
+            elif idx + 1 == len(text):
+                # \r at end of chunk — defer until next chunk
+                self.pending_cr = True
+            elif text[idx + 1] != "\n":
+                # Bare \r: clear current line to prevent stale text
+                self.carriage_return()
+        self._put(text[pos:])
+
+        # Keep a very long unterminated line bounded (amortized).
+        if len(self._line) > self._capacity * 2:
+            excess = len(self._line) - self._capacity
+            del self._line[:excess]
+            self._cursor = max(0, self._cursor - excess)
+
+    def _put(self, run: str) -> None:
+        if run:
+            end = self._cursor + len(run)
+            self._line[self._cursor : end] = run
+            self._cursor = end
+
+    def carriage_return(self) -> None:
+        """Clear the current line content for a bare carriage return."""
+        self._line.clear()
+        self._cursor = 0
+
+    def getvalue(self) -> str:
+        text = self._decode(self._lines.tail()) + "".join(self._line)
+        if len(text) > self._capacity:
+            text = text[-self._capacity :]
+        return text
+
+    def since(self, offset: int) -> str | None:
+        """Text output after *offset* (an earlier ``committed`` value).
+
+        None once any of it has been trimmed, i.e. when ``getvalue()`` no
+        longer holds all of it.
+        """
+        if not 0 <= self.committed - offset <= len(self._lines):
+            return None
+        text = self._decode(self._lines.tail(self.committed - offset))
+        text += "".join(self._line)
+        return text if len(text) <= self._capacity else None
+
+    @staticmethod
+    def _decode(raw: memoryview) -> str:
+        # Skip a UTF-8 sequence cut in half by the ring trimming its head.
+        start = 0
+        while start < len(raw) and raw[start] & 0xC0 == 0x80:
+            start += 1
+        return str(raw[start:], "utf-8", "replace")
+
+
 class TerminalController(StatusObserverMixin):
     def __init__(
         self,
@@ -204,13 +410,13 @@ class TerminalController(StatusObserverMixin):
         self.master_fd: int | None = None
         self.slave_fd: int | None = None
         self.process: subprocess.Popen[bytes] | None = None
-        self.output_buffer = b""
-        self._render_buffer: list[str] = []
-        self._render_cursor = 0
-        self._render_line_start = 0
-        self._pending_cr = False
         self._max_buffer = OUTPUT_BUFFER_MAX
+        self._output = _ByteRing(self._max_buffer)
+        self._render_buffer = _RenderBuffer(self._max_buffer)
         self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        # Output deltas for SSE/gRPC stream subscribers (rendered lazily).
+        self.output_broadcaster = OutputBroadcaster(transform=render_delta)
+        self._stream_carry = ""
         self.status = PROCESSING
         self.lock = threading.Lock()
         self._write_lock = threading.RLock()
@@ -225,6 +431,11 @@ class TerminalController(StatusObserverMixin):
         self._identity_sending = False
         self._agent_ready = False
         self._agent_ready_event = threading.Event()
+        # Events of coroutines awaiting readiness, set via their owning loop
+        self._ready_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = (
+            set()
+        )
+        self._ready_lock = threading.Lock()
         self._submit_seq = submit_seq or "\n"
         self._startup_delay = startup_delay or STARTUP_DELAY
         self._last_output_time: float | None = (
@@ -568,57 +779,111 @@ class TerminalController(StatusObserverMixin):
             self._last_output_time = time.time()
 
     def _monitor_output(self) -> None:
-        """Monitor and process output from the controlled process PTY."""
+        """Monitor and process output from the controlled process PTY.
+
+        Waits on the PTY with a selector, drains everything readable into
+        one batch and runs the append/idle/KKP pipeline once per batch
+        rather than once per fixed-size read.
+        """
         try:
             if self.master_fd is None or self.process is None:
                 return
-            while self.running and self.process.poll() is None:
-                r, _, _ = select.select([self.master_fd], [], [], 0.1)
-                if self.master_fd in r:
-                    try:
-                        data = os.read(self.master_fd, 1024)
-                        if not data:
-                            break
-
-                        self._append_output(data)
-
-                        self._check_idle_state(data)
-
-                        # Detect and disable Kitty Keyboard Protocol.
-                        # Copilot CLI enables KKP on startup which changes
-                        # how Enter is encoded, causing our \r to be ignored.
-                        # Always check — Copilot can re-push KKP after we
-                        # pop it (e.g. after processing a prompt).
-                        if self.agent_type == "copilot" and _KKP_ENABLE_RE.search(data):
-                            self._disable_kkp(
-                                "re-disabled via pop"
-                                if self._kkp_disabled
-                                else "disabled via pop",
-                                force=True,
-                            )
-                            # Ink may also re-enable ICRNL when it re-pushes
-                            # KKP, so reset the cache so the next submit
-                            # re-checks termios.
-                            self._icrnl_cleared = False
-
-                        # Debug logging for PTY output analysis
-                        # Enable with SYNAPSE_DEBUG_PTY=1 to see raw PTY output
-                        if os.environ.get("SYNAPSE_DEBUG_PTY"):
-                            text = data.decode("utf-8", errors="replace")
-                            self._log_pty_output(data, text)
-
-                    except OSError:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.master_fd, selectors.EVENT_READ)
+                read_size = PTY_READ_MIN
+                while self.running and self.process.poll() is None:
+                    if not selector.select(timeout=0.1):
+                        # Periodically check idle state (timeout-based detection)
+                        self._check_idle_state(b"")
+                        continue
+                    data, read_size, eof = self._drain_pty(
+                        self.master_fd, selector, read_size
+                    )
+                    if data:
+                        self._process_output(data)
+                    if eof:
                         break
-                else:
-                    # Periodically check idle state (timeout-based detection)
-                    self._check_idle_state(b"")
         except Exception as e:
             err = f"{type(e).__name__}: {e}"
             logger.error(f"Error in _monitor_output for {self.agent_id}: {err}")
 
+    def _drain_pty(
+        self, fd: int, selector: selectors.BaseSelector, read_size: int
+    ) -> tuple[bytes, int, bool]:
+        """Read everything currently available on *fd*.
+
+        The read size doubles after each read while the fd stays readable
+        (more output is queued) and falls back to ``PTY_READ_MIN`` once the
+        fd is drained by a short read. A short read alone does not end the
+        batch: Linux PTYs return at most 4095 bytes per read however large
+        the buffer. Draining stops when the fd is no longer readable or
+        after ``PTY_READ_BATCH_MAX`` bytes.
+
+        Returns:
+            ``(data, next_read_size, eof)`` where *eof* is True when the
+            PTY reported end-of-file or a read error.
+        """
+        chunks: list[bytes] = []
+        total = 0
+        while True:
+            try:
+                chunk = os.read(fd, read_size)
+            except OSError:
+                return b"".join(chunks), read_size, True
+            if not chunk:
+                return b"".join(chunks), read_size, True
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= PTY_READ_BATCH_MAX:
+                break
+            if not selector.select(timeout=0):
+                if len(chunk) < read_size:
+                    read_size = PTY_READ_MIN
+                break
+            read_size = min(read_size * 2, PTY_READ_MAX)
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        return data, read_size, False
+
+    def _process_output(self, data: bytes) -> None:
+        """Run one batch of PTY output through buffers and status detection."""
+        self._append_output(data)
+
+        self._check_idle_state(data)
+
+        # Detect and disable Kitty Keyboard Protocol.
+        # Copilot CLI enables KKP on startup which changes
+        # how Enter is encoded, causing our \r to be ignored.
+        # Always check — Copilot can re-push KKP after we
+        # pop it (e.g. after processing a prompt).
+        if self.agent_type == "copilot" and _KKP_ENABLE_RE.search(data):
+            self._disable_kkp(
+                "re-disabled via pop" if self._kkp_disabled else "disabled via pop",
+                force=True,
+            )
+            # Ink may also re-enable ICRNL when it re-pushes
+            # KKP, so reset the cache so the next submit
+            # re-checks termios.
+            self._icrnl_cleared = False
+
+        # Debug logging for PTY output analysis
+        # Enable with SYNAPSE_DEBUG_PTY=1 to see raw PTY output
+        if os.environ.get("SYNAPSE_DEBUG_PTY"):
+            text = data.decode("utf-8", errors="replace")
+            self._log_pty_output(data, text)
+
+    @property
+    def output_buffer(self) -> bytes:
+        """Most recent raw PTY output (at most ``OUTPUT_BUFFER_MAX`` bytes)."""
+        return self._output.getvalue()
+
+    @output_buffer.setter
+    def output_buffer(self, data: bytes) -> None:
+        self._output.clear()
+        self._output.append(data)
+
     def _check_pattern_idle(self) -> bool:
         """Check for pattern-based idle detection. Must be called with lock held."""
-        search_window = self.output_buffer[-IDLE_CHECK_WINDOW:]
+        search_window = self._output.tail(IDLE_CHECK_WINDOW)
         if self._idle_detector.check_pattern_idle(
             search_window, self._pattern_detected
         ):
@@ -682,7 +947,7 @@ class TerminalController(StatusObserverMixin):
             waiting_source,
         ) = self._idle_detector.check_waiting_state(
             new_data=new_data,
-            output_buffer=self.output_buffer,
+            output_buffer=self._output.tail(IDLE_CHECK_WINDOW),
             last_output_time=self._last_output_time,
             waiting_pattern_time=self._waiting_pattern_time,
         )
@@ -700,7 +965,7 @@ class TerminalController(StatusObserverMixin):
             try:
                 evaluation = self._idle_detector.check_idle_state(
                     new_data=new_data,
-                    output_buffer=self.output_buffer[-IDLE_CHECK_WINDOW:],
+                    output_buffer=self._output.tail(IDLE_CHECK_WINDOW),
                     last_output_time=self._last_output_time,
                     pattern_detected=self._pattern_detected,
                     waiting_pattern_time=self._waiting_pattern_time,
@@ -776,8 +1041,13 @@ class TerminalController(StatusObserverMixin):
 
     def _mark_agent_ready(self) -> None:
         """Signal that agent initialization is complete and ready for tasks."""
-        self._agent_ready = True
-        self._agent_ready_event.set()
+        with self._ready_lock:
+            self._agent_ready = True
+            self._agent_ready_event.set()
+            waiters, self._ready_waiters = self._ready_waiters, set()
+        for loop, event in waiters:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(event.set)
         # Non-blocking session_id detection after readiness gate opens
         if self.agent_id and self.agent_type:
             threading.Thread(
@@ -821,6 +1091,34 @@ class TerminalController(StatusObserverMixin):
         """
         return self._agent_ready_event.wait(timeout=timeout)
 
+    async def wait_until_ready_async(self, timeout: float) -> bool:
+        """Await readiness without parking a thread (for the server loop).
+
+        Any number of request handlers can wait at once; each holds only an
+        asyncio.Event that :meth:`_mark_agent_ready` sets via its loop.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if agent became ready, False if timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._ready_lock:
+            if self._agent_ready:
+                return True
+            self._ready_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._ready_lock:
+                self._ready_waiters.discard(waiter)
+        return self._agent_ready
+
     def _log_inject(self, category: str, msg: str) -> None:
         """Emit a structured injection observability log line.
 
@@ -858,7 +1156,7 @@ class TerminalController(StatusObserverMixin):
             waited += interval
 
             with self.lock:
-                recent_output = self.output_buffer[-2000:]
+                recent_output = bytes(self._output.tail(2000))
 
             if pattern_bytes in recent_output:
                 logger.info(
@@ -1257,12 +1555,58 @@ class TerminalController(StatusObserverMixin):
     def get_context(self) -> str:
         """Get the current output context from the controlled process."""
         with self.lock:
-            if self._pending_cr:
-                self._apply_bare_cr()
-                self._pending_cr = False
-            raw = "".join(self._render_buffer)
+            raw = self._render_context_locked()
         return strip_ansi(raw)
 
+    @property
+    def output_offset(self) -> int:
+        """Marker of the start of the current output line (only ever increases).
+
+        An O(1) count of committed output bytes. Pass it to
+        :meth:`output_since` later to get the text produced from there on,
+        without rendering the whole context now. The marker sits at a line
+        start because the current line can still be rewritten by ``\r``.
+        """
+        return self._render_buffer.committed
+
+    def output_since(self, offset: int) -> str | None:
+        """Output from *offset* (from :attr:`output_offset`) to the end.
+
+        Returns the matching tail of ``get_context()`` exactly, or None if
+        part of it has already been trimmed from the context.
+        """
+        with self.lock:
+            self._settle_pending_cr_locked()
+            raw = self._render_buffer.since(offset)
+        return None if raw is None else strip_ansi(raw)
+
+    def _settle_pending_cr_locked(self) -> None:
+        if self._render_buffer.pending_cr:
+            self._render_buffer.carriage_return()
+            self._render_buffer.pending_cr = False
+
+    def _render_context_locked(self) -> str:
+        self._settle_pending_cr_locked()
+        return self._render_buffer.getvalue()
+
+    def subscribe_output(
+        self, after: int | None = None
+    ) -> tuple[str | None, OutputSubscription]:
+        """Subscribe to PTY output deltas.
+
+        Resumes right after sequence *after* when every later delta is still
+        retained; the snapshot is then None. Otherwise (or without *after*)
+        the current ``get_context()`` text is returned as a snapshot, taken
+        atomically with the subscription so deltas continue from it without
+        gaps or overlap.
+        """
+        with self.lock:
+            subscription = self.output_broadcaster.subscribe(after)
+            if subscription.resumed:
+                return None, subscription
+            raw = self._render_context_locked()
+        return strip_ansi(raw), subscription
+
     @property
     def renderer_available(self) -> bool:
         """Return whether the pyte PTY renderer initialized successfully."""
@@ -1448,7 +1792,9 @@ class TerminalController(StatusObserverMixin):
                     # ttyname may fail if fd is not a TTY
                     pass
 
-            data = os.read(fd, 1024)
+            # A single read returns whatever is queued, so a large size
+            # lets pty._copy hand over bursts in one callback.
+            data = os.read(fd, PTY_READ_MAX)
             if data:
                 # Update last output time for idle detection
                 with self.lock:
@@ -1575,74 +1921,12 @@ class TerminalController(StatusObserverMixin):
         with self.lock:
             # Update last output time for idle detection
             self._last_output_time = time.time()
-
-            self.output_buffer += data
-            if len(self.output_buffer) > self._max_buffer:
-                self.output_buffer = self.output_buffer[-self._max_buffer :]
-
-            # If a \r was deferred from the previous chunk, resolve it now.
-            if self._pending_cr:
-                self._pending_cr = False
-                if text and text[0] == "\n":
-                    # It was CRLF split across chunks — skip the \r,
-                    # \n will be handled normally below.
-                    pass
-                else:
-                    # Bare \r confirmed — clear current line.
-                    self._apply_bare_cr()
-
-            for idx, ch in enumerate(text):
-                if ch == "\r":
-                    if idx + 1 < len(text):
-                        # If followed by \n (CRLF), skip — \n handles the newline
-                        if text[idx + 1] == "\n":
-                            pass
-                        else:
-                            # Bare \r: clear current line to prevent stale text
-                            self._apply_bare_cr()
-                    else:
-                        # \r at end of chunk — defer until next chunk
-                        self._pending_cr = True
-                    continue
-                if ch == "\b":
-                    if self._render_cursor > self._render_line_start:
-                        self._render_cursor -= 1
-                    continue
-
-                if self._render_cursor == len(self._render_buffer):
-                    self._render_buffer.append(ch)
-                else:
-                    self._render_buffer[self._render_cursor] = ch
-                self._render_cursor += 1
-
-                if ch == "\n":
-                    self._render_line_start = self._render_cursor
-
-            if len(self._render_buffer) > self._max_buffer:
-                remove = len(self._render_buffer) - self._max_buffer
-                del self._render_buffer[:remove]
-                self._render_cursor = max(0, self._render_cursor - remove)
-                if self._render_cursor > len(self._render_buffer):
-                    self._render_cursor = len(self._render_buffer)
-
-                self._render_line_start = 0
-                for i in range(self._render_cursor - 1, -1, -1):
-                    if self._render_buffer[i] == "\n":
-                        self._render_line_start = i + 1
-                        break
-
-    def _apply_bare_cr(self) -> None:
-        """Clear the current line content for a bare carriage return.
-
-        Must be called while ``self.lock`` is held.
-        """
-        line_end = len(self._render_buffer)
-        for i in range(self._render_line_start, len(self._render_buffer)):
-            if self._render_buffer[i] == "\n":
-                line_end = i
-                break
-        del self._render_buffer[self._render_line_start : line_end]
-        self._render_cursor = self._render_line_start
+            self._output.append(data)
+            self._render_buffer.feed(text)
+            head, self._stream_carry = _split_incomplete_escape(
+                self._stream_carry + text
+            )
+            self.output_broadcaster.publish(head)
 
     def _log_pty_output(self, raw_data: bytes, text: str) -> None:
         """Log PTY output for debugging WAITING detection patterns.
@@ -0,0 +1,309 @@
+"""Shared SQLite access layer for Synapse stores.
+
+History, shared memory, file safety, observations, instincts, workflow
+runs and the canvas each keep a SQLite database that several agent
+processes read and write at once. Opening a connection per call repeats
+the connect, the journal-mode PRAGMA and statement compilation every time,
+and the stores used to configure their connections differently.
+``SQLiteDatabase`` gives each store one long-lived connection per thread,
+opened with the same settings everywhere:
+
+- WAL journal, so readers do not block the writer and vice versa
+- ``synchronous=NORMAL``: sync on checkpoint instead of on every commit
+- a ``SQLITE_BUSY_TIMEOUT`` busy timeout instead of failing immediately
+  with "database is locked"
+- a ``SQLITE_STATEMENT_CACHE_SIZE`` compiled-statement cache
+
+``transaction(immediate=True)`` takes the write lock up front with
+``BEGIN IMMEDIATE``, so a read that turns into a write cannot fail on lock
+upgrade, which the busy timeout cannot resolve.
+
+Query timing is off by default. ``enable_query_timing()`` (or
+``SYNAPSE_DB_TIMING=1``) makes connections opened afterwards record per-
+statement counts and durations, read with ``query_stats()``. Statements
+slower than ``SQLITE_SLOW_QUERY_MS`` are logged.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from synapse.config import (
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_SLOW_QUERY_MS,
+    SQLITE_STATEMENT_CACHE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+RowFactory = Any  # sqlite3.Row, a callable, or None
+
+
+@dataclass
+class QueryStats:
+    """Accumulated timing for one SQL statement."""
+
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+_timing_enabled = os.environ.get("SYNAPSE_DB_TIMING", "").lower() in ("1", "true")
+_stats_lock = threading.Lock()
+_stats: dict[str, QueryStats] = {}
+
+
+def enable_query_timing(enabled: bool = True) -> None:
+    """Turn per-statement timing on or off for connections opened afterwards."""
+    global _timing_enabled
+    _timing_enabled = enabled
+
+
+def query_stats() -> dict[str, QueryStats]:
+    """Return a snapshot of timing per statement (whitespace-normalized SQL)."""
+    with _stats_lock:
+        return {
+            sql: QueryStats(s.calls, s.total_ms, s.max_ms) for sql, s in _stats.items()
+        }
+
+
+def reset_query_stats() -> None:
+    """Discard the timing recorded so far."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record(sql: str, started: float) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    key = " ".join(sql.split())
+    with _stats_lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = QueryStats()
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+    if elapsed_ms >= SQLITE_SLOW_QUERY_MS:
+        logger.info("Slow SQLite statement (%.1f ms): %s", elapsed_ms, key[:200])
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that records how long each statement takes to execute."""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> _TimedCursor:
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)  # type: ignore[return-value]
+        finally:
+            _record(sql, started)
+
+    def executemany(
+        self, sql: str, seq_of_parameters: Iterable[Any], /
+    ) -> _TimedCursor:
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)  # type: ignore[return-value]
+        finally:
+            _record(sql, started)
+
+    def executescript(self, sql_script: str, /) -> _TimedCursor:
+        started = time.perf_counter()
+        try:
+            return super().executescript(sql_script)  # type: ignore[return-value]
+        finally:
+            _record(sql_script, started)
+
+
+class _TimedConnection(sqlite3.Connection):
+    """Connection whose cursors and ``execute`` shortcuts are timed.
+
+    The shortcuts are overridden too: the C implementation creates their
+    cursor directly rather than through cursor().
+    """
+
+    def cursor(self, factory: Any = None) -> Any:  # type: ignore[override]
+        return super().cursor(factory or _TimedCursor)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> Any:  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any], /) -> Any:  # type: ignore[override]
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str, /) -> Any:  # type: ignore[override]
+        return self.cursor().executescript(sql_script)
+
+
+def open_connection(
+    db_path: str,
+    *,
+    row_factory: RowFactory = None,
+    foreign_keys: bool = False,
+    cache_size_kb: int | None = None,
+) -> sqlite3.Connection:
+    """Open a connection configured like every other Synapse connection.
+
+    Args:
+        db_path: Path to the SQLite database file
+        row_factory: Row factory to install (e.g. sqlite3.Row)
+        foreign_keys: Enforce foreign key constraints
+        cache_size_kb: Page cache size in KiB (SQLite default if None)
+
+    Returns:
+        sqlite3.Connection usable from any thread (one thread at a time)
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT,
+        check_same_thread=False,
+        cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+        factory=_TimedConnection if _timing_enabled else sqlite3.Connection,
+    )
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if foreign_keys:
+            conn.execute("PRAGMA foreign_keys=ON")
+        if cache_size_kb:
+            conn.execute(f"PRAGMA cache_size=-{int(cache_size_kb)}")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    conn.row_factory = row_factory
+    return conn
+
+
+class SQLiteDatabase:
+    """Per-thread connections to one SQLite database file.
+
+    Each thread gets its own connection on first use and keeps it, so the
+    connect, the PRAGMAs and compiled statements are paid once per thread
+    rather than once per call. Connections of threads that have exited are
+    closed whenever a new one is opened, and close() closes the rest.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        row_factory: RowFactory = None,
+        foreign_keys: bool = False,
+        cache_size_kb: int | None = None,
+    ) -> None:
+        """Initialize SQLiteDatabase.
+
+        Args:
+            db_path: Path to the SQLite database file
+            row_factory: Row factory every connection starts (and is reset) with
+            foreign_keys: Enforce foreign key constraints
+            cache_size_kb: Page cache size per connection in KiB
+        """
+        self.db_path = db_path
+        self.row_factory = row_factory
+        self._foreign_keys = foreign_keys
+        self._cache_size_kb = cache_size_kb
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        # transaction() blocks open on each thread; release() leaves the
+        # connection alone while one is open.
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it once.
+
+        Pair with release() when done, or use connect()/transaction().
+        """
+        ident = threading.get_ident()
+        conn = self._connections.get(ident)
+        if conn is not None:
+            return conn
+
+        conn = open_connection(
+            self.db_path,
+            row_factory=self.row_factory,
+            foreign_keys=self._foreign_keys,
+            cache_size_kb=self._cache_size_kb,
+        )
+        with self._connections_lock:
+            alive = {thread.ident for thread in threading.enumerate()}
+            for stale_ident in [i for i in self._connections if i not in alive]:
+                with contextlib.suppress(sqlite3.Error):
+                    self._connections.pop(stale_ident).close()
+            self._connections[ident] = conn
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Hand a connection back after use, keeping it open for reuse.
+
+        Anything left uncommitted is rolled back, as closing a per-call
+        connection would, and the row factory is reset. Inside a
+        transaction() block on this thread, both are left to the block.
+        """
+        if getattr(self._local, "depth", 0):
+            return
+        with contextlib.suppress(sqlite3.Error):
+            if conn.in_transaction:
+                conn.rollback()
+        conn.row_factory = self.row_factory
+
+    @contextlib.contextmanager
+    def connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Use this thread's connection; uncommitted work is rolled back after."""
+        conn = self.connection()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextlib.contextmanager
+    def transaction(
+        self, immediate: bool = False
+    ) -> Generator[sqlite3.Connection, None, None]:
+        """Run the block in one transaction: commit on success, roll back on error.
+
+        Args:
+            immediate: Take the write lock at BEGIN (BEGIN IMMEDIATE) rather
+                than at the first write. Use it for read-then-write blocks.
+
+        Nested use joins the transaction already open on this thread.
+        """
+        conn = self.connection()
+        depth = getattr(self._local, "depth", 0)
+        if depth or conn.in_transaction:
+            self._local.depth = depth + 1
+            try:
+                yield conn
+            finally:
+                self._local.depth = depth
+            return
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        self._local.depth = 1
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            with contextlib.suppress(sqlite3.Error):
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = 0
+            conn.row_factory = self.row_factory
+
+    def close(self) -> None:
+        """Close every cached connection.
+
+        Call at shutdown, once no other thread is using the database.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
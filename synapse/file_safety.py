@@ -10,21 +10,118 @@ Features:
 - Context injection for collaborative awareness
 """
 
+import atexit
 import contextlib
 import json
 import logging
 import os
 import sqlite3
 import threading
+import time
+import weakref
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from synapse.config import (
+    FILE_SAFETY_JOURNAL_DELAY,
+    FILE_SAFETY_JOURNAL_MAX_PENDING,
+    FILE_SAFETY_JOURNAL_MAX_RETRIES,
+    FILE_SAFETY_SWEEP_INTERVAL,
+)
+from synapse.db import SQLiteDatabase, open_connection
 from synapse.paths import get_file_safety_db_path
 
 logger = logging.getLogger(__name__)
 
+# Columns written by record_modification, in _INSERT_MODIFICATION order
+_MODIFICATION_COLUMNS = (
+    "task_id",
+    "agent_name",
+    "file_path",
+    "change_type",
+    "intent",
+    "affected_lines",
+    "metadata",
+    "timestamp",
+)
+_INSERT_MODIFICATION = (
+    f"INSERT INTO file_modifications ({', '.join(_MODIFICATION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_MODIFICATION_COLUMNS))})"
+)
+
+# Monthly partitions of file_modifications. New records land in the
+# file_modifications table; once a month is over its rows are moved to a
+# sealed file_modifications_YYYY_MM table, so retention drops whole tables
+# and per-month counts can be precomputed.
+_PARTITION_PREFIX = "file_modifications_"
+_PARTITION_GLOB = f"{_PARTITION_PREFIX}[0-9][0-9][0-9][0-9]_[0-9][0-9]"
+_PARTITION_COLUMNS = ", ".join(("id", *_MODIFICATION_COLUMNS))
+_PARTITION_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY,
+        task_id TEXT NOT NULL,
+        agent_name TEXT NOT NULL,
+        file_path TEXT NOT NULL,
+        change_type TEXT NOT NULL,
+        intent TEXT,
+        affected_lines TEXT,
+        metadata TEXT,
+        timestamp TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_{table}_file_path ON {table}(file_path, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_{table}_task_id ON {table}(task_id)",
+    "CREATE INDEX IF NOT EXISTS idx_{table}_timestamp ON {table}(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_{table}_agent_name ON {table}(agent_name)",
+)
+# Union of file_modifications and every partition, for ad-hoc queries
+_ALL_MODIFICATIONS_VIEW = "file_modifications_all"
+# Row counts per sealed partition by change type, agent and file, so
+# get_statistics() only aggregates the current month's rows.
+_COUNTS_TABLE = "file_modification_counts"
+_COUNTS_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS {_COUNTS_TABLE} (
+        partition TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (partition, dimension, key)
+    ) WITHOUT ROWID
+"""
+_COUNT_DIMENSIONS = ("change_type", "agent_name", "file_path")
+
+
+def _next_month(month: str) -> str:
+    """Return the 'YYYY-MM' after *month* ('YYYY-MM')."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+# Change counter for file_locks, bumped by triggers on every insert, update
+# and delete (including those made by other processes), so the in-process
+# lock cache knows when to reload.
+_LOCKS_VERSION_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS file_locks_version (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        generation INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO file_locks_version (id, generation) VALUES (0, 0)",
+    *(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS file_locks_version_{suffix}
+        AFTER {event} ON file_locks BEGIN
+            UPDATE file_locks_version SET generation = generation + 1;
+        END
+        """
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+    ),
+)
+
 
 class ChangeType(str, Enum):
     """Type of file modification."""
@@ -65,7 +162,8 @@ class FileSafetyManager:
 
     The database schema includes:
     - file_locks: Active locks on files with expiration
-    - file_modifications: History of all file changes with intent
+    - file_modifications: Current month's file changes with intent
+    - file_modifications_YYYY_MM: Finished months, dropped whole on retention
     """
 
     DEFAULT_LOCK_DURATION_SECONDS = 300  # 5 minutes
@@ -76,6 +174,7 @@ class FileSafetyManager:
         db_path: str | None = None,
         enabled: bool = True,
         retention_days: int | None = None,
+        journal: bool = False,
     ) -> None:
         """Initialize FileSafetyManager.
 
@@ -83,6 +182,13 @@ class FileSafetyManager:
             db_path: Path to SQLite database file. Defaults to .synapse/file_safety.db
             enabled: Whether file safety features are enabled
             retention_days: Number of days to keep modification records (auto-cleanup)
+            journal: Queue recorded modifications and insert them in one
+                background transaction every FILE_SAFETY_JOURNAL_DELAY (or
+                once FILE_SAFETY_JOURNAL_MAX_PENDING are queued) instead of
+                committing each one. File history and context include
+                queued records; other reads, releasing locks and close()
+                flush the queue first. Call flush() when a task completes
+                (queued records are also flushed at exit).
         """
         self.enabled = enabled
         self.db_path = os.path.abspath(db_path or get_file_safety_db_path())
@@ -92,6 +198,29 @@ class FileSafetyManager:
             else self.DEFAULT_RETENTION_DAYS
         )
         self._lock = threading.RLock()
+        # One long-lived connection per thread
+        self._db = SQLiteDatabase(self.db_path)
+        # In-process copy of file_locks for check_lock(), keyed by path
+        self._lock_cache: dict[str, dict[str, Any]] = {}
+        self._lock_cache_key: tuple[int, int] | None = None
+        self._lock_cache_data_version: int | None = None
+        self._lock_cache_conn: sqlite3.Connection | None = None
+        self._lock_cache_lock = threading.Lock()
+        self._sweeper: threading.Thread | None = None
+        self._sweeper_stop = threading.Event()
+        self.journal = journal
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending_full = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._atexit_flush_registered = False
+        # Consecutive failed journal commits, and when to retry next.
+        self._flush_failures = 0
+        self._retry_at = 0.0
+        # 'YYYY-MM' whose records file_modifications holds; a record from a
+        # later month first moves the finished months into partitions.
+        self._live_month: str | None = None
 
         if self.enabled:
             self._init_db()
@@ -99,17 +228,45 @@ class FileSafetyManager:
             self._auto_cleanup()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a SQLite connection with WAL mode and timeout for better concurrency.
+        """Get the calling thread's SQLite connection, opening it once.
+
+        The connection comes from the shared SQLiteDatabase layer (WAL mode,
+        busy timeout, statement cache) and is reused by later calls on the
+        same thread. Pair every call with _release_connection().
 
         Returns:
             sqlite3.Connection configured for multi-agent access
         """
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+        return self._db.connection()
+
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        """Hand a connection back after use, keeping it open for reuse.
+
+        Anything the caller left uncommitted is rolled back, as closing a
+        per-call connection used to do.
+        """
+        self._db.release(conn)
+
+    def close(self) -> None:
+        """Stop the lock sweeper and close all cached connections.
+
+        Call at shutdown, once no other thread is using this manager.
+        """
+        self.flush()
+        self._sweeper_stop.set()
+        self._sweeper = None
+        with self._lock_cache_lock:
+            cache_conn, self._lock_cache_conn = self._lock_cache_conn, None
+            self._lock_cache_key = None
+        self._db.close()
+        if cache_conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                cache_conn.close()
 
     @classmethod
-    def from_env(cls, db_path: str | None = None) -> "FileSafetyManager":
+    def from_env(
+        cls, db_path: str | None = None, journal: bool = False
+    ) -> "FileSafetyManager":
         """Create FileSafetyManager from environment variables and settings.
 
         Environment variables (higher priority):
@@ -121,6 +278,7 @@ class FileSafetyManager:
 
         Args:
             db_path: Optional path to SQLite database file
+            journal: Batch recorded modifications in the background
 
         Returns:
             FileSafetyManager instance with settings from env/config
@@ -166,7 +324,10 @@ class FileSafetyManager:
                 retention_days = int(env_retention)
 
         return cls(
-            db_path=resolved_db_path, enabled=enabled, retention_days=retention_days
+            db_path=resolved_db_path,
+            enabled=enabled,
+            retention_days=retention_days,
+            journal=journal,
         )
 
     @staticmethod
@@ -293,15 +454,25 @@ class FileSafetyManager:
                 )
                 conn.commit()
 
+                for statement in _LOCKS_VERSION_SCHEMA:
+                    cursor.execute(statement)
+                conn.commit()
+
                 # Migrate legacy timestamps to ISO-8601 format
                 self._migrate_timestamps_to_iso8601(cursor, conn)
 
+                # Move finished months into partitions (also migrates a
+                # pre-partitioning database on first open)
+                cursor.execute(_COUNTS_SCHEMA)
+                conn.commit()
+                self._rotate_partitions(conn)
+
                 logger.debug(f"File safety database initialized: {self.db_path}")
             except sqlite3.Error as e:
                 logger.error(f"Failed to initialize file safety DB: {e}")
             finally:
                 if conn is not None:
-                    conn.close()
+                    self._release_connection(conn)
 
     def _migrate_locks_schema(
         self, cursor: sqlite3.Cursor, conn: sqlite3.Connection
@@ -383,6 +554,131 @@ class FileSafetyManager:
         except sqlite3.Error as e:
             logger.warning(f"Timestamp migration failed (non-fatal): {e}")
 
+    def _partitions(self, cursor: sqlite3.Cursor) -> list[tuple[str, str]]:
+        """Return (table, 'YYYY-MM') for each modification partition, newest first."""
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ? "
+            "ORDER BY name DESC",
+            (_PARTITION_GLOB,),
+        )
+        prefix = len(_PARTITION_PREFIX)
+        return [
+            (name, name[prefix:].replace("_", "-")) for (name,) in cursor.fetchall()
+        ]
+
+    def _rotate_partitions(self, conn: sqlite3.Connection) -> None:
+        """Move records of finished months from file_modifications to partitions.
+
+        Each month's rows are copied into file_modifications_YYYY_MM (created
+        on first use) and deleted from file_modifications in one
+        transaction, and the partition's counts are refreshed. Concurrent
+        rotations from other processes are serialized by BEGIN IMMEDIATE and
+        find nothing left to move.
+        """
+        month = datetime.now(timezone.utc).strftime("%Y-%m")
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                "SELECT DISTINCT substr(timestamp, 1, 7) FROM file_modifications "
+                "WHERE timestamp < ?",
+                (month,),
+            )
+            # Skip malformed timestamps; they stay in file_modifications.
+            finished = [
+                m
+                for (m,) in cursor.fetchall()
+                if len(m) == 7 and m[:4].isdigit() and m[4] == "-" and m[5:].isdigit()
+            ]
+            for old_month in finished:
+                table = _PARTITION_PREFIX + old_month.replace("-", "_")
+                for statement in _PARTITION_SCHEMA:
+                    cursor.execute(statement.format(table=table))
+                bounds = (old_month, _next_month(old_month))
+                cursor.execute(
+                    f"INSERT INTO {table} ({_PARTITION_COLUMNS}) "
+                    f"SELECT {_PARTITION_COLUMNS} FROM file_modifications "
+                    "WHERE timestamp >= ? AND timestamp < ?",
+                    bounds,
+                )
+                cursor.execute(
+                    "DELETE FROM file_modifications "
+                    "WHERE timestamp >= ? AND timestamp < ?",
+                    bounds,
+                )
+                logger.debug(f"Moved {cursor.rowcount} modifications to {table}")
+                self._refresh_partition_counts(cursor, table)
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = ?",
+                (_ALL_MODIFICATIONS_VIEW,),
+            )
+            if finished or cursor.fetchone() is None:
+                self._create_modifications_view(cursor)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        self._live_month = month
+
+    def _create_modifications_view(self, cursor: sqlite3.Cursor) -> None:
+        """(Re)create the file_modifications_all view over every partition."""
+        selects = [f"SELECT {_PARTITION_COLUMNS} FROM file_modifications"]
+        selects += [
+            f"SELECT {_PARTITION_COLUMNS} FROM {table}"
+            for table, _ in self._partitions(cursor)
+        ]
+        cursor.execute(f"DROP VIEW IF EXISTS {_ALL_MODIFICATIONS_VIEW}")
+        cursor.execute(
+            f"CREATE VIEW {_ALL_MODIFICATIONS_VIEW} AS " + " UNION ALL ".join(selects)
+        )
+
+    def _refresh_partition_counts(self, cursor: sqlite3.Cursor, table: str) -> None:
+        """Recompute the per-dimension row counts of a sealed partition."""
+        cursor.execute(f"DELETE FROM {_COUNTS_TABLE} WHERE partition = ?", (table,))
+        for dimension in _COUNT_DIMENSIONS:
+            cursor.execute(
+                f"INSERT INTO {_COUNTS_TABLE} (partition, dimension, key, count) "
+                f"SELECT ?, ?, {dimension}, COUNT(*) FROM {table} "
+                f"GROUP BY {dimension}",
+                (table, dimension),
+            )
+
+    def _newest_modifications(
+        self,
+        cursor: sqlite3.Cursor,
+        where: str,
+        params: tuple[Any, ...],
+        limit: int,
+    ) -> list[sqlite3.Row]:
+        """Return the newest *limit* modification rows matching *where*.
+
+        Reads file_modifications, then partitions newest first, and stops
+        at the first partition that ends before the oldest row already
+        kept, so recent lookups touch only the months they return.
+        """
+        sources = [("file_modifications", None)]
+        sources += [
+            (table, _next_month(month)) for table, month in self._partitions(cursor)
+        ]
+        rows: list[sqlite3.Row] = []
+        for table, month_end in sources:
+            if (
+                month_end is not None
+                and len(rows) >= limit
+                and rows[-1]["timestamp"] >= month_end
+            ):
+                break
+            cursor.execute(
+                f"SELECT * FROM {table} {where} ORDER BY timestamp DESC LIMIT ?",
+                (*params, limit),
+            )
+            rows = sorted(
+                [*rows, *cursor.fetchall()],
+                key=lambda row: row["timestamp"],
+                reverse=True,
+            )[:limit]
+        return rows
+
     def _auto_cleanup(self) -> None:
         """Automatically clean up old modification records on startup.
 
@@ -469,9 +765,9 @@ class FileSafetyManager:
                 conn = self._get_connection()
                 cursor = conn.cursor()
 
-                # First, clean up expired locks and stale locks (dead processes)
+                # First, clean up expired locks; dead-process locks are left
+                # to the background sweep except on the path being locked
                 self._cleanup_expired_locks_internal(cursor)
-                self._cleanup_stale_locks_internal(cursor)
 
                 # Check for existing lock
                 cursor.execute(
@@ -480,6 +776,12 @@ class FileSafetyManager:
                     (normalized_path,),
                 )
                 existing = cursor.fetchone()
+                if existing and not self._holder_alive(existing[3]):
+                    cursor.execute(
+                        "DELETE FROM file_locks WHERE file_path = ?",
+                        (normalized_path,),
+                    )
+                    existing = None
 
                 if existing:
                     (
@@ -595,7 +897,187 @@ class FileSafetyManager:
                 return {"status": LockStatus.FAILED, "reason": str(e)}
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
+
+    def acquire_locks(
+        self,
+        file_paths: list[str],
+        agent_name: str | None = None,
+        task_id: str | None = None,
+        duration_seconds: int | None = None,
+        intent: str | None = None,
+        *,
+        agent_id: str | None = None,
+        agent_type: str | None = None,
+        pid: int | None = None,
+        delegate_mode: bool = False,
+    ) -> dict[str, Any]:
+        """Acquire locks on several files at once, all or nothing.
+
+        Runs in a single write transaction: either every path ends up locked
+        by the caller (newly acquired or renewed), or none of them changes.
+
+        Args:
+            file_paths: Paths of the files to lock
+            agent_name: Name of the agent requesting the locks (deprecated)
+            task_id: Optional task identifier
+            duration_seconds: Lock duration in seconds (default: 300)
+            intent: Optional description of intended changes
+            agent_id: Full agent identifier (e.g., "synapse-claude-8100")
+            agent_type: Short agent type (e.g., "claude") for filtering
+            pid: Process ID for session tracking (default: current process)
+            delegate_mode: If True, deny locks (manager should not edit files)
+
+        Returns:
+            Dict with keys:
+                - status: ACQUIRED if every lock is held, ALREADY_LOCKED if
+                  another agent holds any of them, or FAILED
+                - locks: {path: ACQUIRED | RENEWED} (if ACQUIRED)
+                - conflicts: {path: {"lock_holder", "expires_at"}}
+                  (if ALREADY_LOCKED)
+                - expires_at: Lock expiration time (if ACQUIRED)
+                - reason: Reason for failure (if FAILED)
+        """
+        if delegate_mode:
+            return {
+                "status": LockStatus.FAILED,
+                "reason": "Delegate/manager mode: file locks are denied",
+            }
+
+        if not self.enabled:
+            return {"status": LockStatus.ACQUIRED, "locks": {}, "expires_at": None}
+
+        effective_agent_id = agent_id or agent_name
+        if not effective_agent_id:
+            raise ValueError("Either agent_id or agent_name must be provided")
+
+        effective_pid = pid if pid is not None else os.getpid()
+        duration = duration_seconds or self.DEFAULT_LOCK_DURATION_SECONDS
+        expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=duration)
+        ).isoformat()
+        paths = list(dict.fromkeys(self._normalize_path(p) for p in file_paths))
+        if not paths:
+            return {"status": LockStatus.ACQUIRED, "locks": {}, "expires_at": None}
+
+        with self._lock:
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                # Take the write lock up front so no other process can lock
+                # one of these paths between our check and our insert.
+                cursor.execute("BEGIN IMMEDIATE")
+
+                self._cleanup_expired_locks_internal(cursor)
+
+                placeholders = ",".join("?" * len(paths))
+                cursor.execute(
+                    "SELECT file_path, agent_id, agent_name, expires_at, pid "
+                    f"FROM file_locks WHERE file_path IN ({placeholders})",
+                    paths,
+                )
+                held: set[str] = set()
+                stale: list[str] = []
+                conflicts: dict[str, dict[str, Any]] = {}
+                for (
+                    path,
+                    holder_id,
+                    holder_name,
+                    holder_expires,
+                    pid,
+                ) in cursor.fetchall():
+                    holder = holder_id or holder_name
+                    if not self._holder_alive(pid):
+                        stale.append(path)
+                    elif holder == effective_agent_id:
+                        held.add(path)
+                    else:
+                        conflicts[path] = {
+                            "lock_holder": holder,
+                            "expires_at": holder_expires,
+                        }
+
+                if conflicts:
+                    conn.rollback()
+                    return {"status": LockStatus.ALREADY_LOCKED, "conflicts": conflicts}
+
+                cursor.executemany(
+                    "DELETE FROM file_locks WHERE file_path = ?",
+                    [(path,) for path in stale],
+                )
+
+                cursor.executemany(
+                    """
+                    UPDATE file_locks
+                    SET expires_at = ?, intent = ?, task_id = ?, pid = ?,
+                        agent_id = ?, agent_type = ?
+                    WHERE file_path = ?
+                    """,
+                    [
+                        (
+                            expires_at,
+                            intent,
+                            task_id,
+                            effective_pid,
+                            effective_agent_id,
+                            agent_type,
+                            path,
+                        )
+                        for path in paths
+                        if path in held
+                    ],
+                )
+                cursor.executemany(
+                    """
+                    INSERT INTO file_locks
+                    (file_path, agent_name, agent_id, agent_type,
+                     pid, task_id, expires_at, intent)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            path,
+                            effective_agent_id,
+                            effective_agent_id,
+                            agent_type,
+                            effective_pid,
+                            task_id,
+                            expires_at,
+                            intent,
+                        )
+                        for path in paths
+                        if path not in held
+                    ],
+                )
+                conn.commit()
+
+                logger.debug(
+                    f"Locks acquired: {len(paths)} files by {effective_agent_id} "
+                    f"(pid={effective_pid}, expires: {expires_at})"
+                )
+                return {
+                    "status": LockStatus.ACQUIRED,
+                    "locks": {
+                        path: LockStatus.RENEWED
+                        if path in held
+                        else LockStatus.ACQUIRED
+                        for path in paths
+                    },
+                    "expires_at": expires_at,
+                }
+
+            except sqlite3.Error as e:
+                logger.error(
+                    "event=file_lock_acquire_failed file_path=%s agent=%s error=%s",
+                    ",".join(paths),
+                    effective_agent_id,
+                    e,
+                )
+                return {"status": LockStatus.FAILED, "reason": str(e)}
+            finally:
+                if conn:
+                    self._release_connection(conn)
 
     def release_lock(self, file_path: str, agent_name: str) -> bool:
         """Release a lock on a file.
@@ -610,6 +1092,9 @@ class FileSafetyManager:
         if not self.enabled:
             return True
 
+        # Releasing a lock ends an edit; make its journal records durable.
+        self.flush()
+
         normalized_path = self._normalize_path(file_path)
 
         with self._lock:
@@ -634,7 +1119,56 @@ class FileSafetyManager:
                 return False
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
+
+    def release_locks(self, file_paths: list[str], agent_name: str) -> int:
+        """Release several locks held by one agent in a single transaction.
+
+        Paths that are not locked, or are locked by another agent, are left
+        untouched.
+
+        Args:
+            file_paths: Paths of the files to unlock
+            agent_name: Name of the agent releasing the locks
+
+        Returns:
+            Number of locks released
+        """
+        if not self.enabled:
+            return 0
+
+        # Releasing locks ends an edit; make its journal records durable.
+        self.flush()
+
+        paths = list(dict.fromkeys(self._normalize_path(p) for p in file_paths))
+        if not paths:
+            return 0
+
+        with self._lock:
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                placeholders = ",".join("?" * len(paths))
+                cursor.execute(
+                    f"DELETE FROM file_locks WHERE file_path IN ({placeholders}) "
+                    "AND agent_name = ?",
+                    [*paths, agent_name],
+                )
+                released = cursor.rowcount
+
+                conn.commit()
+                if released:
+                    logger.debug(f"Locks released: {released} files by {agent_name}")
+                return released
+
+            except sqlite3.Error as e:
+                logger.error(f"Failed to release locks for {agent_name}: {e}")
+                return 0
+            finally:
+                if conn:
+                    self._release_connection(conn)
 
     def check_lock(
         self, file_path: str, *, cleanup_stale: bool = True
@@ -658,51 +1192,120 @@ class FileSafetyManager:
 
         normalized_path = self._normalize_path(file_path)
 
+        try:
+            lock = self._cached_locks().get(normalized_path)
+        except sqlite3.Error as e:
+            # Fail-closed: raise exception so callers can deny access
+            logger.error(f"Database error checking lock for {normalized_path}: {e}")
+            raise FileLockDBError(f"Failed to check lock: {e}") from e
+
+        if lock is None:
+            return None
+
+        pid = lock.get("pid")
+        if lock["expires_at"] < datetime.now(timezone.utc).isoformat():
+            reason = "expired"
+        elif cleanup_stale and pid and not self._is_process_running(pid):
+            reason = f"pid {pid} no longer running"
+        else:
+            return dict(lock)
+
+        # Write the cleanup through to SQLite; the id guard leaves a lock
+        # that was re-acquired since the cache was loaded alone.
         with self._lock:
             conn = None
             try:
                 conn = self._get_connection()
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                # Clean up expired locks first
-                self._cleanup_expired_locks_internal(cursor)
+                conn.execute("DELETE FROM file_locks WHERE id = ?", (lock["id"],))
                 conn.commit()
-
-                cursor.execute(
-                    "SELECT * FROM file_locks WHERE file_path = ?",
-                    (normalized_path,),
-                )
-                row = cursor.fetchone()
-
-                if row:
-                    row_dict = dict(row)
-                    pid = row_dict.get("pid")
-
-                    # Check if the lock holder is still alive
-                    if cleanup_stale and pid and not self._is_process_running(pid):
-                        # Lock holder is dead, clean up
-                        cursor.execute(
-                            "DELETE FROM file_locks WHERE file_path = ?",
-                            (normalized_path,),
-                        )
-                        conn.commit()
-                        logger.debug(
-                            f"Auto-cleaned stale lock on {normalized_path} "
-                            f"(pid {pid} no longer running)"
-                        )
-                        return None
-
-                    return row_dict
-                return None
-
             except sqlite3.Error as e:
-                # Fail-closed: raise exception so callers can deny access
                 logger.error(f"Database error checking lock for {normalized_path}: {e}")
                 raise FileLockDBError(f"Failed to check lock: {e}") from e
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
+        logger.debug(f"Auto-cleaned lock on {normalized_path} ({reason})")
+        return None
+
+    def _cached_locks(self) -> dict[str, dict[str, Any]]:
+        """Return the lock table, reloading the in-process copy if it changed.
+
+        ``PRAGMA data_version`` on a dedicated read connection changes
+        whenever any other connection commits, so an unchanged value means
+        the copy is current without reading a table. Otherwise the
+        ``file_locks_version`` generation (bumped by triggers) and the
+        schema version decide whether file_locks itself needs re-reading.
+        Durability stays with SQLite: every lock write still goes through
+        it, and this only serves reads.
+
+        Raises:
+            sqlite3.Error: If the lock table cannot be read
+        """
+        with self._lock_cache_lock:
+            try:
+                conn = self._lock_cache_conn
+                if conn is None:
+                    conn = open_connection(self.db_path, row_factory=sqlite3.Row)
+                    self._lock_cache_conn = conn
+
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if (
+                    self._lock_cache_key is not None
+                    and data_version == self._lock_cache_data_version
+                ):
+                    return self._lock_cache
+
+                # One read transaction so the generation matches the rows
+                conn.execute("BEGIN")
+                try:
+                    generation = conn.execute(
+                        "SELECT generation FROM file_locks_version"
+                    ).fetchone()[0]
+                    schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+                    key = (generation, schema_version)
+                    if key != self._lock_cache_key:
+                        rows = conn.execute("SELECT * FROM file_locks").fetchall()
+                        self._lock_cache = {row["file_path"]: dict(row) for row in rows}
+                        self._lock_cache_key = key
+                finally:
+                    conn.rollback()
+                self._lock_cache_data_version = data_version
+            except sqlite3.Error:
+                self._lock_cache_key = None
+                raise
+            self._ensure_sweeper()
+            return self._lock_cache
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background sweep of expired and stale locks, once."""
+        if self._sweeper is not None:
+            return
+        self._sweeper_stop = threading.Event()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop,
+            args=(weakref.ref(self), self._sweeper_stop),
+            name="file-safety-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    @staticmethod
+    def _sweep_loop(
+        manager_ref: "weakref.ref[FileSafetyManager]", stop: threading.Event
+    ) -> None:
+        """Every FILE_SAFETY_SWEEP_INTERVAL, delete expired and stale locks.
+
+        Holds only a weak reference so an abandoned manager can be collected,
+        which ends the loop.
+        """
+        while not stop.wait(FILE_SAFETY_SWEEP_INTERVAL):
+            manager = manager_ref()
+            if manager is None:
+                return
+            with contextlib.suppress(OSError, sqlite3.Error):
+                manager.cleanup_expired_locks()
+                manager.cleanup_stale_locks()
+            del manager
 
     def is_locked_by_other(self, file_path: str, agent_name: str) -> bool:
         """Check if a file is locked by another agent.
@@ -806,7 +1409,59 @@ class FileSafetyManager:
                 return []
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
+
+    def locks_by_holder(self) -> dict[str, Any]:
+        """Group all active locks by holder with one query.
+
+        Lets callers that need the locks of many agents (e.g. ``synapse
+        list``) make one database round trip instead of one per agent.
+        Each lock's PID is probed at most once.
+
+        Returns:
+            Dict with keys:
+                - by_pid: {pid: [lock, ...]} for locks of live processes
+                - by_agent: {agent_id or agent_name: [lock, ...]} for locks
+                  of live processes (or without a PID)
+                - stale: locks held by processes that are no longer running
+            Lock lists are newest first, as in list_locks().
+        """
+        result: dict[str, Any] = {"by_pid": {}, "by_agent": {}, "stale": []}
+        if not self.enabled:
+            return result
+
+        with self._lock:
+            conn = None
+            try:
+                conn = self._get_connection()
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                self._cleanup_expired_locks_internal(cursor)
+                conn.commit()
+
+                cursor.execute("SELECT * FROM file_locks ORDER BY locked_at DESC")
+                rows = [dict(row) for row in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error(f"Failed to group locks by holder: {e}")
+                return result
+            finally:
+                if conn:
+                    self._release_connection(conn)
+
+        alive: dict[int, bool] = {}
+        for lock in rows:
+            pid = lock.get("pid")
+            if pid:
+                if pid not in alive:
+                    alive[pid] = self._is_process_running(pid)
+                if not alive[pid]:
+                    result["stale"].append(lock)
+                    continue
+                result["by_pid"].setdefault(pid, []).append(lock)
+            for holder in {lock.get("agent_id"), lock.get("agent_name")} - {None}:
+                result["by_agent"].setdefault(holder, []).append(lock)
+        return result
 
     def _cleanup_expired_locks_internal(self, cursor: sqlite3.Cursor) -> int:
         """Clean up expired locks (internal, requires cursor).
@@ -844,6 +1499,10 @@ class FileSafetyManager:
         except (OSError, TypeError):
             return False
 
+    def _holder_alive(self, pid: int | None) -> bool:
+        """Return False only for a lock whose recorded process has exited."""
+        return not pid or self._is_process_running(pid)
+
     def _cleanup_stale_locks_internal(self, cursor: sqlite3.Cursor) -> int:
         """Clean up locks from dead processes (internal, requires cursor).
 
@@ -897,7 +1556,7 @@ class FileSafetyManager:
                 return 0
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def get_stale_locks(self) -> list[dict[str, Any]]:
         """Get list of locks from dead processes.
@@ -932,7 +1591,7 @@ class FileSafetyManager:
                 return []
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def force_unlock(self, file_path: str) -> bool:
         """Force release a lock on a file regardless of owner.
@@ -970,7 +1629,7 @@ class FileSafetyManager:
                 return False
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def cleanup_expired_locks(self) -> int:
         """Clean up expired locks.
@@ -997,7 +1656,7 @@ class FileSafetyManager:
                 return 0
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     # ========== File Modification Tracking Methods ==========
 
@@ -1023,7 +1682,8 @@ class FileSafetyManager:
             metadata: Additional metadata about the change
 
         Returns:
-            ID of the created record, or None on failure
+            ID of the created record, or None on failure. In journal mode
+            the record is queued and None is returned.
         """
         if not self.enabled:
             return None
@@ -1054,31 +1714,29 @@ class FileSafetyManager:
 
         # Use ISO-8601 UTC timestamp for consistent sorting and comparison
         timestamp = datetime.now(timezone.utc).isoformat()
+        row = (
+            task_id,
+            agent_name,
+            normalized_path,
+            change_type_str,
+            intent,
+            affected_lines,
+            metadata_json,
+            timestamp,
+        )
+        if self.journal:
+            self._enqueue(row)
+            return None
 
         with self._lock:
             conn = None
             try:
                 conn = self._get_connection()
+                if timestamp[:7] != self._live_month:
+                    self._rotate_partitions(conn)
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    INSERT INTO file_modifications
-                    (task_id, agent_name, file_path, change_type, intent,
-                     affected_lines, metadata, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        task_id,
-                        agent_name,
-                        normalized_path,
-                        change_type_str,
-                        intent,
-                        affected_lines,
-                        metadata_json,
-                        timestamp,
-                    ),
-                )
+                cursor.execute(_INSERT_MODIFICATION, row)
 
                 record_id = cursor.lastrowid
                 conn.commit()
@@ -1093,7 +1751,113 @@ class FileSafetyManager:
                 return None
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
+
+    def _enqueue(self, row: tuple[Any, ...]) -> None:
+        """Queue a modification row for the background journal writer."""
+        with self._pending_lock:
+            self._pending.append(row)
+            if not self._atexit_flush_registered:
+                atexit.register(self.flush)
+                self._atexit_flush_registered = True
+            if len(self._pending) >= FILE_SAFETY_JOURNAL_MAX_PENDING:
+                self._pending_full.set()
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="file-safety-journal", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._pending_full.wait(
+                max(FILE_SAFETY_JOURNAL_DELAY, self._retry_at - time.monotonic())
+            )
+            self._pending_full.clear()
+            # A full queue does not cut a retry backoff short.
+            if time.monotonic() >= self._retry_at:
+                self.flush()
+            with self._pending_lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+
+    def flush(self) -> None:
+        """Insert journaled modifications in one transaction (executemany).
+
+        Called from the background writer, before reads that do not merge
+        the queue themselves, when locks are released and at exit. Call it
+        when a task completes so its modifications are durable.
+
+        Modifications stay queued until their transaction commits. After a
+        failed commit the background writer retries with a doubling delay;
+        after FILE_SAFETY_JOURNAL_MAX_RETRIES failures in a row the queued
+        modifications are dropped and logged.
+        """
+        if not self.journal or not self.enabled:
+            return
+        with self._flush_lock:
+            with self._pending_lock:
+                batch = list(self._pending)
+            if not batch:
+                return
+            with self._lock:
+                conn = None
+                try:
+                    conn = self._get_connection()
+                    if batch[-1][-1][:7] != self._live_month:
+                        self._rotate_partitions(conn)
+                    conn.executemany(_INSERT_MODIFICATION, batch)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.error(
+                        f"Failed to record {len(batch)} journaled modifications: {e}"
+                    )
+                    committed = False
+                else:
+                    committed = True
+                finally:
+                    if conn:
+                        self._release_connection(conn)
+            if not committed:
+                self._flush_failures += 1
+                if self._flush_failures <= FILE_SAFETY_JOURNAL_MAX_RETRIES:
+                    self._retry_at = time.monotonic() + (
+                        FILE_SAFETY_JOURNAL_DELAY * 2**self._flush_failures
+                    )
+                    return
+                logger.error(
+                    "Dropping %d journaled modifications after %d failed "
+                    "commits (files: %s)",
+                    len(batch),
+                    self._flush_failures,
+                    ", ".join(sorted({row[2] for row in batch})),
+                )
+            self._flush_failures = 0
+            self._retry_at = 0.0
+            # Drop the batch only now, so readers holding _flush_lock never
+            # see it neither queued nor committed.
+            with self._pending_lock:
+                del self._pending[: len(batch)]
+
+    def _pending_modifications(self, file_path: str) -> list[dict[str, Any]]:
+        """Return queued journal records for *file_path*, newest first.
+
+        Call with _flush_lock held so the queue and the table agree.
+        """
+        with self._pending_lock:
+            rows = [row for row in self._pending if row[2] == file_path]
+        records = []
+        for row in reversed(rows):
+            record = dict(zip(_MODIFICATION_COLUMNS, row, strict=True))
+            record["id"] = None
+            metadata = record["metadata"]
+            record["metadata"] = {}
+            if metadata:
+                with contextlib.suppress(json.JSONDecodeError, TypeError):
+                    record["metadata"] = json.loads(metadata)
+            records.append(record)
+        return records
 
     def get_file_history(
         self,
@@ -1107,33 +1871,36 @@ class FileSafetyManager:
             limit: Maximum number of records to return
 
         Returns:
-            List of modification records, newest first
+            List of modification records, newest first. In journal mode
+            queued records are included (with ``id`` None).
         """
         if not self.enabled:
             return []
 
         normalized_path = self._normalize_path(file_path)
 
-        with self._lock:
+        with self._flush_lock, self._lock:
             conn = None
             try:
+                pending = (
+                    self._pending_modifications(normalized_path) if self.journal else []
+                )
                 conn = self._get_connection()
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    SELECT * FROM file_modifications
-                    WHERE file_path = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
-                    (normalized_path, limit),
+                rows = self._newest_modifications(
+                    cursor, "WHERE file_path = ?", (normalized_path,), limit
                 )
 
-                rows = cursor.fetchall()
-
-                return [self._row_to_dict(row) for row in rows]
+                history = [self._row_to_dict(row) for row in rows]
+                if pending:
+                    history = sorted(
+                        pending + history,
+                        key=lambda record: record["timestamp"],
+                        reverse=True,
+                    )[:limit]
+                return history
 
             except sqlite3.Error as e:
                 import sys
@@ -1142,7 +1909,7 @@ class FileSafetyManager:
                 return []
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def get_recent_modifications(
         self,
@@ -1161,6 +1928,8 @@ class FileSafetyManager:
         if not self.enabled:
             return []
 
+        self.flush()
+
         with self._lock:
             conn = None
             try:
@@ -1169,26 +1938,11 @@ class FileSafetyManager:
                 cursor = conn.cursor()
 
                 if agent_name:
-                    cursor.execute(
-                        """
-                        SELECT * FROM file_modifications
-                        WHERE agent_name = ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (agent_name, limit),
+                    rows = self._newest_modifications(
+                        cursor, "WHERE agent_name = ?", (agent_name,), limit
                     )
                 else:
-                    cursor.execute(
-                        """
-                        SELECT * FROM file_modifications
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (limit,),
-                    )
-
-                rows = cursor.fetchall()
+                    rows = self._newest_modifications(cursor, "", (), limit)
 
                 return [self._row_to_dict(row) for row in rows]
 
@@ -1201,7 +1955,7 @@ class FileSafetyManager:
                 return []
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def get_modifications_by_task(self, task_id: str) -> list[dict[str, Any]]:
         """Get all file modifications for a specific task.
@@ -1215,6 +1969,8 @@ class FileSafetyManager:
         if not self.enabled:
             return []
 
+        self.flush()
+
         with self._lock:
             conn = None
             try:
@@ -1223,8 +1979,8 @@ class FileSafetyManager:
                 cursor = conn.cursor()
 
                 cursor.execute(
-                    """
-                    SELECT * FROM file_modifications
+                    f"""
+                    SELECT * FROM {_ALL_MODIFICATIONS_VIEW}
                     WHERE task_id = ?
                     ORDER BY timestamp ASC
                     """,
@@ -1245,7 +2001,7 @@ class FileSafetyManager:
                 return []
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     # ========== Context Injection Methods ==========
 
@@ -1378,6 +2134,8 @@ class FileSafetyManager:
         if not self.enabled:
             return 0
 
+        self.flush()
+
         # Validate days is a non-negative integer
         if not isinstance(days, int) or days < 0:
             import sys
@@ -1393,11 +2151,13 @@ class FileSafetyManager:
             conn = None
             try:
                 conn = self._get_connection()
+                self._rotate_partitions(conn)
                 cursor = conn.cursor()
 
                 # Calculate cutoff timestamp to avoid SQL injection
                 cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute(
                     """
                     DELETE FROM file_modifications
@@ -1407,6 +2167,33 @@ class FileSafetyManager:
                 )
                 deleted = cursor.rowcount
 
+                dropped = False
+                for table, month in self._partitions(cursor):
+                    if _next_month(month) <= cutoff:
+                        # The whole month is past retention: drop the table
+                        # instead of deleting its rows one by one.
+                        cursor.execute(
+                            f"SELECT COALESCE(SUM(count), 0) FROM {_COUNTS_TABLE} "
+                            "WHERE partition = ? AND dimension = 'change_type'",
+                            (table,),
+                        )
+                        deleted += cursor.fetchone()[0]
+                        cursor.execute(f"DROP TABLE {table}")
+                        cursor.execute(
+                            f"DELETE FROM {_COUNTS_TABLE} WHERE partition = ?",
+                            (table,),
+                        )
+                        dropped = True
+                    elif month < cutoff:
+                        cursor.execute(
+                            f"DELETE FROM {table} WHERE timestamp < ?", (cutoff,)
+                        )
+                        if cursor.rowcount:
+                            deleted += cursor.rowcount
+                            self._refresh_partition_counts(cursor, table)
+                if dropped:
+                    self._create_modifications_view(cursor)
+
                 conn.commit()
                 return deleted
 
@@ -1420,7 +2207,7 @@ class FileSafetyManager:
                 return 0
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about file safety data.
@@ -1431,6 +2218,8 @@ class FileSafetyManager:
         if not self.enabled:
             return {}
 
+        self.flush()
+
         with self._lock:
             conn = None
             try:
@@ -1441,39 +2230,34 @@ class FileSafetyManager:
                 cursor.execute("SELECT COUNT(*) FROM file_locks")
                 active_locks = cursor.fetchone()[0]
 
-                # Total modifications
-                cursor.execute("SELECT COUNT(*) FROM file_modifications")
-                total_modifications = cursor.fetchone()[0]
+                # Sealed partitions contribute their precomputed counts;
+                # only the current month's rows are aggregated here.
+                counts = f"""
+                    SELECT key, SUM(count) AS count FROM (
+                        SELECT key, count FROM {_COUNTS_TABLE}
+                        WHERE dimension = ?
+                        UNION ALL
+                        SELECT {{column}}, COUNT(*) FROM file_modifications
+                        GROUP BY {{column}}
+                    )
+                    GROUP BY key
+                """
 
                 # Modifications by type
-                cursor.execute(
-                    """
-                    SELECT change_type, COUNT(*)
-                    FROM file_modifications
-                    GROUP BY change_type
-                    """
-                )
+                cursor.execute(counts.format(column="change_type"), ("change_type",))
                 by_type = dict(cursor.fetchall())
 
+                # Total modifications
+                total_modifications = sum(by_type.values())
+
                 # Modifications by agent
-                cursor.execute(
-                    """
-                    SELECT agent_name, COUNT(*)
-                    FROM file_modifications
-                    GROUP BY agent_name
-                    """
-                )
+                cursor.execute(counts.format(column="agent_name"), ("agent_name",))
                 by_agent = dict(cursor.fetchall())
 
                 # Most modified files
                 cursor.execute(
-                    """
-                    SELECT file_path, COUNT(*) as count
-                    FROM file_modifications
-                    GROUP BY file_path
-                    ORDER BY count DESC
-                    LIMIT 10
-                    """
+                    counts.format(column="file_path") + "ORDER BY count DESC LIMIT 10",
+                    ("file_path",),
                 )
                 most_modified = [
                     {"file_path": row[0], "count": row[1]} for row in cursor.fetchall()
@@ -1494,7 +2278,7 @@ class FileSafetyManager:
                 return {}
             finally:
                 if conn:
-                    conn.close()
+                    self._release_connection(conn)
 
     # ========== Utility Methods ==========
 
@@ -8,7 +8,7 @@ Requires optional 'grpc' dependencies: pip install synapse-a2a[grpc]
 import asyncio
 import logging
 import os
-import time
+import threading
 from collections.abc import Iterator
 from concurrent import futures
 from datetime import datetime, timezone
@@ -25,6 +25,9 @@ except ImportError:
     GRPC_AVAILABLE = False
     a2a_pb2_grpc = None  # type: ignore[assignment]
 
+from synapse.config import TASK_WAIT_RECHECK_INTERVAL
+from synapse.output_broadcast import OutputBroadcaster, OutputSubscription
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,6 +73,9 @@ class GrpcServicer(_ServicerBase):  # type: ignore[misc, unused-ignore]
 
         # In-memory task store (simplified)
         self._tasks: dict[str, dict[str, Any]] = {}
+        # Active Subscribe streams per task, woken on status changes
+        self._streams: dict[str, set[OutputSubscription]] = {}
+        self._streams_lock = threading.Lock()
 
     def _create_task(
         self,
@@ -101,6 +107,10 @@ class GrpcServicer(_ServicerBase):  # type: ignore[misc, unused-ignore]
         if task_id in self._tasks:
             self._tasks[task_id]["status"] = status
             self._tasks[task_id]["updated_at"] = datetime.now(timezone.utc)
+            with self._streams_lock:
+                streams = list(self._streams.get(task_id, ()))
+            for subscription in streams:
+                subscription.wake()
 
     def get_agent_card(self) -> dict[str, Any]:
         """Get agent card for discovery."""
@@ -193,53 +203,83 @@ class GrpcServicer(_ServicerBase):  # type: ignore[misc, unused-ignore]
         self._update_task_status(task_id, "canceled")
         return {"status": "canceled", "task_id": task_id}
 
-    def subscribe(self, task_id: str) -> Iterator[dict[str, Any]]:
+    def subscribe(
+        self, task_id: str, from_sequence: int = 0
+    ) -> Iterator[dict[str, Any]]:
         """
         Subscribe to task output stream.
 
-        Yields events until task completes.
+        Yields events until task completes. The first output event is a
+        snapshot of the current context; later ones are the deltas the
+        controller publishes, each with a ``sequence``. Passing the last
+        sequence seen as *from_sequence* resumes after a reconnect without
+        a snapshot, as long as the missed output is still retained.
         """
         task = self._tasks.get(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
-        last_len = 0
         last_status = task["status"]
+        snapshot: str | None = None
+        if self.controller:
+            snapshot, subscription = self.controller.subscribe_output(
+                from_sequence or None
+            )
+        else:
+            # No PTY output; the subscription only carries status wake-ups.
+            subscription = OutputBroadcaster().subscribe()
+        with self._streams_lock:
+            self._streams.setdefault(task_id, set()).add(subscription)
 
-        while True:
-            task = self._tasks.get(task_id)
-            if not task:
-                break
-
-            # Check for new output
-            if self.controller:
-                context = self.controller.get_context()
-                if len(context) > last_len:
-                    new_content = context[last_len:]
-                    last_len = len(context)
-                    yield {
-                        "event_type": "output",
-                        "data": new_content,
-                    }
-
-            # Check for status change
-            if task["status"] != last_status:
-                last_status = task["status"]
+        try:
+            if snapshot:
                 yield {
-                    "event_type": "status",
-                    "data": last_status,
+                    "event_type": "output",
+                    "data": snapshot,
+                    "sequence": subscription.start_sequence,
                 }
 
-            # Check for terminal state
-            if task["status"] in ["completed", "failed", "canceled"]:
-                yield {
-                    "event_type": "done",
-                    "task": task,
-                }
-                break
+            pending = subscription.drain()
+            while True:
+                task = self._tasks.get(task_id)
+                if not task:
+                    break
+
+                # Stream new output
+                for delta in pending:
+                    if delta.text:
+                        yield {
+                            "event_type": "output",
+                            "data": delta.text,
+                            "sequence": delta.seq,
+                        }
 
-            # Small delay
-            time.sleep(0.5)
+                # Check for status change
+                if task["status"] != last_status:
+                    last_status = task["status"]
+                    yield {
+                        "event_type": "status",
+                        "data": last_status,
+                    }
+
+                # Check for terminal state
+                if task["status"] in ["completed", "failed", "canceled"]:
+                    yield {
+                        "event_type": "done",
+                        "task": task,
+                    }
+                    break
+
+                # Block until output arrives or the task status changes
+                pending = subscription.wait(TASK_WAIT_RECHECK_INTERVAL)
+        finally:
+            subscription.close()
+            with self._streams_lock:
+                streams = self._streams.get(task_id)
+                if streams is not None:
+                    streams.discard(subscription)
+                    if not streams:
+                        del self._streams[task_id]
 
     # =========================================================================
     # gRPC Service Methods (PascalCase - required by generated servicer)
@@ -285,7 +325,7 @@ class GrpcServicer(_ServicerBase):  # type: ignore[misc, unused-ignore]
 
     def Subscribe(self, request: Any, context: Any) -> Iterator[dict[str, Any]]:  # noqa: N802
         """gRPC: Subscribe to task output stream."""
-        yield from self.subscribe(request.task_id)
+        yield from self.subscribe(request.task_id, getattr(request, "from_sequence", 0))
 
     def SendPriorityMessage(self, request: Any, context: Any) -> dict[str, Any]:  # noqa: N802
         """gRPC: Send a priority message."""
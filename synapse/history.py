@@ -4,19 +4,77 @@ This module provides lightweight history tracking for Synapse A2A tasks,
 enabling users to review past interactions and search historical data.
 """
 
+import atexit
 import contextlib
+import io
 import json
 import logging
 import os
 import sqlite3
 import sys
 import threading
+import time
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from synapse.config import (
+    HISTORY_CACHE_SIZE_KB,
+    HISTORY_EXPORT_CHUNK_SIZE,
+    HISTORY_WRITE_BEHIND_DELAY,
+    HISTORY_WRITE_BEHIND_MAX_PENDING,
+    HISTORY_WRITE_BEHIND_MAX_RETRIES,
+)
+from synapse.db import SQLiteDatabase
 
 logger = logging.getLogger(__name__)
 
+# Full-text index over observations.input/output: an external-content FTS5
+# table (no duplicate text storage) kept in sync by triggers. The trigram
+# tokenizer (SQLite 3.34+) matches case-insensitive substrings in any
+# script, so it answers the same queries as the LIKE scan it replaces
+# ("auth" finds "oauth", "ユーザー認証" finds Japanese text). Keywords shorter
+# than a trigram still use the scan.
+_FTS_TABLE = "observations_fts"
+_FTS_TOKENIZER = "trigram"
+_FTS_MIN_KEYWORD_CHARS = 3
+_FTS_SCHEMA = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {_FTS_TABLE} USING fts5(
+        input, output,
+        content='observations', content_rowid='id', tokenize='{_FTS_TOKENIZER}'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observations_fts_ai
+    AFTER INSERT ON observations BEGIN
+        INSERT INTO {_FTS_TABLE}(rowid, input, output)
+        VALUES (new.id, new.input, new.output);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observations_fts_ad
+    AFTER DELETE ON observations BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, input, output)
+        VALUES ('delete', old.id, old.input, old.output);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observations_fts_au
+    AFTER UPDATE OF input, output ON observations BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, input, output)
+        VALUES ('delete', old.id, old.input, old.output);
+        INSERT INTO {_FTS_TABLE}(rowid, input, output)
+        VALUES (new.id, new.input, new.output);
+    END
+    """,
+)
+
+
+def _fts_phrase_query(keyword: str) -> str:
+    """Quote *keyword* as an FTS5 phrase (a substring with trigrams)."""
+    return '"' + keyword.replace('"', '""') + '"'
+
 
 def _metadata_agent_ids(metadata: dict[str, Any]) -> set[str]:
     """Extract sender/recipient agent IDs from observation metadata."""
@@ -60,27 +118,180 @@ def _observation_matches_agent_id(observation: dict[str, Any], agent_id: str) ->
     return agent_id in _metadata_agent_ids(metadata)
 
 
-@contextlib.contextmanager
-def _db_connection(
-    db_path: str, row_factory: bool = False
-) -> Generator[sqlite3.Connection, None, None]:
-    """Context manager for SQLite database connections.
+# Materialized statistics: task counts and token/cost sums per
+# (agent, day, status), kept in step with observations by triggers so
+# `history stats` reads O(agents x days) rows instead of scanning history.
+_ROLLUP_TABLE = "observation_rollups"
+
+
+def _rollup_values(row: str) -> tuple[str, ...]:
+    """SQL expressions for one observation's rollup key and contribution."""
+    metadata = f"{row}.metadata"
+    # Only observations with a non-empty ``tokens`` object count as token
+    # usage (CASE keeps json_type away from malformed metadata, COALESCE
+    # turns a missing ``tokens`` key into 0 rather than NULL).
+    has_tokens = (
+        f"CASE WHEN json_valid({metadata}) THEN "
+        f"COALESCE(json_type({metadata}, '$.tokens') = 'object' "
+        f"AND json_extract({metadata}, '$.tokens') <> '{{}}', 0) ELSE 0 END"
+    )
+
+    def token(key: str) -> str:
+        return (
+            f"CASE WHEN {has_tokens} "
+            f"THEN COALESCE(json_extract({metadata}, '$.tokens.{key}'), 0) "
+            "ELSE 0 END"
+        )
+
+    return (
+        f"{row}.agent_name",
+        f"COALESCE(date({row}.timestamp), '')",
+        f"{row}.status",
+        has_tokens,
+        token("input_tokens"),
+        token("output_tokens"),
+        token("cost_usd"),
+    )
+
+
+def _rollup_add_sql(row: str) -> str:
+    agent, day, status, has_tokens, inp, out, cost = _rollup_values(row)
+    return f"""
+        INSERT INTO {_ROLLUP_TABLE} (agent_name, day, status, task_count,
+            token_tasks, input_tokens, output_tokens, cost_usd)
+        VALUES ({agent}, {day}, {status}, 1, {has_tokens}, {inp}, {out}, {cost})
+        ON CONFLICT(agent_name, day, status) DO UPDATE SET
+            task_count = task_count + 1,
+            token_tasks = token_tasks + excluded.token_tasks,
+            input_tokens = input_tokens + excluded.input_tokens,
+            output_tokens = output_tokens + excluded.output_tokens,
+            cost_usd = cost_usd + excluded.cost_usd;
+    """
 
-    Args:
-        db_path: Path to the SQLite database file
-        row_factory: If True, set row_factory to sqlite3.Row
 
-    Yields:
-        sqlite3.Connection that auto-commits and closes
+def _rollup_remove_sql(row: str) -> str:
+    agent, day, status, has_tokens, inp, out, cost = _rollup_values(row)
+    key = f"agent_name = {agent} AND day = {day} AND status = {status}"
+    return f"""
+        UPDATE {_ROLLUP_TABLE} SET
+            task_count = task_count - 1,
+            token_tasks = token_tasks - {has_tokens},
+            input_tokens = input_tokens - {inp},
+            output_tokens = output_tokens - {out},
+            cost_usd = cost_usd - {cost}
+        WHERE {key};
+        DELETE FROM {_ROLLUP_TABLE} WHERE {key} AND task_count <= 0;
     """
-    conn = sqlite3.connect(db_path)
-    if row_factory:
-        conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+
+
+_ROLLUP_SCHEMA = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {_ROLLUP_TABLE} (
+        agent_name TEXT NOT NULL,
+        day TEXT NOT NULL,
+        status TEXT NOT NULL,
+        task_count INTEGER NOT NULL DEFAULT 0,
+        token_tasks INTEGER NOT NULL DEFAULT 0,
+        input_tokens INTEGER NOT NULL DEFAULT 0,
+        output_tokens INTEGER NOT NULL DEFAULT 0,
+        cost_usd REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (agent_name, day, status)
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observation_rollups_ai
+    AFTER INSERT ON observations BEGIN
+        {_rollup_add_sql("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observation_rollups_ad
+    AFTER DELETE ON observations BEGIN
+        {_rollup_remove_sql("old")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS observation_rollups_au
+    AFTER UPDATE OF agent_name, status, timestamp, metadata ON observations
+    BEGIN
+        {_rollup_remove_sql("old")}
+        {_rollup_add_sql("new")}
+    END
+    """,
+)
+
+_ROLLUP_REBUILD = (
+    f"DELETE FROM {_ROLLUP_TABLE}",
+    f"""
+    INSERT INTO {_ROLLUP_TABLE} (agent_name, day, status, task_count,
+        token_tasks, input_tokens, output_tokens, cost_usd)
+    SELECT {", ".join(_rollup_values("observations")[:3])}, COUNT(*),
+        {", ".join(f"SUM({expr})" for expr in _rollup_values("observations")[3:])}
+    FROM observations
+    GROUP BY 1, 2, 3
+    """,
+)
+
+
+_INSERT_OBSERVATION = """
+    INSERT OR IGNORE INTO observations
+    (session_id, agent_name, task_id, input, output, status, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+EXPORT_FORMATS = ("jsonl", "json", "csv")
+
+_CSV_FIELDNAMES = [
+    "id",
+    "task_id",
+    "agent_name",
+    "session_id",
+    "status",
+    "timestamp",
+    "input",
+    "output",
+    "metadata",
+]
+
+
+def _csv_row(obs: dict[str, Any]) -> dict[str, Any]:
+    """Flatten an observation into a CSV row (metadata as JSON)."""
+    metadata = obs.get("metadata", {})
+    row = {field: obs.get(field, "") for field in _CSV_FIELDNAMES}
+    row["metadata"] = json.dumps(metadata) if metadata else ""
+    return row
+
+
+def _indent_json(text: str) -> str:
+    """Indent a pretty-printed JSON item to sit inside a top-level array."""
+    return "\n".join("  " + line for line in text.split("\n"))
+
+
+def _scan_token_usage(
+    rows: list[sqlite3.Row],
+) -> Generator[tuple[str, Any, Any, Any], None, None]:
+    """Yield (agent, input_tokens, output_tokens, cost_usd) from metadata rows."""
+    for row in rows:
+        meta_str = row["metadata"]
+        if not meta_str:
+            continue
+        try:
+            meta = json.loads(meta_str)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not isinstance(meta, dict):
+            continue
+        tokens = meta.get("tokens")
+        if not tokens or not isinstance(tokens, dict):
+            continue
+
+        yield (
+            row["agent_name"],
+            tokens.get("input_tokens") or 0,
+            tokens.get("output_tokens") or 0,
+            tokens.get("cost_usd") or 0.0,
+        )
 
 
 class HistoryManager:
@@ -88,27 +299,53 @@ class HistoryManager:
 
     Features:
     - Automatically creates database and schema on first use
-    - Thread-safe operations with lock protection
+    - One cached WAL connection per thread, reused across calls
+    - Optional write-behind: observations are queued and group-committed
     - Optionally disabled via SYNAPSE_HISTORY_ENABLED environment variable
     - Stores task input/output with metadata
     """
 
-    def __init__(self, db_path: str, enabled: bool = True) -> None:
+    def __init__(
+        self, db_path: str, enabled: bool = True, write_behind: bool = False
+    ) -> None:
         """Initialize HistoryManager.
 
         Args:
             db_path: Path to SQLite database file
             enabled: Whether history recording is enabled
+            write_behind: Queue saved observations and insert them in one
+                background transaction every HISTORY_WRITE_BEHIND_DELAY
+                instead of committing each save. Reads through the same
+                manager flush the queue first; call flush() or close() on
+                shutdown (queued saves are also flushed at exit).
         """
         self.enabled = enabled
         self.db_path = db_path
+        # Serializes writers within the process; readers use their own
+        # connection and WAL snapshot and do not take it.
         self._lock = threading.RLock()
+        # Whether the FTS5 index is available (SQLite built with FTS5 and
+        # the trigram tokenizer); search falls back to LIKE scans otherwise.
+        self._fts_enabled = False
+        # Whether statistics rollups are maintained (SQLite built with JSON
+        # functions); statistics fall back to full scans otherwise.
+        self._rollups_enabled = False
+        self._db = SQLiteDatabase(db_path, cache_size_kb=HISTORY_CACHE_SIZE_KB)
+        self.write_behind = write_behind
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._atexit_flush_registered = False
+        # Consecutive failed write-behind commits, and when to retry next.
+        self._flush_failures = 0
+        self._retry_at = 0.0
 
         if self.enabled:
             self._init_db()
 
     @classmethod
-    def from_env(cls, db_path: str) -> "HistoryManager":
+    def from_env(cls, db_path: str, write_behind: bool = False) -> "HistoryManager":
         """Create HistoryManager from environment variables.
 
         Respects SYNAPSE_HISTORY_ENABLED environment variable.
@@ -118,13 +355,44 @@ class HistoryManager:
 
         Args:
             db_path: Path to SQLite database file
+            write_behind: Group-commit saved observations in the background
 
         Returns:
             HistoryManager instance with enabled status from env var
         """
         env_val = os.environ.get("SYNAPSE_HISTORY_ENABLED", "true").lower()
         enabled = env_val not in ("false", "0")
-        return cls(db_path=db_path, enabled=enabled)
+        return cls(db_path=db_path, enabled=enabled, write_behind=write_behind)
+
+    @contextlib.contextmanager
+    def _connection(
+        self, row_factory: bool = False
+    ) -> Generator[sqlite3.Connection, None, None]:
+        """Use this thread's connection; commit on success, roll back on error.
+
+        Args:
+            row_factory: If True, set row_factory to sqlite3.Row
+
+        Yields:
+            sqlite3.Connection that stays open for the next call
+        """
+        conn = self._db.connection()
+        conn.row_factory = sqlite3.Row if row_factory else None
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            with contextlib.suppress(sqlite3.Error):
+                conn.rollback()
+            raise
+
+    def close(self) -> None:
+        """Flush queued observations and close all cached connections.
+
+        Call at shutdown, once no other thread is using this manager.
+        """
+        self.flush()
+        self._db.close()
 
     def _init_db(self) -> None:
         """Initialize database and create schema if needed."""
@@ -136,7 +404,7 @@ class HistoryManager:
 
         with self._lock:
             try:
-                with _db_connection(self.db_path) as conn:
+                with self._connection() as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         """
@@ -167,12 +435,96 @@ class HistoryManager:
                         "CREATE INDEX IF NOT EXISTS idx_task_id "
                         "ON observations(task_id)"
                     )
+                    cursor.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_agent_timestamp "
+                        "ON observations(agent_name, timestamp)"
+                    )
+                    self._fts_enabled = self._migrate_fts_index(cursor)
+                    self._rollups_enabled = self._migrate_rollups(cursor)
             except sqlite3.Error as e:
                 print(
                     f"Warning: Failed to initialize history DB: {e}",
                     file=sys.stderr,
                 )
 
+    def _migrate_fts_index(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the FTS5 index and its triggers, backfilling existing rows.
+
+        Databases created before the index existed, or with an index built
+        by another tokenizer, are (re)built once with an FTS5 'rebuild' the
+        first time they are opened.
+
+        Returns:
+            True if the index is usable, False to fall back to LIKE search
+        """
+        try:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (_FTS_TABLE,),
+            )
+            row = cursor.fetchone()
+            exists = row is not None and f"'{_FTS_TOKENIZER}'" in row[0]
+            if row is not None and not exists:
+                cursor.execute(f"DROP TABLE {_FTS_TABLE}")
+            for statement in _FTS_SCHEMA:
+                cursor.execute(statement)
+            if not exists:
+                cursor.execute(
+                    f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')"
+                )
+                logger.info("Migrated history: built full-text search index")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"History full-text index unavailable (non-fatal): {e}")
+            return False
+
+    def _migrate_rollups(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the statistics rollup table and its triggers.
+
+        Databases created before rollups existed are backfilled once the
+        first time they are opened; rebuild_statistics() redoes it on demand.
+
+        Returns:
+            True if rollups are maintained, False to fall back to scans
+        """
+        try:
+            cursor.execute("SELECT json_valid('{}')")
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (_ROLLUP_TABLE,),
+            )
+            exists = cursor.fetchone() is not None
+            for statement in _ROLLUP_SCHEMA:
+                cursor.execute(statement)
+            if not exists:
+                for statement in _ROLLUP_REBUILD:
+                    cursor.execute(statement)
+                logger.info("Migrated history: built statistics rollups")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"History statistics rollups unavailable (non-fatal): {e}")
+            return False
+
+    def rebuild_statistics(self) -> bool:
+        """Recompute the statistics rollups from every observation.
+
+        Returns:
+            True if the rollups were rebuilt, otherwise False
+        """
+        if not self.enabled or not self._rollups_enabled:
+            return False
+
+        self.flush()
+        with self._lock:
+            try:
+                with self._connection() as conn:
+                    for statement in _ROLLUP_REBUILD:
+                        conn.execute(statement)
+                return True
+            except sqlite3.Error as e:
+                print(f"Warning: Failed to rebuild statistics: {e}", file=sys.stderr)
+                return False
+
     def save_observation(
         self,
         task_id: str,
@@ -202,35 +554,103 @@ class HistoryManager:
             with contextlib.suppress(TypeError, ValueError):
                 metadata_json = json.dumps(metadata)
 
+        row = (
+            session_id,
+            agent_name,
+            task_id,
+            input_text,
+            output_text,
+            status,
+            metadata_json,
+        )
+        if not self.write_behind:
+            self._insert_observations([row])
+        elif self._enqueue(row):
+            # Queue is full: commit it from this thread (backpressure).
+            self.flush()
+
+    def _insert_observations(self, rows: list[tuple[Any, ...]]) -> bool:
+        """Insert observation rows in a single transaction.
+
+        Returns:
+            True if the transaction committed
+        """
         with self._lock:
             try:
-                with _db_connection(self.db_path) as conn:
-                    conn.cursor().execute(
-                        """
-                        INSERT INTO observations
-                        (session_id, agent_name, task_id, input, output,
-                         status, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            session_id,
-                            agent_name,
-                            task_id,
-                            input_text,
-                            output_text,
-                            status,
-                            metadata_json,
-                        ),
-                    )
-            except sqlite3.IntegrityError:
-                # Duplicate task_id saves are benign. The first observation wins,
-                # and later status changes should use update_observation_status().
-                logger.debug(
-                    "Observation already exists for task_id=%s; skipping duplicate save",
-                    task_id,
-                )
+                with self._connection() as conn:
+                    for row in rows:
+                        if conn.execute(_INSERT_OBSERVATION, row).rowcount == 0:
+                            # Duplicate task_id saves are benign. The first
+                            # observation wins, and later status changes should
+                            # use update_observation_status().
+                            logger.debug(
+                                "Observation already exists for task_id=%s; "
+                                "skipping duplicate save",
+                                row[2],
+                            )
             except sqlite3.Error as e:
                 print(f"Warning: Failed to save observation: {e}", file=sys.stderr)
+                return False
+            return True
+
+    def _enqueue(self, row: tuple[Any, ...]) -> bool:
+        """Queue *row* for the background writer; True if the queue is full."""
+        with self._pending_lock:
+            self._pending.append(row)
+            if not self._atexit_flush_registered:
+                atexit.register(self.flush)
+                self._atexit_flush_registered = True
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="history-write-behind", daemon=True
+                )
+                self._flusher.start()
+            return len(self._pending) >= HISTORY_WRITE_BEHIND_MAX_PENDING
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(
+                max(HISTORY_WRITE_BEHIND_DELAY, self._retry_at - time.monotonic())
+            )
+            self.flush()
+            with self._pending_lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+
+    def flush(self) -> None:
+        """Insert observations queued by write-behind saves (group commit).
+
+        Saves stay queued until their transaction commits. After a failed
+        commit the background writer retries with a doubling delay; after
+        HISTORY_WRITE_BEHIND_MAX_RETRIES failures in a row the queued saves
+        are dropped and logged.
+        """
+        if not self.write_behind:
+            return
+        with self._flush_lock:
+            with self._pending_lock:
+                batch = list(self._pending)
+            if not batch:
+                return
+            if not self._insert_observations(batch):
+                self._flush_failures += 1
+                if self._flush_failures <= HISTORY_WRITE_BEHIND_MAX_RETRIES:
+                    self._retry_at = time.monotonic() + (
+                        HISTORY_WRITE_BEHIND_DELAY * 2**self._flush_failures
+                    )
+                    return
+                logger.error(
+                    "Dropping %d queued history observations after %d failed "
+                    "commits (task_ids: %s)",
+                    len(batch),
+                    self._flush_failures,
+                    ", ".join(row[2] for row in batch),
+                )
+            self._flush_failures = 0
+            self._retry_at = 0.0
+            with self._pending_lock:
+                del self._pending[: len(batch)]
 
     def get_observation(self, task_id: str) -> dict[str, Any] | None:
         """Retrieve a specific observation by task_id.
@@ -244,19 +664,19 @@ class HistoryManager:
         if not self.enabled:
             return None
 
-        with self._lock:
-            try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "SELECT * FROM observations WHERE task_id = ?",
-                        (task_id,),
-                    )
-                    row = cursor.fetchone()
-                    return self._row_to_dict(row) if row else None
-            except sqlite3.Error as e:
-                print(f"Warning: Failed to retrieve observation: {e}", file=sys.stderr)
-                return None
+        self.flush()
+        try:
+            with self._connection(row_factory=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM observations WHERE task_id = ?",
+                    (task_id,),
+                )
+                row = cursor.fetchone()
+                return self._row_to_dict(row) if row else None
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to retrieve observation: {e}", file=sys.stderr)
+            return None
 
     def update_observation_status(
         self,
@@ -279,9 +699,11 @@ class HistoryManager:
         if not self.enabled:
             return False
 
+        # Queued saves must land before they can be updated.
+        self.flush()
         with self._lock:
             try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
+                with self._connection(row_factory=True) as conn:
                     cursor = conn.cursor()
 
                     metadata_json: str | None = None
@@ -353,44 +775,44 @@ class HistoryManager:
         if not self.enabled:
             return []
 
-        with self._lock:
-            try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
-                    cursor = conn.cursor()
-                    # When agent_id is set, post-filter discards rows so we cannot
-                    # use the user-facing limit at the SQL layer; bound it to a
-                    # generous prefetch instead.
-                    sql_limit = limit if not agent_id else limit * 20
-                    if agent_name:
-                        cursor.execute(
-                            """
-                            SELECT * FROM observations
-                            WHERE agent_name = ?
-                            ORDER BY timestamp DESC
-                            LIMIT ?
-                            """,
-                            (agent_name, sql_limit),
-                        )
-                    else:
-                        cursor.execute(
-                            """
-                            SELECT * FROM observations
-                            ORDER BY timestamp DESC
-                            LIMIT ?
-                            """,
-                            (sql_limit,),
-                        )
-                    observations = [self._row_to_dict(row) for row in cursor.fetchall()]
-                    if agent_id:
-                        observations = [
-                            obs
-                            for obs in observations
-                            if _observation_matches_agent_id(obs, agent_id)
-                        ]
-                    return observations[:limit]
-            except sqlite3.Error as e:
-                print(f"Warning: Failed to list observations: {e}", file=sys.stderr)
-                return []
+        self.flush()
+        try:
+            with self._connection(row_factory=True) as conn:
+                cursor = conn.cursor()
+                # When agent_id is set, post-filter discards rows so we cannot
+                # use the user-facing limit at the SQL layer; bound it to a
+                # generous prefetch instead.
+                sql_limit = limit if not agent_id else limit * 20
+                if agent_name:
+                    cursor.execute(
+                        """
+                        SELECT * FROM observations
+                        WHERE agent_name = ?
+                        ORDER BY timestamp DESC
+                        LIMIT ?
+                        """,
+                        (agent_name, sql_limit),
+                    )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT * FROM observations
+                        ORDER BY timestamp DESC
+                        LIMIT ?
+                        """,
+                        (sql_limit,),
+                    )
+                observations = [self._row_to_dict(row) for row in cursor.fetchall()]
+                if agent_id:
+                    observations = [
+                        obs
+                        for obs in observations
+                        if _observation_matches_agent_id(obs, agent_id)
+                    ]
+                return observations[:limit]
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to list observations: {e}", file=sys.stderr)
+            return []
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
         """Convert sqlite3.Row to dict with parsed metadata.
@@ -422,6 +844,12 @@ class HistoryManager:
     ) -> list[dict[str, Any]]:
         """Search observations by keyword(s) in input/output fields.
 
+        Keywords match as substrings. With the trigram FTS5 index, results
+        are ordered by BM25 relevance with a ``relevance`` score (higher is
+        better). Without it (no FTS5 trigram support, or a keyword shorter
+        than three characters), observations are scanned and results are
+        ordered newest first.
+
         Args:
             keywords: List of keywords to search for
             logic: Search logic - "OR" (any keyword) or "AND" (all keywords)
@@ -435,41 +863,64 @@ class HistoryManager:
         if not self.enabled or not keywords:
             return []
 
-        with self._lock:
-            try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
-                    cursor = conn.cursor()
+        join_op = " AND " if logic.upper() == "AND" else " OR "
+        # A keyword shorter than one trigram has no index entries.
+        use_fts = self._fts_enabled and all(
+            len(keyword) >= _FTS_MIN_KEYWORD_CHARS for keyword in keywords
+        )
 
-                    like_clauses: list[str] = []
-                    params: list[Any] = []
+        self.flush()
+        try:
+            with self._connection(row_factory=True) as conn:
+                cursor = conn.cursor()
 
+                like_clauses: list[str] = []
+                params: list[Any] = []
+
+                # The index is case-insensitive; case-sensitive searches
+                # narrow its matches down with GLOB.
+                if case_sensitive or not use_fts:
                     for keyword in keywords:
                         if case_sensitive:
-                            like_clauses.append("(input GLOB ? OR output GLOB ?)")
+                            like_clauses.append("(o.input GLOB ? OR o.output GLOB ?)")
                             params.extend([f"*{keyword}*", f"*{keyword}*"])
                         else:
                             like_clauses.append(
-                                "(LOWER(input) LIKE ? OR LOWER(output) LIKE ?)"
+                                "(LOWER(o.input) LIKE ? OR LOWER(o.output) LIKE ?)"
                             )
                             params.extend(
                                 [f"%{keyword.lower()}%", f"%{keyword.lower()}%"]
                             )
 
-                    join_op = " AND " if logic.upper() == "AND" else " OR "
-                    where_clause = join_op.join(like_clauses)
-
-                    query = f"SELECT * FROM observations WHERE ({where_clause})"
-                    if agent_name:
-                        query += " AND agent_name = ?"
-                        params.append(agent_name)
-                    query += " ORDER BY timestamp DESC LIMIT ?"
-                    params.append(limit)
+                if use_fts:
+                    query = (
+                        f"SELECT o.*, -bm25({_FTS_TABLE}) AS relevance "
+                        f"FROM {_FTS_TABLE} "
+                        f"JOIN observations o ON o.id = {_FTS_TABLE}.rowid "
+                        f"WHERE {_FTS_TABLE} MATCH ?"
+                    )
+                    params.insert(0, join_op.join(map(_fts_phrase_query, keywords)))
+                    if like_clauses:
+                        query += f" AND ({join_op.join(like_clauses)})"
+                else:
+                    query = (
+                        "SELECT o.* FROM observations o "
+                        f"WHERE ({join_op.join(like_clauses)})"
+                    )
+                if agent_name:
+                    query += " AND o.agent_name = ?"
+                    params.append(agent_name)
+                if use_fts:
+                    query += " ORDER BY relevance DESC, o.timestamp DESC LIMIT ?"
+                else:
+                    query += " ORDER BY o.timestamp DESC LIMIT ?"
+                params.append(limit)
 
-                    cursor.execute(query, params)
-                    return [self._row_to_dict(row) for row in cursor.fetchall()]
-            except sqlite3.Error as e:
-                print(f"Warning: Failed to search observations: {e}", file=sys.stderr)
-                return []
+                cursor.execute(query, params)
+                return [self._row_to_dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to search observations: {e}", file=sys.stderr)
+            return []
 
     def recall_observations(
         self,
@@ -547,28 +998,27 @@ class HistoryManager:
         if not self.enabled:
             return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
 
+        self.flush()
         with self._lock:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    f"""DELETE FROM observations
-                       WHERE timestamp < datetime('now', '-{days} days')"""
-                )
-                deleted_count = cursor.rowcount
-                conn.commit()
+                with self._connection() as conn:
+                    cursor = conn.cursor()
 
-                vacuum_reclaimed_mb = 0.0
-                if vacuum and deleted_count > 0:
-                    vacuum_reclaimed_mb = self._run_vacuum(conn, cursor)
+                    cursor.execute(
+                        f"""DELETE FROM observations
+                           WHERE timestamp < datetime('now', '-{days} days')"""
+                    )
+                    deleted_count = cursor.rowcount
+                    conn.commit()
 
-                conn.close()
+                    vacuum_reclaimed_mb = 0.0
+                    if vacuum and deleted_count > 0:
+                        vacuum_reclaimed_mb = self._run_vacuum(conn, cursor)
 
-                return {
-                    "deleted_count": deleted_count,
-                    "vacuum_reclaimed_mb": vacuum_reclaimed_mb,
-                }
+                    return {
+                        "deleted_count": deleted_count,
+                        "vacuum_reclaimed_mb": vacuum_reclaimed_mb,
+                    }
             except sqlite3.Error as e:
                 print(f"Warning: Failed to cleanup observations: {e}", file=sys.stderr)
                 return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
@@ -590,58 +1040,60 @@ class HistoryManager:
         if not self.enabled:
             return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
 
+        self.flush()
         with self._lock:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
+                with self._connection() as conn:
+                    cursor = conn.cursor()
 
-                # Check current size
-                current_size_mb = Path(self.db_path).stat().st_size / (1024 * 1024)
+                    # Check current size (move WAL contents into the main
+                    # file first so its size reflects every saved row)
+                    cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    current_size_mb = Path(self.db_path).stat().st_size / (1024 * 1024)
 
-                if current_size_mb <= max_size_mb:
-                    conn.close()
-                    return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
+                    if current_size_mb <= max_size_mb:
+                        return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
 
-                # Delete in batches (25% at a time) until under target size
-                cursor.execute("SELECT COUNT(*) FROM observations")
-                total_rows = cursor.fetchone()[0]
-                deleted_count = 0
-                max_iterations = 10
+                    # Delete in batches (25% at a time) until under target size
+                    cursor.execute("SELECT COUNT(*) FROM observations")
+                    total_rows = cursor.fetchone()[0]
+                    deleted_count = 0
+                    max_iterations = 10
 
-                for _ in range(max_iterations):
-                    # Delete oldest 25% of remaining records
-                    batch_size = max(1, total_rows // 4)
+                    for _ in range(max_iterations):
+                        # Delete oldest 25% of remaining records
+                        batch_size = max(1, total_rows // 4)
 
-                    cursor.execute(
-                        """DELETE FROM observations
-                           WHERE id IN (
-                               SELECT id FROM observations
-                               ORDER BY timestamp ASC
-                               LIMIT ?
-                           )""",
-                        (batch_size,),
-                    )
-
-                    deleted_count += cursor.rowcount
-                    total_rows -= cursor.rowcount
-                    conn.commit()
+                        cursor.execute(
+                            """DELETE FROM observations
+                               WHERE id IN (
+                                   SELECT id FROM observations
+                                   ORDER BY timestamp ASC
+                                   LIMIT ?
+                               )""",
+                            (batch_size,),
+                        )
 
-                    # Check size after deletion
-                    current_size_mb = Path(self.db_path).stat().st_size / (1024 * 1024)
+                        deleted_count += cursor.rowcount
+                        total_rows -= cursor.rowcount
+                        conn.commit()
 
-                    if current_size_mb <= max_size_mb or total_rows == 0:
-                        break
+                        # Check size after deletion
+                        current_size_mb = Path(self.db_path).stat().st_size / (
+                            1024 * 1024
+                        )
 
-                vacuum_reclaimed_mb = 0.0
-                if vacuum and deleted_count > 0:
-                    vacuum_reclaimed_mb = self._run_vacuum(conn, cursor)
+                        if current_size_mb <= max_size_mb or total_rows == 0:
+                            break
 
-                conn.close()
+                    vacuum_reclaimed_mb = 0.0
+                    if vacuum and deleted_count > 0:
+                        vacuum_reclaimed_mb = self._run_vacuum(conn, cursor)
 
-                return {
-                    "deleted_count": deleted_count,
-                    "vacuum_reclaimed_mb": vacuum_reclaimed_mb,
-                }
+                    return {
+                        "deleted_count": deleted_count,
+                        "vacuum_reclaimed_mb": vacuum_reclaimed_mb,
+                    }
             except sqlite3.Error as e:
                 print(f"Warning: Failed to cleanup by size: {e}", file=sys.stderr)
                 return {"deleted_count": 0, "vacuum_reclaimed_mb": 0}
@@ -673,10 +1125,9 @@ class HistoryManager:
         if not self.enabled:
             return {}
 
-        with self._lock:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
+        self.flush()
+        try:
+            with self._connection(row_factory=True) as conn:
                 cursor = conn.cursor()
 
                 # Build WHERE clause for agent filter
@@ -686,15 +1137,35 @@ class HistoryManager:
                     where_clause = "WHERE agent_name = ?"
                     params = [agent_name]
 
-                # Total task count
+                # Task counts per (agent, status), from the rollups when
+                # they are maintained
+                if self._rollups_enabled:
+                    source = f"SUM(task_count) FROM {_ROLLUP_TABLE}"
+                else:
+                    source = "COUNT(*) FROM observations"
                 cursor.execute(
-                    f"SELECT COUNT(*) FROM observations {where_clause}",
+                    f"SELECT agent_name, status, {source} {where_clause} "
+                    "GROUP BY agent_name, status",
                     params,
                 )
-                total_tasks = cursor.fetchone()[0]
-
+                status_counts: dict[str, int] = {}
+                by_agent: dict[str, dict[str, int]] = {}
+                for agent, status, count in cursor.fetchall():
+                    status_counts[status] = status_counts.get(status, 0) + count
+                    if agent_name:
+                        continue  # Per-agent breakdown only when not filtering
+                    if agent not in by_agent:
+                        by_agent[agent] = {
+                            "total": 0,
+                            "completed": 0,
+                            "failed": 0,
+                            "canceled": 0,
+                        }
+                    by_agent[agent][status] = count
+                    by_agent[agent]["total"] += count
+
+                total_tasks = sum(status_counts.values())
                 if total_tasks == 0:
-                    conn.close()
                     return {
                         "total_tasks": 0,
                         "completed": 0,
@@ -708,11 +1179,6 @@ class HistoryManager:
                         "date_range_days": 0,
                     }
 
-                # Status breakdown
-                sql = f"SELECT status, COUNT(*) FROM observations {where_clause}"
-                cursor.execute(f"{sql} GROUP BY status", params)
-                status_counts = dict(cursor.fetchall())
-
                 completed = status_counts.get("completed", 0)
                 failed = status_counts.get("failed", 0)
                 canceled = status_counts.get("canceled", 0)
@@ -723,28 +1189,13 @@ class HistoryManager:
                     (completed / total_finished * 100) if total_finished > 0 else 0.0
                 )
 
-                # Per-agent breakdown (only if not filtering by agent)
-                by_agent = {}
-                if not agent_name:
-                    cursor.execute(
-                        """SELECT agent_name, status, COUNT(*)
-                           FROM observations
-                           GROUP BY agent_name, status"""
-                    )
-                    for agent, status, count in cursor.fetchall():
-                        if agent not in by_agent:
-                            by_agent[agent] = {
-                                "total": 0,
-                                "completed": 0,
-                                "failed": 0,
-                                "canceled": 0,
-                            }
-                        by_agent[agent][status] = count
-                        by_agent[agent]["total"] += count
-
-                # Time range
-                sql = "SELECT MIN(timestamp), MAX(timestamp) FROM observations"
-                cursor.execute(f"{sql} {where_clause}", params)
+                # Time range. Separate MIN/MAX subqueries so each is a single
+                # lookup on the timestamp (or agent_name, timestamp) index.
+                cursor.execute(
+                    f"SELECT (SELECT MIN(timestamp) FROM observations {where_clause}),"
+                    f" (SELECT MAX(timestamp) FROM observations {where_clause})",
+                    params * 2,
+                )
                 oldest, newest = cursor.fetchone()
 
                 # Calculate date range in days
@@ -759,8 +1210,6 @@ class HistoryManager:
                 # Database size
                 db_size_mb = self.get_database_size() / (1024 * 1024)
 
-                conn.close()
-
                 return {
                     "total_tasks": total_tasks,
                     "completed": completed,
@@ -773,9 +1222,9 @@ class HistoryManager:
                     "newest_task": newest,
                     "date_range_days": date_range_days,
                 }
-            except sqlite3.Error as e:
-                print(f"Warning: Failed to get statistics: {e}", file=sys.stderr)
-                return {}
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to get statistics: {e}", file=sys.stderr)
+            return {}
 
     def get_token_statistics(
         self,
@@ -783,8 +1232,9 @@ class HistoryManager:
     ) -> dict[str, Any]:
         """Get aggregated token usage statistics from observation metadata.
 
-        Scans all observations' metadata JSON for a ``tokens`` key and
-        aggregates input_tokens, output_tokens, and cost_usd.
+        Sums input_tokens, output_tokens, and cost_usd from the ``tokens``
+        key of each observation's metadata, read from the statistics
+        rollups (or by scanning every observation when they are unavailable).
 
         Args:
             agent_name: Optional filter to get stats for specific agent only.
@@ -803,163 +1253,208 @@ class HistoryManager:
             "by_agent": {},
         }
 
-        with self._lock:
-            try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
-                    where = ""
-                    params: list[str] = []
-                    if agent_name:
-                        where = "WHERE agent_name = ?"
-                        params = [agent_name]
+        self.flush()
+        try:
+            with self._connection(row_factory=True) as conn:
+                where = ""
+                params: list[str] = []
+                if agent_name:
+                    where = "WHERE agent_name = ?"
+                    params = [agent_name]
 
-                    cursor = conn.cursor()
+                cursor = conn.cursor()
+                if self._rollups_enabled:
+                    cursor.execute(
+                        "SELECT agent_name, SUM(input_tokens), SUM(output_tokens), "
+                        f"SUM(cost_usd) FROM {_ROLLUP_TABLE} {where} "
+                        "GROUP BY agent_name HAVING SUM(token_tasks) > 0",
+                        params,
+                    )
+                    usage = cursor.fetchall()
+                else:
                     cursor.execute(
                         f"SELECT agent_name, metadata FROM observations {where}",
                         params,
                     )
-
-                    for row in cursor.fetchall():
-                        meta_str = row["metadata"]
-                        if not meta_str:
-                            continue
-                        try:
-                            meta = json.loads(meta_str)
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-                        if not isinstance(meta, dict):
-                            continue
-                        tokens = meta.get("tokens")
-                        if not tokens or not isinstance(tokens, dict):
-                            continue
-
-                        inp = tokens.get("input_tokens") or 0
-                        out = tokens.get("output_tokens") or 0
-                        cost = tokens.get("cost_usd") or 0.0
-
-                        totals["total_input_tokens"] += inp
-                        totals["total_output_tokens"] += out
-                        totals["total_cost_usd"] += cost
-
-                        agent = row["agent_name"]
-                        if agent not in totals["by_agent"]:
-                            totals["by_agent"][agent] = {
-                                "input_tokens": 0,
-                                "output_tokens": 0,
-                                "cost_usd": 0.0,
-                            }
-                        totals["by_agent"][agent]["input_tokens"] += inp
-                        totals["by_agent"][agent]["output_tokens"] += out
-                        totals["by_agent"][agent]["cost_usd"] += cost
-
-            except sqlite3.Error as e:
-                print(
-                    f"Warning: Failed to get token statistics: {e}",
-                    file=sys.stderr,
-                )
+                    usage = list(_scan_token_usage(cursor.fetchall()))
+
+                for agent, inp, out, cost in usage:
+                    totals["total_input_tokens"] += inp
+                    totals["total_output_tokens"] += out
+                    totals["total_cost_usd"] += cost
+
+                    if agent not in totals["by_agent"]:
+                        totals["by_agent"][agent] = {
+                            "input_tokens": 0,
+                            "output_tokens": 0,
+                            "cost_usd": 0.0,
+                        }
+                    totals["by_agent"][agent]["input_tokens"] += inp
+                    totals["by_agent"][agent]["output_tokens"] += out
+                    totals["by_agent"][agent]["cost_usd"] += cost
+
+        except sqlite3.Error as e:
+            print(
+                f"Warning: Failed to get token statistics: {e}",
+                file=sys.stderr,
+            )
 
         return totals
 
-    def export_observations(
+    def iter_observations(
         self,
-        format: str = "json",
         agent_name: str | None = None,
         limit: int | None = None,
-    ) -> str:
-        """Export observations in specified format (JSON or CSV).
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        chunk_size: int = HISTORY_EXPORT_CHUNK_SIZE,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield observations newest first, reading the cursor in chunks.
+
+        All filters run in SQL, and at most *chunk_size* rows are held in
+        memory at a time regardless of history size.
 
         Args:
-            format: Export format - "json" or "csv" (default: "json")
             agent_name: Optional filter by agent name
-            limit: Optional maximum number of observations to export
+            limit: Optional maximum number of observations
+            status: Optional filter by task status
+            since: Optional lower timestamp bound, inclusive ("YYYY-MM-DD[ HH:MM:SS]")
+            until: Optional upper timestamp bound, exclusive
+            chunk_size: Rows fetched from SQLite per round trip
 
-        Returns:
-            String representation of exported data in requested format
+        Yields:
+            Observation dicts with parsed metadata
+
+        Raises:
+            sqlite3.Error: If the query fails
         """
         if not self.enabled:
-            return "[]" if format.lower() == "json" else ""
+            return
 
-        with self._lock:
-            try:
-                with _db_connection(self.db_path, row_factory=True) as conn:
-                    cursor = conn.cursor()
+        clauses: list[str] = []
+        params: list[Any] = []
+        for clause, value in (
+            ("agent_name = ?", agent_name),
+            ("status = ?", status),
+            ("timestamp >= ?", since),
+            ("timestamp < ?", until),
+        ):
+            if value:
+                clauses.append(clause)
+                params.append(value)
+
+        query = "SELECT * FROM observations"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        self.flush()
+        with self._connection(row_factory=True) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            while rows := cursor.fetchmany(chunk_size):
+                for row in rows:
+                    yield self._row_to_dict(row)
+
+    def write_export(
+        self,
+        out: TextIO,
+        format: str = "jsonl",
+        agent_name: str | None = None,
+        limit: int | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> int:
+        """Stream observations to *out* as JSON Lines, a JSON array, or CSV.
 
-                    query = "SELECT * FROM observations"
-                    params: list[Any] = []
+        Rows are written as they are read (see iter_observations), so memory
+        use stays constant. The JSON and CSV output is identical to
+        export_observations().
 
-                    if agent_name:
-                        query += " WHERE agent_name = ?"
-                        params.append(agent_name)
+        Args:
+            out: Text stream to write to (file, gzip text stream, stdout)
+            format: "jsonl", "json" or "csv"
+            agent_name: Optional filter by agent name
+            limit: Optional maximum number of observations to export
+            status: Optional filter by task status
+            since: Optional lower timestamp bound, inclusive
+            until: Optional upper timestamp bound, exclusive
 
-                    query += " ORDER BY timestamp DESC"
+        Returns:
+            Number of observations written
 
-                    if limit:
-                        query += " LIMIT ?"
-                        params.append(limit)
+        Raises:
+            ValueError: If *format* is not supported
+            sqlite3.Error: If reading the history fails; rows written
+                before the failure stay in *out*
+        """
+        import csv
 
-                    cursor.execute(query, params)
-                    observations = [self._row_to_dict(row) for row in cursor.fetchall()]
+        format = format.lower()
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {format}")
 
-                if format.lower() == "json":
-                    return json.dumps(observations, indent=2, default=str)
-                elif format.lower() == "csv":
-                    return self._export_to_csv(observations)
-                else:
-                    print(f"Warning: Unknown export format: {format}", file=sys.stderr)
-                    return "[]" if format.lower() == "json" else ""
+        observations = self.iter_observations(
+            agent_name=agent_name,
+            limit=limit,
+            status=status,
+            since=since,
+            until=until,
+        )
+        writer = csv.DictWriter(out, fieldnames=_CSV_FIELDNAMES)
+        count = 0
+        for obs in observations:
+            if format == "jsonl":
+                out.write(json.dumps(obs, default=str) + "\n")
+            elif format == "json":
+                item = json.dumps(obs, indent=2, default=str)
+                out.write(("[\n" if count == 0 else ",\n") + _indent_json(item))
+            else:
+                if count == 0:
+                    writer.writeheader()
+                writer.writerow(_csv_row(obs))
+            count += 1
+
+        if format == "json":
+            out.write("\n]" if count else "[]")
+        return count
 
-            except sqlite3.Error as e:
-                print(f"Warning: Failed to export observations: {e}", file=sys.stderr)
-                return "[]" if format.lower() == "json" else ""
+    def export_observations(
+        self,
+        format: str = "json",
+        agent_name: str | None = None,
+        limit: int | None = None,
+    ) -> str:
+        """Export observations in specified format (JSON or CSV).
 
-    def _export_to_csv(self, observations: list[dict[str, Any]]) -> str:
-        """Convert observations to CSV format.
+        Builds the whole export in memory; use write_export() to stream
+        large histories to a file.
 
         Args:
-            observations: List of observation dictionaries
+            format: Export format - "json" or "csv" (default: "json")
+            agent_name: Optional filter by agent name
+            limit: Optional maximum number of observations to export
 
         Returns:
-            CSV string representation
+            String representation of exported data in requested format
         """
-        import csv
-        import io
+        if not self.enabled:
+            return "[]" if format.lower() == "json" else ""
 
-        if not observations:
+        if format.lower() not in ("json", "csv"):
+            print(f"Warning: Unknown export format: {format}", file=sys.stderr)
             return ""
 
         output = io.StringIO()
-
-        # Define field order
-        fieldnames = [
-            "id",
-            "task_id",
-            "agent_name",
-            "session_id",
-            "status",
-            "timestamp",
-            "input",
-            "output",
-            "metadata",
-        ]
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for obs in observations:
-            # Handle metadata serialization
-            metadata = obs.get("metadata", {})
-            metadata_str = json.dumps(metadata) if metadata else ""
-
-            row = {
-                "id": obs.get("id", ""),
-                "task_id": obs.get("task_id", ""),
-                "agent_name": obs.get("agent_name", ""),
-                "session_id": obs.get("session_id", ""),
-                "status": obs.get("status", ""),
-                "timestamp": obs.get("timestamp", ""),
-                "input": obs.get("input", ""),
-                "output": obs.get("output", ""),
-                "metadata": metadata_str,
-            }
-            writer.writerow(row)
-
+        try:
+            self.write_export(output, format=format, agent_name=agent_name, limit=limit)
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to export observations: {e}", file=sys.stderr)
+            return "[]" if format.lower() == "json" else ""
         return output.getvalue()
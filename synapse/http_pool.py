@@ -0,0 +1,183 @@
+"""Process-wide pooled HTTP clients for local agent communication.
+
+Local sends, task creation and task polling all talk to the same few
+agents. Building a fresh client per request (or using one-shot
+``requests.post``) forces a new socket connect every time; these helpers
+hand out one long-lived ``httpx.Client`` per UDS path and one
+``requests.Session`` for TCP so keep-alive connections are reused.
+
+Timeouts are passed per request, so a single pooled client serves callers
+with different timeout needs.
+
+Async clients are bound to the event loop that created them and are
+therefore pooled per loop. Close them with ``aclose_async_clients()``
+before a short-lived loop ends; clients dropped with their loop are
+logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import logging
+import threading
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool per client. Local agents are few; the limits only bound
+# pathological fan-out.
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=0.5)
+
+_lock = threading.Lock()
+_clients: dict[str | None, httpx.Client] = {}
+_session: requests.Session | None = None
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str | None, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def get_client(uds_path: str | None = None) -> httpx.Client:
+    """Return the shared httpx client for *uds_path* (plain TCP when None).
+
+    UDS requests should use ``http://localhost/...`` URLs; the transport
+    ignores the host.
+    """
+    client = _clients.get(uds_path)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(uds_path)
+        if client is None:
+            transport = (
+                httpx.HTTPTransport(uds=uds_path, limits=_LIMITS)
+                if uds_path
+                else httpx.HTTPTransport(limits=_LIMITS)
+            )
+            client = httpx.Client(transport=transport, timeout=_DEFAULT_TIMEOUT)
+            _clients[uds_path] = client
+        return client
+
+
+def get_session() -> requests.Session:
+    """Return the shared ``requests.Session`` for TCP requests."""
+    global _session
+    session = _session
+    if session is not None:
+        return session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def get_async_client(uds_path: str | None = None) -> httpx.AsyncClient:
+    """Return the shared async client for *uds_path* on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        per_loop = _async_clients.get(loop)
+        if per_loop is None:
+            per_loop = _async_clients[loop] = {}
+            # At exit close_clients() closes whatever is still pooled.
+            weakref.finalize(loop, _warn_unclosed, per_loop).atexit = False
+        client = per_loop.get(uds_path)
+        if client is None:
+            transport = (
+                httpx.AsyncHTTPTransport(uds=uds_path, limits=_LIMITS)
+                if uds_path
+                else httpx.AsyncHTTPTransport(limits=_LIMITS)
+            )
+            client = httpx.AsyncClient(transport=transport, timeout=_DEFAULT_TIMEOUT)
+            per_loop[uds_path] = client
+        return client
+
+
+def discard_client(uds_path: str | None = None) -> None:
+    """Close and drop the pooled client for *uds_path*.
+
+    Used after transport errors so a restarted agent (new socket inode) is
+    reached with fresh connections.
+    """
+    with _lock:
+        client = _clients.pop(uds_path, None)
+    if client is not None:
+        with contextlib.suppress(Exception):
+            client.close()
+
+
+async def aclose_async_clients() -> None:
+    """Close the async clients pooled for the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        per_loop = _async_clients.pop(loop, {})
+    for client in per_loop.values():
+        with contextlib.suppress(Exception):
+            await client.aclose()
+
+
+def _warn_unclosed(per_loop: dict[str | None, httpx.AsyncClient]) -> None:
+    """Warn about pooled async clients left open when their loop went away."""
+    unclosed = [client for client in per_loop.values() if not client.is_closed]
+    per_loop.clear()
+    if unclosed:
+        logger.warning(
+            "Dropping %d pooled async HTTP client(s) whose event loop is gone; "
+            "close them with aclose_async_clients() before the loop ends",
+            len(unclosed),
+        )
+
+
+def _aclose_on_loop(
+    loop: asyncio.AbstractEventLoop, per_loop: dict[str | None, httpx.AsyncClient]
+) -> None:
+    """Close *per_loop*'s clients on their own loop, or warn if it is gone."""
+    clients = list(per_loop.values())
+
+    async def aclose_all() -> None:
+        for client in clients:
+            with contextlib.suppress(Exception):
+                await client.aclose()
+
+    if loop.is_running():
+        # Owned by another thread (or the caller's own loop): schedule it.
+        asyncio.run_coroutine_threadsafe(aclose_all(), loop)
+        return
+    if not loop.is_closed():
+        try:
+            loop.run_until_complete(aclose_all())
+            return
+        except RuntimeError:
+            pass  # Another loop is running in this thread.
+    _warn_unclosed(per_loop)
+
+
+def close_clients() -> None:
+    """Close every pooled client, async ones on their own event loops."""
+    global _session
+    with _lock:
+        clients: list[httpx.Client | requests.Session] = list(_clients.values())
+        if _session is not None:
+            clients.append(_session)
+        _clients.clear()
+        _session = None
+        async_clients = list(_async_clients.items())
+        _async_clients.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            client.close()
+    for loop, per_loop in async_clients:
+        if per_loop:
+            _aclose_on_loop(loop, per_loop)
+
+
+atexit.register(close_clients)
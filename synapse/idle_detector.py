@@ -55,6 +55,9 @@ _HEURISTIC_REGEX = re.compile(
 # trusting the profile only.
 _HEURISTIC_CONFIDENCE = 0.6
 _PRIMARY_CONFIDENCE = 1.0
+# Rows of unchanged screen above/below the redrawn region that are
+# included when matching WAITING prompts against renderer deltas.
+_WAITING_CONTEXT_ROWS = 2
 
 
 @dataclass(frozen=True)
@@ -156,7 +159,9 @@ class IdleDetector:
             )
             return None
 
-    def check_pattern_idle(self, output_buffer: bytes, pattern_detected: bool) -> bool:
+    def check_pattern_idle(
+        self, output_buffer: bytes | memoryview, pattern_detected: bool
+    ) -> bool:
         if self.idle_strategy not in ("pattern", "hybrid") or not self.idle_regex:
             return False
 
@@ -239,7 +244,7 @@ class IdleDetector:
         self,
         *,
         new_data: bytes,
-        output_buffer: bytes,
+        output_buffer: bytes | memoryview,
         last_output_time: float | None,
         waiting_pattern_time: float | None,
     ) -> tuple[bool, float | None, float, str]:
@@ -282,12 +287,23 @@ class IdleDetector:
         if new_data:
             if self._renderer is not None:
                 self._renderer.feed(new_data)
-                # renderer path: match against the full rendered screen
-                rendered_text = self._renderer.render_text()
-                rendered_text_tail = rendered_text.rstrip()[-256:]
+                # renderer path: match against the rows this chunk redrew
+                # (plus a little context) instead of the whole screen.
+                changed_text = self._renderer.pop_changed_text(
+                    context=_WAITING_CONTEXT_ROWS
+                )
                 pattern_visible, confidence, source = self._match_waiting_prompt(
-                    rendered_text
+                    changed_text
                 )
+                rendered_text = self._renderer.render_text()
+                if not pattern_visible and waiting_pattern_time is not None:
+                    # A prompt detected earlier may still sit on an
+                    # unchanged row; keep refreshing it like before.
+                    pattern_visible, confidence, source = self._match_waiting_prompt(
+                        rendered_text,
+                        preferred_source=self._waiting_source,
+                    )
+                rendered_text_tail = rendered_text.rstrip()[-256:]
             else:
                 new_text = self._strip_ansi(new_data.decode("utf-8", errors="replace"))
                 rendered_text_tail = new_text[-256:]
@@ -302,7 +318,7 @@ class IdleDetector:
                 rendered_text_tail = self._renderer.render_text().rstrip()[-256:]
             else:
                 rendered_text_tail = self._strip_ansi(
-                    output_buffer[-512:].decode("utf-8", errors="replace")
+                    bytes(output_buffer[-512:]).decode("utf-8", errors="replace")
                 )[-256:]
 
         if pattern_visible:
@@ -322,7 +338,7 @@ class IdleDetector:
                 # single source that compound_signal tests manipulate
                 # via direct ``ctrl.output_buffer = ...`` assignment.
                 buffer_text = self._strip_ansi(
-                    output_buffer[-512:].decode("utf-8", errors="replace")
+                    bytes(output_buffer[-512:]).decode("utf-8", errors="replace")
                 )
                 still_visible, confidence, source = self._match_waiting_prompt(
                     buffer_text,
@@ -430,7 +446,7 @@ class IdleDetector:
         self,
         *,
         new_data: bytes,
-        output_buffer: bytes,
+        output_buffer: bytes | memoryview,
         last_output_time: float | None,
         pattern_detected: bool,
         waiting_pattern_time: float | None,
@@ -0,0 +1,266 @@
+"""Per-agent inbox for messages that arrive while the agent is busy.
+
+A PTY-backed agent works on one task at a time. Messages sent while it has
+a working task are queued here instead of being rejected with 409, ordered
+by priority (highest first) and then by arrival, and the A2A router injects
+the next one when the agent becomes READY again.
+
+The queue is a heap in memory. Given a database path, it is also written
+through to SQLite (one row per queued message, keyed by agent ID), so
+messages still queued when the server stops are delivered after a restart.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from synapse.config import AGENT_INBOX_MAX_DEPTH
+from synapse.db import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS inbox (
+        agent_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        seq INTEGER NOT NULL,
+        enqueued_at REAL NOT NULL,
+        request TEXT NOT NULL,
+        PRIMARY KEY (agent_id, task_id)
+    )
+"""
+
+
+@dataclass
+class QueuedMessage:
+    """A message waiting in an agent's inbox."""
+
+    task_id: str
+    priority: int
+    seq: int
+    enqueued_at: float
+    request: dict[str, Any]
+
+    def wait_seconds(self, now: float | None = None) -> float:
+        """Seconds since the message was queued."""
+        return max(0.0, (now if now is not None else time.time()) - self.enqueued_at)
+
+
+class AgentInbox:
+    """Priority queue of messages for one agent, optionally persisted.
+
+    Thread-safe: the router pushes from request handlers and pops from the
+    controller's status callback thread.
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        db_path: str | None = None,
+        max_depth: int = AGENT_INBOX_MAX_DEPTH,
+    ) -> None:
+        """Initialize AgentInbox.
+
+        Args:
+            agent_id: Agent whose messages this inbox holds
+            db_path: SQLite database to persist queued messages in, or None
+                to keep them in memory only
+            max_depth: Max queued messages; push() refuses more
+        """
+        self.agent_id = agent_id
+        self.db_path = db_path
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+        # (-priority, seq, task_id); entries whose task_id is no longer in
+        # _items were removed and are skipped when popped
+        self._heap: list[tuple[int, int, str]] = []
+        self._items: dict[str, QueuedMessage] = {}
+        self._next_seq = 0
+        self._delivered = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._db: SQLiteDatabase | None = None
+
+        if db_path:
+            self._load()
+
+    def _load(self) -> None:
+        """Open the database and restore messages queued before a restart."""
+        assert self.db_path is not None
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = SQLiteDatabase(self.db_path)
+            with self._db.transaction() as conn:
+                conn.execute(_SCHEMA)
+                rows = conn.execute(
+                    "SELECT task_id, priority, seq, enqueued_at, request "
+                    "FROM inbox WHERE agent_id = ?",
+                    (self.agent_id,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Inbox database unavailable, queueing in memory: %s", e)
+            self._db = None
+            return
+
+        for task_id, priority, seq, enqueued_at, request in rows:
+            try:
+                payload = json.loads(request)
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("Dropping unreadable queued message %s", task_id)
+                self._delete(task_id)
+                continue
+            message = QueuedMessage(task_id, priority, seq, enqueued_at, payload)
+            self._items[task_id] = message
+            heapq.heappush(self._heap, (-priority, seq, task_id))
+            self._next_seq = max(self._next_seq, seq + 1)
+        if self._items:
+            logger.info(
+                "Restored %d queued message(s) for %s", len(self._items), self.agent_id
+            )
+
+    def _delete(self, task_id: str) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "DELETE FROM inbox WHERE agent_id = ? AND task_id = ?",
+                    (self.agent_id, task_id),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Failed to remove queued message %s: %s", task_id, e)
+
+    def push(
+        self, task_id: str, priority: int, request: dict[str, Any]
+    ) -> QueuedMessage | None:
+        """Queue a message.
+
+        Args:
+            task_id: Task created for the message (status ``submitted``)
+            priority: Higher priorities are delivered first
+            request: The SendMessageRequest as JSON, replayed on delivery
+
+        Returns:
+            The queued message, or None if the inbox is full
+        """
+        with self._lock:
+            if len(self._items) >= self.max_depth:
+                return None
+            message = QueuedMessage(
+                task_id, priority, self._next_seq, time.time(), request
+            )
+            self._next_seq += 1
+            if self._db is not None:
+                try:
+                    with self._db.transaction() as conn:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO inbox (agent_id, task_id, "
+                            "priority, seq, enqueued_at, request) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                self.agent_id,
+                                task_id,
+                                priority,
+                                message.seq,
+                                message.enqueued_at,
+                                json.dumps(request),
+                            ),
+                        )
+                except sqlite3.Error as e:
+                    logger.warning(
+                        "Failed to persist queued message %s: %s", task_id, e
+                    )
+            self._items[task_id] = message
+            heapq.heappush(self._heap, (-priority, message.seq, task_id))
+            return message
+
+    def pop(
+        self, accept: Callable[[QueuedMessage], bool] | None = None
+    ) -> QueuedMessage | None:
+        """Remove and return the next message to deliver.
+
+        Args:
+            accept: If given, the next message is only removed when
+                ``accept(message)`` is true
+
+        Returns:
+            The message, or None if the inbox is empty or *accept* refused
+            the next message (which stays queued)
+        """
+        with self._lock:
+            while self._heap:
+                task_id = self._heap[0][2]
+                message = self._items.get(task_id)
+                if message is None:
+                    heapq.heappop(self._heap)
+                    continue
+                if accept is not None and not accept(message):
+                    return None
+                heapq.heappop(self._heap)
+                del self._items[task_id]
+                self._delete(task_id)
+                wait = message.wait_seconds()
+                self._delivered += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                return message
+            return None
+
+    def remove(self, task_id: str) -> QueuedMessage | None:
+        """Drop a queued message (e.g. canceled) and return it, if queued."""
+        with self._lock:
+            message = self._items.pop(task_id, None)
+            if message is not None:
+                self._delete(task_id)
+            return message
+
+    def get(self, task_id: str) -> QueuedMessage | None:
+        """Return the queued message for *task_id*, if any."""
+        with self._lock:
+            return self._items.get(task_id)
+
+    def items(self) -> list[QueuedMessage]:
+        """Queued messages in delivery order."""
+        with self._lock:
+            return sorted(self._items.values(), key=lambda m: (-m.priority, m.seq))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._items
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and wait-time metrics (for /status)."""
+        now = time.time()
+        with self._lock:
+            oldest = min((m.enqueued_at for m in self._items.values()), default=None)
+            delivered = self._delivered
+            return {
+                "depth": len(self._items),
+                "max_depth": self.max_depth,
+                "oldest_wait_seconds": (
+                    round(max(0.0, now - oldest), 3) if oldest is not None else 0.0
+                ),
+                "delivered": delivered,
+                "avg_wait_seconds": (
+                    round(self._total_wait / delivered, 3) if delivered else 0.0
+                ),
+                "max_wait_seconds": round(self._max_wait, 3),
+                "persistent": self._db is not None,
+            }
+
+    def close(self) -> None:
+        """Close the database connections (queued rows stay persisted)."""
+        if self._db is not None:
+            self._db.close()
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from synapse.db import SQLiteDatabase
 from synapse.paths import get_instinct_db_path
 
 
@@ -21,6 +22,7 @@ class InstinctStore:
         self.enabled = enabled
         self.db_path = os.path.abspath(db_path or get_instinct_db_path())
         self._lock = threading.RLock()
+        self._db = SQLiteDatabase(self.db_path, row_factory=sqlite3.Row)
 
         if self.enabled:
             self._init_db()
@@ -31,10 +33,15 @@ class InstinctStore:
         return cls(db_path=db_path, enabled=True)
 
     def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's cached SQLite connection (WAL, busy timeout)."""
+        return self._db.connection()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Call at shutdown, once no other thread is using this store.
+        """
+        self._db.close()
 
     def _init_db(self) -> None:
         db_file = Path(self.db_path)
@@ -74,7 +81,7 @@ class InstinctStore:
                 )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
@@ -137,7 +144,7 @@ class InstinctStore:
                 ).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def get(self, instinct_id: str) -> dict[str, Any] | None:
         """Get an instinct by ID."""
@@ -152,7 +159,7 @@ class InstinctStore:
                 ).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def list(
         self,
@@ -188,7 +195,7 @@ class InstinctStore:
                 rows = conn.execute(query, params).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def find_by_trigger_action(
         self, trigger: str, action: str, project_hash: str | None = None
@@ -209,7 +216,7 @@ class InstinctStore:
                 row = conn.execute(query, params).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def update_confidence(self, instinct_id: str, new_confidence: float) -> bool:
         """Update confidence for an instinct."""
@@ -230,7 +237,7 @@ class InstinctStore:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def update_sources(
         self, instinct_id: str, source_observations: builtins.list[str]
@@ -253,7 +260,7 @@ class InstinctStore:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def promote(self, instinct_id: str) -> bool:
         """Promote a project instinct to global scope."""
@@ -274,7 +281,7 @@ class InstinctStore:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def delete(self, instinct_id: str) -> bool:
         """Delete an instinct by ID."""
@@ -291,7 +298,7 @@ class InstinctStore:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def count(
         self,
@@ -320,4 +327,4 @@ class InstinctStore:
                 row = conn.execute(query, params).fetchone()
                 return int(row[0]) if row else 0
             finally:
-                conn.close()
+                self._db.release(conn)
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from synapse.db import SQLiteDatabase
 from synapse.paths import get_observation_db_path
 
 
@@ -40,15 +41,21 @@ class ObservationStore:
         self.enabled = enabled
         self.db_path = os.path.abspath(db_path or get_observation_db_path())
         self._lock = threading.RLock()
+        self._db = SQLiteDatabase(self.db_path, row_factory=sqlite3.Row)
 
         if self.enabled:
             self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's cached SQLite connection (WAL, busy timeout)."""
+        return self._db.connection()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Call at shutdown, once no other thread is using this store.
+        """
+        self._db.close()
 
     def _init_db(self) -> None:
         db_file = Path(self.db_path)
@@ -81,7 +88,7 @@ class ObservationStore:
                 )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
@@ -134,7 +141,7 @@ class ObservationStore:
                 ).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def list(
         self,
@@ -167,7 +174,7 @@ class ObservationStore:
                 rows = conn.execute(query, params).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def search(self, query: str, limit: int = 50) -> builtins.list[dict[str, Any]]:
         """Search observations by event metadata."""
@@ -200,7 +207,7 @@ class ObservationStore:
                 ).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def count(
         self,
@@ -230,7 +237,7 @@ class ObservationStore:
                 value = conn.execute(query, params).fetchone()
                 return int(value[0]) if value else 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def clear(
         self,
@@ -261,7 +268,7 @@ class ObservationStore:
                 conn.commit()
                 return int(cursor.rowcount)
             finally:
-                conn.close()
+                self._db.release(conn)
 
 
 class ObservationCollector:
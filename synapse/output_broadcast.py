@@ -0,0 +1,216 @@
+"""
+Output Broadcast — fan-out of PTY output deltas to stream subscribers.
+
+The controller publishes each batch of decoded PTY output once. SSE
+(``/tasks/{id}/subscribe``) and gRPC ``Subscribe`` streams read the
+deltas from per-subscriber bounded queues instead of re-rendering the
+whole context buffer on every poll tick, so N subscribers cost O(new
+output) rather than O(buffer) per tick.
+
+Every delta carries a monotonically increasing sequence number (starting
+at 1). Recent deltas are retained so a reconnecting client can resume
+right after the last sequence it saw.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from types import TracebackType
+
+from synapse.config import OUTPUT_STREAM_HISTORY_CHARS, OUTPUT_STREAM_QUEUE_MAX
+
+
+class OutputDelta:
+    """One published chunk of output."""
+
+    __slots__ = ("seq", "raw", "_text", "_transform")
+
+    def __init__(
+        self, seq: int, raw: str, transform: Callable[[str], str] | None
+    ) -> None:
+        self.seq = seq
+        self.raw = raw
+        self._text: str | None = None
+        self._transform = transform
+
+    @property
+    def text(self) -> str:
+        """Transformed text, computed on first access and shared by all
+        subscribers (publishing stays cheap when nobody is listening)."""
+        if self._text is None:
+            self._text = self._transform(self.raw) if self._transform else self.raw
+        return self._text
+
+
+class OutputSubscription:
+    """A subscriber's bounded queue of pending deltas.
+
+    Use :meth:`wait` from threads and :meth:`wait_async` from the event
+    loop the subscription was created on. When the queue is full the
+    oldest delta is dropped; consumers see that as a gap in ``seq``.
+    """
+
+    def __init__(
+        self,
+        broadcaster: OutputBroadcaster,
+        queue_size: int,
+        loop: asyncio.AbstractEventLoop | None,
+    ) -> None:
+        self._broadcaster = broadcaster
+        self._cond = broadcaster._cond
+        self._queue: deque[OutputDelta] = deque(maxlen=queue_size)
+        self._loop = loop
+        self._event = asyncio.Event() if loop is not None else None
+        self._woken = False
+        # Sequence number of the last delta covered before live deltas.
+        self.start_sequence = 0
+        # True when subscribe(after=...) could replay every missed delta.
+        self.resumed = False
+
+    def _push(self, delta: OutputDelta) -> None:
+        """Queue *delta*. Caller holds the broadcaster lock."""
+        self._queue.append(delta)
+        self._signal()
+
+    def _signal(self) -> None:
+        if self._loop is not None and self._event is not None:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                self._loop.call_soon_threadsafe(self._event.set)
+
+    def _take(self) -> list[OutputDelta]:
+        items = list(self._queue)
+        self._queue.clear()
+        self._woken = False
+        return items
+
+    def wake(self) -> None:
+        """Wake a pending :meth:`wait` / :meth:`wait_async` without output,
+        e.g. after a task status change."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+            self._signal()
+
+    def drain(self) -> list[OutputDelta]:
+        """Return and clear the queued deltas without blocking."""
+        with self._cond:
+            return self._take()
+
+    def wait(self, timeout: float) -> list[OutputDelta]:
+        """Block until deltas arrive, :meth:`wake` is called or *timeout*
+        passes, then drain the queue."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while not self._queue and not self._woken:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._take()
+
+    async def wait_async(self, timeout: float) -> list[OutputDelta]:
+        """Async variant of :meth:`wait` for loop-bound subscriptions."""
+        if self._event is None:
+            raise RuntimeError("subscription was not created inside an event loop")
+        self._event.clear()
+        items = self.drain()
+        if items:
+            return items
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._event.wait(), timeout)
+        return self.drain()
+
+    def close(self) -> None:
+        """Stop receiving deltas."""
+        self._broadcaster._unsubscribe(self)
+
+    def __enter__(self) -> OutputSubscription:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class OutputBroadcaster:
+    """Thread-safe publisher of sequenced output deltas."""
+
+    def __init__(
+        self,
+        transform: Callable[[str], str] | None = None,
+        history_chars: int = OUTPUT_STREAM_HISTORY_CHARS,
+        queue_size: int = OUTPUT_STREAM_QUEUE_MAX,
+    ) -> None:
+        self._transform = transform
+        self._history_limit = history_chars
+        self._queue_size = queue_size
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._history: deque[OutputDelta] = deque()
+        self._history_chars = 0
+        self._subscribers: set[OutputSubscription] = set()
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the most recently published delta."""
+        return self._seq
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, raw: str) -> int:
+        """Publish *raw* to every subscriber and return its sequence number."""
+        if not raw:
+            return self._seq
+        with self._cond:
+            self._seq += 1
+            delta = OutputDelta(self._seq, raw, self._transform)
+            self._history.append(delta)
+            self._history_chars += len(raw)
+            while self._history_chars > self._history_limit and len(self._history) > 1:
+                self._history_chars -= len(self._history.popleft().raw)
+            for subscription in self._subscribers:
+                subscription._push(delta)
+            self._cond.notify_all()
+            return self._seq
+
+    def subscribe(self, after: int | None = None) -> OutputSubscription:
+        """Start receiving deltas published after this call.
+
+        With *after*, deltas with a higher sequence number that are still
+        retained are queued first and ``resumed`` is set. If some of them
+        were already evicted (or *after* comes from an earlier process),
+        ``resumed`` stays False and only live deltas are delivered.
+
+        Subscriptions created inside a running event loop support
+        :meth:`OutputSubscription.wait_async`.
+        """
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        subscription = OutputSubscription(self, self._queue_size, loop)
+        with self._cond:
+            if after is not None and 0 <= after <= self._seq:
+                missed = [delta for delta in self._history if delta.seq > after]
+                oldest = missed[0].seq if missed else self._seq + 1
+                if oldest == after + 1 and len(missed) <= self._queue_size:
+                    subscription._queue.extend(missed)
+                    subscription.resumed = True
+            subscription.start_sequence = self._seq
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: OutputSubscription) -> None:
+        with self._cond:
+            self._subscribers.discard(subscription)
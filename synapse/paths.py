@@ -122,6 +122,30 @@ def get_file_safety_db_path() -> str:
     )
 
 
+def get_inbox_db_path() -> str:
+    """Get the path to the agent inbox database.
+
+    Default: ~/.synapse/inbox.db (user-global; rows are keyed by agent ID).
+    Override with SYNAPSE_INBOX_DB_PATH environment variable.
+    """
+    return _resolve_path(
+        "SYNAPSE_INBOX_DB_PATH",
+        Path.home() / ".synapse" / "inbox.db",
+    )
+
+
+def get_webhook_outbox_db_path() -> str | None:
+    """Get the path to the webhook outbox database, if one is configured.
+
+    Unset by default: undelivered webhook events are kept in memory only.
+    Set SYNAPSE_WEBHOOK_OUTBOX_DB_PATH to persist them across restarts
+    (user-global is fine; rows are keyed by agent ID).
+    """
+    if not os.environ.get("SYNAPSE_WEBHOOK_OUTBOX_DB_PATH"):
+        return None
+    return _resolve_path("SYNAPSE_WEBHOOK_OUTBOX_DB_PATH", Path())
+
+
 def get_observation_db_path() -> str:
     """Get the path to the observations database.
 
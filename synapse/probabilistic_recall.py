@@ -1,9 +1,9 @@
 """Probabilistic recall over saved task history.
 
 This module implements the small, deterministic core behind issue #227:
-given candidate observations from history, score each one using frequency,
-recency, and random noise, then roll the dice to decide whether it surfaces
-as an advisory memory.
+given candidate observations from history, score each one using search
+relevance, frequency, recency, and random noise, then roll the dice to
+decide whether it surfaces as an advisory memory.
 """
 
 from __future__ import annotations
@@ -66,14 +66,23 @@ def _encounter_count(observation: dict[str, Any]) -> int:
     return 1
 
 
+def _relevance(observation: dict[str, Any]) -> float:
+    value = observation.get("relevance")
+    if isinstance(value, int | float) and value > 0:
+        return float(value)
+    return 0.0
+
+
 def score_recall_candidate(
     observation: dict[str, Any],
     *,
     now: datetime | None = None,
     noise: float = 0.0,
+    relevance: float = 0.0,
     alpha: float = 1.0,
     beta: float = 1.0,
     gamma: float = 0.35,
+    delta: float = 1.0,
     half_life_days: float = 30.0,
 ) -> float:
     """Return recall probability for a single observation.
@@ -81,6 +90,7 @@ def score_recall_candidate(
     The score follows the #227 intent without deleting data: frequently
     encountered and recent memories are more likely to surface, while noise
     makes recall non-deterministic unless tests inject stable values.
+    *relevance* is the candidate's normalized search rank (0..1).
     """
     now = now or datetime.now(timezone.utc)
     if now.tzinfo is None:
@@ -90,7 +100,13 @@ def score_recall_candidate(
     age_days = max(0.0, (now - timestamp).total_seconds() / _SECONDS_PER_DAY)
     recency = math.exp(-age_days / max(half_life_days, 0.001))
     frequency = math.log1p(_encounter_count(observation))
-    raw = (alpha * frequency) + (beta * recency) + (gamma * noise) - 2.0
+    raw = (
+        (alpha * frequency)
+        + (beta * recency)
+        + (gamma * noise)
+        + (delta * relevance)
+        - 2.0
+    )
     return 1.0 / (1.0 + math.exp(-raw))
 
 
@@ -102,17 +118,24 @@ def select_recalled_observations(
     random_fn: Callable[[], float] | None = None,
     noise_fn: Callable[[], float] | None = None,
 ) -> list[dict[str, Any]]:
-    """Select observations that pass their recall probability roll."""
+    """Select observations that pass their recall probability roll.
+
+    Candidates from a ranked history search carry a BM25 ``relevance``
+    score, normalized here against the best candidate.
+    """
     now = now or datetime.now(timezone.utc)
     roll = random_fn or random.random
     noise = noise_fn or (lambda: random.gauss(0.0, 1.0))
+    candidates = list(observations)
+    best = max((_relevance(o) for o in candidates), default=0.0)
 
     scored: list[tuple[float, dict[str, Any]]] = []
-    for observation in observations:
+    for observation in candidates:
         probability = score_recall_candidate(
             observation,
             now=now,
             noise=noise(),
+            relevance=_relevance(observation) / best if best else 0.0,
         )
         if roll() <= probability:
             scored.append((probability, observation))
@@ -26,7 +26,7 @@ from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ta2a.proto\x12\x0bsynapse.a2a\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\"&\n\x08TextPart\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\"G\n\x08\x46ilePart\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\"f\n\x04Part\x12*\n\ttext_part\x18\x01 \x01(\x0b\x32\x15.synapse.a2a.TextPartH\x00\x12*\n\tfile_part\x18\x02 \x01(\x0b\x32\x15.synapse.a2a.FilePartH\x00\x42\x06\n\x04part\"9\n\x07Message\x12\x0c\n\x04role\x18\x01 \x01(\t\x12 \n\x05parts\x18\x02 \x03(\x0b\x32\x11.synapse.a2a.Part\"?\n\x08\x41rtifact\x12\x0c\n\x04type\x18\x01 \x01(\t\x12%\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\"Q\n\tTaskError\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12%\n\x04\x64\x61ta\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\"\xb9\x02\n\x04Task\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12%\n\x07message\x18\x04 \x01(\x0b\x32\x14.synapse.a2a.Message\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.synapse.a2a.Artifact\x12%\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x16.synapse.a2a.TaskError\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12)\n\x08metadata\x18\t \x01(\x0b\x32\x17.google.protobuf.Struct\"D\n\x05Skill\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\"m\n\x11\x41gentCapabilities\x12\x11\n\tstreaming\x18\x01 \x01(\x08\x12\x1a\n\x12push_notifications\x18\x02 \x01(\x08\x12\x13\n\x0binput_modes\x18\x03 \x03(\t\x12\x14\n\x0coutput_modes\x18\x04 \x03(\t\"\xa6\x01\n\tAgentCard\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x34\n\x0c\x63\x61pabilities\x18\x05 \x01(\x0b\x32\x1e.synapse.a2a.AgentCapabilities\x12\"\n\x06skills\x18\x06 \x03(\x0b\x32\x12.synapse.a2a.Skill\"z\n\x12SendMessageRequest\x12%\n\x07message\x18\x01 \x01(\x0b\x32\x14.synapse.a2a.Message\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12)\n\x08metadata\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\"6\n\x13SendMessageResponse\x12\x1f\n\x04task\x18\x01 \x01(\x0b\x32\x11.synapse.a2a.Task\"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"2\n\x0fGetTaskResponse\x12\x1f\n\x04task\x18\x01 \x01(\x0b\x32\x11.synapse.a2a.Task\"&\n\x10ListTasksRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\"5\n\x11ListTasksResponse\x12 \n\x05tasks\x18\x01 \x03(\x0b\x32\x11.synapse.a2a.Task\"$\n\x11\x43\x61ncelTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"5\n\x12\x43\x61ncelTaskResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07task_id\x18\x02 \x01(\t\"\x15\n\x13GetAgentCardRequest\"B\n\x14GetAgentCardResponse\x12*\n\nagent_card\x18\x01 \x01(\x0b\x32\x16.synapse.a2a.AgentCard\"T\n\x0fTaskStreamEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\t\x12\x1f\n\x04task\x18\x03 \x01(\x0b\x32\x11.synapse.a2a.Task\"#\n\x10SubscribeRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"\x94\x01\n\x1aSendPriorityMessageRequest\x12%\n\x07message\x18\x01 \x01(\x0b\x32\x14.synapse.a2a.Message\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12)\n\x08metadata\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x10\n\x08priority\x18\x04 \x01(\x05\x32\xc2\x04\n\nA2AService\x12S\n\x0cGetAgentCard\x12 .synapse.a2a.GetAgentCardRequest\x1a!.synapse.a2a.GetAgentCardResponse\x12P\n\x0bSendMessage\x12\x1f.synapse.a2a.SendMessageRequest\x1a .synapse.a2a.SendMessageResponse\x12\x44\n\x07GetTask\x12\x1b.synapse.a2a.GetTaskRequest\x1a\x1c.synapse.a2a.GetTaskResponse\x12J\n\tListTasks\x12\x1d.synapse.a2a.ListTasksRequest\x1a\x1e.synapse.a2a.ListTasksResponse\x12M\n\nCancelTask\x12\x1e.synapse.a2a.CancelTaskRequest\x1a\x1f.synapse.a2a.CancelTaskResponse\x12J\n\tSubscribe\x12\x1d.synapse.a2a.SubscribeRequest\x1a\x1c.synapse.a2a.TaskStreamEvent0\x01\x12`\n\x13SendPriorityMessage\x12\'.synapse.a2a.SendPriorityMessageRequest\x1a .synapse.a2a.SendMessageResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ta2a.proto\x12\x0bsynapse.a2a\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\"&\n\x08TextPart\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\"G\n\x08\x46ilePart\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\"f\n\x04Part\x12*\n\ttext_part\x18\x01 \x01(\x0b\x32\x15.synapse.a2a.TextPartH\x00\x12*\n\tfile_part\x18\x02 \x01(\x0b\x32\x15.synapse.a2a.FilePartH\x00\x42\x06\n\x04part\"9\n\x07Message\x12\x0c\n\x04role\x18\x01 \x01(\t\x12 \n\x05parts\x18\x02 \x03(\x0b\x32\x11.synapse.a2a.Part\"?\n\x08\x41rtifact\x12\x0c\n\x04type\x18\x01 \x01(\t\x12%\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\"Q\n\tTaskError\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12%\n\x04\x64\x61ta\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\"\xb9\x02\n\x04Task\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12%\n\x07message\x18\x04 \x01(\x0b\x32\x14.synapse.a2a.Message\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.synapse.a2a.Artifact\x12%\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x16.synapse.a2a.TaskError\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12)\n\x08metadata\x18\t \x01(\x0b\x32\x17.google.protobuf.Struct\"D\n\x05Skill\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\"m\n\x11\x41gentCapabilities\x12\x11\n\tstreaming\x18\x01 \x01(\x08\x12\x1a\n\x12push_notifications\x18\x02 \x01(\x08\x12\x13\n\x0binput_modes\x18\x03 \x03(\t\x12\x14\n\x0coutput_modes\x18\x04 \x03(\t\"\xa6\x01\n\tAgentCard\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x34\n\x0c\x63\x61pabilities\x18\x05 \x01(\x0b\x32\x1e.synapse.a2a.AgentCapabilities\x12\"\n\x06skills\x18\x06 \x03(\x0b\x32\x12.synapse.a2a.Skill\"z\n\x12SendMessageRequest\x12%\n\x07message\x18\x01 \x01(\x0b\x32\x14.synapse.a2a.Message\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12)\n\x08metadata\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\"6\n\x13SendMessageResponse\x12\x1f\n\x04task\x18\x01 \x01(\x0b\x32\x11.synapse.a2a.Task\"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"2\n\x0fGetTaskResponse\x12\x1f\n\x04task\x18\x01 \x01(\x0b\x32\x11.synapse.a2a.Task\"&\n\x10ListTasksRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\"5\n\x11ListTasksResponse\x12 \n\x05tasks\x18\x01 \x03(\x0b\x32\x11.synapse.a2a.Task\"$\n\x11\x43\x61ncelTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"5\n\x12\x43\x61ncelTaskResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07task_id\x18\x02 \x01(\t\"\x15\n\x13GetAgentCardRequest\"B\n\x14GetAgentCardResponse\x12*\n\nagent_card\x18\x01 \x01(\x0b\x32\x16.synapse.a2a.AgentCard\"f\n\x0fTaskStreamEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\t\x12\x1f\n\x04task\x18\x03 \x01(\x0b\x32\x11.synapse.a2a.Task\x12\x10\n\x08sequence\x18\x04 \x01(\x04\":\n\x10SubscribeRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x15\n\rfrom_sequence\x18\x02 \x01(\x04\"\x94\x01\n\x1aSendPriorityMessageRequest\x12%\n\x07message\x18\x01 \x01(\x0b\x32\x14.synapse.a2a.Message\x12\x12\n\ncontext_id\x18\x02 \x01(\t\x12)\n\x08metadata\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x10\n\x08priority\x18\x04 \x01(\x05\x32\xc2\x04\n\nA2AService\x12S\n\x0cGetAgentCard\x12 .synapse.a2a.GetAgentCardRequest\x1a!.synapse.a2a.GetAgentCardResponse\x12P\n\x0bSendMessage\x12\x1f.synapse.a2a.SendMessageRequest\x1a .synapse.a2a.SendMessageResponse\x12\x44\n\x07GetTask\x12\x1b.synapse.a2a.GetTaskRequest\x1a\x1c.synapse.a2a.GetTaskResponse\x12J\n\tListTasks\x12\x1d.synapse.a2a.ListTasksRequest\x1a\x1e.synapse.a2a.ListTasksResponse\x12M\n\nCancelTask\x12\x1e.synapse.a2a.CancelTaskRequest\x1a\x1f.synapse.a2a.CancelTaskResponse\x12J\n\tSubscribe\x12\x1d.synapse.a2a.SubscribeRequest\x1a\x1c.synapse.a2a.TaskStreamEvent0\x01\x12`\n\x13SendPriorityMessage\x12\'.synapse.a2a.SendPriorityMessageRequest\x1a .synapse.a2a.SendMessageResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -74,11 +74,11 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETAGENTCARDRESPONSE']._serialized_start=1657
   _globals['_GETAGENTCARDRESPONSE']._serialized_end=1723
   _globals['_TASKSTREAMEVENT']._serialized_start=1725
-  _globals['_TASKSTREAMEVENT']._serialized_end=1809
-  _globals['_SUBSCRIBEREQUEST']._serialized_start=1811
-  _globals['_SUBSCRIBEREQUEST']._serialized_end=1846
-  _globals['_SENDPRIORITYMESSAGEREQUEST']._serialized_start=1849
-  _globals['_SENDPRIORITYMESSAGEREQUEST']._serialized_end=1997
-  _globals['_A2ASERVICE']._serialized_start=2000
-  _globals['_A2ASERVICE']._serialized_end=2578
+  _globals['_TASKSTREAMEVENT']._serialized_end=1827
+  _globals['_SUBSCRIBEREQUEST']._serialized_start=1829
+  _globals['_SUBSCRIBEREQUEST']._serialized_end=1887
+  _globals['_SENDPRIORITYMESSAGEREQUEST']._serialized_start=1890
+  _globals['_SENDPRIORITYMESSAGEREQUEST']._serialized_end=2038
+  _globals['_A2ASERVICE']._serialized_start=2041
+  _globals['_A2ASERVICE']._serialized_end=2619
 # @@protoc_insertion_point(module_scope)
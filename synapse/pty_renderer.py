@@ -13,6 +13,11 @@ downstream consumer sees what the user would have seen: the final state
 of each cell after cursor motion, erases, and overwrites have been
 applied. Alt-screen toggles (DECSET/DECRST 1049) are tracked so
 full-screen overlays are exposed cleanly.
+
+Rendering is incremental: pyte records the rows touched by each ``feed``
+in ``screen.dirty``, and only those rows are re-rendered into a per-row
+cache. Consumers that only care about what changed (WAITING detection)
+can call ``pop_changed_text`` instead of scanning the whole screen.
 """
 
 from __future__ import annotations
@@ -82,6 +87,11 @@ class PtyRenderer:
         self._saved_display: list[str] | None = None
         self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
         self._pending = ""
+        # Per-row render cache, refreshed from ``screen.dirty`` on demand.
+        self._lines: list[str] = [""] * rows
+        self._text: str | None = None
+        # Rows whose rendered text changed since the last pop_changed_text().
+        self._changed_rows: set[int] = set()
 
     @property
     def in_alt_screen(self) -> bool:
@@ -135,33 +145,52 @@ class PtyRenderer:
                 self._in_alt_screen = False
                 text = text[idx + len(_ALT_SCREEN_LEAVE) :]
 
-    def render(self) -> list[str]:
-        """Return the current display as a list of right-stripped lines."""
+    def _render_line(self, y: int) -> tuple[str, int]:
+        """Render row *y*, returning ``(text, broken_cell_count)``."""
+        broken_cells = 0
+        line = self._screen.buffer[y]
+        chars: list[str] = []
+        skip_wide_stub = False
+        for x in range(self._columns):
+            if skip_wide_stub:
+                skip_wide_stub = False
+                continue
+            cell_data = line[x].data
+            if not cell_data or any(wcwidth(c) != 0 for c in cell_data[1:]):
+                broken_cells += 1
+                chars.append(" ")
+                skip_wide_stub = False
+                continue
+            skip_wide_stub = wcwidth(cell_data[0]) == 2
+            chars.append(cell_data)
+        return "".join(chars).rstrip(), broken_cells
+
+    def _refresh(self) -> None:
+        """Re-render the rows pyte marked dirty since the last refresh."""
+        dirty = self._screen.dirty
+        if not dirty:
+            return
         broken_cells = 0
-        lines: list[str] = []
-        for y in range(self._rows):
-            line = self._screen.buffer[y]
-            chars: list[str] = []
-            skip_wide_stub = False
-            for x in range(self._columns):
-                if skip_wide_stub:
-                    skip_wide_stub = False
-                    continue
-                cell_data = line[x].data
-                if not cell_data or any(wcwidth(c) != 0 for c in cell_data[1:]):
-                    broken_cells += 1
-                    chars.append(" ")
-                    skip_wide_stub = False
-                    continue
-                skip_wide_stub = wcwidth(cell_data[0]) == 2
-                chars.append(cell_data)
-            lines.append("".join(chars).rstrip())
+        for y in dirty:
+            if y >= self._rows:
+                continue
+            text, broken = self._render_line(y)
+            broken_cells += broken
+            if text != self._lines[y]:
+                self._lines[y] = text
+                self._changed_rows.add(y)
+                self._text = None
+        dirty.clear()
         if broken_cells:
             logger.debug(
                 "Substituted blanks for %d broken pyte screen cells during render",
                 broken_cells,
             )
-        return lines
+
+    def render(self) -> list[str]:
+        """Return the current display as a list of right-stripped lines."""
+        self._refresh()
+        return list(self._lines)
 
     def render_text(self) -> str:
         """Return the rendered display as a newline-joined string.
@@ -170,7 +199,26 @@ class PtyRenderer:
         see consistent line indices, but leading/trailing whitespace is
         trimmed off each line.
         """
-        return "\n".join(self.render())
+        self._refresh()
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
+
+    def pop_changed_text(self, context: int = 0) -> str:
+        """Return the rows that changed since the previous call.
+
+        The result spans from the first to the last changed row, widened
+        by *context* rows on each side so single-line patterns anchored
+        next to a redraw (e.g. a selector under a question) still match.
+        Returns ``""`` when nothing changed. Resets the changed-row set.
+        """
+        self._refresh()
+        if not self._changed_rows:
+            return ""
+        first = max(min(self._changed_rows) - context, 0)
+        last = min(max(self._changed_rows) + context, self._rows - 1)
+        self._changed_rows.clear()
+        return "\n".join(self._lines[first : last + 1])
 
     def snapshot(self) -> dict[str, Any]:
         """Return a JSON-serialisable snapshot of the current state.
@@ -4,12 +4,17 @@ import errno
 import json
 import logging
 import os
+import re
 import socket
+import sqlite3
 import tempfile
+import threading
 import time
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO
 
 from synapse.status import PROCESSING
 from synapse.utils import is_role_file_reference, resolve_role_value
@@ -78,14 +83,420 @@ def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
         return False
 
 
+@contextmanager
+def _flock(path: Path) -> Iterator[IO[str]]:
+    """Hold an exclusive fcntl.flock on *path* (best effort on non-POSIX)."""
+    with open(path, "a+") as lock_file:
+        try:
+            try:
+                import fcntl
+
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except (ImportError, OSError) as e:
+                # Best effort on non-POSIX; continue without hard-failing.
+                if isinstance(e, OSError) and e.errno not in (
+                    errno.ENOSYS,
+                    errno.EBADF,
+                ):
+                    raise
+            yield lock_file
+        finally:
+            with contextlib.suppress(Exception):
+                try:
+                    import fcntl
+
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                except (ImportError, OSError):
+                    pass
+
+
+_INDEX_FILENAME = ".index.db"
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS agents (
+    file TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    agent_id TEXT,
+    name TEXT,
+    agent_definition_id TEXT,
+    agent_type TEXT,
+    port INTEGER,
+    data TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_agents_agent_id ON agents(agent_id);
+CREATE INDEX IF NOT EXISTS idx_agents_name ON agents(name);
+CREATE INDEX IF NOT EXISTS idx_agents_definition ON agents(agent_definition_id);
+CREATE INDEX IF NOT EXISTS idx_agents_type_port ON agents(agent_type, port);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+"""
+_TYPE_PORT_RE = re.compile(r"^([\w-]+)-(\d+)$")
+
+# One connection per index file, shared by every AgentRegistry in the process.
+_INDEX_CONNECTIONS: dict[str, tuple[sqlite3.Connection, int]] = {}
+# Per index file: (generation, time.monotonic()) of this process' last full
+# reconcile, advanced in step with our own writes.
+_INDEX_SYNCED: dict[str, tuple[int, float]] = {}
+_INDEX_LOCK = threading.RLock()
+
+
+def _file_signature(st: os.stat_result) -> str:
+    # Atomic writes replace the file, so the inode changes on every update
+    # even when mtime granularity would hide a rewrite.
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+class _RegistryIndex:
+    """SQLite (WAL) snapshot of the per-agent registry JSON files.
+
+    The JSON files remain the source of truth. The index caches their
+    parsed contents keyed by a per-file stat signature, so readers only
+    open and parse files that actually changed, and keeps secondary
+    indexes on name, ``agent_definition_id`` and ``(agent_type, port)``.
+    Every change bumps a monotonically increasing ``generation``; every
+    registry write records itself here, so readers only rescan the
+    directory when the generation moved or to pick up external edits.
+
+    Callers must hold ``_INDEX_LOCK``.
+    """
+
+    def __init__(self, registry_dir: Path) -> None:
+        self.registry_dir = registry_dir
+        self.path = registry_dir / _INDEX_FILENAME
+
+    def _connect(self) -> sqlite3.Connection:
+        key = str(self.path)
+        cached = _INDEX_CONNECTIONS.get(key)
+        try:
+            inode = self.path.stat().st_ino
+        except OSError:
+            inode = None
+        if cached is not None and cached[1] == inode:
+            return cached[0]
+        if cached is not None:
+            # Index file was removed or replaced underneath us.
+            with contextlib.suppress(sqlite3.Error):
+                cached[0].close()
+        _INDEX_SYNCED.pop(key, None)
+        conn = sqlite3.connect(
+            key, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_INDEX_SCHEMA)
+        _INDEX_CONNECTIONS[key] = (conn, self.path.stat().st_ino)
+        return conn
+
+    @staticmethod
+    def _row(file_name: str, signature: str, path: Path) -> tuple | None:
+        """Parse one registry file into an index row (None if it vanished)."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            return (file_name, signature, None, None, None, None, None, None, str(e))
+        agent_id = data.get("agent_id") if isinstance(data, dict) else None
+        if not isinstance(agent_id, str) or not agent_id:
+            return (
+                file_name,
+                signature,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                "missing agent_id",
+            )
+        port = data.get("port")
+        return (
+            file_name,
+            signature,
+            agent_id,
+            data.get("name"),
+            data.get("agent_definition_id"),
+            data.get("agent_type"),
+            port if isinstance(port, int) else None,
+            json.dumps(data),
+            None,
+        )
+
+    def _bump(self, conn: sqlite3.Connection) -> int:
+        """Bump the generation inside the caller's transaction; return the old one."""
+        row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+        return int(row[0])
+
+    def _advance_synced(self, previous: int) -> None:
+        """Keep our reconcile current across a write we just committed.
+
+        Only valid if nothing else changed the index since that reconcile.
+        """
+        synced = _INDEX_SYNCED.get(str(self.path))
+        if synced is not None and synced[0] == previous:
+            _INDEX_SYNCED[str(self.path)] = (previous + 1, synced[1])
+
+    def generation(self) -> int:
+        row = (
+            self._connect()
+            .execute("SELECT value FROM meta WHERE key = 'generation'")
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
+
+    def sync(self) -> int:
+        """Reconcile the index with the JSON files and return the generation.
+
+        Reads one counter when the generation is unchanged since this
+        process last reconciled. Otherwise, and at least every
+        ``REGISTRY_INDEX_RESCAN_INTERVAL`` seconds to catch files edited
+        outside the registry, it costs one directory scan plus a stat per
+        file; only files whose signature changed are opened and parsed.
+        """
+        from synapse.config import REGISTRY_INDEX_RESCAN_INTERVAL
+
+        generation = self.generation()
+        now = time.monotonic()
+        synced = _INDEX_SYNCED.get(str(self.path))
+        if (
+            synced is not None
+            and synced[0] == generation
+            and now - synced[1] < REGISTRY_INDEX_RESCAN_INTERVAL
+        ):
+            return generation
+        generation = self._reconcile()
+        _INDEX_SYNCED[str(self.path)] = (generation, now)
+        return generation
+
+    def _reconcile(self) -> int:
+        on_disk: dict[str, str] = {}
+        with os.scandir(self.registry_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    with contextlib.suppress(OSError):
+                        on_disk[entry.name] = _file_signature(entry.stat())
+        conn = self._connect()
+        indexed = dict(conn.execute("SELECT file, signature FROM agents"))
+        changed = [name for name, sig in on_disk.items() if indexed.get(name) != sig]
+        removed = [name for name in indexed if name not in on_disk]
+        if not changed and not removed:
+            return self.generation()
+
+        rows = []
+        for name in changed:
+            row = self._row(name, on_disk[name], self.registry_dir / name)
+            if row is None:
+                removed.append(name)
+            else:
+                rows.append(row)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO agents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "DELETE FROM agents WHERE file = ?", [(n,) for n in removed]
+            )
+            self._bump(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.generation()
+
+    def load(self) -> tuple[int, list[tuple[str, str | None, str | None, str | None]]]:
+        """Return ``(generation, [(file, agent_id, data_json, error), ...])``."""
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            generation = int(
+                conn.execute(
+                    "SELECT value FROM meta WHERE key = 'generation'"
+                ).fetchone()[0]
+            )
+            rows = conn.execute(
+                "SELECT file, agent_id, data, error FROM agents ORDER BY file"
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return generation, rows
+
+    def name_owners(self, name: str) -> list[str]:
+        return [
+            row[0]
+            for row in self._connect().execute(
+                "SELECT agent_id FROM agents WHERE name = ?", (name,)
+            )
+        ]
+
+    def record(self, file_path: Path, data: dict) -> None:
+        """Index a registry file this process just wrote."""
+        signature = _file_signature(file_path.stat())
+        row = self._row(file_path.name, signature, file_path)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if row is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO agents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+            previous = self._bump(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._advance_synced(previous)
+
+    def forget(self, file_path: Path) -> None:
+        """Drop a registry file this process just removed."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM agents WHERE file = ?", (file_path.name,))
+            previous = self._bump(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._advance_synced(previous)
+
+
+@dataclass
+class _RegistrySnapshot:
+    """Parsed registry contents plus O(1) lookup tables for one generation."""
+
+    registry_dir: Path
+    generation: int
+    agents: dict[str, dict] = field(default_factory=dict)
+    by_name: dict[str, str] = field(default_factory=dict)
+    by_definition_id: dict[str, str] = field(default_factory=dict)
+    by_type_port: dict[tuple[str, int], str] = field(default_factory=dict)
+    by_type: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, registry_dir: Path, generation: int, agents: dict[str, dict]
+    ) -> "_RegistrySnapshot":
+        snapshot = cls(registry_dir, generation, agents)
+        for agent_id, info in agents.items():
+            name = info.get("name")
+            if name:
+                snapshot.by_name.setdefault(name, agent_id)
+            definition_id = info.get("agent_definition_id")
+            if definition_id:
+                snapshot.by_definition_id.setdefault(definition_id, agent_id)
+            agent_type = info.get("agent_type")
+            if isinstance(agent_type, str):
+                snapshot.by_type.setdefault(agent_type, []).append(agent_id)
+                port = info.get("port")
+                if isinstance(port, int):
+                    snapshot.by_type_port.setdefault((agent_type, port), agent_id)
+        return snapshot
+
+    def resolve(self, target: str) -> str | None:
+        """Return the agent_id *target* resolves to (see ``resolve_agent``)."""
+        for table in (self.by_name, self.by_definition_id):
+            if target in table:
+                return table[target]
+        if target in self.agents:
+            return target
+        if match := _TYPE_PORT_RE.match(target):
+            agent_type, port_str = match.groups()
+            agent_id = self.by_type_port.get((agent_type, int(port_str)))
+            if agent_id is not None:
+                return agent_id
+        type_matches = self.by_type.get(target, [])
+        return type_matches[0] if len(type_matches) == 1 else None
+
+
 class AgentRegistry:
-    def __init__(self) -> None:
+    def __init__(self, write_behind: bool = False) -> None:
+        """Initialize the registry.
+
+        Args:
+            write_behind: Queue volatile field updates (status, transport,
+                task preview, summary) and apply them in coalesced
+                background writes instead of writing on every call. Meant
+                for the long-lived registry owned by a running agent.
+        """
         from synapse.paths import get_registry_dir
 
         self.registry_dir = Path(get_registry_dir())
         self.registry_dir.mkdir(parents=True, exist_ok=True)
         self.hostname = socket.gethostname()
         self._lock_file = self.registry_dir / ".registry.lock"
+        self._snapshot: _RegistrySnapshot | None = None
+        self.write_behind = write_behind
+        self._pending: dict[str, list[Callable[[dict], None]]] = {}
+        self._pending_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._atexit_flush_registered = False
+
+    def _with_index(self, operation: Callable[[_RegistryIndex], object]) -> object:
+        """Run *operation* against the registry index.
+
+        The index is a cache; any failure is logged and reported as
+        ``None`` so callers fall back to scanning the JSON files.
+        """
+        try:
+            with _INDEX_LOCK:
+                return operation(_RegistryIndex(self.registry_dir))
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Registry index unavailable (%s): %s", self.registry_dir, e)
+            return None
+
+    def _load_snapshot(self) -> _RegistrySnapshot | None:
+        """Return the parsed registry, reloading only when the generation moved."""
+
+        def load(index: _RegistryIndex) -> _RegistrySnapshot:
+            generation = index.sync()
+            cached = self._snapshot
+            if (
+                cached is not None
+                and cached.registry_dir == self.registry_dir
+                and cached.generation == generation
+            ):
+                return cached
+            generation, rows = index.load()
+            agents: dict[str, dict] = {}
+            for file_name, agent_id, data, error in rows:
+                if agent_id is None or data is None:
+                    logger.warning(
+                        "Skipping invalid registry file %s: %s", file_name, error
+                    )
+                    continue
+                agents[agent_id] = json.loads(data)
+            return _RegistrySnapshot.build(self.registry_dir, generation, agents)
+
+        snapshot = self._with_index(load)
+        if isinstance(snapshot, _RegistrySnapshot):
+            self._snapshot = snapshot
+            return snapshot
+        return None
+
+    def get_generation(self) -> int | None:
+        """Return the registry generation counter.
+
+        The value increases whenever any agent entry is added, updated or
+        removed, so watchers can poll it instead of re-reading the
+        registry. Returns None when the index is unavailable.
+        """
+        snapshot = self._load_snapshot()
+        return snapshot.generation if snapshot is not None else None
+
+    def _index_record(self, file_path: Path, data: dict) -> None:
+        self._with_index(lambda index: index.record(file_path, data))
+
+    def _index_forget(self, file_path: Path) -> None:
+        self._with_index(lambda index: index.forget(file_path))
 
     @contextmanager
     def registry_write_lock(self) -> Iterator[None]:
@@ -100,33 +511,43 @@ class AgentRegistry:
         instead of ``register``.
         """
         self.registry_dir.mkdir(parents=True, exist_ok=True)
-        with open(self._lock_file, "a+") as lock_file:
-            try:
-                try:
-                    import fcntl
+        with _flock(self._lock_file):
+            yield
 
-                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
-                except (ImportError, OSError) as e:
-                    # Best effort on non-POSIX; continue without hard-failing.
-                    if isinstance(e, OSError) and e.errno not in (
-                        errno.ENOSYS,
-                        errno.EBADF,
-                    ):
-                        raise
-                yield
-            finally:
-                with contextlib.suppress(Exception):
-                    try:
-                        import fcntl
+    @contextmanager
+    def _agent_write_lock(self, agent_id: str) -> Iterator[None]:
+        """Cross-process lock guarding read-modify-write of one agent's file.
+
+        Volatile field updates take only this lock, so agents on the same
+        host no longer serialize on ``registry_write_lock``. Writers that
+        need the registry-wide lock acquire it first, then this one.
 
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-                    except (ImportError, OSError):
-                        pass
+        ``unregister`` removes the lock file while holding it, so a waiter
+        that was blocked on the unlinked inode retries on the current file.
+        """
+        lock_path = self.registry_dir / f".{agent_id}.lock"
+        while True:
+            with _flock(lock_path) as lock_file:
+                try:
+                    current = lock_path.stat().st_ino
+                except FileNotFoundError:
+                    continue
+                if current == os.fstat(lock_file.fileno()).st_ino:
+                    yield
+                    return
 
     def _is_name_taken_locked(
         self, name: str, exclude_agent_id: str | None = None
     ) -> bool:
         """Check name collision while holding registry write lock."""
+
+        def owners(index: _RegistryIndex) -> list[str]:
+            index.sync()
+            return index.name_owners(name)
+
+        agent_ids = self._with_index(owners)
+        if isinstance(agent_ids, list):
+            return any(aid != exclude_agent_id for aid in agent_ids)
         for p in self.registry_dir.glob("*.json"):
             try:
                 with open(p) as f:
@@ -140,8 +561,14 @@ class AgentRegistry:
                 return True
         return False
 
-    def _write_json_atomic(self, file_path: Path, data: dict) -> None:
-        """Write JSON file atomically via temporary file + replace."""
+    def _write_json_atomic(
+        self, file_path: Path, data: dict, durable: bool = True
+    ) -> None:
+        """Write JSON file atomically via temporary file + replace.
+
+        ``durable=False`` skips the fsync: the rename is still atomic for
+        concurrent readers, but the write may be lost on power failure.
+        """
         temp_fd, temp_path = tempfile.mkstemp(
             dir=self.registry_dir,
             prefix=f".{file_path.stem}.",
@@ -150,8 +577,9 @@ class AgentRegistry:
         try:
             with os.fdopen(temp_fd, "w") as f:
                 json.dump(data, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(temp_path, file_path)
         except (OSError, TypeError, ValueError):
             if os.path.exists(temp_path):
@@ -294,8 +722,10 @@ class AgentRegistry:
         file_path = self.registry_dir / f"{agent_id}.json"
         if name and self._is_name_taken_locked(name, exclude_agent_id=agent_id):
             raise NameConflictError(f"name '{name}' is already taken")
-        self._write_json_atomic(file_path, data)
-        self._verify_registered_file(file_path, agent_id)
+        with self._agent_write_lock(agent_id):
+            self._write_json_atomic(file_path, data)
+            self._verify_registered_file(file_path, agent_id)
+        self._index_record(file_path, data)
 
         self._register_atexit_cleanup(agent_id)
 
@@ -309,12 +739,17 @@ class AgentRegistry:
         # the path that was recorded at registration time, not the
         # current SYNAPSE_UDS_DIR which may differ.
         uds_path_str: str | None = None
+        with self._pending_cond:
+            self._pending.pop(agent_id, None)
         if file_path.exists():
-            with contextlib.suppress(Exception):
-                with open(file_path) as f:
-                    data = json.load(f)
-                uds_path_str = data.get("uds_path")
-            file_path.unlink()
+            with self._agent_write_lock(agent_id):
+                with contextlib.suppress(Exception):
+                    with open(file_path) as f:
+                        data = json.load(f)
+                    uds_path_str = data.get("uds_path")
+                file_path.unlink(missing_ok=True)
+                (self.registry_dir / f".{agent_id}.lock").unlink(missing_ok=True)
+            self._index_forget(file_path)
 
         # Clean up UDS socket file to prevent stale socket accumulation.
         # Prefer the path from registry; fall back to resolve_uds_path.
@@ -325,6 +760,14 @@ class AgentRegistry:
 
     def list_agents(self) -> dict[str, dict]:
         """Returns all currently registered agents."""
+        self.flush()
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            return {aid: dict(info) for aid, info in snapshot.agents.items()}
+        return self._scan_agents()
+
+    def _scan_agents(self) -> dict[str, dict]:
+        """Parse every registry file (fallback when the index is unavailable)."""
         agents = {}
         for p in self.registry_dir.glob("*.json"):
             try:
@@ -353,6 +796,7 @@ class AgentRegistry:
         Returns:
             Agent info dict, or None if not found.
         """
+        self.flush(agent_id)
         file_path = self.registry_dir / f"{agent_id}.json"
         if not file_path.exists():
             return None
@@ -378,38 +822,75 @@ class AgentRegistry:
         Returns:
             True if updated successfully, False otherwise.
         """
-        file_path = self.registry_dir / f"{agent_id}.json"
+        # Apply queued volatile updates first so this write cannot be
+        # overtaken by an older status/transport value.
+        self.flush(agent_id)
+        if not (self.registry_dir / f"{agent_id}.json").exists():
+            return False
         try:
             with self.registry_write_lock():
-                if not file_path.exists():
-                    return False
+                return self._rewrite_agent_file(agent_id, [updater], durable=True)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(
+                "event=registry_update_failed field=%s agent_id=%s error=%s",
+                field_name,
+                agent_id,
+                e,
+            )
+            return False
 
-                with open(file_path) as f:
-                    data = json.load(f)
+    def _rewrite_agent_file(
+        self, agent_id: str, updaters: list[Callable[[dict], None]], durable: bool
+    ) -> bool:
+        """Read, apply *updaters* in order, and atomically replace the file.
 
+        Holds the per-agent lock; callers needing registry-wide exclusion
+        must already hold ``registry_write_lock``.
+        """
+        file_path = self.registry_dir / f"{agent_id}.json"
+        if not file_path.exists():
+            return False
+        with self._agent_write_lock(agent_id):
+            if not file_path.exists():
+                # Unregistered while we waited: drop the lock file _flock
+                # just re-created (waiters retry on the current inode).
+                (self.registry_dir / f".{agent_id}.lock").unlink(missing_ok=True)
+                return False
+
+            with open(file_path) as f:
+                data = json.load(f)
+
+            for updater in updaters:
                 updater(data)
 
-                # Atomic write: write to temp file, then rename
-                temp_fd, temp_path = tempfile.mkstemp(
-                    dir=self.registry_dir,
-                    prefix=f".{agent_id}.",
-                    suffix=".tmp",
-                )
-                try:
-                    with os.fdopen(temp_fd, "w") as f:
-                        json.dump(data, f, indent=2)
-                        f.flush()
-                        os.fsync(f.fileno())
-
-                    # Atomic rename (POSIX guarantee)
-                    os.replace(temp_path, file_path)
-                    return True
-                except (OSError, TypeError, ValueError):
-                    if os.path.exists(temp_path):
-                        with contextlib.suppress(OSError):
-                            os.unlink(temp_path)
-                    raise
+            self._write_json_atomic(file_path, data, durable=durable)
+        # Volatile writes too: readers only rescan when the generation moves.
+        self._index_record(file_path, data)
+        return True
 
+    def _volatile_update(
+        self, agent_id: str, updater: Callable[[dict], None], field_name: str
+    ) -> bool:
+        """Update a frequently changing, non-critical field.
+
+        Skips the fsync. With ``write_behind`` enabled the update is queued
+        and coalesced with others for the same agent, and True means the
+        agent is registered. Otherwise it is written immediately under
+        ``registry_write_lock``, like ``_atomic_update``: short-lived CLI
+        registries racing on per-agent locks alone were slower than the
+        serialized durable path.
+
+        Returns:
+            True if updated (or queued) successfully, False otherwise.
+        """
+        if not (self.registry_dir / f"{agent_id}.json").exists():
+            return False
+        if self.write_behind:
+            self._enqueue(agent_id, updater)
+            return True
+        try:
+            with self.registry_write_lock():
+                return self._rewrite_agent_file(agent_id, [updater], durable=False)
         except (json.JSONDecodeError, OSError) as e:
             logger.error(
                 "event=registry_update_failed field=%s agent_id=%s error=%s",
@@ -419,6 +900,52 @@ class AgentRegistry:
             )
             return False
 
+    def _enqueue(self, agent_id: str, updater: Callable[[dict], None]) -> None:
+        with self._pending_cond:
+            self._pending.setdefault(agent_id, []).append(updater)
+            if not self._atexit_flush_registered:
+                atexit.register(self.flush)
+                self._atexit_flush_registered = True
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="registry-write-behind", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        from synapse.config import REGISTRY_WRITE_BEHIND_DELAY
+
+        while True:
+            time.sleep(REGISTRY_WRITE_BEHIND_DELAY)
+            self.flush()
+            with self._pending_cond:
+                if not self._pending:
+                    self._flusher = None
+                    return
+
+    def flush(self, agent_id: str | None = None) -> None:
+        """Apply queued write-behind updates (all agents, or just *agent_id*)."""
+        if not self.write_behind:
+            return
+        with self._flush_lock:
+            with self._pending_cond:
+                if agent_id is None:
+                    batch, self._pending = self._pending, {}
+                elif agent_id in self._pending:
+                    batch = {agent_id: self._pending.pop(agent_id)}
+                else:
+                    return
+            for pending_id, updaters in batch.items():
+                try:
+                    self._rewrite_agent_file(pending_id, updaters, durable=False)
+                except (json.JSONDecodeError, OSError) as e:
+                    logger.error(
+                        "event=registry_update_failed field=write_behind "
+                        "agent_id=%s error=%s",
+                        pending_id,
+                        e,
+                    )
+
     def update_status(self, agent_id: str, status: str) -> bool:
         """
         Update the status of a registered agent (atomic write).
@@ -439,7 +966,7 @@ class AgentRegistry:
             if previous_status != status:
                 data["last_status_change_at"] = now
 
-        return self._atomic_update(agent_id, set_status, "status")
+        return self._volatile_update(agent_id, set_status, "status")
 
     def update_input_required_tasks(
         self, agent_id: str, tasks: list[dict[str, str]]
@@ -569,7 +1096,7 @@ class AgentRegistry:
                 data["last_transport"] = transport
                 data["transport_updated_at"] = now
 
-        return self._atomic_update(agent_id, set_transport, "transport")
+        return self._volatile_update(agent_id, set_transport, "transport")
 
     def get_transport_display(
         self, agent_id: str, retention_seconds: float = 3.0
@@ -625,39 +1152,47 @@ class AgentRegistry:
         Returns:
             Agent info dict if found, None if not found or ambiguous.
         """
-        import re
-
+        self.flush()
+        snapshot = self._load_snapshot()
+        if snapshot is None:
+            return self._resolve_live_scan(target)
+
+        # Probe only the match (or, for a bare type, its candidates); dead
+        # entries are removed and the lookup retried on the fresh snapshot.
+        while True:
+            agent_id = snapshot.resolve(target)
+            candidates = (
+                [agent_id] if agent_id is not None else snapshot.by_type.get(target, [])
+            )
+            dead = [
+                aid
+                for aid in candidates
+                if (pid := snapshot.agents[aid].get("pid"))
+                and not is_process_running(pid)
+            ]
+            if not dead:
+                if agent_id is None:
+                    return None
+                return dict(snapshot.agents[agent_id])
+            for aid in dead:
+                self.unregister(aid)
+            snapshot = self._load_snapshot()
+            if snapshot is None or any(aid in snapshot.agents for aid in dead):
+                return self._resolve_live_scan(target)
+
+    def _resolve_live_scan(self, target: str) -> dict | None:
+        """Resolve *target* against a full liveness scan (index unavailable)."""
         agents = self.get_live_agents()
         if not agents:
             return None
 
-        # Priority 1: Custom name (exact match)
-        for info in agents.values():
-            if info.get("name") == target:
-                return info
-
-        # Priority 2: Saved agent definition ID / petname (exact match)
-        for info in agents.values():
-            if info.get("agent_definition_id") == target:
-                return info
-
-        # Priority 3: Full agent ID (exact match)
-        if target in agents:
-            return agents[target]
-
-        # Priority 4: Type-port shorthand (e.g., "claude-8100")
-        if match := re.match(r"^([\w-]+)-(\d+)$", target):
-            agent_type, port_str = match.groups()
-            port = int(port_str)
-            for info in agents.values():
-                if info.get("agent_type") == agent_type and info.get("port") == port:
-                    return info
-
-        # Priority 5: Type (only if single agent of that type)
-        type_matches = [
-            info for info in agents.values() if info.get("agent_type") == target
-        ]
-        return type_matches[0] if len(type_matches) == 1 else None
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.agents.keys() != agents.keys():
+            # Live view differs from the indexed snapshot (e.g. a caller
+            # supplied its own agents); build lookup tables for it.
+            snapshot = _RegistrySnapshot.build(self.registry_dir, -1, agents)
+        agent_id = snapshot.resolve(target)
+        return agents.get(agent_id) if agent_id is not None else None
 
     def is_name_unique(self, name: str, exclude_agent_id: str | None = None) -> bool:
         """Check if a name is unique across all agents.
@@ -753,7 +1288,7 @@ class AgentRegistry:
                 data["current_task_preview"] = truncated_preview
                 data["task_received_at"] = time.time()
 
-        return self._atomic_update(agent_id, set_task_preview, "current_task_preview")
+        return self._volatile_update(agent_id, set_task_preview, "current_task_preview")
 
     def update_summary(self, agent_id: str, summary: str | None) -> bool:
         """Update the summary for an agent.
@@ -777,7 +1312,7 @@ class AgentRegistry:
                 data["summary"] = truncated
                 data["summary_updated_at"] = time.time()
 
-        return self._atomic_update(agent_id, set_summary, "summary")
+        return self._volatile_update(agent_id, set_summary, "summary")
 
     def update_skill_set(self, agent_id: str, skill_set: str | None) -> bool:
         """Update the skill set for an agent.
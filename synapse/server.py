@@ -11,16 +11,25 @@ import uvicorn
 import yaml
 from fastapi import FastAPI
 
-from synapse.a2a_compat import create_a2a_router
+from synapse.a2a_compat import create_a2a_router, history_manager
+from synapse.config import A2A_COALESCE_WINDOW_MS
 from synapse.controller import TerminalController
+from synapse.inbox import AgentInbox
 from synapse.logging_config import setup_logging
+from synapse.paths import get_inbox_db_path, get_webhook_outbox_db_path
 from synapse.registry import AgentRegistry, resolve_uds_path
 from synapse.status import PROCESSING, evaluate_readiness
 from synapse.utils import resolve_command_path
+from synapse.webhooks import (
+    WebhookDispatcher,
+    reset_webhook_dispatcher,
+    set_webhook_dispatcher,
+)
 
 # Global controller and registry instances (for standalone mode)
 controller: TerminalController | None = None
 registry: AgentRegistry | None = None
+inbox: AgentInbox | None = None
 current_agent_id: str | None = None
 agent_port: int = 8100
 agent_profile: str = "claude"
@@ -49,12 +58,24 @@ def load_profile(profile_name: str) -> dict:
         return result
 
 
+def _coalesce_window_ms() -> int:
+    """Message coalescing window from SYNAPSE_A2A_COALESCE_MS (0 = off)."""
+    raw = os.environ.get("SYNAPSE_A2A_COALESCE_MS")
+    if not raw:
+        return A2A_COALESCE_WINDOW_MS
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return A2A_COALESCE_WINDOW_MS
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for startup and shutdown events."""
     global \
         controller, \
         registry, \
+        inbox, \
         current_agent_id, \
         agent_port, \
         agent_profile, \
@@ -126,8 +147,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if "env" in profile:
         env.update(profile["env"])
 
-    # Registry Registration (before controller to pass agent_id)
-    registry = AgentRegistry()
+    # Registry Registration (before controller to pass agent_id).
+    # Status churn from the controller is coalesced via write-behind.
+    registry = AgentRegistry(write_behind=True)
     current_agent_id = registry.get_agent_id(profile_name, agent_port)
     setup_logging(agent_name=current_agent_id)
 
@@ -217,6 +239,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         **register_kwargs,
     )
 
+    # Messages sent while the agent is busy wait here, persisted across restarts
+    inbox = AgentInbox(current_agent_id, db_path=get_inbox_db_path())
+    # Webhook events are delivered from one worker thread; with an outbox
+    # configured, undelivered events survive restarts
+    set_webhook_dispatcher(
+        WebhookDispatcher(db_path=get_webhook_outbox_db_path(), owner=current_agent_id)
+    )
+
     # Add Google A2A compatible routes
     a2a_router = create_a2a_router(
         controller,
@@ -227,6 +257,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         registry,
         approve_response=approve_response,
         deny_response=deny_response,
+        inbox=inbox,
+        coalesce_window_ms=_coalesce_window_ms(),
     )
     app.include_router(a2a_router)
 
@@ -267,6 +299,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         controller.stop()
     if registry and current_agent_id:
         registry.unregister(current_agent_id)
+    if inbox:
+        inbox.close()
+    reset_webhook_dispatcher()
+    history_manager.flush()
 
 
 # Global app instance for standalone mode
@@ -287,12 +323,32 @@ def create_app(
     agent_type: str = "claude",
     approve_response: str = "",
     deny_response: str = "",
+    inbox: AgentInbox | None = None,
 ) -> FastAPI:
-    """Create a FastAPI app with external controller and registry."""
+    """Create a FastAPI app with external controller and registry.
+
+    *inbox* holds messages sent while the agent is busy; by default one is
+    opened on get_inbox_db_path(). The app closes it on shutdown.
+    """
+    app_inbox = (
+        inbox
+        if inbox is not None
+        else AgentInbox(agent_id, db_path=get_inbox_db_path())
+    )
+
+    @asynccontextmanager
+    async def app_lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+        yield
+        app_inbox.close()
+
     new_app = FastAPI(
         title="Synapse A2A Server",
         description="CLI agent wrapper with Google A2A protocol compatibility",
         version="1.0.0",
+        lifespan=app_lifespan,
+    )
+    set_webhook_dispatcher(
+        WebhookDispatcher(db_path=get_webhook_outbox_db_path(), owner=agent_id)
     )
 
     @new_app.get("/status", tags=["Synapse Original"])
@@ -306,6 +362,7 @@ def create_app(
             "lifecycle": readiness.lifecycle.value,
             "ready": readiness.ready,
             "readiness_reason": readiness.reason,
+            "inbox": app_inbox.stats(),
             "context": ctrl.get_context()[-2000:],
         }
 
@@ -318,6 +375,8 @@ def create_app(
         reg,
         approve_response=approve_response,
         deny_response=deny_response,
+        inbox=app_inbox,
+        coalesce_window_ms=_coalesce_window_ms(),
     )
     new_app.include_router(a2a_router)
 
@@ -336,6 +395,7 @@ async def get_status() -> dict:
         "lifecycle": readiness.lifecycle.value,
         "ready": readiness.ready,
         "readiness_reason": readiness.reason,
+        "inbox": inbox.stats() if inbox else None,
         "context": controller.get_context()[-2000:],  # Return last 2000 chars
     }
 
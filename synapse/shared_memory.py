@@ -14,15 +14,120 @@ import logging
 import os
 import sqlite3
 import threading
-from collections import Counter
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from synapse.db import SQLiteDatabase
 from synapse.paths import get_shared_memory_db_path
 
 logger = logging.getLogger(__name__)
 
+# Full-text index over key/content/tags: an external-content FTS5 table
+# over the implicit rowid of ``memories`` (no duplicate text storage),
+# kept in sync by triggers. UPSERTs update rows in place, so rowids are
+# stable; rebuild_index() re-syncs after a manual VACUUM, which may
+# renumber them. The trigram tokenizer (SQLite 3.34+) matches
+# case-insensitive substrings in any script, like the LIKE scan it
+# replaces ("fresh" finds "refresh", "認証" finds Japanese text); queries
+# shorter than a trigram still use the scan.
+_FTS_TABLE = "memories_fts"
+_FTS_TOKENIZER = "trigram"
+_FTS_MIN_QUERY_CHARS = 3
+_FTS_SCHEMA = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {_FTS_TABLE} USING fts5(
+        key, content, tags,
+        content='memories', content_rowid='rowid', tokenize='{_FTS_TOKENIZER}'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ai
+    AFTER INSERT ON memories BEGIN
+        INSERT INTO {_FTS_TABLE}(rowid, key, content, tags)
+        VALUES (new.rowid, new.key, new.content, new.tags);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ad
+    AFTER DELETE ON memories BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, key, content, tags)
+        VALUES ('delete', old.rowid, old.key, old.content, old.tags);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_fts_au
+    AFTER UPDATE OF key, content, tags ON memories BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, key, content, tags)
+        VALUES ('delete', old.rowid, old.key, old.content, old.tags);
+        INSERT INTO {_FTS_TABLE}(rowid, key, content, tags)
+        VALUES (new.rowid, new.key, new.content, new.tags);
+    END
+    """,
+)
+
+# BM25 column weights: a hit in the key outranks one in the tags, which
+# outranks one in the content.
+_FTS_WEIGHTS = "10.0, 1.0, 5.0"
+
+# Normalized tags: one (memory_id, tag) row per tag, derived from the
+# ``tags`` JSON column by triggers so tag filters and tag counts use an
+# index instead of parsing every row's JSON.
+_TAGS_TABLE = "memory_tags"
+_TAGS_SCHEMA = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {_TAGS_TABLE} (
+        memory_id TEXT NOT NULL,
+        tag       TEXT NOT NULL,
+        PRIMARY KEY (memory_id, tag)
+    ) WITHOUT ROWID
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_memory_tags_tag ON {_TAGS_TABLE}(tag)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memory_tags_ai
+    AFTER INSERT ON memories WHEN json_valid(new.tags) BEGIN
+        INSERT OR IGNORE INTO {_TAGS_TABLE}(memory_id, tag)
+        SELECT new.id, value FROM json_each(new.tags);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memory_tags_ad
+    AFTER DELETE ON memories BEGIN
+        DELETE FROM {_TAGS_TABLE} WHERE memory_id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memory_tags_au
+    AFTER UPDATE OF id, tags ON memories BEGIN
+        DELETE FROM {_TAGS_TABLE} WHERE memory_id = old.id;
+        INSERT OR IGNORE INTO {_TAGS_TABLE}(memory_id, tag)
+        SELECT new.id, value FROM json_each(new.tags) WHERE json_valid(new.tags);
+    END
+    """,
+)
+_TAGS_BACKFILL = f"""
+    INSERT OR IGNORE INTO {_TAGS_TABLE}(memory_id, tag)
+    SELECT m.id, j.value FROM memories m, json_each(m.tags) j
+    WHERE json_valid(m.tags)
+"""
+
+# Composite indexes matching _apply_scope_filters() predicates, with
+# updated_at last so ``ORDER BY updated_at DESC LIMIT n`` reads the index
+# in order instead of sorting every match.
+_SCOPE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_memory_scope_updated "
+    "ON memories(scope, updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_memory_scope_dir_updated "
+    "ON memories(scope, working_dir, updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_memory_scope_author_updated "
+    "ON memories(scope, author, updated_at)",
+)
+
+
+def _fts_phrase_query(query: str) -> str:
+    """Quote *query* as an FTS5 phrase (a substring with trigrams)."""
+    return '"' + query.replace('"', '""') + '"'
+
 
 class SharedMemory:
     """Cross-agent shared memory for knowledge sharing.
@@ -37,16 +142,22 @@ class SharedMemory:
         resolved = db_path or get_shared_memory_db_path()
         self.db_path = os.path.abspath(os.path.expanduser(os.path.expandvars(resolved)))
         self._lock = threading.RLock()
+        self._db = SQLiteDatabase(self.db_path, row_factory=sqlite3.Row)
+        self._fts_enabled = False
 
         if self.enabled:
             self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a SQLite connection with WAL mode."""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's cached SQLite connection (WAL, busy timeout)."""
+        return self._db.connection()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Call at shutdown, once no other thread is using this store.
+        """
+        self._db.close()
 
     @classmethod
     def from_env(cls, db_path: str | None = None) -> SharedMemory:
@@ -124,9 +235,76 @@ class SharedMemory:
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_memory_author ON memories(author)"
                 )
+                for statement in _SCOPE_INDEXES:
+                    conn.execute(statement)
+                self._migrate_tags(conn)
+                self._fts_enabled = self._migrate_fts_index(conn)
+                conn.commit()
+            finally:
+                self._db.release(conn)
+
+    @staticmethod
+    def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (name,),
+        ).fetchone()
+        return row is not None
+
+    def _migrate_tags(self, conn: sqlite3.Connection) -> None:
+        """Create the normalized tag table, backfilling existing memories."""
+        exists = self._table_exists(conn, _TAGS_TABLE)
+        for statement in _TAGS_SCHEMA:
+            conn.execute(statement)
+        if not exists:
+            conn.execute(_TAGS_BACKFILL)
+            logger.info("Migrated shared memory: built tag index")
+
+    def _migrate_fts_index(self, conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 index and its triggers, backfilling existing rows.
+
+        An index built by another tokenizer is dropped and rebuilt.
+
+        Returns:
+            True if the index is usable, False to fall back to LIKE search.
+        """
+        try:
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (_FTS_TABLE,),
+            ).fetchone()
+            exists = row is not None and f"'{_FTS_TOKENIZER}'" in row[0]
+            if row is not None and not exists:
+                conn.execute(f"DROP TABLE {_FTS_TABLE}")
+            for statement in _FTS_SCHEMA:
+                conn.execute(statement)
+            if not exists:
+                conn.execute(
+                    f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')"
+                )
+                logger.info("Migrated shared memory: built full-text search index")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Shared memory full-text index unavailable: {e}")
+            return False
+
+    def rebuild_index(self) -> None:
+        """Recompute the full-text and tag indexes from the memories table."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                if self._fts_enabled:
+                    conn.execute(
+                        f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')"
+                    )
+                conn.execute(f"DELETE FROM {_TAGS_TABLE}")
+                conn.execute(_TAGS_BACKFILL)
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def save(
         self,
@@ -181,7 +359,7 @@ class SharedMemory:
                 ).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def get(self, id_or_key: str) -> dict[str, Any] | None:
         """Get a memory by ID or key.
@@ -204,7 +382,7 @@ class SharedMemory:
                 ).fetchone()
                 return self._row_to_dict(row) if row else None
             finally:
-                conn.close()
+                self._db.release(conn)
 
     @staticmethod
     def _apply_scope_filters(
@@ -275,9 +453,11 @@ class SharedMemory:
                     params.append(author)
 
                 if tags:
-                    condition = "EXISTS (SELECT 1 FROM json_each(tags) WHERE value = ?)"
-                    tag_conditions = " OR ".join([condition] * len(tags))
-                    query += f" AND ({tag_conditions})"
+                    placeholders = ", ".join("?" * len(tags))
+                    query += (
+                        f" AND id IN (SELECT memory_id FROM {_TAGS_TABLE} "
+                        f"WHERE tag IN ({placeholders}))"
+                    )
                     params.extend(tags)
 
                 query += " ORDER BY updated_at DESC LIMIT ?"
@@ -286,7 +466,7 @@ class SharedMemory:
                 rows = conn.execute(query, params).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def search(
         self,
@@ -298,8 +478,14 @@ class SharedMemory:
     ) -> list[dict[str, Any]]:
         """Search memories by key, content, or tags.
 
+        The query matches as a case-insensitive substring. With the trigram
+        FTS5 index, results are ordered by BM25 relevance, key hits first.
+        Without it (no FTS5 trigram support, or a query shorter than three
+        characters), memories are scanned and results are ordered newest
+        first.
+
         Args:
-            query: Search query string (LIKE matching).
+            query: Search query string.
             limit: Maximum number of results.
             scope: Filter by memory scope.
             author: Author filter used for private scope.
@@ -317,12 +503,23 @@ class SharedMemory:
         with self._lock:
             conn = self._get_connection()
             try:
-                like_query = f"%{query}%"
-                sql = """
-                    SELECT * FROM memories
-                    WHERE (key LIKE ? OR content LIKE ? OR tags LIKE ?)
-                """
-                params: list[Any] = [like_query, like_query, like_query]
+                # A query shorter than one trigram has no index entries.
+                use_fts = self._fts_enabled and len(query) >= _FTS_MIN_QUERY_CHARS
+                params: list[Any]
+                if use_fts:
+                    sql = f"""
+                        SELECT memories.* FROM {_FTS_TABLE}
+                        JOIN memories ON memories.rowid = {_FTS_TABLE}.rowid
+                        WHERE {_FTS_TABLE} MATCH ?
+                    """
+                    params = [_fts_phrase_query(query)]
+                else:
+                    like_query = f"%{query}%"
+                    sql = """
+                        SELECT * FROM memories
+                        WHERE (key LIKE ? OR content LIKE ? OR tags LIKE ?)
+                    """
+                    params = [like_query, like_query, like_query]
 
                 result = self._apply_scope_filters(
                     sql, params, scope, author, working_dir
@@ -331,12 +528,18 @@ class SharedMemory:
                     return []
                 sql, params = result
 
-                sql += " ORDER BY updated_at DESC LIMIT ?"
+                if use_fts:
+                    sql += (
+                        f" ORDER BY bm25({_FTS_TABLE}, {_FTS_WEIGHTS}),"
+                        " updated_at DESC LIMIT ?"
+                    )
+                else:
+                    sql += " ORDER BY updated_at DESC LIMIT ?"
                 params.append(limit)
                 rows = conn.execute(sql, params).fetchall()
                 return [self._row_to_dict(row) for row in rows]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def delete(self, id_or_key: str) -> bool:
         """Delete a memory by ID or key.
@@ -360,7 +563,7 @@ class SharedMemory:
                 conn.commit()
                 return cursor.rowcount > 0
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def stats(self) -> dict[str, Any]:
         """Get memory statistics.
@@ -381,11 +584,10 @@ class SharedMemory:
                 ).fetchall()
                 by_author = {row["author"]: row["cnt"] for row in author_rows}
 
-                tag_rows = conn.execute("SELECT tags FROM memories").fetchall()
-                tag_counter: Counter[str] = Counter()
-                for row in tag_rows:
-                    tag_counter.update(json.loads(row["tags"] or "[]"))
-                by_tag = dict(tag_counter)
+                tag_rows = conn.execute(
+                    f"SELECT tag, COUNT(*) as cnt FROM {_TAGS_TABLE} GROUP BY tag"
+                ).fetchall()
+                by_tag = {row["tag"]: row["cnt"] for row in tag_rows}
 
                 return {
                     "total": total,
@@ -393,4 +595,4 @@ class SharedMemory:
                     "by_tag": by_tag,
                 }
             finally:
-                conn.close()
+                self._db.release(conn)
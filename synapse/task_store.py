@@ -5,7 +5,16 @@ Thread-safe task store for A2A protocol tasks.
 Extracted from synapse/a2a_compat.py for modularity.
 """
 
+import asyncio
+import bisect
+import contextlib
+import logging
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from operator import itemgetter
 from typing import Any, Literal
 from uuid import uuid4
 
@@ -16,32 +25,277 @@ from synapse.a2a_models import (
     TaskErrorModel,
     TaskState,
 )
+from synapse.config import (
+    COMPLETED_TASK_STATES,
+    TASK_STORE_FINISHED_TTL,
+    TASK_STORE_MAX_FINISHED,
+)
 from synapse.utils import get_iso_timestamp
 
+logger = logging.getLogger(__name__)
+
 # Metadata key constants used by TaskStore
 _EXPLICIT_REPLY_RECORDED_METADATA_KEY = "_explicit_reply_recorded"
 ERROR_CODE_MISSING_REPLY = "MISSING_REPLY"
 ERROR_CODE_REPLY_FAILED = "REPLY_FAILED"
+PARENT_TASK_METADATA_KEY = "parent_task_id"
+CHILD_TASKS_METADATA_KEY = "child_task_ids"
 
 
-class TaskStore:
-    """Thread-safe in-memory task storage"""
+class _TaskIdIndex:
+    """Sorted task IDs, bucketed by their first two characters.
+
+    Prefix lookups bisect a single bucket (O(log n)), and inserts only shift
+    one bucket instead of a list of every ID.
+    """
+
+    _KEY_LEN = 2
 
     def __init__(self) -> None:
+        self._buckets: dict[str, list[str]] = {}
+
+    def add(self, task_id: str) -> None:
+        bucket = self._buckets.setdefault(task_id[: self._KEY_LEN], [])
+        bisect.insort(bucket, task_id)
+
+    def discard(self, task_id: str) -> None:
+        key = task_id[: self._KEY_LEN]
+        bucket = self._buckets.get(key)
+        if not bucket:
+            return
+        i = bisect.bisect_left(bucket, task_id)
+        if i < len(bucket) and bucket[i] == task_id:
+            del bucket[i]
+            if not bucket:
+                del self._buckets[key]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield IDs starting with *prefix* in sorted order."""
+        if len(prefix) >= self._KEY_LEN:
+            buckets: Iterable[list[str]] = [
+                self._buckets.get(prefix[: self._KEY_LEN], [])
+            ]
+        else:
+            buckets = [
+                bucket
+                for key, bucket in sorted(self._buckets.items())
+                if key.startswith(prefix)
+            ]
+        for bucket in buckets:
+            i = bisect.bisect_left(bucket, prefix)
+            while i < len(bucket) and bucket[i].startswith(prefix):
+                yield bucket[i]
+                i += 1
+
+
+class TaskStore:
+    """Thread-safe in-memory task storage.
+
+    Finished tasks (completed/failed/canceled) are evicted once they are
+    older than *finished_ttl* seconds or more than *max_finished* of them
+    are held, oldest first; tasks still in progress are never evicted.
+    *on_evict* is called with each evicted task (outside the store lock),
+    e.g. to spill it to the history database.
+
+    A parent task created by :meth:`create_with_children` finishes on its
+    own once every child has finished.
+
+    Unfinished tasks are also indexed by status, so status queries such as
+    ``list_tasks(status="working")`` do not scan finished tasks.
+    """
+
+    def __init__(
+        self,
+        finished_ttl: float = TASK_STORE_FINISHED_TTL,
+        max_finished: int = TASK_STORE_MAX_FINISHED,
+        on_evict: Callable[[Task], None] | None = None,
+    ) -> None:
         self._tasks: dict[str, Task] = {}
         self._lock = threading.Lock()
+        self._index = _TaskIdIndex()
+        # status -> {task_id: creation sequence} of unfinished tasks in that
+        # status; entries of tasks no longer held are dropped lazily
+        self._by_status: dict[str, dict[str, int]] = {}
+        # task_id -> creation sequence, to return indexed tasks in order
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        # task_id -> monotonic time it finished, oldest first
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        self.on_evict = on_evict
+        # task_id -> events of coroutines long-polling for a status change
+        self._waiters: dict[
+            str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = {}
 
-    def create(
+    def _notify_waiters(self, task_id: str) -> None:
+        """Wake long-poll waiters for *task_id*. Caller must hold ``_lock``.
+
+        Status updates arrive from the PTY reader thread as well as from
+        request handlers, so events are set via their owning loop.
+        """
+        for loop, event in self._waiters.pop(task_id, ()):
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(event.set)
+
+    def _add(self, task: Task) -> None:
+        """Hold a new task. Caller holds ``_lock``."""
+        self._tasks[task.id] = task
+        self._index.add(task.id)
+        self._order[task.id] = self._next_order
+        self._next_order += 1
+        self._reindex(task, None)
+
+    def _reindex(self, task: Task, old_status: str | None) -> None:
+        """Move *task* to its status bucket. Caller holds ``_lock``."""
+        if old_status is not None:
+            bucket = self._by_status.get(old_status)
+            if bucket is not None:
+                bucket.pop(task.id, None)
+        if task.status not in COMPLETED_TASK_STATES:
+            order = self._order.get(task.id, 0)
+            self._by_status.setdefault(task.status, {})[task.id] = order
+
+    def _with_status(self, statuses: set[str]) -> list[Task]:
+        """Unfinished tasks in *statuses*, creation order. Caller holds ``_lock``."""
+        entries: list[tuple[int, Task]] = []
+        for status in statuses:
+            bucket = self._by_status.get(status)
+            if not bucket:
+                continue
+            stale = []
+            for task_id, order in bucket.items():
+                task = self._tasks.get(task_id)
+                if task is None or task.status != status:
+                    stale.append(task_id)
+                else:
+                    entries.append((order, task))
+            for task_id in stale:
+                del bucket[task_id]
+        # Buckets are mostly in creation order already, which sorts in O(n)
+        entries.sort(key=itemgetter(0))
+        return [task for _, task in entries]
+
+    def _status_changed(self, task: Task, old_status: str) -> list[Task]:
+        """Bookkeeping after *task*'s status changed. Caller holds ``_lock``.
+
+        Returns the tasks evicted as a result, to pass to ``_spill``.
+        """
+        self._reindex(task, old_status)
+        self._notify_waiters(task.id)
+        if task.status in COMPLETED_TASK_STATES:
+            self._finished[task.id] = time.monotonic()
+            self._finished.move_to_end(task.id)
+            parent_id = task.metadata.get(PARENT_TASK_METADATA_KEY)
+            if parent_id:
+                self._settle_parent(parent_id)
+        else:
+            self._finished.pop(task.id, None)
+        return self._evict()
+
+    def _settle_parent(self, parent_id: str) -> None:
+        """Finish the parent once all children have. Caller holds ``_lock``.
+
+        The parent is completed if any child completed (or all children
+        are gone), otherwise failed.
+        """
+        parent = self._tasks.get(parent_id)
+        if parent is None or parent.status in COMPLETED_TASK_STATES:
+            return
+        statuses = []
+        for child_id in parent.metadata.get(CHILD_TASKS_METADATA_KEY, []):
+            child = self._tasks.get(child_id)
+            if child is None:
+                continue
+            if child.status not in COMPLETED_TASK_STATES:
+                return
+            statuses.append(child.status)
+        completed = not statuses or "completed" in statuses
+        old_status = parent.status
+        parent.status = "completed" if completed else "failed"
+        parent.updated_at = get_iso_timestamp()
+        self._reindex(parent, old_status)
+        self._notify_waiters(parent.id)
+        self._finished[parent.id] = time.monotonic()
+
+    def _evict(self) -> list[Task]:
+        """Drop expired / over-cap finished tasks. Caller holds ``_lock``."""
+        evicted: list[Task] = []
+        cutoff = time.monotonic() - self.finished_ttl
+        while self._finished:
+            task_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > cutoff and len(self._finished) <= self.max_finished:
+                break
+            del self._finished[task_id]
+            self._index.discard(task_id)
+            self._order.pop(task_id, None)
+            task = self._tasks.pop(task_id, None)
+            if task is not None:
+                self._notify_waiters(task_id)
+                evicted.append(task)
+        return evicted
+
+    def _spill(self, evicted: list[Task]) -> None:
+        if self.on_evict is None:
+            return
+        for task in evicted:
+            try:
+                self.on_evict(task)
+            except Exception as e:  # broad: eviction must never break callers
+                logger.warning("Failed to spill evicted task %s: %s", task.id, e)
+
+    async def wait_for_change(
+        self,
+        task_id: str,
+        unless_status: TaskState,
+        timeout: float,
+    ) -> Task | None:
+        """Wait until the task's status differs from *unless_status*.
+
+        Returns immediately if it already differs. The check and the waiter
+        registration happen under the store lock, so an update racing with
+        the call cannot be missed.
+
+        Returns:
+            The task after the change or timeout, None if it does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None or task.status != unless_status:
+                return task
+            self._waiters.setdefault(task_id, set()).add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(task_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[task_id]
+        return self.get(task_id)
+
+    def _new_task(
         self,
         message: Message,
-        context_id: str | None = None,
-        metadata: dict[str, Any] | None = None,
+        context_id: str | None,
+        metadata: dict[str, Any] | None,
+        status: TaskState = "submitted",
+        task_id: str | None = None,
     ) -> Task:
-        """Create a new task with optional metadata (including sender info)"""
         now = get_iso_timestamp()
-        task = Task(
-            id=str(uuid4()),
-            status="submitted",
+        return Task(
+            id=task_id or str(uuid4()),
+            status=status,
             message=message,
             artifacts=[],
             created_at=now,
@@ -49,10 +303,58 @@ class TaskStore:
             context_id=context_id,
             metadata=metadata or {},
         )
+
+    def create(
+        self,
+        message: Message,
+        context_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        task_id: str | None = None,
+    ) -> Task:
+        """Create a new task with optional metadata (including sender info).
+
+        *task_id* recreates a task under a known ID (e.g. a message restored
+        from the agent inbox after a restart); a new UUID is used otherwise.
+        """
+        task = self._new_task(message, context_id, metadata, task_id=task_id)
         with self._lock:
-            self._tasks[task.id] = task
+            self._add(task)
+            evicted = self._evict()
+        self._spill(evicted)
         return task
 
+    def create_with_children(
+        self,
+        message: Message,
+        metadata: dict[str, Any] | None,
+        children: list[dict[str, Any]],
+    ) -> tuple[Task, list[Task]]:
+        """Create a working parent task and one working child per metadata dict.
+
+        Children reference the parent via ``parent_task_id``; the parent
+        lists them under ``child_task_ids`` and finishes when they all have
+        (at once when there are none).
+        """
+        parent = self._new_task(message, None, metadata, status="working")
+        child_tasks = [
+            self._new_task(
+                message,
+                None,
+                {**child_metadata, PARENT_TASK_METADATA_KEY: parent.id},
+                status="working",
+            )
+            for child_metadata in children
+        ]
+        parent.metadata[CHILD_TASKS_METADATA_KEY] = [c.id for c in child_tasks]
+        with self._lock:
+            for task in (parent, *child_tasks):
+                self._add(task)
+            if not child_tasks:
+                self._settle_parent(parent.id)
+            evicted = self._evict()
+        self._spill(evicted)
+        return parent, child_tasks
+
     def get(self, task_id: str) -> Task | None:
         """Get a task by ID"""
         with self._lock:
@@ -78,9 +380,9 @@ class TaskStore:
 
             # Prefix match
             matches = [
-                task
-                for task_id, task in self._tasks.items()
-                if task_id.lower().startswith(prefix_lower)
+                self._tasks[task_id]
+                for task_id in islice(self._index.with_prefix(prefix_lower), 2)
+                if task_id in self._tasks
             ]
 
             if not matches:
@@ -88,19 +390,27 @@ class TaskStore:
             if len(matches) == 1:
                 return matches[0]
             # Multiple matches - ambiguous
+            count = sum(
+                1
+                for task_id in self._index.with_prefix(prefix_lower)
+                if task_id in self._tasks
+            )
             raise ValueError(
-                f"Ambiguous task ID prefix '{prefix}': matches {len(matches)} tasks"
+                f"Ambiguous task ID prefix '{prefix}': matches {count} tasks"
             )
 
     def update_status(self, task_id: str, status: TaskState) -> Task | None:
         """Update task status"""
         with self._lock:
-            if task_id in self._tasks:
-                task = self._tasks[task_id]
-                task.status = status
-                task.updated_at = get_iso_timestamp()
-                return task
-        return None
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            old_status = task.status
+            task.status = status
+            task.updated_at = get_iso_timestamp()
+            evicted = self._status_changed(task, old_status)
+        self._spill(evicted)
+        return task
 
     def add_artifact(self, task_id: str, artifact: Artifact) -> Task | None:
         """Add artifact to task"""
@@ -147,13 +457,16 @@ class TaskStore:
     def set_error(self, task_id: str, error: TaskErrorModel) -> Task | None:
         """Set error on a task"""
         with self._lock:
-            if task_id in self._tasks:
-                task = self._tasks[task_id]
-                task.error = error
-                task.status = "failed"
-                task.updated_at = get_iso_timestamp()
-                return task
-        return None
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            old_status = task.status
+            task.error = error
+            task.status = "failed"
+            task.updated_at = get_iso_timestamp()
+            evicted = self._status_changed(task, old_status)
+        self._spill(evicted)
+        return task
 
     def record_explicit_reply(
         self,
@@ -175,6 +488,7 @@ class TaskStore:
                 return None
             metadata[_EXPLICIT_REPLY_RECORDED_METADATA_KEY] = True
             task.metadata = metadata
+            old_status = task.status
             if status == "failed":
                 task.artifacts = []
                 task.error = error or TaskErrorModel(
@@ -186,7 +500,9 @@ class TaskStore:
                 task.error = None
                 task.status = "completed"
             task.updated_at = get_iso_timestamp()
-            return task
+            evicted = self._status_changed(task, old_status)
+        self._spill(evicted)
+        return task
 
     def mark_missing_reply_if_unreplied(self, task_id: str) -> Task | None:
         """Fail a task as missing-reply only if no explicit reply was recorded.
@@ -214,14 +530,49 @@ class TaskStore:
             )
             task.status = "failed"
             task.updated_at = get_iso_timestamp()
-            return task
+            evicted = self._status_changed(task, "completed")
+        self._spill(evicted)
+        return task
+
+    def only_finished(self) -> bool:
+        """True if the store holds tasks and all of them have finished."""
+        with self._lock:
+            return bool(self._tasks) and not self._with_status(set(self._by_status))
 
-    def list_tasks(self, context_id: str | None = None) -> list[Task]:
-        """List all tasks, optionally filtered by context"""
+    def list_tasks(
+        self,
+        context_id: str | None = None,
+        status: TaskState | Iterable[TaskState] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Task]:
+        """List tasks in creation order, optionally filtered and paginated.
+
+        Args:
+            context_id: Only tasks in this context.
+            status: Only tasks in this state (or any of these states).
+            limit: Return at most this many tasks.
+            offset: Skip this many matching tasks first.
+        """
+        statuses = {status} if isinstance(status, str) else status
+        if statuses is not None:
+            statuses = set(statuses)
         with self._lock:
+            # Also sweeps expired tasks on agents that stopped receiving work.
+            evicted = self._evict()
+            tasks: Iterable[Task]
+            if statuses is not None and statuses.isdisjoint(COMPLETED_TASK_STATES):
+                tasks = self._with_status(statuses)
+            else:
+                tasks = self._tasks.values()
+                if statuses is not None:
+                    tasks = (t for t in tasks if t.status in statuses)
             if context_id:
-                return [t for t in self._tasks.values() if t.context_id == context_id]
-            return list(self._tasks.values())
+                tasks = (t for t in tasks if t.context_id == context_id)
+            stop = None if limit is None else offset + limit
+            result = list(islice(tasks, offset, stop))
+        self._spill(evicted)
+        return result
 
 
 # Global task store
@@ -7,6 +7,7 @@ import shlex
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,7 @@ from synapse.a2a_compat import (
     _REPLY_STATUS_METADATA_KEY,
     ERROR_CODE_REPLY_FAILED,
 )
+from synapse.config import BROADCAST_MAX_WORKERS
 from synapse.registry import (
     AgentRegistry,
     get_valid_uds_path,
@@ -159,12 +161,18 @@ def _wait_for_parent_intervention(
     to ``/tasks/<id>/permission/{approve,deny}`` on this same child, which
     unblocks the PTY and returns the task to ``working`` → ``completed``.
 
-    This helper therefore keeps the sender subprocess alive and simply polls
-    the task until it terminates. Returns the final task on terminal state,
-    or ``None`` on timeout (parent never intervened).
+    This helper therefore keeps the sender subprocess alive and simply waits
+    on the task until it terminates, long-polling ``/tasks/<id>/wait`` when
+    the child supports it. Returns the final task on terminal state, or
+    ``None`` on timeout (parent never intervened).
     """
-    from synapse.a2a_client import A2ATask
-    from synapse.config import COMPLETED_TASK_STATES, TASK_POLL_INTERVAL
+    from synapse import http_pool
+    from synapse.a2a_client import A2ATask, wait_for_task_update
+    from synapse.config import (
+        COMPLETED_TASK_STATES,
+        TASK_POLL_INTERVAL,
+        TASK_WAIT_MAX_TIMEOUT,
+    )
 
     if not endpoint:
         return None
@@ -173,22 +181,26 @@ def _wait_for_parent_intervention(
     url = f"{base}/tasks/{task_id}"
     deadline = time.time() + max(timeout_s, 0)
     last_task_status: str | None = None
+    long_poll = True
 
     while time.time() < deadline:
         data: dict | None = None
         try:
-            if uds_path:
-                import httpx
-
-                transport = httpx.HTTPTransport(uds=uds_path)
-                with httpx.Client(transport=transport, timeout=10.0) as client:
-                    uds_resp = client.get(url)
+            if long_poll:
+                wait = min(max(deadline - time.time(), 0.0), TASK_WAIT_MAX_TIMEOUT)
+                data = wait_for_task_update(
+                    url, uds_path, wait=wait, since_status=last_task_status
+                )
+                long_poll = data is not None
+            if data is None:
+                if uds_path:
+                    uds_resp = http_pool.get_client(uds_path).get(url, timeout=10.0)
                     uds_resp.raise_for_status()
                     data = uds_resp.json()
-            else:
-                http_resp = requests.get(url, timeout=10)
-                http_resp.raise_for_status()
-                data = http_resp.json()
+                else:
+                    http_resp = requests.get(url, timeout=10)
+                    http_resp.raise_for_status()
+                    data = http_resp.json()
         except Exception:  # broad: transient HTTP errors shouldn't abort the watch
             _sleep(TASK_POLL_INTERVAL)
             continue
@@ -199,7 +211,8 @@ def _wait_for_parent_intervention(
 
         task = A2ATask.from_dict(data, fallback_id=task_id)
         status = task.status
-        if status != last_task_status:
+        changed = status != last_task_status
+        if changed:
             print(
                 f"  Task {task_id[:8]} status: {status}",
                 file=sys.stderr,
@@ -207,7 +220,8 @@ def _wait_for_parent_intervention(
             last_task_status = status
         if status in COMPLETED_TASK_STATES:
             return task
-        _sleep(TASK_POLL_INTERVAL)
+        if not (long_poll and changed):
+            _sleep(TASK_POLL_INTERVAL)
 
     return None
 
@@ -566,67 +580,118 @@ def cmd_broadcast(args: argparse.Namespace) -> None:
     response_mode = _get_response_mode(getattr(args, "response_mode", None))
     client = A2AClient()
     sent_count = 0
-    failed: list[tuple[str, str]] = []
-
-    for target_agent in recipients:
-        agent_id = target_agent.get("agent_id", "unknown")
-        pid = target_agent.get("pid")
-        port = target_agent.get("port")
-        endpoint = target_agent.get("endpoint")
-        uds_path = get_valid_uds_path(target_agent.get("uds_path"))
-
-        if not endpoint:
-            failed.append((agent_id, "missing endpoint"))
-            continue
-
-        if pid and not is_process_running(pid):
-            reg.unregister(agent_id)
-            failed.append((agent_id, f"process {pid} is no longer running"))
-            continue
-
-        if not uds_path and port and not is_port_open("localhost", port, timeout=1.0):
-            failed.append((agent_id, f"server on port {port} is not responding"))
-            continue
-
-        task = client.send_to_local(
-            endpoint=str(endpoint),
-            message=message,
-            file_parts=file_parts,
-            priority=args.priority,
-            wait_for_completion=(response_mode == "wait"),
-            timeout=60,
-            sender_info=sender_info or None,
+    failed_count = 0
+
+    def _report_failure(agent_id: str, reason: str) -> None:
+        nonlocal failed_count
+        failed_count += 1
+        print(f"  {agent_id}: failed ({reason})", flush=True)
+
+    # Recipients are probed and sent to concurrently, so the broadcast takes
+    # about as long as the slowest recipient rather than the sum of all.
+    workers = min(len(recipients), BROADCAST_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reasons = list(
+            pool.map(lambda agent: _broadcast_liveness_error(reg, agent), recipients)
+        )
+        live: list[dict] = []
+        for target_agent, reason in zip(recipients, reasons, strict=True):
+            if reason:
+                _report_failure(target_agent.get("agent_id", "unknown"), reason)
+            else:
+                live.append(target_agent)
+
+        # One parent task on the sender's server, one child per recipient,
+        # created in a single request.
+        _, child_task_ids = client.create_broadcast_tasks(
+            message,
+            [str(agent["endpoint"]) for agent in live],
+            sender_info or None,
             response_mode=response_mode,
-            uds_path=uds_path,
-            local_only=False,
-            registry=reg,
-            sender_agent_id=sender_id,
-            target_agent_id=agent_id,
+            file_parts=file_parts,
         )
 
-        if not task:
-            failed.append((agent_id, "local send failed"))
-            continue
+        def _fail_child(child_task_id: str | None, agent_id: str, reason: str) -> None:
+            # No reply will come for a failed send; settle its child task
+            # so the parent still finishes.
+            if child_task_id:
+                client.fail_sender_task(
+                    child_task_id,
+                    f"broadcast to {agent_id} failed: {reason}",
+                    sender_info or None,
+                )
 
-        sent_count += 1
-        task_id = task.id or str(uuid.uuid4())
-        _record_sent_message(
-            task_id=task_id,
-            target_agent=target_agent,
-            message=message,
-            priority=args.priority,
-            sender_info=sender_info or None,
-        )
+        futures = {
+            pool.submit(
+                client.send_to_local,
+                endpoint=str(target_agent["endpoint"]),
+                message=message,
+                file_parts=file_parts,
+                priority=args.priority,
+                wait_for_completion=(response_mode == "wait"),
+                timeout=60,
+                sender_info=sender_info or None,
+                response_mode=response_mode,
+                uds_path=get_valid_uds_path(target_agent.get("uds_path")),
+                local_only=False,
+                registry=reg,
+                sender_agent_id=sender_id,
+                target_agent_id=target_agent.get("agent_id", "unknown"),
+                sender_task_id=child_task_id,
+            ): (target_agent, child_task_id)
+            for target_agent, child_task_id in zip(live, child_task_ids, strict=True)
+        }
+        for future in as_completed(futures):
+            target_agent, child_task_id = futures[future]
+            agent_id = target_agent.get("agent_id", "unknown")
+            try:
+                task = future.result()
+            except Exception as e:  # broad: one recipient must not abort the rest
+                _report_failure(agent_id, f"local send failed: {e}")
+                _fail_child(child_task_id, agent_id, str(e))
+                continue
+            if not task:
+                _report_failure(agent_id, "local send failed")
+                _fail_child(child_task_id, agent_id, "local send failed")
+                continue
+
+            sent_count += 1
+            task_id = task.id or str(uuid.uuid4())
+            print(f"  {agent_id}: sent (task {task_id[:8]})", flush=True)
+            _record_sent_message(
+                task_id=task_id,
+                target_agent=target_agent,
+                message=message,
+                priority=args.priority,
+                sender_info=sender_info or None,
+            )
 
     print(f"Sent: {sent_count}")
-    print(f"Failed: {len(failed)}")
-    for agent_id, reason in failed:
-        print(f"  - {agent_id}: {reason}")
+    print(f"Failed: {failed_count}")
 
-    if failed:
+    if failed_count:
         sys.exit(1)
 
 
+def _broadcast_liveness_error(reg: AgentRegistry, target_agent: dict) -> str | None:
+    """Return why a broadcast recipient cannot be reached, or None if live.
+
+    Registry entries of agents whose process has exited are removed.
+    """
+    agent_id = target_agent.get("agent_id", "unknown")
+    pid = target_agent.get("pid")
+    port = target_agent.get("port")
+    if not target_agent.get("endpoint"):
+        return "missing endpoint"
+    if pid and not is_process_running(pid):
+        reg.unregister(agent_id)
+        return f"process {pid} is no longer running"
+    uds_path = get_valid_uds_path(target_agent.get("uds_path"))
+    if not uds_path and port and not is_port_open("localhost", port, timeout=1.0):
+        return f"server on port {port} is not responding"
+    return None
+
+
 def cmd_reply(args: argparse.Namespace) -> None:
     """Reply to the last message using the reply map.
 
@@ -11,8 +11,10 @@ Phase B (future): ChannelTransport will be added behind the --channel flag.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
+from synapse.long_message import format_file_reference
 from synapse.utils import format_a2a_message
 
 if TYPE_CHECKING:
@@ -22,6 +24,17 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TransportMessage:
+    """One message of a coalesced batch (see MessageTransport.deliver_batch)."""
+
+    task_id: str
+    content: str
+    response_mode: str = "silent"
+    sender_id: str | None = None
+    sender_name: str | None = None
+
+
 class MessageTransport(Protocol):
     """Protocol for delivering A2A messages to an agent."""
 
@@ -48,6 +61,16 @@ class MessageTransport(Protocol):
         """
         ...
 
+    def deliver_batch(self, messages: list[TransportMessage]) -> bool:
+        """Deliver several messages to the agent as a single turn.
+
+        Each message keeps its own ``A2A:`` header and sender prefix.
+
+        Returns:
+            True if delivered successfully, False otherwise.
+        """
+        ...
+
     def is_available(self) -> bool:
         """Return True if this transport is ready to deliver messages."""
         ...
@@ -100,6 +123,46 @@ class PTYTransport:
 
         return self._controller.write(prefixed_content, submit_seq=self._submit_seq)
 
+    def deliver_batch(self, messages: list[TransportMessage]) -> bool:
+        """Deliver messages as one PTY write, blank-line separated.
+
+        A batch too long for the TUI goes to a file (named after the first
+        task) and the agent gets a single file reference, as for one long
+        message.
+        """
+        if len(messages) == 1:
+            message = messages[0]
+            return self.deliver(
+                message.task_id,
+                message.content,
+                response_mode=message.response_mode,
+                sender_id=message.sender_id,
+                sender_name=message.sender_name,
+            )
+
+        combined = "\n\n".join(
+            format_a2a_message(
+                message.content,
+                response_mode=message.response_mode,
+                sender_id=message.sender_id,
+                sender_name=message.sender_name,
+            )
+            for message in messages
+        )
+        if self._store.needs_file_storage(combined):
+            file_path = self._store.store_message(messages[0].task_id, combined)
+            logger.info(
+                f"Batch of {len(messages)} messages stored to {file_path} "
+                f"for task {messages[0].task_id[:8]}"
+            )
+            expects_reply = any(m.response_mode == "notify" for m in messages)
+            combined = format_a2a_message(
+                format_file_reference(
+                    file_path, "notify" if expects_reply else "silent"
+                )
+            )
+        return self._controller.write(combined, submit_seq=self._submit_seq)
+
     def is_available(self) -> bool:
         """PTY is available when the controller process is running."""
         return self._controller.running
@@ -2,6 +2,11 @@
 Webhook Notifications for Synapse A2A.
 
 Provides push notifications when tasks complete.
+
+Task events are handed to a :class:`WebhookDispatcher`, which delivers
+them from one long-lived worker thread with a pooled HTTP client. With a
+database path, pending deliveries are kept in a SQLite outbox and resumed
+after a restart.
 """
 
 import asyncio
@@ -10,14 +15,27 @@ import hmac
 import json
 import logging
 import os
+import sqlite3
+import threading
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
+from synapse.config import (
+    WEBHOOK_MAX_PENDING,
+    WEBHOOK_MAX_PER_URL,
+    WEBHOOK_MAX_RECORDED_DELIVERIES,
+    WEBHOOK_RETRY_DELAYS,
+)
+from synapse.db import SQLiteDatabase
+from synapse.http_pool import aclose_async_clients, get_async_client
+
 logger = logging.getLogger(__name__)
 
 # Environment variables
@@ -67,7 +85,9 @@ class WebhookRegistry:
 
     def __init__(self) -> None:
         self._webhooks: dict[str, WebhookConfig] = {}
-        self._deliveries: list[WebhookDelivery] = []
+        self._deliveries: deque[WebhookDelivery] = deque(
+            maxlen=WEBHOOK_MAX_RECORDED_DELIVERIES
+        )
 
     def register(
         self,
@@ -116,15 +136,12 @@ class WebhookRegistry:
         ]
 
     def add_delivery(self, delivery: WebhookDelivery) -> None:
-        """Record a delivery attempt."""
+        """Record a delivery attempt (the oldest records are dropped)."""
         self._deliveries.append(delivery)
-        # Keep only last 100 deliveries
-        if len(self._deliveries) > 100:
-            self._deliveries = self._deliveries[-100:]
 
     def get_recent_deliveries(self, limit: int = 20) -> list[WebhookDelivery]:
         """Get recent delivery attempts."""
-        return self._deliveries[-limit:]
+        return list(self._deliveries)[-limit:]
 
 
 def compute_signature(payload: str, secret: str) -> str:
@@ -132,98 +149,135 @@ def compute_signature(payload: str, secret: str) -> str:
     return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
 
 
+def _build_request(
+    webhook: WebhookConfig, event: WebhookEvent
+) -> tuple[str, dict[str, str]]:
+    """Return the JSON body and headers (signed if a secret is set)."""
+    payload = {
+        "event": event.event_type,
+        "event_id": event.id,
+        "timestamp": event.timestamp.isoformat(),
+        "data": event.payload,
+    }
+    payload_json = json.dumps(payload)
+
+    headers = {
+        "Content-Type": "application/json",
+        "X-Synapse-Event": event.event_type,
+        "X-Synapse-Event-Id": event.id,
+        "X-Synapse-Timestamp": event.timestamp.isoformat(),
+    }
+
+    # Add signature if secret is configured
+    if webhook.secret:
+        signature = compute_signature(payload_json, webhook.secret)
+        headers["X-Synapse-Signature"] = f"sha256={signature}"
+
+    return payload_json, headers
+
+
+def _retry_delay(attempt: int, delays: tuple[float, ...]) -> float:
+    """Seconds to wait after failed attempt number *attempt* (1-based)."""
+    return delays[min(attempt, len(delays)) - 1]
+
+
+async def _post(
+    client: httpx.AsyncClient,
+    delivery: WebhookDelivery,
+    body: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> bool:
+    """Make one delivery attempt and record its outcome on *delivery*.
+
+    Returns:
+        True when the delivery is settled (delivered, or failed with a 4xx
+        that retrying will not fix), False when it should be retried
+    """
+    url = delivery.webhook_url
+    event_type = delivery.event.event_type
+    delivery.attempts += 1
+
+    try:
+        response = await client.post(
+            url,
+            content=body,
+            headers=headers,
+            timeout=timeout,
+        )
+    except httpx.TimeoutException:
+        delivery.error = "Request timed out"
+        logger.warning(f"Webhook timeout: {url}")
+        return False
+    except httpx.RequestError as e:
+        delivery.error = str(e)
+        logger.warning(f"Webhook error: {url} - {e}")
+        return False
+
+    delivery.status_code = response.status_code
+    delivery.response_body = response.text[:500]  # Truncate
+
+    if 200 <= response.status_code < 300:
+        delivery.success = True
+        delivery.delivered_at = datetime.now(timezone.utc)
+        logger.info(f"Webhook delivered: {url} ({event_type})")
+        return True
+    if 400 <= response.status_code < 500:
+        # 4xx client errors are permanent — do not retry
+        logger.warning(
+            f"Webhook permanently failed (4xx): {url} status={response.status_code}"
+        )
+        return True
+    logger.warning(f"Webhook failed: {url} status={response.status_code}")
+    return False
+
+
 async def deliver_webhook(
     webhook: WebhookConfig,
     event: WebhookEvent,
     max_retries: int = 3,
     timeout: float = 10.0,
     registry: WebhookRegistry | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> WebhookDelivery:
     """
     Deliver a webhook event to a URL.
 
+    Callers may run on a short-lived loop (``asyncio.run``), so this does
+    not take a pooled client that would outlive it: it uses *client* when
+    given, otherwise one closed before returning. The server delivers task
+    events through :class:`WebhookDispatcher` instead.
+
     Args:
         webhook: Webhook configuration
         event: Event to deliver
         max_retries: Maximum retry attempts
         timeout: Request timeout in seconds
         registry: Optional registry to record delivery
+        client: Optional client owned by the caller
 
     Returns:
         WebhookDelivery record
     """
+    if client is None:
+        async with httpx.AsyncClient(timeout=timeout) as owned:
+            return await deliver_webhook(
+                webhook, event, max_retries, timeout, registry, owned
+            )
+
     delivery = WebhookDelivery(
         webhook_url=webhook.url,
         event=event,
     )
-
-    payload = {
-        "event": event.event_type,
-        "event_id": event.id,
-        "timestamp": event.timestamp.isoformat(),
-        "data": event.payload,
-    }
-    payload_json = json.dumps(payload)
-
-    headers = {
-        "Content-Type": "application/json",
-        "X-Synapse-Event": event.event_type,
-        "X-Synapse-Event-Id": event.id,
-        "X-Synapse-Timestamp": event.timestamp.isoformat(),
-    }
-
-    # Add signature if secret is configured
-    if webhook.secret:
-        signature = compute_signature(payload_json, webhook.secret)
-        headers["X-Synapse-Signature"] = f"sha256={signature}"
+    body, headers = _build_request(webhook, event)
 
     # Retry with exponential backoff
-    retry_delays = [1, 2, 4]  # seconds
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for attempt in range(max_retries):
-            delivery.attempts = attempt + 1
-
-            try:
-                response = await client.post(
-                    webhook.url,
-                    content=payload_json,
-                    headers=headers,
-                )
-
-                delivery.status_code = response.status_code
-                delivery.response_body = response.text[:500]  # Truncate
-
-                if 200 <= response.status_code < 300:
-                    delivery.success = True
-                    delivery.delivered_at = datetime.now(timezone.utc)
-                    logger.info(
-                        f"Webhook delivered: {webhook.url} ({event.event_type})"
-                    )
-                    break
-                elif 400 <= response.status_code < 500:
-                    # 4xx client errors are permanent — do not retry
-                    logger.warning(
-                        f"Webhook permanently failed (4xx): "
-                        f"{webhook.url} status={response.status_code}"
-                    )
-                    break
-                else:
-                    logger.warning(
-                        f"Webhook failed: {webhook.url} status={response.status_code}"
-                    )
-
-            except httpx.TimeoutException:
-                delivery.error = "Request timed out"
-                logger.warning(f"Webhook timeout: {webhook.url}")
-
-            except httpx.RequestError as e:
-                delivery.error = str(e)
-                logger.warning(f"Webhook error: {webhook.url} - {e}")
-
-            # Wait before retry (except on last attempt)
-            if attempt < max_retries - 1:
-                await asyncio.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
+    for attempt in range(1, max_retries + 1):
+        if await _post(client, delivery, body, headers, timeout):
+            break
+        # Wait before retry (except on last attempt)
+        if attempt < max_retries:
+            await asyncio.sleep(_retry_delay(attempt, WEBHOOK_RETRY_DELAYS))
 
     if registry:
         registry.add_delivery(delivery)
@@ -260,15 +314,16 @@ async def dispatch_event(
     timeout = float(os.environ.get(ENV_WEBHOOK_TIMEOUT, "10"))
     max_retries = int(os.environ.get(ENV_WEBHOOK_MAX_RETRIES, str(max_retries)))
 
-    # Deliver to all webhooks concurrently
-    tasks = [
-        deliver_webhook(webhook, event, max_retries, timeout, registry)
-        for webhook in webhooks
-    ]
+    # Deliver to all webhooks concurrently over one client for this call
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        tasks = [
+            deliver_webhook(webhook, event, max_retries, timeout, registry, client)
+            for webhook in webhooks
+        ]
 
-    # Use return_exceptions=True to ensure all webhooks are attempted
-    # even if one fails
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Use return_exceptions=True to ensure all webhooks are attempted
+        # even if one fails
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Filter out exceptions, keeping only successful deliveries, and log errors
     deliveries = []
@@ -283,6 +338,344 @@ async def dispatch_event(
     return deliveries
 
 
+_OUTBOX_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS webhook_outbox (
+        owner TEXT NOT NULL,
+        id TEXT NOT NULL,
+        url TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        event_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        body TEXT NOT NULL,
+        headers TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (owner, id)
+    )
+"""
+
+
+@dataclass
+class _PendingDelivery:
+    """One event on its way to one webhook URL."""
+
+    id: str
+    delivery: WebhookDelivery
+    body: str
+    headers: dict[str, str]
+    registry: WebhookRegistry | None = None
+
+
+class WebhookDispatcher:
+    """Delivers webhook events from one long-lived worker thread.
+
+    :meth:`submit` may be called from any thread (PTY status callbacks as
+    well as request handlers on the TCP and UDS server loops) and never
+    waits on the network. The worker runs its own event loop with one
+    pooled ``httpx.AsyncClient``, so connections to a webhook host are
+    reused across events. At most ``per_url_limit`` requests run against
+    one URL at a time, and a failed attempt is rescheduled with
+    ``loop.call_later`` rather than by a coroutine sleeping through the
+    backoff.
+
+    Given a database path, pending deliveries are also written to a SQLite
+    outbox (keyed by *owner*, the agent ID) and resumed after a restart.
+    """
+
+    def __init__(
+        self,
+        registry: WebhookRegistry | None = None,
+        db_path: str | None = None,
+        owner: str = "",
+        max_pending: int = WEBHOOK_MAX_PENDING,
+        per_url_limit: int = WEBHOOK_MAX_PER_URL,
+        max_retries: int | None = None,
+        timeout: float | None = None,
+        retry_delays: tuple[float, ...] = WEBHOOK_RETRY_DELAYS,
+    ) -> None:
+        """Initialize WebhookDispatcher.
+
+        Args:
+            registry: Registry to read subscriptions from and record
+                deliveries in, or None for the global registry
+            db_path: SQLite outbox for pending deliveries, or None to keep
+                them in memory only
+            owner: Key of this dispatcher's rows in a shared outbox
+            max_pending: Max deliveries pending at once; submit() drops more
+            per_url_limit: Max concurrent requests to one URL
+            max_retries: Attempts per delivery (default:
+                SYNAPSE_WEBHOOK_MAX_RETRIES, else 3)
+            timeout: Request timeout in seconds (default:
+                SYNAPSE_WEBHOOK_TIMEOUT, else 10)
+            retry_delays: Seconds before each retry; the last one repeats
+        """
+        self.registry = registry
+        self.db_path = db_path
+        self.owner = owner
+        self.max_pending = max_pending
+        self.per_url_limit = per_url_limit
+        self.max_retries = (
+            max_retries
+            if max_retries is not None
+            else int(os.environ.get(ENV_WEBHOOK_MAX_RETRIES, "3"))
+        )
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else float(os.environ.get(ENV_WEBHOOK_TIMEOUT, "10"))
+        )
+        self.retry_delays = retry_delays
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+        self._pending = 0
+        self._dropped = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # Only touched on the worker loop
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._db: SQLiteDatabase | None = None
+
+        if db_path:
+            self._load()
+
+    def _load(self) -> None:
+        """Open the outbox and resume deliveries pending before a restart."""
+        assert self.db_path is not None
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = SQLiteDatabase(self.db_path)
+            with self._db.transaction() as conn:
+                conn.execute(_OUTBOX_SCHEMA)
+                rows = conn.execute(
+                    "SELECT id, url, event_type, event_id, timestamp, body, "
+                    "headers, attempts FROM webhook_outbox WHERE owner = ? "
+                    "ORDER BY rowid",
+                    (self.owner,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Webhook outbox unavailable, queueing in memory: {e}")
+            self._db = None
+            return
+
+        pending = []
+        for row in rows:
+            row_id, url, event_type, event_id, timestamp, body, headers, attempts = row
+            try:
+                event = WebhookEvent(
+                    event_type=event_type,
+                    payload=json.loads(body).get("data", {}),
+                    timestamp=datetime.fromisoformat(timestamp),
+                    id=event_id,
+                )
+                item = _PendingDelivery(
+                    row_id,
+                    WebhookDelivery(webhook_url=url, event=event, attempts=attempts),
+                    body,
+                    json.loads(headers),
+                )
+            except (AttributeError, TypeError, ValueError):
+                logger.warning(f"Dropping unreadable webhook outbox entry {row_id}")
+                self._delete(row_id)
+                continue
+            pending.append(item)
+        if pending:
+            logger.info(f"Resuming {len(pending)} pending webhook delivery(ies)")
+            with self._lock:
+                self._pending += len(pending)
+            self._schedule(pending)
+
+    def _save(self, item: _PendingDelivery) -> None:
+        if self._db is None:
+            return
+        event = item.delivery.event
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO webhook_outbox (owner, id, url, "
+                    "event_type, event_id, timestamp, body, headers, attempts) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.owner,
+                        item.id,
+                        item.delivery.webhook_url,
+                        event.event_type,
+                        event.id,
+                        event.timestamp.isoformat(),
+                        item.body,
+                        json.dumps(item.headers),
+                        item.delivery.attempts,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist webhook delivery {item.id}: {e}")
+
+    def _delete(self, row_id: str) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "DELETE FROM webhook_outbox WHERE owner = ? AND id = ?",
+                    (self.owner, row_id),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove webhook delivery {row_id}: {e}")
+
+    def submit(self, event_type: str, payload: dict[str, Any]) -> int:
+        """Queue an event for every webhook subscribed to it.
+
+        Thread-safe and non-blocking.
+
+        Args:
+            event_type: Type of event (e.g., "task.completed")
+            payload: Event payload data
+
+        Returns:
+            Number of deliveries queued (0 if nobody is subscribed; fewer
+            than the subscribers if the pending limit was reached)
+        """
+        registry = self.registry or get_webhook_registry()
+        webhooks = registry.get_webhooks_for_event(event_type)
+        if not webhooks:
+            logger.debug(f"No webhooks registered for event: {event_type}")
+            return 0
+
+        event = WebhookEvent(event_type=event_type, payload=payload)
+        with self._lock:
+            room = max(0, self.max_pending - self._pending)
+            accepted = webhooks[:room]
+            self._pending += len(accepted)
+            self._dropped += len(webhooks) - len(accepted)
+        if len(accepted) < len(webhooks):
+            logger.warning(
+                f"Webhook queue full ({self.max_pending} pending); dropped "
+                f"{len(webhooks) - len(accepted)} delivery(ies) of {event_type}"
+            )
+
+        pending = []
+        for webhook in accepted:
+            body, headers = _build_request(webhook, event)
+            item = _PendingDelivery(
+                str(uuid.uuid4()),
+                WebhookDelivery(webhook_url=webhook.url, event=event),
+                body,
+                headers,
+                registry,
+            )
+            self._save(item)
+            pending.append(item)
+        if pending:
+            self._schedule(pending)
+        return len(pending)
+
+    def _schedule(self, pending: list[_PendingDelivery]) -> None:
+        """Hand deliveries to the worker loop, starting it if needed."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="synapse-webhooks", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            loop = self._loop
+        for item in pending:
+            loop.call_soon_threadsafe(self._start, item)
+
+    def _start(self, item: _PendingDelivery) -> None:
+        """Start an attempt. Runs on the worker loop."""
+        task = asyncio.get_running_loop().create_task(self._attempt(item))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _attempt(self, item: _PendingDelivery) -> None:
+        url = item.delivery.webhook_url
+        limit = self._limits.get(url)
+        if limit is None:
+            limit = self._limits[url] = asyncio.Semaphore(self.per_url_limit)
+        try:
+            async with limit:
+                settled = await _post(
+                    get_async_client(),
+                    item.delivery,
+                    item.body,
+                    item.headers,
+                    self.timeout,
+                )
+        except Exception as e:
+            logger.error(f"Webhook delivery raised unexpected exception: {e}")
+            item.delivery.error = str(e)
+            settled = True
+
+        attempts = item.delivery.attempts
+        if not settled and attempts < self.max_retries:
+            # Nothing waits through the backoff; the retry is a timer
+            self._save(item)
+            asyncio.get_running_loop().call_later(
+                _retry_delay(attempts, self.retry_delays), self._start, item
+            )
+            return
+
+        (item.registry or self.registry or get_webhook_registry()).add_delivery(
+            item.delivery
+        )
+        self._delete(item.id)
+        with self._lock:
+            self._pending -= 1
+            self._settled.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until no delivery is pending.
+
+        Returns:
+            True if everything settled, False if *timeout* expired first
+        """
+        with self._settled:
+            return self._settled.wait_for(lambda: self._pending == 0, timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Pending and dropped delivery counts."""
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "dropped": self._dropped,
+                "persistent": self._db is not None,
+            }
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread and close the outbox.
+
+        Deliveries still pending are abandoned; with an outbox they are
+        resumed by the next dispatcher opened on it.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread is not None:
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+            try:
+                future.result(timeout)
+            except Exception as e:
+                logger.debug(f"Webhook worker shutdown incomplete: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+        with self._lock:
+            self._pending = 0
+            self._settled.notify_all()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def _shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await aclose_async_clients()
+
+
 # Global registry instance
 _webhook_registry: WebhookRegistry | None = None
 
@@ -299,3 +692,35 @@ def reset_webhook_registry() -> None:
     """Reset the global webhook registry (for testing)."""
     global _webhook_registry
     _webhook_registry = None
+
+
+# Global dispatcher instance
+_webhook_dispatcher: WebhookDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Get the global webhook dispatcher (memory-only unless one was set)."""
+    global _webhook_dispatcher
+    with _dispatcher_lock:
+        if _webhook_dispatcher is None:
+            _webhook_dispatcher = WebhookDispatcher()
+        return _webhook_dispatcher
+
+
+def set_webhook_dispatcher(dispatcher: WebhookDispatcher) -> None:
+    """Install the global webhook dispatcher, closing the previous one."""
+    global _webhook_dispatcher
+    with _dispatcher_lock:
+        previous, _webhook_dispatcher = _webhook_dispatcher, dispatcher
+    if previous is not None and previous is not dispatcher:
+        previous.close()
+
+
+def reset_webhook_dispatcher() -> None:
+    """Close and forget the global webhook dispatcher (shutdown, testing)."""
+    global _webhook_dispatcher
+    with _dispatcher_lock:
+        previous, _webhook_dispatcher = _webhook_dispatcher, None
+    if previous is not None:
+        previous.close()
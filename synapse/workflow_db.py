@@ -16,6 +16,7 @@ import threading
 from pathlib import Path
 from typing import Any
 
+from synapse.db import SQLiteDatabase
 from synapse.paths import get_workflow_runs_db_path
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,9 @@ class WorkflowRunDB:
             Path(db_path or get_workflow_runs_db_path()).expanduser().resolve()
         )
         self._lock = threading.RLock()
+        self._db = SQLiteDatabase(
+            self.db_path, row_factory=sqlite3.Row, foreign_keys=True
+        )
         self._init_db()
 
     # ------------------------------------------------------------------
@@ -36,12 +40,15 @@ class WorkflowRunDB:
     # ------------------------------------------------------------------
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a SQLite connection with WAL mode."""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's cached SQLite connection (WAL, busy timeout)."""
+        return self._db.connection()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Call at shutdown, once no other thread is using this store.
+        """
+        self._db.close()
 
     # ------------------------------------------------------------------
     # Schema
@@ -96,7 +103,7 @@ class WorkflowRunDB:
                 )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     # ------------------------------------------------------------------
     # Write operations
@@ -143,7 +150,7 @@ class WorkflowRunDB:
                     )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def update_run_status(
         self,
@@ -161,7 +168,7 @@ class WorkflowRunDB:
                 )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def update_step(self, run_id: str, step: dict[str, Any]) -> None:
         """Update a single step's status, timestamps, output, and error."""
@@ -185,7 +192,7 @@ class WorkflowRunDB:
                 )
                 conn.commit()
             finally:
-                conn.close()
+                self._db.release(conn)
 
     # ------------------------------------------------------------------
     # Read operations
@@ -209,7 +216,7 @@ class WorkflowRunDB:
                     row, [self._step_row_to_dict(s) for s in step_rows]
                 )
             finally:
-                conn.close()
+                self._db.release(conn)
 
     def get_runs(self, limit: int = 200) -> list[dict[str, Any]]:
         """Return runs ordered by most recent first."""
@@ -240,7 +247,7 @@ class WorkflowRunDB:
                     for r in rows
                 ]
             finally:
-                conn.close()
+                self._db.release(conn)
 
     # ------------------------------------------------------------------
     # Maintenance
@@ -263,7 +270,7 @@ class WorkflowRunDB:
                 conn.commit()
                 return count
             finally:
-                conn.close()
+                self._db.release(conn)
 
     # ------------------------------------------------------------------
     # Internal helpers
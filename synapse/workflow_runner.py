@@ -26,6 +26,7 @@ from urllib.parse import urlsplit, urlunsplit
 
 import httpx
 
+from synapse import http_pool
 from synapse.config import BLOCKING_TASK_STATES
 from synapse.registry import AgentRegistry
 from synapse.workflow import Workflow, WorkflowError, WorkflowStore
@@ -620,35 +621,62 @@ async def _poll_task_completion(
     *,
     target_is_self: bool = False,
 ) -> tuple[str, str]:
-    """Poll target agent's task until terminal state. Returns (status, output)."""
-    from synapse.config import COMPLETED_TASK_STATES, TASK_POLL_INTERVAL
+    """Poll target agent's task until terminal state. Returns (status, output).
+
+    Long-polls ``/tasks/{id}/wait`` so a status change is seen as soon as it
+    happens; servers without that endpoint are polled every
+    ``TASK_POLL_INTERVAL``.
+    """
+    from synapse.config import (
+        COMPLETED_TASK_STATES,
+        TASK_POLL_INTERVAL,
+        TASK_WAIT_MAX_TIMEOUT,
+    )
 
     url = f"{endpoint.rstrip('/')}/tasks/{task_id}"
     deadline = time.time() + _POLL_TIMEOUT
+    long_poll = True
+    last_status: str | None = None
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        while time.time() < deadline:
-            try:
-                resp = await client.get(url)
-                if resp.status_code == 404:
-                    return "completed", ""  # task not tracked
-                resp.raise_for_status()
-                task_data = _extract_task_data(resp.json())
-                status = _extract_task_status(task_data)
-                if status in COMPLETED_TASK_STATES:
-                    return status, _extract_task_output(task_data)
-                if status == "input_required" and not target_is_self:
-                    # Self-target sends can be transiently input_required while
-                    # local PTY injection settles. External targets cannot
-                    # progress from workflow context without approval, so fail
-                    # fast with a clear permission error.
-                    return "failed", (
-                        "Agent requires permission approval"
-                        " — check auto-approve configuration"
-                    )
-            except httpx.HTTPError:
-                pass
-            await asyncio.sleep(TASK_POLL_INTERVAL)
+    client = http_pool.get_async_client()
+    while time.time() < deadline:
+        changed = False
+        try:
+            if long_poll:
+                wait = max(0.0, min(deadline - time.time(), TASK_WAIT_MAX_TIMEOUT))
+                params: dict[str, Any] = {"timeout": wait}
+                if last_status:
+                    params["status"] = last_status
+                resp = await client.get(f"{url}/wait", params=params, timeout=wait + 10)
+                if resp.status_code in (404, 405):
+                    # No /wait on this server (or unknown task): plain GET.
+                    long_poll = False
+                    resp = await client.get(url, timeout=10.0)
+            else:
+                resp = await client.get(url, timeout=10.0)
+            if resp.status_code == 404:
+                return "completed", ""  # task not tracked
+            resp.raise_for_status()
+            task_data = _extract_task_data(resp.json())
+            status = _extract_task_status(task_data)
+            changed = status != last_status
+            last_status = status
+            if status in COMPLETED_TASK_STATES:
+                return status, _extract_task_output(task_data)
+            if status == "input_required" and not target_is_self:
+                # Self-target sends can be transiently input_required while
+                # local PTY injection settles. External targets cannot
+                # progress from workflow context without approval, so fail
+                # fast with a clear permission error.
+                return "failed", (
+                    "Agent requires permission approval"
+                    " — check auto-approve configuration"
+                )
+        except httpx.HTTPError:
+            pass
+        if long_poll and changed:
+            continue  # re-arm the long-poll against the new status
+        await asyncio.sleep(TASK_POLL_INTERVAL)
 
     return "completed", ""  # timeout → best-effort complete
 
@@ -680,25 +708,23 @@ async def _wait_for_helper_idle(endpoint: str) -> bool:
     consecutive_errors = 0
     max_consecutive_errors = 3
 
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        while time.time() < deadline:
-            try:
-                response = await client.get(f"{endpoint.rstrip('/')}/tasks")
-                consecutive_errors = 0  # reset on any successful response
-                if response.status_code == 200 and not _has_working_tasks(
-                    response.json()
-                ):
-                    return True
-            except httpx.HTTPError:
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    logger.warning(
-                        "Helper at %s unreachable after %d attempts, giving up",
-                        endpoint,
-                        consecutive_errors,
-                    )
-                    return False
-            await asyncio.sleep(3.0)
+    client = http_pool.get_async_client()
+    while time.time() < deadline:
+        try:
+            response = await client.get(f"{endpoint.rstrip('/')}/tasks", timeout=5.0)
+            consecutive_errors = 0  # reset on any successful response
+            if response.status_code == 200 and not _has_working_tasks(response.json()):
+                return True
+        except httpx.HTTPError:
+            consecutive_errors += 1
+            if consecutive_errors >= max_consecutive_errors:
+                logger.warning(
+                    "Helper at %s unreachable after %d attempts, giving up",
+                    endpoint,
+                    consecutive_errors,
+                )
+                return False
+        await asyncio.sleep(3.0)
 
     return False
 
@@ -714,23 +740,23 @@ async def _send_workflow_request(
     """
     payload = _build_canvas_workflow_request(wf_step, sender_info)
     url = f"{endpoint.rstrip('/')}/tasks/send-priority?priority={wf_step.priority}"
+    client = http_pool.get_async_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = None
-            for _attempt in range(_SEND_MAX_RETRIES):
-                response = await client.post(url, json=payload)
-                if response.status_code == 409:
-                    await asyncio.sleep(_SEND_RETRY_INTERVAL)
-                    continue
-                response.raise_for_status()
-                break
-            else:
-                # All retries exhausted with 409
-                if response is not None:
-                    detail = response.text.strip() or "Agent busy (409)"
-                    return 409, "", detail, ""
-            assert response is not None  # guaranteed by for/else
-            data = response.json()
+        response = None
+        for _attempt in range(_SEND_MAX_RETRIES):
+            response = await client.post(url, json=payload, timeout=30.0)
+            if response.status_code == 409:
+                await asyncio.sleep(_SEND_RETRY_INTERVAL)
+                continue
+            response.raise_for_status()
+            break
+        else:
+            # All retries exhausted with 409
+            if response is not None:
+                detail = response.text.strip() or "Agent busy (409)"
+                return 409, "", detail, ""
+        assert response is not None  # guaranteed by for/else
+        data = response.json()
     except httpx.HTTPStatusError as e:
         detail = e.response.text.strip() or str(e)
         return e.response.status_code, "", detail, ""
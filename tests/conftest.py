@@ -28,9 +28,10 @@ def reset_global_state() -> Generator[None, None, None]:
     _saved = {k: os.environ.pop(k) for k in _helper_envs if k in os.environ}
 
     # Reset any singleton instances
-    from synapse import a2a_client
+    from synapse import a2a_client, http_pool
 
     a2a_client._client = None
+    http_pool.close_clients()
 
     # Reset task_store singleton to prevent cross-test contamination
     from synapse.a2a_compat import task_store
@@ -45,6 +46,7 @@ def reset_global_state() -> Generator[None, None, None]:
         os.environ[k] = v
 
     a2a_client._client = None
+    http_pool.close_clients()
     with task_store._lock:
         task_store._tasks.clear()
 
@@ -91,6 +93,15 @@ def reset_global_state() -> Generator[None, None, None]:
         )
 
 
+@pytest.fixture(autouse=True)
+def isolate_inbox_db(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Keep agent inboxes opened by tests out of ~/.synapse/inbox.db."""
+    monkeypatch.setenv("SYNAPSE_INBOX_DB_PATH", str(tmp_path / "inbox.db"))
+    yield
+
+
 @pytest.fixture
 def temp_registry_dir(tmp_path):
     """Create a temporary registry directory."""
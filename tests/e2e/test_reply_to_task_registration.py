@@ -277,7 +277,7 @@ class TestSendToLocalTaskCreation:
             def __exit__(self, *args):
                 pass
 
-            def post(self, url, json=None):
+            def post(self, url, json=None, timeout=None):
                 if "/tasks/create" in url:
                     uds_calls.append({"url": url, "json": json})
                     mock_resp = MagicMock()
@@ -307,7 +307,7 @@ class TestSendToLocalTaskCreation:
 
         monkeypatch.setattr(Path, "exists", mock_exists)
         monkeypatch.setattr("httpx.Client", MockHttpxClient)
-        monkeypatch.setattr("httpx.HTTPTransport", lambda uds: MagicMock())
+        monkeypatch.setattr("httpx.HTTPTransport", lambda **kwargs: MagicMock())
 
         client = A2AClient()
         client.send_to_local(
@@ -347,7 +347,7 @@ class TestSendToLocalTaskCreation:
             def __exit__(self, *args):
                 pass
 
-            def post(self, url, json=None):
+            def post(self, url, json=None, timeout=None):
                 if "/tasks/create" in url:
                     raise httpx.HTTPError("UDS connection failed")
                 elif "/tasks/send-priority" in url:
@@ -360,7 +360,7 @@ class TestSendToLocalTaskCreation:
                 raise ValueError(f"Unexpected URL: {url}")
 
         # Mock requests for HTTP fallback
-        def mock_requests_post(url, json=None, timeout=None):
+        def mock_session_post(_session, url, json=None, timeout=None):
             if "/tasks/create" in url:
                 http_create_calls.append({"url": url, "json": json})
                 mock_resp = MagicMock()
@@ -389,8 +389,8 @@ class TestSendToLocalTaskCreation:
 
         monkeypatch.setattr(Path, "exists", mock_exists)
         monkeypatch.setattr("httpx.Client", MockHttpxClient)
-        monkeypatch.setattr("httpx.HTTPTransport", lambda uds: MagicMock())
-        monkeypatch.setattr("requests.post", mock_requests_post)
+        monkeypatch.setattr("httpx.HTTPTransport", lambda **kwargs: MagicMock())
+        monkeypatch.setattr("requests.Session.post", mock_session_post)
 
         client = A2AClient()
         client.send_to_local(
@@ -417,7 +417,7 @@ class TestSendToLocalTaskCreation:
 
         send_calls = []
 
-        def mock_requests_post(url, json=None, timeout=None):
+        def mock_session_post(_session, url, json=None, timeout=None):
             send_calls.append({"url": url, "json": json})
             mock_resp = MagicMock()
             mock_resp.json.return_value = {
@@ -426,7 +426,7 @@ class TestSendToLocalTaskCreation:
             mock_resp.raise_for_status = MagicMock()
             return mock_resp
 
-        monkeypatch.setattr("requests.post", mock_requests_post)
+        monkeypatch.setattr("requests.Session.post", mock_session_post)
 
         client = A2AClient()
         client.send_to_local(
@@ -296,7 +296,7 @@ class TestA2AClientSendToLocal:
 
         monkeypatch.setattr("synapse.a2a_client.httpx.Client", DummyClient)
 
-        with patch("synapse.a2a_client.requests.post") as mock_post:
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
                 message="Hello",
@@ -320,7 +320,7 @@ class TestA2AClientSendToLocal:
 
         monkeypatch.setattr("synapse.a2a_client.httpx.Client", DummyClient)
 
-        with patch("synapse.a2a_client.requests.post") as mock_post:
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
                 message="Hello",
@@ -357,7 +357,7 @@ class TestA2AClientSendToLocal:
 
         monkeypatch.setattr("synapse.a2a_client.httpx.Client", DummyClient)
 
-        with patch("synapse.a2a_client.requests.post") as mock_post:
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
                 message="Hello",
@@ -396,7 +396,7 @@ class TestA2AClientSendToLocal:
 
         with (
             patch("synapse.a2a_client.logger.warning") as mock_warning,
-            patch("synapse.a2a_client.requests.post") as mock_post,
+            patch("synapse.a2a_client.requests.Session.post") as mock_post,
         ):
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
@@ -445,7 +445,7 @@ class TestA2AClientSendToLocal:
 
         with (
             patch("synapse.a2a_client.logger.warning") as mock_warning,
-            patch("synapse.a2a_client.requests.post") as mock_post,
+            patch("synapse.a2a_client.requests.Session.post") as mock_post,
         ):
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
@@ -489,7 +489,7 @@ class TestA2AClientSendToLocal:
 
         with (
             patch("synapse.a2a_client.logger.warning") as mock_warning,
-            patch("synapse.a2a_client.requests.post") as mock_post,
+            patch("synapse.a2a_client.requests.Session.post") as mock_post,
         ):
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
@@ -530,7 +530,7 @@ class TestA2AClientSendToLocal:
 
         with (
             patch("synapse.a2a_client.logger.warning") as mock_warning,
-            patch("synapse.a2a_client.requests.post", side_effect=error),
+            patch("synapse.a2a_client.requests.Session.post", side_effect=error),
             patch("builtins.print") as mock_print,
         ):
             task = a2a_client.send_to_local(
@@ -547,7 +547,7 @@ class TestA2AClientSendToLocal:
         """Should warn when local_only is requested without a UDS path."""
         with (
             patch("synapse.a2a_client.logger.warning") as mock_warning,
-            patch("synapse.a2a_client.requests.post") as mock_post,
+            patch("synapse.a2a_client.requests.Session.post") as mock_post,
         ):
             task = a2a_client.send_to_local(
                 endpoint="http://localhost:8001",
@@ -561,6 +561,115 @@ class TestA2AClientSendToLocal:
             "Cannot send: local_only=True but no UDS path provided"
         )
 
+    @responses.activate
+    def test_send_to_local_uses_given_sender_task_id(self, a2a_client):
+        """A pre-created sender task is used instead of creating a new one."""
+        responses.add(
+            responses.POST,
+            "http://localhost:8001/tasks/send-priority?priority=1",
+            json={"task": {"id": "t-1", "status": "working"}},
+            status=200,
+        )
+
+        a2a_client.send_to_local(
+            endpoint="http://localhost:8001",
+            message="Hello",
+            sender_info={"sender_endpoint": "http://localhost:8100"},
+            response_mode="notify",
+            sender_task_id="child-1",
+        )
+
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert body["metadata"]["sender_task_id"] == "child-1"
+
+
+class TestA2AClientCreateBroadcastTasks:
+    """Test create_broadcast_tasks (one parent + per-recipient children)."""
+
+    @responses.activate
+    def test_creates_parent_and_children_in_one_request(self, a2a_client):
+        responses.add(
+            responses.POST,
+            "http://localhost:8100/tasks/create",
+            json={
+                "task": {"id": "parent", "status": "working"},
+                "children": [
+                    {"id": "child-a", "status": "working"},
+                    {"id": "child-b", "status": "working"},
+                ],
+            },
+            status=200,
+        )
+
+        parent_id, child_ids = a2a_client.create_broadcast_tasks(
+            "hello team",
+            ["http://localhost:8001", "http://localhost:8002"],
+            {"sender_endpoint": "http://localhost:8100"},
+        )
+
+        assert parent_id == "parent"
+        assert child_ids == ["child-a", "child-b"]
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert [c["target_endpoint"] for c in body["children"]] == [
+            "http://localhost:8001",
+            "http://localhost:8002",
+        ]
+
+    def test_silent_mode_creates_nothing(self, a2a_client):
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
+            result = a2a_client.create_broadcast_tasks(
+                "fyi",
+                ["http://localhost:8001"],
+                {"sender_endpoint": "http://localhost:8100"},
+                response_mode="silent",
+            )
+
+        assert result == (None, [None])
+        mock_post.assert_not_called()
+
+    def test_no_targets_creates_nothing(self, a2a_client):
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
+            result = a2a_client.create_broadcast_tasks(
+                "hello", [], {"sender_endpoint": "http://localhost:8100"}
+            )
+
+        assert result == (None, [])
+        mock_post.assert_not_called()
+
+    @responses.activate
+    def test_fail_sender_task_records_failed_reply(self, a2a_client):
+        responses.add(
+            responses.POST,
+            "http://localhost:8100/tasks/child-a/reply",
+            json={"id": "child-a", "status": "failed"},
+            status=200,
+        )
+
+        assert a2a_client.fail_sender_task(
+            "child-a", "send failed", {"sender_endpoint": "http://localhost:8100"}
+        )
+        body = json.loads(responses.calls[0].request.body)
+        assert body == {"message": "send failed", "status": "failed"}
+
+    @responses.activate
+    def test_server_without_children_support_falls_back(self, a2a_client):
+        responses.add(
+            responses.POST,
+            "http://localhost:8100/tasks/create",
+            json={"task": {"id": "parent", "status": "working"}},
+            status=200,
+        )
+
+        result = a2a_client.create_broadcast_tasks(
+            "hello",
+            ["http://localhost:8001"],
+            {"sender_endpoint": "http://localhost:8100"},
+        )
+
+        assert result == (None, [None])
+
 
 class TestA2AClientSendMessage:
     """Test send_message method for external agents."""
@@ -626,6 +735,81 @@ class TestA2AClientWaitForCompletion:
         assert task.status == "completed"
         assert len(task.artifacts) == 1
 
+    @responses.activate
+    def test_wait_uses_long_poll_endpoint(self, a2a_client):
+        """Should return from a single /wait long-poll without interval polling."""
+        responses.add(
+            responses.GET,
+            "http://localhost:8001/tasks/task-1/wait",
+            json={"id": "task-1", "status": "completed", "artifacts": []},
+            status=200,
+        )
+
+        with patch("synapse.a2a_client.time.sleep") as mock_sleep:
+            task = a2a_client._wait_for_local_completion(
+                endpoint="http://localhost:8001", task_id="task-1", timeout=5
+            )
+
+        assert task is not None
+        assert task.status == "completed"
+        assert len(responses.calls) == 1
+        assert "timeout=" in responses.calls[0].request.url
+        mock_sleep.assert_not_called()
+
+    @responses.activate
+    def test_wait_falls_back_to_polling_without_long_poll_support(self, a2a_client):
+        """A 404 from /wait (older server) should switch to GET polling."""
+        responses.add(
+            responses.GET, "http://localhost:8001/tasks/task-1/wait", status=404
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:8001/tasks/task-1",
+            json={"id": "task-1", "status": "completed", "artifacts": []},
+            status=200,
+        )
+
+        task = a2a_client._wait_for_local_completion(
+            endpoint="http://localhost:8001", task_id="task-1", timeout=5
+        )
+
+        assert task is not None
+        assert task.status == "completed"
+        assert [call.request.url for call in responses.calls][-1] == (
+            "http://localhost:8001/tasks/task-1"
+        )
+
+    @responses.activate
+    def test_wait_retries_long_poll_after_transient_error(self, a2a_client):
+        """A 5xx from /wait polls once, then goes back to long-polling."""
+        wait_url = "http://localhost:8001/tasks/task-1/wait"
+        responses.add(responses.GET, wait_url, status=503)
+        responses.add(
+            responses.GET,
+            "http://localhost:8001/tasks/task-1",
+            json={"id": "task-1", "status": "working", "artifacts": []},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            wait_url,
+            json={"id": "task-1", "status": "completed", "artifacts": []},
+            status=200,
+        )
+
+        with patch("synapse.a2a_client.time.sleep"):
+            task = a2a_client._wait_for_local_completion(
+                endpoint="http://localhost:8001", task_id="task-1", timeout=5
+            )
+
+        assert task is not None
+        assert task.status == "completed"
+        assert [call.request.url.split("?")[0] for call in responses.calls] == [
+            wait_url,
+            "http://localhost:8001/tasks/task-1",
+            wait_url,
+        ]
+
     @responses.activate
     def test_wait_falls_back_to_target_polling_when_no_sender_endpoint(
         self, a2a_client
@@ -852,7 +1036,7 @@ class TestA2AClientReplyToFailsafe:
 
         monkeypatch.setattr("synapse.a2a_client.httpx.Client", DummyClient)
 
-        with patch("synapse.a2a_client.requests.post") as mock_post:
+        with patch("synapse.a2a_client.requests.Session.post") as mock_post:
             # Mock HTTP fallback for retry
             mock_response = mock_post.return_value
             mock_response.json.return_value = {
@@ -1,6 +1,9 @@
 """Tests for A2A Compatibility Layer - Google A2A protocol compliance."""
 
+import json
 import logging
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,6 +21,7 @@ from synapse.a2a_compat import (
     map_synapse_status_to_a2a,
     task_store,
 )
+from synapse.output_broadcast import OutputBroadcaster
 
 # ============================================================
 # Message/Part Model Tests
@@ -171,6 +175,157 @@ class TestTaskStore:
         ctx1_tasks = task_store.list_tasks(context_id="ctx-1")
         assert len(ctx1_tasks) == 2
 
+    def test_list_tasks_by_status_with_pagination(self, task_store):
+        """Should filter by status and page through results in creation order."""
+        msg = Message(parts=[TextPart(text="Test")])
+        tasks = [task_store.create(msg) for _ in range(5)]
+        for task in tasks[1:]:
+            task_store.update_status(task.id, "working")
+
+        working = task_store.list_tasks(status="working")
+        assert [t.id for t in working] == [t.id for t in tasks[1:]]
+
+        page = task_store.list_tasks(status="working", limit=2, offset=1)
+        assert [t.id for t in page] == [t.id for t in tasks[2:4]]
+
+        either = task_store.list_tasks(status=["submitted", "working"], limit=2)
+        assert [t.id for t in either] == [t.id for t in tasks[:2]]
+
+    def test_finished_tasks_evicted_over_cap(self):
+        """Oldest finished tasks are evicted past max_finished and spilled."""
+        spilled = []
+        store = TaskStore(max_finished=2, on_evict=spilled.append)
+        msg = Message(parts=[TextPart(text="Test")])
+        active = store.create(msg)
+        store.update_status(active.id, "working")
+        finished = [store.create(msg) for _ in range(3)]
+
+        for task in finished:
+            store.update_status(task.id, "completed")
+
+        assert [t.id for t in spilled] == [finished[0].id]
+        assert store.get(finished[0].id) is None
+        assert store.get_by_prefix(finished[0].id[:12]) is None
+        assert store.get(active.id) is not None
+        assert {t.id for t in store.list_tasks()} == {
+            active.id,
+            finished[1].id,
+            finished[2].id,
+        }
+
+    def test_finished_tasks_evicted_after_ttl(self, monkeypatch):
+        """Finished tasks older than finished_ttl are dropped on the next sweep."""
+        now = [1000.0]
+        monkeypatch.setattr("synapse.task_store.time.monotonic", lambda: now[0])
+        store = TaskStore(finished_ttl=60)
+        msg = Message(parts=[TextPart(text="Test")])
+        done = store.create(msg)
+        store.set_error(done.id, TaskErrorModel(code="E", message="boom"))
+        working = store.create(msg)
+        store.update_status(working.id, "working")
+
+        now[0] += 61
+        assert [t.id for t in store.list_tasks()] == [working.id]
+
+    def test_reopened_task_is_not_evicted(self):
+        """A task that leaves a finished state is no longer eviction-eligible."""
+        store = TaskStore(max_finished=1)
+        msg = Message(parts=[TextPart(text="Test")])
+        reopened = store.create(msg)
+        other = store.create(msg)
+        store.update_status(reopened.id, "completed")
+        store.update_status(reopened.id, "working")
+
+        store.update_status(other.id, "completed")
+
+        assert store.get(reopened.id) is not None
+        assert store.get(other.id) is not None
+
+    def test_spill_errors_do_not_break_updates(self):
+        """A failing on_evict callback must not propagate to callers."""
+
+        def broken(task):
+            raise RuntimeError("disk full")
+
+        store = TaskStore(max_finished=0, on_evict=broken)
+        task = store.create(Message(parts=[TextPart(text="Test")]))
+
+        updated = store.update_status(task.id, "completed")
+
+        assert updated is not None
+        assert store.get(task.id) is None
+
+    def test_parent_finishes_when_all_children_finish(self):
+        """A broadcast parent completes once every child has finished."""
+        store = TaskStore()
+        msg = Message(parts=[TextPart(text="Test")])
+        parent, children = store.create_with_children(
+            msg, {"direction": "outgoing"}, [{"target_endpoint": "a"}, {}]
+        )
+
+        assert parent.metadata["child_task_ids"] == [c.id for c in children]
+        assert {c.metadata["parent_task_id"] for c in children} == {parent.id}
+        assert parent.status == "working"
+
+        store.update_status(children[0].id, "failed")
+        assert store.get(parent.id).status == "working"
+
+        store.update_status(children[1].id, "completed")
+        assert store.get(parent.id).status == "completed"
+
+    def test_parent_fails_when_no_child_completed(self):
+        store = TaskStore()
+        msg = Message(parts=[TextPart(text="Test")])
+        parent, children = store.create_with_children(msg, None, [{}, {}])
+
+        for child in children:
+            store.update_status(child.id, "failed")
+
+        assert store.get(parent.id).status == "failed"
+
+    def test_list_by_status_uses_index_in_creation_order(self, task_store):
+        """Status queries follow every transition and keep creation order."""
+        msg = Message(parts=[TextPart(text="Test")])
+        first, second, third = (task_store.create(msg) for _ in range(3))
+        task_store.update_status(third.id, "working")
+        task_store.update_status(first.id, "working")
+        task_store.update_status(second.id, "input_required")
+
+        assert [t.id for t in task_store.list_tasks(status="working")] == [
+            first.id,
+            third.id,
+        ]
+        assert [
+            t.id for t in task_store.list_tasks(status=["input_required", "working"])
+        ] == [first.id, second.id, third.id]
+
+        task_store.set_error(first.id, TaskErrorModel(code="E", message="boom"))
+        task_store.record_explicit_reply(second.id, "done")
+        assert [t.id for t in task_store.list_tasks(status="working")] == [third.id]
+        assert task_store.list_tasks(status="input_required") == []
+        assert [t.id for t in task_store.list_tasks(status="failed")] == [first.id]
+
+    def test_only_finished(self, task_store):
+        """True only when tasks exist and none is still in progress."""
+        msg = Message(parts=[TextPart(text="Test")])
+        assert task_store.only_finished() is False
+
+        task = task_store.create(msg)
+        assert task_store.only_finished() is False
+
+        task_store.update_status(task.id, "canceled")
+        assert task_store.only_finished() is True
+
+    def test_status_index_skips_tasks_removed_directly(self, task_store):
+        """Tasks dropped from _tasks (e.g. by tests) are not returned."""
+        task = task_store.create(Message(parts=[TextPart(text="Test")]))
+        task_store.update_status(task.id, "working")
+
+        task_store._tasks.clear()
+
+        assert task_store.list_tasks(status="working") == []
+        assert task_store.only_finished() is False
+
     def test_create_task_with_metadata(self, task_store):
         """Should create task with metadata (including sender info)."""
         msg = Message(parts=[TextPart(text="Test")])
@@ -264,6 +419,53 @@ class TestTaskStore:
         assert first is not None
         assert second is None
 
+    async def test_wait_for_change_returns_immediately_when_status_differs(
+        self, task_store
+    ):
+        """wait_for_change should not block when the status already differs."""
+        task = task_store.create(Message(parts=[TextPart(text="Test")]))
+        task_store.update_status(task.id, "completed")
+
+        start = time.monotonic()
+        result = await task_store.wait_for_change(task.id, "working", timeout=5)
+
+        assert result is not None
+        assert result.status == "completed"
+        assert time.monotonic() - start < 1
+
+    async def test_wait_for_change_woken_by_update_from_another_thread(
+        self, task_store
+    ):
+        """Updates from the PTY reader thread should wake async waiters."""
+        task = task_store.create(Message(parts=[TextPart(text="Test")]))
+        task_store.update_status(task.id, "working")
+        timer = threading.Timer(0.1, task_store.update_status, (task.id, "completed"))
+        timer.start()
+
+        start = time.monotonic()
+        result = await task_store.wait_for_change(task.id, "working", timeout=5)
+        timer.join()
+
+        assert result is not None
+        assert result.status == "completed"
+        assert time.monotonic() - start < 2
+        assert task_store._waiters == {}
+
+    async def test_wait_for_change_times_out(self, task_store):
+        """wait_for_change should return the unchanged task on timeout."""
+        task = task_store.create(Message(parts=[TextPart(text="Test")]))
+        task_store.update_status(task.id, "working")
+
+        result = await task_store.wait_for_change(task.id, "working", timeout=0.05)
+
+        assert result is not None
+        assert result.status == "working"
+        assert task_store._waiters == {}
+
+    async def test_wait_for_change_unknown_task(self, task_store):
+        """wait_for_change should return None for unknown tasks."""
+        assert await task_store.wait_for_change("missing", "working", 1) is None
+
 
 # ============================================================
 # Status Mapping Tests
@@ -343,6 +545,60 @@ class TestA2ARouterEndpoints:
         assert "capabilities" in data
         assert "skills" in data
 
+    def test_list_tasks_endpoint_filters_and_paginates(self, client):
+        """GET /tasks should accept status, limit and offset."""
+        with task_store._lock:
+            task_store._tasks.clear()
+        msg = Message(parts=[TextPart(text="Test")])
+        ids = [task_store.create(msg).id for _ in range(3)]
+        for task_id in ids:
+            task_store.update_status(task_id, "working")
+        task_store.create(msg)
+
+        response = client.get(
+            "/tasks", params={"status": "working", "limit": 2, "offset": 1}
+        )
+
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == ids[1:]
+        assert client.get("/tasks", params={"limit": 0}).status_code == 422
+
+    def test_create_task_with_children(self, client):
+        """POST /tasks/create with children creates a parent plus children."""
+        payload = {
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+            "metadata": {"direction": "outgoing"},
+            "children": [{"target_endpoint": "a"}, {"target_endpoint": "b"}],
+        }
+
+        response = client.post("/tasks/create", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task"]["status"] == "working"
+        assert [c["metadata"]["target_endpoint"] for c in data["children"]] == [
+            "a",
+            "b",
+        ]
+        assert data["task"]["metadata"]["child_task_ids"] == [
+            c["id"] for c in data["children"]
+        ]
+
+    def test_create_task_with_empty_children(self, client):
+        """An empty children list still creates a parent, already settled."""
+        payload = {
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+            "children": [],
+        }
+
+        response = client.post("/tasks/create", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["children"] == []
+        assert data["task"]["metadata"]["child_task_ids"] == []
+        assert data["task"]["status"] == "completed"
+
     def test_tasks_send_endpoint(self, client, mock_controller):
         """POST /tasks/send should create task."""
         payload = {
@@ -839,7 +1095,9 @@ class TestA2ARouterEndpoints:
 
         task = task_store.get(task_id)
         assert task is not None
-        task.metadata["_context_start"] = len(full_context) - 1
+        # Only the last line ("7") was output after the task started
+        task.metadata["_output_offset"] = 26
+        mock_controller.output_since.return_value = "7"
         task.metadata["_sent_message"] = (
             "SYNAPSE_WAIT_TEST_SHORT_3 とだけ返答してください。"
         )
@@ -852,8 +1110,10 @@ class TestA2ARouterEndpoints:
             {"type": "text", "data": {"content": "SYNAPSE_WAIT_TEST_SHORT_3"}}
         ]
 
-    def test_tasks_send_rejects_second_working_task(self, client, mock_controller):
-        """A single PTY-backed agent should not accept overlapping working tasks."""
+    def test_tasks_send_queues_second_message_while_working(
+        self, client, mock_controller
+    ):
+        """A single PTY-backed agent queues messages instead of overlapping tasks."""
         mock_controller.status = "BUSY"
 
         first_payload = {
@@ -868,8 +1128,14 @@ class TestA2ARouterEndpoints:
         }
         second_response = client.post("/tasks/send", json=second_payload)
 
-        assert second_response.status_code == 409
-        assert "already has a working task" in second_response.json()["detail"]
+        assert second_response.status_code == 200
+        second_task = second_response.json()["task"]
+        assert second_task["status"] == "submitted"
+        assert task_store.get(first_response.json()["task"]["id"]).status == "working"
+
+        inbox = client.get("/inbox").json()
+        assert inbox["depth"] == 1
+        assert inbox["items"][0]["task_id"] == second_task["id"]
 
     def test_tasks_send_allows_priority_interrupt_while_working(
         self, client, mock_controller
@@ -1082,14 +1348,44 @@ class TestSSEStreaming:
 
     @pytest.fixture
     def mock_controller(self):
-        """Create mock controller."""
+        """Create mock controller backed by a real output broadcaster."""
         controller = MagicMock()
         controller.status = "BUSY"
         controller.get_context.return_value = ""
         controller.write = MagicMock()
         controller.interrupt = MagicMock()
+        broadcaster = OutputBroadcaster()
+
+        def subscribe_output(after=None):
+            subscription = broadcaster.subscribe(after)
+            snapshot = None if subscription.resumed else controller.get_context()
+            return snapshot, subscription
+
+        controller.output_broadcaster = broadcaster
+        controller.subscribe_output.side_effect = subscribe_output
         return controller
 
+    @staticmethod
+    def _events(response) -> list[tuple[str | None, dict]]:
+        """Collect (id, payload) pairs from an SSE response."""
+        events = []
+        event_id = None
+        for line in response.iter_lines():
+            if line.startswith("id: "):
+                event_id = line[4:]
+            elif line.startswith("data: "):
+                events.append((event_id, json.loads(line[6:])))
+                event_id = None
+        return events
+
+    def _working_task(self, client) -> str:
+        payload = {
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Test"}]}
+        }
+        task_id = client.post("/tasks/send", json=payload).json()["task"]["id"]
+        task_store.update_status(task_id, "working")
+        return task_id
+
     @pytest.fixture
     def client(self, mock_controller):
         """Create test client with mock controller."""
@@ -1127,6 +1423,45 @@ class TestSSEStreaming:
                 response.headers["content-type"] == "text/event-stream; charset=utf-8"
             )
 
+    def test_subscribe_streams_output_deltas(self, client, mock_controller):
+        """Published output is streamed with sequence IDs until done."""
+        mock_controller.get_context.return_value = "earlier"
+        task_id = self._working_task(client)
+        broadcaster = mock_controller.output_broadcaster
+
+        def produce():
+            broadcaster.publish("one")
+            broadcaster.publish("two")
+            task_store.update_status(task_id, "completed")
+
+        timer = threading.Timer(0.2, produce)
+        timer.start()
+        with client.stream("GET", f"/tasks/{task_id}/subscribe") as response:
+            events = self._events(response)
+        timer.join()
+
+        outputs = [(eid, e["data"]) for eid, e in events if e["type"] == "output"]
+        assert outputs == [("0", "earlier"), ("1", "one"), ("2", "two")]
+        assert events[0][1]["snapshot"] is True
+        assert events[-1][1]["type"] == "done"
+
+    def test_subscribe_resumes_from_last_event_id(self, client, mock_controller):
+        """Reconnecting with Last-Event-ID replays only missed output."""
+        mock_controller.get_context.return_value = "snapshot"
+        task_id = self._working_task(client)
+        broadcaster = mock_controller.output_broadcaster
+        for text in ("seen", "missed-1", "missed-2"):
+            broadcaster.publish(text)
+        task_store.update_status(task_id, "completed")
+
+        with client.stream(
+            "GET", f"/tasks/{task_id}/subscribe", headers={"Last-Event-ID": "1"}
+        ) as response:
+            events = self._events(response)
+
+        outputs = [e["data"] for _, e in events if e["type"] == "output"]
+        assert outputs == ["missed-1", "missed-2"]
+
     def test_subscribe_returns_404_for_nonexistent_task(self, client, mock_controller):  # noqa: ARG002
         """Subscribe should return 404 for nonexistent task."""
         response = client.get("/tasks/nonexistent-id/subscribe")
@@ -1140,6 +1475,67 @@ class TestSSEStreaming:
         assert data["capabilities"]["streaming"] is True
 
 
+class TestTaskWaitEndpoint:
+    """Test the GET /tasks/{id}/wait long-poll endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with a controller that stays busy."""
+        from fastapi import FastAPI
+
+        controller = MagicMock()
+        controller.status = "PROCESSING"
+        controller.get_context.return_value = ""
+        app = FastAPI()
+        app.include_router(create_a2a_router(controller, "test", 8000, "\n"))
+        return TestClient(app)
+
+    def _working_task(self) -> str:
+        task = task_store.create(Message(parts=[TextPart(text="Test")]))
+        task_store.update_status(task.id, "working")
+        return task.id
+
+    def test_wait_returns_when_task_completes(self, client):
+        """The request should return as soon as the task completes."""
+        task_id = self._working_task()
+        timer = threading.Timer(0.2, task_store.update_status, (task_id, "completed"))
+        timer.start()
+
+        start = time.monotonic()
+        response = client.get(f"/tasks/{task_id}/wait", params={"timeout": 10})
+        timer.join()
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        assert time.monotonic() - start < 5
+
+    def test_wait_returns_current_task_on_timeout(self, client):
+        """A task that does not change is returned after the timeout."""
+        task_id = self._working_task()
+
+        response = client.get(f"/tasks/{task_id}/wait", params={"timeout": 0.1})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "working"
+
+    def test_wait_with_status_returns_on_any_change(self, client):
+        """With ?status=, any transition away from it ends the wait."""
+        task_id = self._working_task()
+        task_store.update_status(task_id, "input_required")
+
+        response = client.get(
+            f"/tasks/{task_id}/wait", params={"timeout": 5, "status": "working"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "input_required"
+
+    def test_wait_returns_404_for_unknown_task(self, client):
+        """Unknown tasks should 404 like GET /tasks/{id}."""
+        response = client.get("/tasks/nonexistent-id/wait", params={"timeout": 1})
+        assert response.status_code == 404
+
+
 # ============================================================
 # Reply Stack Tests
 # ============================================================
@@ -15,6 +15,7 @@ from synapse.a2a_compat import (
     _send_response_to_sender,
     create_a2a_router,
 )
+from synapse.webhooks import WebhookDispatcher, WebhookRegistry
 
 
 class TestHistorySaving:
@@ -245,37 +246,26 @@ class TestExtendedRouterEndpoints:
 
 
 class TestDispatchTaskEvent:
-    """Tests for _dispatch_task_event event-loop handling."""
+    """Tests for _dispatch_task_event hand-off to the webhook dispatcher."""
 
-    def test_dispatch_task_event_with_running_loop_schedules_task(self):
-        """Should schedule dispatch_event on the current running loop."""
-        mock_loop = MagicMock()
-        mock_loop.create_task.side_effect = lambda coro: coro.close()
-
-        with (
-            patch("synapse.a2a_compat.get_webhook_registry", return_value=MagicMock()),
-            patch("synapse.a2a_compat.dispatch_event", new_callable=AsyncMock),
-            patch(
-                "synapse.a2a_compat.asyncio.get_running_loop", return_value=mock_loop
-            ),
-        ):
+    def test_dispatch_task_event_submits_to_dispatcher(self):
+        """Should queue the event on the global dispatcher and return."""
+        with patch("synapse.a2a_compat.get_webhook_dispatcher") as mock_get:
             _dispatch_task_event("task.completed", {"task_id": "t-1"})
 
-        mock_loop.create_task.assert_called_once()
-
-    def test_dispatch_task_event_without_running_loop_does_not_raise(self):
-        """Should fallback safely when called from threads without event loop."""
-        mock_thread = MagicMock()
+        mock_get.return_value.submit.assert_called_once_with(
+            "task.completed", {"task_id": "t-1"}
+        )
 
+    def test_dispatch_task_event_without_webhooks_starts_no_thread(self):
+        """Without subscribers, no worker thread or loop is started."""
         with (
-            patch("synapse.a2a_compat.get_webhook_registry", return_value=MagicMock()),
-            patch("synapse.a2a_compat.dispatch_event", new_callable=AsyncMock),
             patch(
-                "synapse.a2a_compat.asyncio.get_running_loop",
-                side_effect=RuntimeError("no running event loop"),
+                "synapse.a2a_compat.get_webhook_dispatcher",
+                return_value=WebhookDispatcher(registry=WebhookRegistry()),
             ),
-            patch("synapse.a2a_compat.threading.Thread", return_value=mock_thread),
+            patch("synapse.webhooks.threading.Thread") as mock_thread,
         ):
             _dispatch_task_event("task.completed", {"task_id": "t-2"})
 
-        mock_thread.start.assert_called_once()
+        mock_thread.assert_not_called()
@@ -1,5 +1,6 @@
 """Tests for agent naming and role functionality (v0.3.11)."""
 
+import os
 import shutil
 from pathlib import Path
 from unittest.mock import patch
@@ -306,13 +307,13 @@ def test_role_with_unicode(registry):
 
 
 def test_resolve_agent_with_live_check(registry):
-    """resolve_agent should use get_live_agents for process check."""
+    """resolve_agent should check the matched agent's process."""
     agent_id = "synapse-claude-8100"
     registry.register(agent_id, "claude", 8100, name="my-claude")
 
-    # Mock get_live_agents to return the agent
-    with patch.object(registry, "get_live_agents") as mock_live:
-        mock_live.return_value = {agent_id: registry.get_agent(agent_id)}
+    with patch(
+        "synapse.registry.is_process_running", return_value=True
+    ) as mock_running:
         info = registry.resolve_agent("my-claude")
         assert info is not None
-        mock_live.assert_called_once()
+        mock_running.assert_called_once_with(os.getpid())
@@ -923,6 +923,23 @@ class TestCmdHistoryStats:
         assert "Success Rate:    80.0%" in captured.out
         assert "claude" in captured.out
 
+    def test_history_stats_rebuild(self, mock_args, capsys):
+        """--rebuild should recompute rollups before reading statistics."""
+        mock_args.agent = None
+        mock_args.rebuild = True
+
+        with patch("synapse.history.HistoryManager") as mock_hm_class:
+            mock_hm = MagicMock()
+            mock_hm.enabled = True
+            mock_hm.rebuild_statistics.return_value = True
+            mock_hm.get_statistics.return_value = {"total_tasks": 0}
+            mock_hm_class.from_env.return_value = mock_hm
+
+            cmd_history_stats(mock_args)
+
+        mock_hm.rebuild_statistics.assert_called_once_with()
+        assert "Rebuilt statistics rollups" in capsys.readouterr().out
+
 
 class TestCmdHistoryExport:
     """Tests for cmd_history_export command."""
@@ -957,7 +974,9 @@ class TestCmdHistoryExport:
         with patch("synapse.history.HistoryManager") as mock_hm_class:
             mock_hm = MagicMock()
             mock_hm.enabled = True
-            mock_hm.export_observations.return_value = '{"data": []}'
+            mock_hm.write_export.side_effect = lambda out, **kwargs: (
+                out.write('{"data": []}') and 0
+            )
             mock_hm_class.from_env.return_value = mock_hm
 
             cmd_history_export(mock_args)
@@ -976,7 +995,9 @@ class TestCmdHistoryExport:
         with patch("synapse.history.HistoryManager") as mock_hm_class:
             mock_hm = MagicMock()
             mock_hm.enabled = True
-            mock_hm.export_observations.return_value = '{"data": []}'
+            mock_hm.write_export.side_effect = lambda out, **kwargs: (
+                out.write('{"data": []}') and 0
+            )
             mock_hm_class.from_env.return_value = mock_hm
 
             cmd_history_export(mock_args)
@@ -984,6 +1005,40 @@ class TestCmdHistoryExport:
         assert output_file.exists()
         assert output_file.read_text() == '{"data": []}'
 
+    def test_history_export_streams_gzip_jsonl(self, mock_args, temp_synapse_dir):
+        """A .gz output path should stream a compressed JSON Lines export."""
+        import gzip
+        import json
+
+        from synapse.history import HistoryManager
+
+        manager = HistoryManager(db_path=str(temp_synapse_dir / "history.db"))
+        for i, status in enumerate(["completed", "failed", "completed"]):
+            manager.save_observation(
+                task_id=f"task-{i}",
+                agent_name="claude",
+                session_id="session-1",
+                input_text=f"Input {i}",
+                output_text=f"Output {i}",
+                status=status,
+            )
+
+        output_file = temp_synapse_dir / "export.jsonl.gz"
+        mock_args.format = "jsonl"
+        mock_args.agent = "claude"
+        mock_args.status = "completed"
+        mock_args.limit = None
+        mock_args.output = str(output_file)
+
+        with patch(
+            "synapse.commands.history._get_history_manager", return_value=manager
+        ):
+            cmd_history_export(mock_args)
+
+        with gzip.open(output_file, "rt") as f:
+            rows = [json.loads(line) for line in f]
+        assert [row["task_id"] for row in rows] == ["task-2", "task-0"]
+
 
 # ==============================================================================
 # Tests for external agent commands
@@ -1,4 +1,6 @@
 import argparse
+import sqlite3
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -215,14 +217,39 @@ class TestCliHistoryCommands:
         mock_args.format = "json"
         mock_hm_inst = mock_get_hm.return_value
         mock_hm_inst.enabled = True
-        mock_hm_inst.export_observations.return_value = "[]"
+        mock_hm_inst.write_export.return_value = 0
 
         cmd_history_export(mock_args)
 
-        mock_hm_inst.export_observations.assert_called_once_with(
-            format="json", agent_name=None, limit=50
+        mock_hm_inst.write_export.assert_called_once_with(
+            sys.stdout,
+            format="json",
+            agent_name=None,
+            limit=50,
+            status=None,
+            since=None,
+            until=None,
+        )
+
+    @patch("synapse.commands.history._get_history_manager")
+    @patch("builtins.print")
+    def test_cmd_history_export_exits_nonzero_on_db_error(
+        self, mock_print, mock_get_hm, mock_args
+    ):
+        """A history read error fails the export instead of exiting 0."""
+        mock_args.format = "jsonl"
+        mock_hm_inst = mock_get_hm.return_value
+        mock_hm_inst.enabled = True
+        mock_hm_inst.write_export.side_effect = sqlite3.OperationalError(
+            "database disk image is malformed"
         )
 
+        with pytest.raises(SystemExit) as exc_info:
+            cmd_history_export(mock_args)
+
+        assert exc_info.value.code == 1
+        assert "malformed" in str(mock_print.call_args)
+
     @patch("synapse.commands.history._get_history_manager")
     @patch("builtins.open", new_callable=MagicMock)
     @patch("builtins.print")
@@ -233,11 +260,15 @@ class TestCliHistoryCommands:
         mock_args.output = "test.json"
         mock_hm_inst = mock_get_hm.return_value
         mock_hm_inst.enabled = True
-        mock_hm_inst.export_observations.return_value = '{"data": "test"}'
+        mock_hm_inst.write_export.side_effect = lambda out, **kwargs: out.write(
+            '{"data": "test"}'
+        )
 
         cmd_history_export(mock_args)
 
-        mock_open.assert_called_once_with("test.json", "w")
+        mock_open.assert_called_once_with(
+            "test.json", "w", encoding="utf-8", newline=""
+        )
         mock_open.return_value.__enter__.return_value.write.assert_called_once_with(
             '{"data": "test"}'
         )
@@ -16,7 +16,9 @@ def registry():
     reg = AgentRegistry()
     reg.registry_dir = Path("/tmp/a2a_test_cli_registry")
     reg.registry_dir.mkdir(parents=True, exist_ok=True)
-    yield reg
+    # resolve_agent probes the matched PID; keep that out of os.kill counts
+    with patch("synapse.registry.is_process_running", return_value=True):
+        yield reg
     # Teardown: Cleanup temp directory
     shutil.rmtree(reg.registry_dir, ignore_errors=True)
 
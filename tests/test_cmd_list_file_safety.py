@@ -1,6 +1,5 @@
 "Tests for file safety integration in synapse list command."
 
-from collections.abc import Callable
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -9,40 +8,27 @@ import pytest
 from synapse.commands.list import ListCommand
 from synapse.registry import AgentRegistry
 
-# Type alias for mock_list_locks function signature
-MockListLocksType = Callable[..., list[dict[str, Any]]]
 
-
-def create_mock_list_locks(
+def create_locks_by_holder(
     pid_locks: dict[int, list[dict[str, Any]]] | None = None,
     agent_locks: dict[str, list[dict[str, Any]]] | None = None,
-) -> MockListLocksType:
-    """Create a mock list_locks function with configurable return values.
+    stale: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build a locks_by_holder() return value.
 
     Args:
         pid_locks: Dict mapping PID to list of lock dicts.
-        agent_locks: Dict mapping agent_name to list of lock dicts.
+        agent_locks: Dict mapping agent ID to list of lock dicts.
+        stale: Locks held by dead processes.
 
     Returns:
-        A function that returns locks based on pid or agent_name lookup.
+        Dict shaped like FileSafetyManager.locks_by_holder().
     """
-    pid_locks = pid_locks or {}
-    agent_locks = agent_locks or {}
-
-    def mock_list_locks(
-        agent_name: str | None = None,
-        *,
-        pid: int | None = None,
-        agent_type: str | None = None,
-        include_stale: bool = True,
-    ) -> list[dict[str, Any]]:
-        if pid is not None and pid in pid_locks:
-            return pid_locks[pid]
-        if agent_name is not None and agent_name in agent_locks:
-            return agent_locks[agent_name]
-        return []
-
-    return mock_list_locks
+    return {
+        "by_pid": pid_locks or {},
+        "by_agent": agent_locks or {},
+        "stale": stale or [],
+    }
 
 
 @pytest.fixture
@@ -107,8 +93,7 @@ def test_get_agent_data_file_safety_enabled_no_locks(
     with patch("synapse.commands.list.FileSafetyManager") as MockFSM:
         fsm_instance = MockFSM.from_env.return_value
         fsm_instance.enabled = True
-        fsm_instance.list_locks.return_value = []
-        fsm_instance.get_stale_locks.return_value = []
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder()
 
         agents, stale_locks, show_file_safety = list_command._get_agent_data(
             mock_registry
@@ -126,8 +111,7 @@ def test_get_agent_data_file_safety_shows_locked_file(
     with patch("synapse.commands.list.FileSafetyManager") as MockFSM:
         fsm_instance = MockFSM.from_env.return_value
         fsm_instance.enabled = True
-        fsm_instance.get_stale_locks.return_value = []
-        fsm_instance.list_locks.side_effect = create_mock_list_locks(
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder(
             pid_locks={12345: [{"file_path": "/path/to/important_file.py"}]}
         )
 
@@ -147,8 +131,7 @@ def test_get_agent_data_file_safety_falls_back_to_agent_id(
     with patch("synapse.commands.list.FileSafetyManager") as MockFSM:
         fsm_instance = MockFSM.from_env.return_value
         fsm_instance.enabled = True
-        fsm_instance.get_stale_locks.return_value = []
-        fsm_instance.list_locks.side_effect = create_mock_list_locks(
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder(
             pid_locks={12345: []},
             agent_locks={
                 "synapse-claude-8100": [{"file_path": "/path/to/fallback_file.py"}]
@@ -169,8 +152,7 @@ def test_get_agent_data_shows_only_one_locked_file(
     with patch("synapse.commands.list.FileSafetyManager") as MockFSM:
         fsm_instance = MockFSM.from_env.return_value
         fsm_instance.enabled = True
-        fsm_instance.get_stale_locks.return_value = []
-        fsm_instance.list_locks.side_effect = create_mock_list_locks(
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder(
             pid_locks={
                 12345: [
                     {"file_path": "/path/to/file1.py"},
@@ -206,10 +188,31 @@ def test_non_tty_header_uses_editing_file_label(
     ):
         fsm_instance = MockFSM.from_env.return_value
         fsm_instance.enabled = True
-        fsm_instance.list_locks.return_value = []
-        fsm_instance.get_stale_locks.return_value = []
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder()
 
         list_cmd.run(args)
 
     captured = capsys.readouterr()
     assert "EDITING_FILE" in captured.out
+
+
+def test_get_agent_data_queries_locks_once(
+    list_command: ListCommand, mock_registry: MagicMock
+) -> None:
+    """All agents' locks and the stale locks come from one grouped query."""
+    stale = [{"file_path": "/path/to/orphan.py", "pid": 999}]
+    with patch("synapse.commands.list.FileSafetyManager") as MockFSM:
+        fsm_instance = MockFSM.from_env.return_value
+        fsm_instance.enabled = True
+        fsm_instance.locks_by_holder.return_value = create_locks_by_holder(
+            pid_locks={12346: [{"file_path": "/path/to/gemini.py"}]}, stale=stale
+        )
+
+        agents, stale_locks, _ = list_command._get_agent_data(mock_registry)
+
+        fsm_instance.locks_by_holder.assert_called_once_with()
+        fsm_instance.list_locks.assert_not_called()
+        fsm_instance.get_stale_locks.assert_not_called()
+        assert stale_locks == stale
+        gemini_agent = next(a for a in agents if a["agent_type"] == "gemini")
+        assert gemini_agent["editing_file"] == "gemini.py"
@@ -426,8 +426,10 @@ class TestRegistryRaceConditions:
         assert final_status in ["READY", "BUSY"]
         assert len(results) == 2
 
-    def test_watch_reads_partial_update(self, temp_registry):
+    def test_watch_reads_partial_update(self, temp_registry, monkeypatch):
         """Watch mode can read stale data while update is in progress."""
+        # The updater writes the file directly, so rescan on every read.
+        monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
         agent_id = "watch-race-agent"
         temp_registry.register(agent_id, "claude", 8100, status="PROCESSING")
 
@@ -519,8 +521,10 @@ class TestPartialJSONRead:
         # Valid agent data should be accessible
         assert agents[agent_id_1]["status"] == "READY"
 
-    def test_watch_reads_partial_json_write(self, temp_registry):
+    def test_watch_reads_partial_json_write(self, temp_registry, monkeypatch):
         """Watch mode can read partially written JSON (demonstrates race)."""
+        # The writer bypasses AgentRegistry, so rescan on every read.
+        monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
         agent_id = "partial-json-agent"
         temp_registry.register(agent_id, "claude", 8100, status="PROCESSING")
 
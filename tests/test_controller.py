@@ -2222,7 +2222,7 @@ class TestControllerOutputBuffer:
     def test_get_context_returns_decoded_buffer(self):
         """get_context should return render buffer content."""
         ctrl = TerminalController(command="echo test", idle_regex=r"\$")
-        ctrl._render_buffer = list("Hello World")
+        ctrl._append_output(b"Hello World")
 
         context = ctrl.get_context()
         assert context == "Hello World"
@@ -2230,7 +2230,7 @@ class TestControllerOutputBuffer:
     def test_get_context_handles_unicode(self):
         """get_context should handle unicode properly."""
         ctrl = TerminalController(command="echo test", idle_regex=r"\$")
-        ctrl._render_buffer = list("こんにちは")
+        ctrl._append_output("こんにちは".encode())
 
         context = ctrl.get_context()
         assert context == "こんにちは"
@@ -2238,11 +2238,55 @@ class TestControllerOutputBuffer:
     def test_get_context_returns_empty_for_empty_buffer(self):
         """get_context should return empty string for empty buffer."""
         ctrl = TerminalController(command="echo test", idle_regex=r"\$")
-        ctrl._render_buffer = []
-
         context = ctrl.get_context()
         assert context == ""
 
+    def test_append_output_publishes_stripped_deltas(self):
+        """Each appended chunk should reach stream subscribers ANSI-stripped."""
+        ctrl = TerminalController(command="echo test", idle_regex=r"\$")
+        snapshot, subscription = ctrl.subscribe_output()
+        assert snapshot == ""
+
+        ctrl._append_output(b"\x1b[32mgreen\x1b[0m one\n")
+        ctrl._append_output(b"two\n")
+
+        deltas = subscription.drain()
+        assert [d.seq for d in deltas] == [1, 2]
+        assert [d.text for d in deltas] == ["green one\n", "two\n"]
+
+    def test_append_output_publishes_rendered_deltas(self):
+        """Carriage-return overwrites and control bytes are rendered away."""
+        ctrl = TerminalController(command="echo test", idle_regex=r"\$")
+        _, subscription = ctrl.subscribe_output()
+
+        ctrl._append_output(b"\x1b[2K 10%\r 90%\r\ndone\x07 x\by\n")
+
+        assert [d.text for d in subscription.drain()] == [" 90%\ndone y\n"]
+
+    def test_append_output_holds_back_split_escape_sequence(self):
+        """An escape sequence split across reads should be stripped whole."""
+        ctrl = TerminalController(command="echo test", idle_regex=r"\$")
+        _, subscription = ctrl.subscribe_output()
+
+        ctrl._append_output(b"red \x1b[3")
+        ctrl._append_output(b"1mtext")
+
+        assert "".join(d.text for d in subscription.drain()) == "red text"
+
+    def test_subscribe_output_snapshot_and_resume(self):
+        """New subscribers get a snapshot; resumers get only missed deltas."""
+        ctrl = TerminalController(command="echo test", idle_regex=r"\$")
+        ctrl._append_output(b"before\n")
+        snapshot, subscription = ctrl.subscribe_output()
+        assert snapshot == "before\n"
+        assert subscription.start_sequence == 1
+        subscription.close()
+
+        ctrl._append_output(b"missed\n")
+        snapshot, resumed = ctrl.subscribe_output(after=1)
+        assert snapshot is None
+        assert [d.text for d in resumed.drain()] == ["missed\n"]
+
 
 class TestControllerInterrupt:
     """Tests for controller interrupt functionality."""
@@ -1,5 +1,6 @@
 """Tests for TerminalController PTY management and interactive mode."""
 
+import contextlib
 import signal
 import threading
 import time
@@ -57,8 +58,14 @@ class TestControllerPTY:
 
     @pytest.fixture
     def mock_select(self):
-        with patch("synapse.controller.select") as mock:
-            mock.select.return_value = ([10], [], [])
+        with patch("synapse.controller.selectors") as mock:
+            mock.DefaultSelector.return_value.__enter__.return_value = (
+                mock.DefaultSelector.return_value
+            )
+            # Readable when waited on; each read drains it (select(0) is empty)
+            mock.DefaultSelector.return_value.select.side_effect = lambda timeout: (
+                [(MagicMock(fd=10), 1)] if timeout else []
+            )
             yield mock
 
     @pytest.fixture
@@ -100,9 +107,12 @@ class TestControllerPTY:
         controller.running = False
         controller.thread.join(timeout=1.0)
 
-        # Verify select called
-        mock_select.select.assert_called()
-        # Verify read called
+        # Verify the selector waited on the PTY
+        mock_select.DefaultSelector.return_value.register.assert_called_once_with(
+            10, mock_select.EVENT_READ
+        )
+        mock_select.DefaultSelector.return_value.select.assert_called()
+        # Verify read called with the initial adaptive read size
         mock_os.read.assert_called_with(10, 1024)
         # Verify output buffer updated
         assert b"output" in controller.output_buffer
@@ -239,3 +249,87 @@ class TestInteractiveCallbacks:
 
             controller.running = False
             t.join()
+
+
+class TestDrainPty:
+    """Tests for batched, adaptive PTY reads in background mode."""
+
+    @pytest.fixture
+    def pipe(self):
+        import os
+
+        r, w = os.pipe()
+        yield r, w
+        for fd in (r, w):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def _drain(self, controller, fd, read_size=1024):
+        import selectors
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            return controller._drain_pty(fd, selector, read_size)
+
+    def test_drains_burst_in_one_batch_with_growing_reads(self, pipe):
+        import os
+
+        r, w = pipe
+        payload = b"x" * 50_000
+        os.write(w, payload)
+        controller = TerminalController(command="bash")
+
+        with patch("synapse.controller.os.read", wraps=os.read) as spy:
+            data, next_size, eof = self._drain(controller, r)
+
+        assert data == payload
+        assert eof is False
+        sizes = [call.args[1] for call in spy.call_args_list]
+        assert sizes[:4] == [1024, 2048, 4096, 8192]
+        assert max(sizes) <= 65536
+        # Last read came back short, so the next batch starts small again.
+        assert next_size == 1024
+
+    def test_keeps_draining_past_short_pty_reads(self, pipe):
+        import os
+
+        r, w = pipe
+        payload = b"y" * 50_000
+        os.write(w, payload)
+        controller = TerminalController(command="bash")
+        real_read = os.read
+
+        def pty_read(fd, size):
+            # Linux PTYs hand out at most 4095 bytes per read
+            return real_read(fd, min(size, 4095))
+
+        with patch("synapse.controller.os.read", side_effect=pty_read) as spy:
+            data, next_size, eof = self._drain(controller, r)
+
+        assert data == payload
+        assert eof is False
+        sizes = [call.args[1] for call in spy.call_args_list]
+        assert max(sizes) == 65536
+        assert next_size == 1024
+
+    def test_reports_eof_with_pending_data(self, pipe):
+        import os
+
+        r, w = pipe
+        os.write(w, b"a" * 1024 + b"tail")
+        os.close(w)
+        controller = TerminalController(command="bash")
+
+        data, _, eof = self._drain(controller, r)
+        assert data == b"a" * 1024 + b"tail"
+
+        data, _, eof = self._drain(controller, r)
+        assert data == b""
+        assert eof is True
+
+    def test_process_output_evaluates_idle_once_per_batch(self):
+        controller = TerminalController(command="bash")
+        with patch.object(controller, "_check_idle_state") as check:
+            controller._process_output(b"chunk-1" * 1000)
+        check.assert_called_once_with(b"chunk-1" * 1000)
+        assert controller.output_buffer.endswith(b"chunk-1")
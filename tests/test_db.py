@@ -0,0 +1,159 @@
+"""Tests for the shared SQLite access layer (synapse.db)."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from synapse import db
+from synapse.db import SQLiteDatabase, open_connection
+
+
+@pytest.fixture
+def database(tmp_path):
+    """A SQLiteDatabase with one table, closed after the test."""
+    database = SQLiteDatabase(str(tmp_path / "test.db"), row_factory=sqlite3.Row)
+    with database.transaction() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield database
+    database.close()
+
+
+def _count(database: SQLiteDatabase) -> int:
+    with database.connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestOpenConnection:
+    def test_wal_and_settings(self, tmp_path):
+        conn = open_connection(
+            str(tmp_path / "test.db"), foreign_keys=True, cache_size_kb=4096
+        )
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4096
+        finally:
+            conn.close()
+
+
+class TestSQLiteDatabase:
+    def test_connection_is_reused_per_thread(self, database):
+        conn = database.connection()
+        assert database.connection() is conn
+        assert conn.row_factory is sqlite3.Row
+
+        other: list[sqlite3.Connection] = []
+        thread = threading.Thread(target=lambda: other.append(database.connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        database.close()
+        assert database._connections == {}
+
+    def test_dead_thread_connections_are_closed(self, database):
+        database.close()
+        opened: list[sqlite3.Connection] = []
+        thread = threading.Thread(target=lambda: opened.append(database.connection()))
+        thread.start()
+        thread.join()
+        assert thread.ident in database._connections
+
+        database.connection()  # opening a new connection prunes the old one
+        assert thread.ident not in database._connections
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    def test_release_rolls_back_and_resets_row_factory(self, database):
+        conn = database.connection()
+        conn.row_factory = None
+        conn.execute("INSERT INTO items (name) VALUES ('left open')")
+        database.release(conn)
+
+        assert not conn.in_transaction
+        assert conn.row_factory is sqlite3.Row
+        assert _count(database) == 0
+
+    def test_transaction_commits(self, database):
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+        assert _count(database) == 1
+
+    def test_transaction_rolls_back_on_error(self, database):
+        with pytest.raises(RuntimeError), database.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            raise RuntimeError("boom")
+        assert _count(database) == 0
+
+    def test_nested_transaction_joins_outer(self, database):
+        with pytest.raises(RuntimeError), database.transaction() as outer:
+            with database.transaction() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO items (name) VALUES ('a')")
+            assert outer.in_transaction
+            raise RuntimeError("boom")
+        assert _count(database) == 0
+
+    def test_release_inside_transaction_keeps_it_open(self, database):
+        with pytest.raises(RuntimeError), database.transaction() as outer:
+            outer.execute("INSERT INTO items (name) VALUES ('a')")
+            with database.connect() as conn:
+                conn.row_factory = None
+                conn.execute("INSERT INTO items (name) VALUES ('b')")
+            database.release(database.connection())
+            assert outer.in_transaction
+            assert outer.row_factory is None
+            assert outer.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+            raise RuntimeError("boom")
+        assert _count(database) == 0
+
+        with database.transaction() as outer, database.connect() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('c')")
+        assert _count(database) == 1
+        assert database.connection().row_factory is sqlite3.Row
+
+    def test_immediate_transaction_takes_write_lock(self, database, tmp_path):
+        other = sqlite3.connect(str(tmp_path / "test.db"), timeout=0)
+        try:
+            with database.transaction(immediate=True):
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+        finally:
+            other.close()
+
+
+class TestQueryTiming:
+    @pytest.fixture(autouse=True)
+    def _timing(self):
+        db.reset_query_stats()
+        db.enable_query_timing()
+        yield
+        db.enable_query_timing(False)
+        db.reset_query_stats()
+
+    def test_records_statements(self, tmp_path):
+        database = SQLiteDatabase(str(tmp_path / "timed.db"))
+        try:
+            with database.transaction() as conn:
+                conn.execute("CREATE TABLE t (x INTEGER)")
+                conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+            for _ in range(3):
+                database.connection().execute("SELECT   x\n FROM t").fetchall()
+        finally:
+            database.close()
+
+        stats = db.query_stats()
+        assert stats["SELECT x FROM t"].calls == 3
+        assert stats["INSERT INTO t VALUES (?)"].calls == 1
+        assert stats["SELECT x FROM t"].max_ms >= 0
+
+    def test_disabled_records_nothing(self, tmp_path):
+        db.enable_query_timing(False)
+        conn = open_connection(str(tmp_path / "plain.db"))
+        try:
+            conn.execute("SELECT 1")
+        finally:
+            conn.close()
+        assert db.query_stats() == {}
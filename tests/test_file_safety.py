@@ -3,6 +3,7 @@ import os
 import sqlite3
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -391,6 +392,388 @@ class TestFileSafetyManager:
         manager2 = FileSafetyManager(db_path=temp_db_path, retention_days=30)
         assert manager2.get_statistics()["total_modifications"] == 0
 
+    def test_connection_is_reused_per_thread_in_wal_mode(self, manager):
+        """Each thread keeps one WAL connection across calls."""
+        import threading
+
+        manager.check_lock("/tmp/a.py")
+        conn = manager._get_connection()
+        manager.list_locks()
+        manager.get_file_history("/tmp/a.py")
+        assert manager._get_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert not conn.in_transaction
+
+        other: list[object] = []
+        thread = threading.Thread(
+            target=lambda: other.append(manager._get_connection())
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        manager.close()
+        assert manager._db._connections == {}
+
+    def test_acquire_locks_all_or_nothing(self, manager):
+        """acquire_locks should lock every path or none of them."""
+        manager.acquire_lock("/tmp/b.py", "gemini")
+
+        result = manager.acquire_locks(["/tmp/a.py", "/tmp/b.py"], "claude")
+
+        assert result["status"] == LockStatus.ALREADY_LOCKED
+        assert result["conflicts"]["/tmp/b.py"]["lock_holder"] == "gemini"
+        assert manager.check_lock("/tmp/a.py") is None
+
+        manager.release_lock("/tmp/b.py", "gemini")
+        manager.acquire_lock("/tmp/a.py", "claude")
+        result = manager.acquire_locks(
+            ["/tmp/a.py", "/tmp/b.py", "/tmp/a.py"], "claude", intent="Refactor"
+        )
+
+        assert result["status"] == LockStatus.ACQUIRED
+        assert result["locks"] == {
+            "/tmp/a.py": LockStatus.RENEWED,
+            "/tmp/b.py": LockStatus.ACQUIRED,
+        }
+        locks = {lock["file_path"]: lock for lock in manager.list_locks()}
+        assert set(locks) == {"/tmp/a.py", "/tmp/b.py"}
+        assert all(lock["intent"] == "Refactor" for lock in locks.values())
+
+    def test_acquire_locks_delegate_mode_denied(self, manager):
+        """acquire_locks should deny locks in delegate mode."""
+        result = manager.acquire_locks(["/tmp/a.py"], "claude", delegate_mode=True)
+
+        assert result["status"] == LockStatus.FAILED
+        assert manager.list_locks() == []
+
+    def test_release_locks_only_releases_own(self, manager):
+        """release_locks should skip paths held by other agents."""
+        manager.acquire_locks(["/tmp/a.py", "/tmp/b.py"], "claude")
+        manager.acquire_lock("/tmp/c.py", "gemini")
+
+        released = manager.release_locks(
+            ["/tmp/a.py", "/tmp/b.py", "/tmp/c.py", "/tmp/missing.py"], "claude"
+        )
+
+        assert released == 2
+        assert [lock["file_path"] for lock in manager.list_locks()] == ["/tmp/c.py"]
+
+    def test_locks_by_holder_groups_and_separates_stale(self, manager):
+        """locks_by_holder should group live locks and list stale ones."""
+        manager.acquire_lock("/tmp/a.py", agent_id="synapse-claude-8100")
+        manager.acquire_lock("/tmp/b.py", agent_id="synapse-gemini-8110", pid=999999999)
+
+        grouped = manager.locks_by_holder()
+
+        own = [lock["file_path"] for lock in grouped["by_pid"][os.getpid()]]
+        assert own == ["/tmp/a.py"]
+        assert [
+            lock["file_path"] for lock in grouped["by_agent"]["synapse-claude-8100"]
+        ] == ["/tmp/a.py"]
+        assert "synapse-gemini-8110" not in grouped["by_agent"]
+        assert [lock["file_path"] for lock in grouped["stale"]] == ["/tmp/b.py"]
+
+    def test_check_lock_served_from_cache_until_table_changes(self, manager):
+        """Repeat check_lock calls should not re-read file_locks."""
+        manager.acquire_lock("/tmp/a.py", "claude")
+        assert manager.check_lock("/tmp/a.py")["agent_name"] == "claude"
+        cache = manager._lock_cache
+
+        assert manager.check_lock("/tmp/b.py") is None
+        assert manager._lock_cache is cache
+
+        # A write from another connection (another process) is picked up
+        conn = sqlite3.connect(manager.db_path)
+        conn.execute(
+            "INSERT INTO file_locks (file_path, agent_name, expires_at) "
+            "VALUES ('/tmp/b.py', 'gemini', '9999-12-31T00:00:00+00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        assert manager.check_lock("/tmp/b.py")["agent_name"] == "gemini"
+        assert manager.is_locked_by_other("/tmp/b.py", "claude")
+        manager.release_lock("/tmp/a.py", "claude")
+        assert manager.check_lock("/tmp/a.py") is None
+
+    def test_check_lock_writes_stale_cleanup_through(self, manager):
+        """A dead holder found on a cache hit is deleted from SQLite."""
+        manager.acquire_lock("/tmp/a.py", "gemini", pid=999999999)
+
+        assert manager.check_lock("/tmp/a.py", cleanup_stale=False) is not None
+        assert manager.check_lock("/tmp/a.py") is None
+        assert manager.list_locks() == []
+
+    def test_acquire_lock_takes_over_dead_holder_only(self, manager):
+        """acquire_lock should not sweep unrelated stale locks inline."""
+        manager.acquire_lock("/tmp/a.py", "gemini", pid=999999999)
+        manager.acquire_lock("/tmp/b.py", "gemini", pid=999999999)
+
+        result = manager.acquire_lock("/tmp/a.py", "claude")
+
+        assert result["status"] == LockStatus.ACQUIRED
+        assert [lock["file_path"] for lock in manager.get_stale_locks()] == [
+            "/tmp/b.py"
+        ]
+
+    def test_sweeper_removes_stale_locks(self, manager, monkeypatch):
+        """The background sweep should delete dead-process locks on its timer."""
+        import time
+
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_SWEEP_INTERVAL", 0.01)
+        manager.acquire_lock("/tmp/a.py", "gemini", pid=999999999)
+        manager.check_lock("/tmp/b.py")
+
+        deadline = time.monotonic() + 5
+        while manager.list_locks() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert manager.list_locks() == []
+        sweeper = manager._sweeper
+        manager.close()
+        sweeper.join(timeout=5)
+        assert not sweeper.is_alive()
+
+    def test_journal_history_includes_pending_records(self, temp_db_path, monkeypatch):
+        """Journaled records are visible to history/context before the flush."""
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_DELAY", 60)
+        manager = FileSafetyManager(db_path=temp_db_path, journal=True)
+        manager.record_modification("/tmp/a.py", "claude", "t1", ChangeType.CREATE)
+        result = manager.record_modification(
+            "/tmp/a.py",
+            "claude",
+            "t1",
+            ChangeType.MODIFY,
+            intent="Rename",
+            metadata={"lines": 3},
+        )
+        manager.record_modification("/tmp/b.py", "claude", "t1", ChangeType.MODIFY)
+
+        assert result is None
+        history = manager.get_file_history("/tmp/a.py")
+        assert [h["change_type"] for h in history] == ["MODIFY", "CREATE"]
+        assert history[0]["id"] is None
+        assert history[0]["metadata"] == {"lines": 3}
+        assert "Rename" in manager.get_file_context("/tmp/a.py")
+
+        conn = sqlite3.connect(temp_db_path)
+        count = conn.execute("SELECT COUNT(*) FROM file_modifications").fetchone()[0]
+        conn.close()
+        assert count == 0
+
+        manager.flush()
+        assert manager._pending == []
+        history = manager.get_file_history("/tmp/a.py")
+        assert [h["change_type"] for h in history] == ["MODIFY", "CREATE"]
+        assert all(h["id"] is not None for h in history)
+        manager.close()
+
+    def test_journal_flushed_by_task_reads_and_release(self, temp_db_path, monkeypatch):
+        """Task reads and lock release make queued records durable."""
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_DELAY", 60)
+        manager = FileSafetyManager(db_path=temp_db_path, journal=True)
+        manager.acquire_lock("/tmp/a.py", "claude")
+        manager.record_modification("/tmp/a.py", "claude", "t1", ChangeType.MODIFY)
+        assert len(manager.get_modifications_by_task("t1")) == 1
+
+        manager.record_modification("/tmp/a.py", "claude", "t1", ChangeType.MODIFY)
+        manager.release_lock("/tmp/a.py", "claude")
+        assert manager._pending == []
+        assert manager.get_statistics()["total_modifications"] == 2
+        manager.close()
+
+    def test_journal_background_writer_batches(self, temp_db_path, monkeypatch):
+        """The writer commits a full queue without an explicit flush."""
+        import time
+
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_DELAY", 60)
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_MAX_PENDING", 10)
+        manager = FileSafetyManager(db_path=temp_db_path, journal=True)
+        for i in range(10):
+            manager.record_modification(f"/tmp/{i}.py", "claude", "t1", "MODIFY")
+
+        deadline = time.monotonic() + 5
+        while manager._flusher is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        conn = sqlite3.connect(temp_db_path)
+        count = conn.execute("SELECT COUNT(*) FROM file_modifications").fetchone()[0]
+        conn.close()
+        assert count == 10
+
+    def test_journal_keeps_batch_until_commit(self, temp_db_path, monkeypatch):
+        """A failed journal commit keeps the batch queued for the retry."""
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_DELAY", 60)
+        manager = FileSafetyManager(db_path=temp_db_path, journal=True)
+        manager.record_modification("/tmp/a.py", "claude", "t1", ChangeType.MODIFY)
+        real_get_connection = manager._get_connection
+        failing = MagicMock(side_effect=sqlite3.OperationalError("database is locked"))
+        monkeypatch.setattr(manager, "_get_connection", failing)
+
+        manager.flush()
+
+        assert len(manager._pending) == 1
+        assert manager._flush_failures == 1
+        assert manager._retry_at > 0
+
+        monkeypatch.setattr(manager, "_get_connection", real_get_connection)
+        assert len(manager.get_file_history("/tmp/a.py")) == 1
+        manager.flush()
+
+        assert manager._pending == []
+        assert manager._flush_failures == 0
+        assert manager.get_statistics()["total_modifications"] == 1
+        manager.close()
+
+    def test_journal_drops_batch_after_max_retries(
+        self, temp_db_path, monkeypatch, caplog
+    ):
+        """A batch that never commits is dropped and logged, not kept forever."""
+        import synapse.file_safety as file_safety
+
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_DELAY", 60)
+        monkeypatch.setattr(file_safety, "FILE_SAFETY_JOURNAL_MAX_RETRIES", 2)
+        manager = FileSafetyManager(db_path=temp_db_path, journal=True)
+        manager.record_modification("/tmp/a.py", "claude", "t1", ChangeType.MODIFY)
+        failing = MagicMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+        monkeypatch.setattr(manager, "_get_connection", failing)
+
+        manager.flush()
+        manager.flush()
+        assert len(manager._pending) == 1
+        with caplog.at_level("ERROR", logger="synapse.file_safety"):
+            manager.flush()
+
+        assert manager._pending == []
+        assert manager._flush_failures == 0
+        assert "Dropping 1 journaled modifications" in caplog.text
+        assert "/tmp/a.py" in caplog.text
+
+    @staticmethod
+    def _insert_modifications(db_path, rows):
+        """Insert (file_path, agent_name, change_type, days_ago) rows directly."""
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO file_modifications (task_id, agent_name, file_path, "
+            "change_type, timestamp) VALUES ('t1', ?, ?, ?, ?)",
+            [
+                (agent, path, change, (now - timedelta(days=days)).isoformat())
+                for path, agent, change, days in rows
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _tables(db_path):
+        conn = sqlite3.connect(db_path)
+        names = {
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name GLOB 'file_modifications_*'"
+            )
+        }
+        conn.close()
+        return names
+
+    def test_finished_months_move_to_partitions(self, temp_db_path):
+        """Opening a database moves earlier months' records into partitions."""
+        from datetime import datetime, timedelta, timezone
+
+        FileSafetyManager(db_path=temp_db_path, retention_days=0)
+        self._insert_modifications(
+            temp_db_path,
+            [
+                ("/tmp/a.py", "claude", "CREATE", 75),
+                ("/tmp/a.py", "gemini", "MODIFY", 40),
+                ("/tmp/b.py", "claude", "MODIFY", 40),
+                ("/tmp/a.py", "claude", "MODIFY", 0),
+            ],
+        )
+
+        manager = FileSafetyManager(db_path=temp_db_path, retention_days=0)
+
+        now = datetime.now(timezone.utc)
+        expected = {
+            "file_modifications_" + (now - timedelta(days=days)).strftime("%Y_%m")
+            for days in (75, 40)
+        }
+        assert self._tables(temp_db_path) == expected
+        conn = sqlite3.connect(temp_db_path)
+        live = conn.execute("SELECT COUNT(*) FROM file_modifications").fetchone()[0]
+        total = conn.execute("SELECT COUNT(*) FROM file_modifications_all").fetchone()
+        conn.close()
+        assert live == 1
+        assert total[0] == 4
+
+        history = manager.get_file_history("/tmp/a.py")
+        assert [h["change_type"] for h in history] == ["MODIFY", "MODIFY", "CREATE"]
+        assert len(manager.get_recent_modifications(agent_name="claude")) == 3
+        assert len(manager.get_modifications_by_task("t1")) == 4
+
+        stats = manager.get_statistics()
+        assert stats["total_modifications"] == 4
+        assert stats["by_change_type"] == {"CREATE": 1, "MODIFY": 3}
+        assert stats["by_agent"] == {"claude": 3, "gemini": 1}
+        assert stats["most_modified_files"][0] == {"file_path": "/tmp/a.py", "count": 3}
+
+    def test_recent_modifications_skip_older_partitions(self, temp_db_path):
+        """A satisfied recent lookup does not read older partitions."""
+        FileSafetyManager(db_path=temp_db_path, retention_days=0)
+        self._insert_modifications(
+            temp_db_path,
+            [("/tmp/old.py", "claude", "MODIFY", 75)]
+            + [(f"/tmp/{i}.py", "claude", "MODIFY", 40) for i in range(3)],
+        )
+        manager = FileSafetyManager(db_path=temp_db_path, retention_days=0)
+        oldest = min(self._tables(temp_db_path))
+        statements: list[str] = []
+        manager._get_connection().set_trace_callback(statements.append)
+
+        recent = manager.get_recent_modifications(limit=2)
+
+        assert len(recent) == 2
+        assert "/tmp/old.py" not in [r["file_path"] for r in recent]
+        assert not any(oldest in sql for sql in statements)
+        assert len(manager.get_recent_modifications(limit=10)) == 4
+
+    def test_cleanup_drops_expired_partitions(self, temp_db_path):
+        """Retention drops whole partitions and trims the boundary month."""
+        FileSafetyManager(db_path=temp_db_path, retention_days=0)
+        self._insert_modifications(
+            temp_db_path,
+            [("/tmp/a.py", "claude", "MODIFY", days) for days in (200, 190, 100, 0)],
+        )
+        manager = FileSafetyManager(db_path=temp_db_path, retention_days=0)
+        partitions = sorted(self._tables(temp_db_path))
+
+        deleted = manager.cleanup_old_modifications(days=150)
+
+        assert deleted == 2
+        assert sorted(self._tables(temp_db_path)) == partitions[-1:]
+        stats = manager.get_statistics()
+        assert stats["total_modifications"] == 2
+        assert len(manager.get_modifications_by_task("t1")) == 2
+
+        assert manager.cleanup_old_modifications(days=1) == 1
+        assert self._tables(temp_db_path) == set()
+        assert manager.get_statistics()["by_agent"] == {"claude": 1}
+
 
 class TestFileSafetyFromEnv:
     """Test FileSafetyManager.from_env() method."""
@@ -576,7 +959,7 @@ class TestFileSafetyFromEnv:
         # Verify timestamps were migrated to ISO-8601
         conn = sqlite3.connect(temp_db_path)
         cursor = conn.cursor()
-        cursor.execute("SELECT timestamp FROM file_modifications ORDER BY id")
+        cursor.execute("SELECT timestamp FROM file_modifications_all ORDER BY id")
         rows = cursor.fetchall()
         conn.close()
 
@@ -646,7 +1029,7 @@ class TestFileSafetyFromEnv:
         # Verify timestamp remains unchanged
         conn = sqlite3.connect(temp_db_path)
         cursor = conn.cursor()
-        cursor.execute("SELECT timestamp FROM file_modifications")
+        cursor.execute("SELECT timestamp FROM file_modifications_all")
         row = cursor.fetchone()
         conn.close()
 
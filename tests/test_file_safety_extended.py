@@ -118,6 +118,8 @@ class TestFileSafetyExtended:
     def test_db_error_handling(self, mock_connect, manager, capsys, caplog):
         """Should handle database errors in various methods."""
         mock_connect.side_effect = sqlite3.Error("Simulated DB Error")
+        # Drop the cached connection so the next call has to reconnect
+        manager.close()
 
         # Test acquire_lock error
         res = manager.acquire_lock("f", "a")
@@ -180,6 +182,7 @@ class TestFileSafetyExtended:
     ):
         """acquire_lock should emit event marker when DB error occurs."""
         mock_connect.side_effect = sqlite3.Error("Simulated DB Error")
+        manager.close()
 
         manager.acquire_lock("f", "a")
 
@@ -1,5 +1,7 @@
 """Tests for gRPC server module."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +11,7 @@ from synapse.grpc_server import (
     check_grpc_available,
     create_grpc_server,
 )
+from synapse.output_broadcast import OutputBroadcaster
 
 
 class TestCheckGrpcAvailable:
@@ -181,10 +184,19 @@ class TestSubscribe:
 
     @pytest.fixture
     def mock_controller(self):
-        """Create mock controller with changing state."""
+        """Create mock controller backed by a real output broadcaster."""
         controller = MagicMock()
         controller.status = "BUSY"
         controller.get_context.return_value = "Output"
+        broadcaster = OutputBroadcaster()
+
+        def subscribe_output(after=None):
+            subscription = broadcaster.subscribe(after)
+            snapshot = None if subscription.resumed else controller.get_context()
+            return snapshot, subscription
+
+        controller.output_broadcaster = broadcaster
+        controller.subscribe_output.side_effect = subscribe_output
         return controller
 
     def test_subscribe_task_not_found(self, mock_controller):
@@ -199,7 +211,7 @@ class TestSubscribe:
             list(servicer.subscribe("nonexistent-id"))
 
     def test_subscribe_yields_events(self, mock_controller):
-        """Test subscribe yields output events."""
+        """Test subscribe yields snapshot, output deltas and done."""
         servicer = GrpcServicer(
             controller=mock_controller,
             agent_type="claude",
@@ -209,22 +221,52 @@ class TestSubscribe:
         task = servicer._create_task("Test")
         servicer._update_task_status(task["id"], "working")
 
-        # Simulate output growing then task completing
-        outputs = ["Hello", "Hello World"]
-        call_count = [0]
+        def produce():
+            mock_controller.output_broadcaster.publish("Hello")
+            mock_controller.output_broadcaster.publish(" World")
+            servicer._update_task_status(task["id"], "completed")
+
+        timer = threading.Timer(0.1, produce)
+        timer.start()
+        events = list(servicer.subscribe(task["id"]))
+        timer.join()
+
+        outputs = [
+            (e["sequence"], e["data"]) for e in events if e["event_type"] == "output"
+        ]
+        assert outputs == [(0, "Output"), (1, "Hello"), (2, " World")]
+        assert events[-1]["event_type"] == "done"
+        assert servicer._streams == {}
+
+    def test_subscribe_resumes_from_sequence(self, mock_controller):
+        """from_sequence replays only output published after it."""
+        servicer = GrpcServicer(
+            controller=mock_controller,
+            agent_type="claude",
+            port=8100,
+        )
+        task = servicer._create_task("Test")
+        for text in ("a", "b", "c"):
+            mock_controller.output_broadcaster.publish(text)
+        servicer._update_task_status(task["id"], "completed")
+
+        events = list(servicer.subscribe(task["id"], from_sequence=1))
 
-        def side_effect():
-            idx = min(call_count[0], len(outputs) - 1)
-            call_count[0] += 1
-            if call_count[0] > 2:
-                servicer._update_task_status(task["id"], "completed")
-            return outputs[idx]
+        outputs = [e["data"] for e in events if e["event_type"] == "output"]
+        assert outputs == ["b", "c"]
 
-        mock_controller.get_context.side_effect = side_effect
+    def test_subscribe_without_controller_wakes_on_status_change(self):
+        """Without a controller, status changes still end the stream promptly."""
+        servicer = GrpcServicer(controller=None, agent_type="claude", port=8100)
+        task = servicer._create_task("Test")
+        timer = threading.Timer(
+            0.1, servicer._update_task_status, (task["id"], "completed")
+        )
+        timer.start()
 
+        start = time.monotonic()
         events = list(servicer.subscribe(task["id"]))
+        timer.join()
 
-        # Should have output and done events
-        event_types = [e["event_type"] for e in events]
-        assert "output" in event_types
-        assert "done" in event_types
+        assert [e["event_type"] for e in events] == ["status", "done"]
+        assert time.monotonic() - start < 0.9
@@ -29,6 +29,7 @@ except ImportError:
     sys.modules["synapse.proto.a2a_pb2_grpc"] = pb2_grpc
 
 from synapse.grpc_server import GrpcServicer, serve_grpc
+from synapse.output_broadcast import OutputBroadcaster
 
 
 class TestGrpcServiceMethods:
@@ -133,18 +134,24 @@ class TestGrpcServiceMethods:
 
         assert response["status"] == "canceled"
 
-    def test_Subscribe(self, servicer):
+    def test_Subscribe(self, servicer, mock_controller):
         """Test Subscribe gRPC method."""
+        mock_controller.subscribe_output.return_value = (
+            None,
+            OutputBroadcaster().subscribe(),
+        )
         task = servicer.send_message("test")
         servicer._update_task_status(task["id"], "completed")
 
         request = MagicMock()
         request.task_id = task["id"]
+        request.from_sequence = 7
 
         events = list(servicer.Subscribe(request, MagicMock()))
 
         assert len(events) > 0
         assert events[-1]["event_type"] == "done"
+        mock_controller.subscribe_output.assert_called_once_with(7)
 
     def test_SendPriorityMessage(self, servicer, mock_controller):
         """Test SendPriorityMessage gRPC method."""
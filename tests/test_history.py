@@ -4,6 +4,7 @@ import os
 import sqlite3
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -305,6 +306,136 @@ class TestHistoryManager:
         observations = history_manager.list_observations()
         assert len(observations) == 10
 
+    def test_connection_is_reused_per_thread_in_wal_mode(self, history_manager):
+        """Each thread keeps one WAL connection across calls."""
+        import threading
+
+        history_manager.list_observations()
+        conn = history_manager._db.connection()
+        history_manager.get_observation("missing")
+        assert history_manager._db.connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        other: list[object] = []
+        thread = threading.Thread(
+            target=lambda: other.append(history_manager._db.connection())
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        history_manager.close()
+        assert history_manager._db._connections == {}
+
+    def test_write_behind_group_commits_and_reads_flush(
+        self, temp_db_path, monkeypatch
+    ):
+        """Queued saves are invisible to other connections until flushed."""
+        monkeypatch.setattr("synapse.history.HISTORY_WRITE_BEHIND_DELAY", 60.0)
+        manager = HistoryManager(db_path=temp_db_path, write_behind=True)
+        for i in range(3):
+            manager.save_observation(
+                task_id=f"task-{i}",
+                agent_name="claude",
+                session_id="session-1",
+                input_text=f"Input {i}",
+                output_text=f"Output {i}",
+                status="completed",
+            )
+        manager.save_observation(
+            task_id="task-0",
+            agent_name="claude",
+            session_id="session-1",
+            input_text="Duplicate",
+            output_text="Duplicate",
+            status="failed",
+        )
+
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == 0
+
+        # Reads through the manager see its own queued writes.
+        assert len(manager.list_observations()) == 3
+        assert manager.get_observation("task-0")["status"] == "completed"
+
+        manager.save_observation(
+            task_id="task-3",
+            agent_name="claude",
+            session_id="session-1",
+            input_text="Input 3",
+            output_text="Output 3",
+            status="completed",
+        )
+        manager.close()
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == 4
+
+    def test_write_behind_keeps_batch_until_commit(self, temp_db_path, monkeypatch):
+        """A failed group commit keeps the saves queued for the next flush."""
+        monkeypatch.setattr("synapse.history.HISTORY_WRITE_BEHIND_DELAY", 60.0)
+        manager = HistoryManager(db_path=temp_db_path, write_behind=True)
+        manager.save_observation(
+            task_id="task-1",
+            agent_name="claude",
+            session_id="session-1",
+            input_text="Input",
+            output_text="Output",
+            status="completed",
+        )
+
+        with patch.object(
+            manager, "_connection", side_effect=sqlite3.OperationalError("locked")
+        ):
+            manager.flush()
+        assert len(manager._pending) == 1
+        assert manager._retry_at > 0
+
+        manager.flush()
+        assert manager._pending == []
+        assert manager._flush_failures == 0
+        assert manager.get_observation("task-1")["status"] == "completed"
+
+    def test_write_behind_drops_batch_after_max_retries(
+        self, temp_db_path, monkeypatch, caplog
+    ):
+        """Saves are dropped, and logged, once the retry budget is spent."""
+        monkeypatch.setattr("synapse.history.HISTORY_WRITE_BEHIND_DELAY", 60.0)
+        monkeypatch.setattr("synapse.history.HISTORY_WRITE_BEHIND_MAX_RETRIES", 2)
+        manager = HistoryManager(db_path=temp_db_path, write_behind=True)
+        manager.save_observation(
+            task_id="task-lost",
+            agent_name="claude",
+            session_id="session-1",
+            input_text="Input",
+            output_text="Output",
+            status="completed",
+        )
+
+        with patch.object(
+            manager, "_connection", side_effect=sqlite3.OperationalError("locked")
+        ):
+            for _ in range(3):
+                manager.flush()
+
+        assert manager._pending == []
+        assert "Dropping 1 queued history observations" in caplog.text
+        assert "task-lost" in caplog.text
+
+    def test_write_behind_update_applies_after_queued_save(self, temp_db_path):
+        """An update right after a queued save must find the row."""
+        manager = HistoryManager(db_path=temp_db_path, write_behind=True)
+        manager.save_observation(
+            task_id="task-1",
+            agent_name="claude",
+            session_id="session-1",
+            input_text="Input",
+            output_text="",
+            status="working",
+        )
+
+        assert manager.update_observation_status("task-1", "completed", "Done")
+        assert manager.get_observation("task-1")["output"] == "Done"
+
 
 # ============================================================
 # Integration Tests with A2A Components
@@ -596,6 +727,139 @@ class TestHistorySearch:
         assert len(results) >= 1
         assert any("Error" in obs["output"] for obs in results)
 
+    def test_search_matches_substrings(self, populated_history):
+        """Keywords match anywhere in a word, as the LIKE scan did."""
+        for keyword in ("fact", "ctorial"):
+            results = populated_history.search_observations(keywords=[keyword])
+            assert [obs["task_id"] for obs in results] == ["task-python-1"]
+            assert results[0]["relevance"] > 0
+
+    def test_search_matches_cjk_and_inner_substrings(self, temp_db_path):
+        """Japanese text and substrings inside words are found."""
+        manager = HistoryManager(db_path=temp_db_path)
+        manager.save_observation(
+            task_id="ja",
+            agent_name="claude",
+            session_id="s",
+            input_text="ユーザー認証を実装してください",
+            output_text="done",
+            status="completed",
+        )
+        manager.save_observation(
+            task_id="en",
+            agent_name="claude",
+            session_id="s",
+            input_text="Add OAuth login",
+            output_text="done",
+            status="completed",
+        )
+
+        for keyword in ("認証", "ユーザー認証"):
+            results = manager.search_observations(keywords=[keyword])
+            assert [obs["task_id"] for obs in results] == ["ja"]
+        results = manager.search_observations(keywords=["auth"])
+        assert [obs["task_id"] for obs in results] == ["en"]
+
+    def test_search_ranks_by_relevance(self, temp_db_path):
+        """Results are ordered by BM25 relevance, not recency."""
+        manager = HistoryManager(db_path=temp_db_path)
+        manager.save_observation(
+            task_id="strong",
+            agent_name="claude",
+            session_id="s",
+            input_text="deadlock deadlock deadlock in scheduler",
+            output_text="fixed the deadlock",
+            status="completed",
+        )
+        manager.save_observation(
+            task_id="weak",
+            agent_name="claude",
+            session_id="s",
+            input_text="refactor scheduler config loading and document options",
+            output_text="mentions a deadlock once",
+            status="completed",
+        )
+
+        results = manager.search_observations(keywords=["deadlock"])
+
+        assert [obs["task_id"] for obs in results] == ["strong", "weak"]
+        assert results[0]["relevance"] > results[1]["relevance"] > 0
+
+    def test_punctuation_keywords_fall_back_to_scan(self, populated_history):
+        """Keywords without word characters still match as substrings."""
+        results = populated_history.search_observations(keywords=["'"])
+        assert [obs["task_id"] for obs in results] == ["task-error-1"]
+        assert "relevance" not in results[0]
+
+    def test_index_tracks_updates_and_deletes(self, populated_history):
+        """Triggers keep the full-text index in sync with observations."""
+        populated_history.update_observation_status(
+            "task-cancel-1", "completed", output_text="Resumed and finished"
+        )
+        assert populated_history.search_observations(keywords=["canceled by"]) == []
+        assert [
+            obs["task_id"]
+            for obs in populated_history.search_observations(keywords=["Resumed"])
+        ] == ["task-cancel-1"]
+
+        with sqlite3.connect(populated_history.db_path) as conn:
+            conn.execute("DELETE FROM observations WHERE task_id = 'task-docker-1'")
+        assert populated_history.search_observations(keywords=["Docker"]) == []
+
+    def test_existing_database_is_backfilled(self, temp_db_path):
+        """Databases created before the index existed are indexed on open."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            """CREATE TABLE observations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL, agent_name TEXT NOT NULL,
+                task_id TEXT NOT NULL UNIQUE, input TEXT NOT NULL,
+                output TEXT NOT NULL, status TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, metadata TEXT
+            )"""
+        )
+        conn.execute(
+            "INSERT INTO observations (session_id, agent_name, task_id, input, "
+            "output, status) VALUES ('s', 'claude', 'legacy', 'Rotate TLS certs', "
+            "'done', 'completed')"
+        )
+        conn.commit()
+        conn.close()
+
+        manager = HistoryManager(db_path=temp_db_path)
+        results = manager.search_observations(keywords=["TLS"])
+
+        assert [obs["task_id"] for obs in results] == ["legacy"]
+        assert results[0]["relevance"] > 0
+
+    def test_word_tokenized_index_is_rebuilt(self, temp_db_path):
+        """An index built with the old unicode61 tokenizer is replaced."""
+        HistoryManager(db_path=temp_db_path).save_observation(
+            task_id="t",
+            agent_name="claude",
+            session_id="s",
+            input_text="refresh the oauth token",
+            output_text="done",
+            status="completed",
+        )
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute("DROP TABLE observations_fts")
+        conn.execute(
+            "CREATE VIRTUAL TABLE observations_fts USING fts5(input, output, "
+            "content='observations', content_rowid='id', tokenize='unicode61')"
+        )
+        conn.execute(
+            "INSERT INTO observations_fts(observations_fts) VALUES ('rebuild')"
+        )
+        conn.commit()
+        conn.close()
+
+        manager = HistoryManager(db_path=temp_db_path)
+        results = manager.search_observations(keywords=["auth"])
+
+        assert [obs["task_id"] for obs in results] == ["t"]
+        assert results[0]["relevance"] > 0
+
 
 # ============================================================
 # Phase 2c: Retention Policy Tests
@@ -827,6 +1091,86 @@ class TestHistoryStatistics:
         stats = manager.get_statistics()
         assert stats == {}
 
+    def test_rollups_track_updates_and_deletes(self, populated_history_with_stats):
+        """Rollups follow status updates, token metadata and deletions."""
+        manager = populated_history_with_stats
+        manager.update_observation_status(
+            "task-3",
+            "completed",
+            metadata_update={"tokens": {"input_tokens": 10, "output_tokens": 4}},
+        )
+        with sqlite3.connect(manager.db_path) as conn:
+            conn.execute("DELETE FROM observations WHERE agent_name = 'codex'")
+
+        stats = manager.get_statistics()
+        assert (stats["total_tasks"], stats["completed"], stats["failed"]) == (7, 6, 1)
+        assert stats["canceled"] == 0
+        assert "codex" not in stats["by_agent"]
+        assert stats["by_agent"]["claude"] == {
+            "total": 3,
+            "completed": 3,
+            "failed": 0,
+            "canceled": 0,
+        }
+        tokens = manager.get_token_statistics()
+        assert tokens["total_input_tokens"] == 10
+        assert list(tokens["by_agent"]) == ["claude"]
+
+        with sqlite3.connect(manager.db_path) as conn:
+            rows = conn.execute(
+                "SELECT agent_name, day, status, task_count FROM observation_rollups "
+                "ORDER BY 1, 3"
+            ).fetchall()
+        assert manager.rebuild_statistics()
+        with sqlite3.connect(manager.db_path) as conn:
+            rebuilt = conn.execute(
+                "SELECT agent_name, day, status, task_count FROM observation_rollups "
+                "ORDER BY 1, 3"
+            ).fetchall()
+        assert rows == rebuilt
+
+    def test_rollups_count_metadata_without_tokens(self, temp_db_path):
+        """Metadata lacking a tokens key must still be counted in the rollups."""
+        manager = HistoryManager(db_path=temp_db_path)
+        manager.save_observation(
+            task_id="no-tokens",
+            agent_name="claude",
+            session_id="s",
+            input_text="Input",
+            output_text="Output",
+            status="completed",
+            metadata={"sender_id": "synapse-gemini-8110"},
+        )
+
+        assert manager.get_statistics()["completed"] == 1
+        with sqlite3.connect(manager.db_path) as conn:
+            assert conn.execute(
+                "SELECT task_count, token_tasks FROM observation_rollups"
+            ).fetchall() == [(1, 0)]
+
+    def test_existing_database_rollups_are_backfilled(self, temp_db_path):
+        """Databases created before rollups existed are summarized on open."""
+        manager = HistoryManager(db_path=temp_db_path)
+        manager.save_observation(
+            task_id="legacy",
+            agent_name="claude",
+            session_id="s",
+            input_text="Input",
+            output_text="Output",
+            status="completed",
+            metadata={"tokens": {"input_tokens": 7, "cost_usd": 0.5}},
+        )
+        manager.close()
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("DROP TABLE observation_rollups")
+
+        reopened = HistoryManager(db_path=temp_db_path)
+
+        assert reopened.get_statistics()["completed"] == 1
+        assert reopened.get_token_statistics()["by_agent"] == {
+            "claude": {"input_tokens": 7, "output_tokens": 0, "cost_usd": 0.5}
+        }
+
 
 # ============================================================
 # Phase 2b: Export Tests
@@ -1041,3 +1385,110 @@ class TestHistoryExport:
         assert len(parsed) == 1
         assert "quotes" in parsed[0]["input"]
         assert "newlines" in parsed[0]["input"]
+
+    def test_export_jsonl_streams_one_object_per_line(
+        self, populated_history_for_export
+    ):
+        """JSON Lines export should write one observation per line."""
+        import io
+        import json
+
+        out = io.StringIO()
+        count = populated_history_for_export.write_export(out, format="jsonl")
+
+        lines = out.getvalue().splitlines()
+        assert count == 3
+        assert len(lines) == 3
+        assert [json.loads(line)["task_id"] for line in lines] == [
+            "task-3",
+            "task-2",
+            "task-1",
+        ]
+
+    def test_write_export_json_matches_export_observations(
+        self, populated_history_for_export
+    ):
+        """Streamed JSON should be identical to the buffered export."""
+        import io
+
+        out = io.StringIO()
+        populated_history_for_export.write_export(out, format="json")
+
+        assert out.getvalue() == populated_history_for_export.export_observations(
+            format="json"
+        )
+
+    def test_write_export_propagates_db_errors(self, populated_history_for_export):
+        """Read errors reach the caller instead of ending the export early."""
+        import io
+
+        with (
+            patch.object(
+                populated_history_for_export,
+                "iter_observations",
+                side_effect=sqlite3.OperationalError("disk I/O error"),
+            ),
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            populated_history_for_export.write_export(io.StringIO(), format="jsonl")
+
+    def test_write_export_rejects_unknown_format(self, populated_history_for_export):
+        """Unknown formats should raise before anything is written."""
+        import io
+
+        out = io.StringIO()
+        with pytest.raises(ValueError):
+            populated_history_for_export.write_export(out, format="xml")
+        assert out.getvalue() == ""
+
+    def test_iter_observations_filters_in_sql(self, temp_db_path):
+        """Status and time-range filters should narrow the exported rows."""
+        import sqlite3
+
+        manager = HistoryManager(db_path=temp_db_path)
+        for i, (status, timestamp) in enumerate(
+            [
+                ("completed", "2026-01-05 10:00:00"),
+                ("failed", "2026-02-05 10:00:00"),
+                ("completed", "2026-03-05 10:00:00"),
+            ]
+        ):
+            manager.save_observation(
+                task_id=f"task-{i}",
+                agent_name="claude",
+                session_id="session-1",
+                input_text="Input",
+                output_text="Output",
+                status=status,
+            )
+            with sqlite3.connect(temp_db_path) as conn:
+                conn.execute(
+                    "UPDATE observations SET timestamp = ? WHERE task_id = ?",
+                    (timestamp, f"task-{i}"),
+                )
+
+        ids = [
+            obs["task_id"]
+            for obs in manager.iter_observations(since="2026-02-01", until="2026-04")
+        ]
+        assert ids == ["task-2", "task-1"]
+        ids = [obs["task_id"] for obs in manager.iter_observations(status="completed")]
+        assert ids == ["task-2", "task-0"]
+
+    def test_iter_observations_reads_in_chunks(self, temp_db_path):
+        """Chunked reads should yield every row exactly once, in order."""
+        manager = HistoryManager(db_path=temp_db_path)
+        for i in range(7):
+            manager.save_observation(
+                task_id=f"task-{i}",
+                agent_name="claude",
+                session_id="session-1",
+                input_text="Input",
+                output_text="Output",
+                status="completed",
+            )
+
+        rows = list(manager.iter_observations(chunk_size=2))
+        assert len(rows) == 7
+        assert len({row["task_id"] for row in rows}) == 7
+        assert len(list(manager.iter_observations(limit=5, chunk_size=2))) == 5
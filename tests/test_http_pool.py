@@ -0,0 +1,166 @@
+"""Tests for process-wide pooled HTTP clients (synapse.http_pool)."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import logging
+import socketserver
+import tempfile
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import httpx
+import pytest
+
+from synapse import http_pool
+from synapse.a2a_client import A2AClient
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):  # type: ignore[no-untyped-def]
+        request = super().get_request()
+        type(self).connections += 1
+        return request
+
+
+class _TaskHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps({"task": {"id": "task-1", "status": "working"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def uds_server() -> Iterator[tuple[str, type[_UnixHTTPServer]]]:
+    # AF_UNIX paths are length-limited; pytest's tmp_path can be too long.
+    with tempfile.TemporaryDirectory(prefix="synapse-pool-") as tmp:
+        path = str(Path(tmp) / "agent.sock")
+        server_cls = type("_Server", (_UnixHTTPServer,), {"connections": 0})
+        server = server_cls(path, _TaskHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield path, server_cls
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_get_client_is_shared_per_uds_path():
+    client_a = http_pool.get_client("/tmp/a.sock")
+    assert http_pool.get_client("/tmp/a.sock") is client_a
+    assert http_pool.get_client("/tmp/b.sock") is not client_a
+    assert http_pool.get_client() is not client_a
+
+
+def test_get_session_is_shared():
+    assert http_pool.get_session() is http_pool.get_session()
+
+
+def test_discard_client_replaces_pooled_client():
+    client = http_pool.get_client("/tmp/a.sock")
+    http_pool.discard_client("/tmp/a.sock")
+    assert client.is_closed
+    assert http_pool.get_client("/tmp/a.sock") is not client
+
+
+def test_close_clients_resets_pool():
+    client = http_pool.get_client("/tmp/a.sock")
+    session = http_pool.get_session()
+    http_pool.close_clients()
+    assert client.is_closed
+    assert http_pool.get_session() is not session
+
+
+def test_async_clients_are_pooled_per_event_loop():
+    async def grab() -> tuple[object, object]:
+        first = http_pool.get_async_client()
+        second = http_pool.get_async_client()
+        await http_pool.aclose_async_clients()
+        return first, second
+
+    first, second = asyncio.run(grab())
+    assert first is second
+    other, _ = asyncio.run(grab())
+    assert other is not first
+
+
+def test_close_clients_closes_async_clients_on_their_loops():
+    """Async clients are closed on a loop running in another thread and on
+    an idle loop alike."""
+    running = asyncio.new_event_loop()
+    thread = threading.Thread(target=running.run_forever, daemon=True)
+    thread.start()
+    idle = asyncio.new_event_loop()
+
+    async def grab() -> httpx.AsyncClient:
+        return http_pool.get_async_client()
+
+    try:
+        on_running = asyncio.run_coroutine_threadsafe(grab(), running).result(5)
+        on_idle = idle.run_until_complete(grab())
+
+        http_pool.close_clients()
+
+        assert on_idle.is_closed
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), running).result(5)
+        assert on_running.is_closed
+        assert not http_pool._async_clients
+    finally:
+        running.call_soon_threadsafe(running.stop)
+        thread.join(timeout=5)
+        running.close()
+        idle.close()
+
+
+def test_async_clients_left_open_on_a_finished_loop_are_reported(caplog):
+    async def grab() -> httpx.AsyncClient:
+        return http_pool.get_async_client()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(grab())
+    loop.close()
+    with caplog.at_level(logging.WARNING, logger="synapse.http_pool"):
+        http_pool.close_clients()
+        assert "Dropping 1 pooled async HTTP client(s)" in caplog.text
+
+        caplog.clear()
+        asyncio.run(grab())
+        gc.collect()
+        assert "Dropping 1 pooled async HTTP client(s)" in caplog.text
+
+
+def test_send_to_local_reuses_uds_connection(uds_server):
+    """Sequential sends to the same agent share one keep-alive connection."""
+    path, server_cls = uds_server
+    client = A2AClient()
+
+    for _ in range(5):
+        task = client.send_to_local(
+            endpoint="http://localhost:9",
+            message="hello",
+            uds_path=path,
+            local_only=True,
+            response_mode="silent",
+        )
+        assert task is not None
+        assert task.id == "task-1"
+
+    assert server_cls.connections == 1
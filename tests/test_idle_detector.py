@@ -329,6 +329,72 @@ def test_waiting_detection_renderer_path_survives_garbled_raw_tail():
     assert refreshed > waiting_pattern_time
 
 
+def test_waiting_detection_renderer_path_matches_only_changed_rows():
+    """Only rows redrawn by the new chunk (plus context) are matched, so
+    a stale prompt far away on the screen does not start WAITING."""
+    renderer = PtyRenderer(columns=80, rows=24)
+    renderer.feed(b"Proceed?")
+    renderer.pop_changed_text()
+    detector = IdleDetector(
+        waiting_detection={
+            "regex": r"Proceed\?",
+            "require_idle": False,
+            "heuristic_fallback": False,
+        },
+        renderer=renderer,
+    )
+
+    is_waiting, refreshed, _, _ = detector.check_waiting_state(
+        new_data=b"\x1b[20;1Hbuilding...",
+        output_buffer=b"building...",
+        last_output_time=time.time() - 1.0,
+        waiting_pattern_time=None,
+    )
+    assert is_waiting is False
+    assert refreshed is None
+
+    is_waiting, refreshed, _, _ = detector.check_waiting_state(
+        new_data=b"\x1b[19;1HProceed?",
+        output_buffer=b"Proceed?",
+        last_output_time=time.time() - 1.0,
+        waiting_pattern_time=None,
+    )
+    assert is_waiting is True
+    assert refreshed is not None
+
+
+def test_waiting_detection_renderer_path_keeps_prompt_on_unchanged_rows():
+    """Once WAITING was detected, output elsewhere on the screen still
+    refreshes it while the prompt remains visible."""
+    renderer = PtyRenderer(columns=80, rows=24)
+    detector = IdleDetector(
+        waiting_detection={
+            "regex": r"Proceed\?",
+            "require_idle": False,
+            "waiting_expiry": 30,
+        },
+        renderer=renderer,
+    )
+    _, first, _, _ = detector.check_waiting_state(
+        new_data=b"Proceed?",
+        output_buffer=b"Proceed?",
+        last_output_time=time.time() - 1.0,
+        waiting_pattern_time=None,
+    )
+    assert first is not None
+
+    is_waiting, refreshed, _, source = detector.check_waiting_state(
+        new_data=b"\x1b[20;1Hspinner",
+        output_buffer=b"spinner",
+        last_output_time=time.time() - 1.0,
+        waiting_pattern_time=first,
+    )
+    assert is_waiting is True
+    assert refreshed is not None
+    assert refreshed >= first
+    assert source == "regex"
+
+
 def test_waiting_detection_without_renderer_uses_strip_ansi():
     """Backwards compatibility: when no renderer is injected the
     existing strip_ansi path must still work unchanged."""
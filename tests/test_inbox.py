@@ -0,0 +1,416 @@
+"""Tests for the per-agent inbox that queues messages for busy agents."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from synapse.a2a_compat import SendMessageRequest, create_a2a_router, task_store
+from synapse.inbox import AgentInbox
+from synapse.long_message import LongMessageStore
+from synapse.transport import PTYTransport, TransportMessage
+
+
+def _request(text: str) -> dict:
+    return {"message": {"role": "user", "parts": [{"type": "text", "text": text}]}}
+
+
+class TestAgentInbox:
+    def test_orders_by_priority_then_arrival(self):
+        inbox = AgentInbox("synapse-claude-8100")
+        inbox.push("a", 1, _request("a"))
+        inbox.push("b", 3, _request("b"))
+        inbox.push("c", 3, _request("c"))
+        inbox.push("d", 1, _request("d"))
+
+        assert [m.task_id for m in inbox.items()] == ["b", "c", "a", "d"]
+        assert [inbox.pop().task_id for _ in range(4)] == ["b", "c", "a", "d"]
+        assert inbox.pop() is None
+
+    def test_remove_skips_message(self):
+        inbox = AgentInbox("synapse-claude-8100")
+        inbox.push("a", 3, _request("a"))
+        inbox.push("b", 3, _request("b"))
+
+        assert inbox.remove("a").task_id == "a"
+        assert inbox.remove("a") is None
+        assert "a" not in inbox
+        assert inbox.pop().task_id == "b"
+
+    def test_push_refuses_beyond_max_depth(self):
+        inbox = AgentInbox("synapse-claude-8100", max_depth=1)
+        assert inbox.push("a", 3, _request("a")) is not None
+        assert inbox.push("b", 3, _request("b")) is None
+        assert len(inbox) == 1
+
+    def test_stats_report_depth_and_wait(self):
+        inbox = AgentInbox("synapse-claude-8100")
+        inbox.push("a", 3, _request("a"))
+        inbox.push("b", 3, _request("b"))
+        inbox.pop()
+
+        stats = inbox.stats()
+        assert stats["depth"] == 1
+        assert stats["delivered"] == 1
+        assert stats["oldest_wait_seconds"] >= 0
+        assert stats["persistent"] is False
+
+    def test_persisted_messages_survive_restart(self, tmp_path):
+        db_path = str(tmp_path / "inbox.db")
+        inbox = AgentInbox("synapse-claude-8100", db_path=db_path)
+        inbox.push("a", 1, _request("a"))
+        inbox.push("b", 3, _request("b"))
+        inbox.push("c", 1, _request("c"))
+        AgentInbox("synapse-codex-8120", db_path=db_path).push("x", 3, _request("x"))
+        assert inbox.pop().task_id == "b"
+        inbox.close()
+
+        restored = AgentInbox("synapse-claude-8100", db_path=db_path)
+        assert [m.task_id for m in restored.items()] == ["a", "c"]
+        assert restored.get("a").request == _request("a")
+        assert restored.stats()["persistent"] is True
+
+        restored.push("d", 1, _request("d"))
+        assert [m.task_id for m in restored.items()] == ["a", "c", "d"]
+        restored.close()
+
+
+class TestRouterInbox:
+    @pytest.fixture
+    def mock_controller(self):
+        controller = MagicMock()
+        controller.status = "PROCESSING"
+        controller.agent_ready = True
+        controller.get_context.return_value = "Sample output context"
+        return controller
+
+    @pytest.fixture
+    def inbox(self):
+        return AgentInbox("synapse-claude-8100")
+
+    @pytest.fixture
+    def client(self, mock_controller, inbox):
+        app = FastAPI()
+        app.include_router(
+            create_a2a_router(
+                mock_controller,
+                "claude",
+                8100,
+                "\n",
+                "synapse-claude-8100",
+                inbox=inbox,
+            )
+        )
+        # Keep one event loop for the whole test: queued messages start on it
+        with TestClient(app) as client:
+            yield client
+
+    @staticmethod
+    def _send(client: TestClient, text: str, priority: int = 3) -> dict:
+        response = client.post(
+            f"/tasks/send-priority?priority={priority}", json=_request(text)
+        )
+        assert response.status_code == 200
+        return response.json()["task"]
+
+    @staticmethod
+    def _become_ready(mock_controller: MagicMock) -> None:
+        mock_controller.status = "READY"
+        callback = mock_controller.on_status_change.call_args_list[0][0][0]
+        callback("PROCESSING", "READY")
+
+    @staticmethod
+    def _wait_for_status(task_id: str, status: str) -> None:
+        """Wait for the server loop to start a queued message."""
+        deadline = time.monotonic() + 2.0
+        while task_store.get(task_id).status != status:
+            assert time.monotonic() < deadline, f"task never became {status}"
+            time.sleep(0.01)
+
+    def test_busy_agent_queues_instead_of_409(self, client, inbox):
+        first = self._send(client, "first")
+        second = self._send(client, "second")
+
+        assert first["status"] == "working"
+        assert second["status"] == "submitted"
+        assert second["id"] in inbox
+
+    def test_ready_dispatches_highest_priority_next(
+        self, client, inbox, mock_controller
+    ):
+        first = self._send(client, "first")
+        low = self._send(client, "low", priority=1)
+        high = self._send(client, "high", priority=4)
+
+        self._become_ready(mock_controller)
+        self._wait_for_status(high["id"], "working")
+
+        assert task_store.get(first["id"]).status == "completed"
+        assert task_store.get(low["id"]).status == "submitted"
+        assert [m.task_id for m in inbox.items()] == [low["id"]]
+        assert inbox.stats()["delivered"] == 1
+
+        self._become_ready(mock_controller)
+        self._wait_for_status(low["id"], "working")
+        assert len(inbox) == 0
+
+    def test_interrupt_priority_is_not_queued(self, client, inbox, mock_controller):
+        self._send(client, "first")
+        urgent = self._send(client, "stop", priority=5)
+
+        assert urgent["status"] == "working"
+        assert len(inbox) == 0
+        mock_controller.interrupt.assert_called_once()
+
+    def test_list_and_cancel_queued_message(self, client, inbox, mock_controller):
+        self._send(client, "first")
+        queued = self._send(client, "queued message")
+
+        listing = client.get("/inbox").json()
+        assert listing["depth"] == 1
+        assert listing["items"][0]["task_id"] == queued["id"]
+        assert listing["items"][0]["preview"] == "queued message"
+
+        response = client.delete(f"/inbox/{queued['id']}")
+        assert response.status_code == 200
+        assert task_store.get(queued["id"]).status == "canceled"
+        assert len(inbox) == 0
+        mock_controller.interrupt.assert_not_called()
+
+        assert client.delete(f"/inbox/{queued['id']}").status_code == 404
+
+    def test_canceled_message_is_skipped_on_dispatch(
+        self, client, inbox, mock_controller
+    ):
+        self._send(client, "first")
+        canceled = self._send(client, "canceled")
+        kept = self._send(client, "kept")
+        assert client.post(f"/tasks/{canceled['id']}/cancel").status_code == 200
+
+        self._become_ready(mock_controller)
+        self._wait_for_status(kept["id"], "working")
+
+        assert task_store.get(canceled["id"]).status == "canceled"
+
+    def test_canceling_working_task_starts_next(self, client, inbox, mock_controller):
+        first = self._send(client, "first")
+        queued = self._send(client, "queued")
+
+        # The agent is idle after the interrupt and reports no READY change
+        assert client.post(f"/tasks/{first['id']}/cancel").status_code == 200
+
+        assert task_store.get(queued["id"]).status == "working"
+        assert len(inbox) == 0
+
+    def test_failed_delivery_starts_queued_messages(
+        self, client, inbox, mock_controller
+    ):
+        behind = task_store.create(SendMessageRequest(**_request("behind")).message)
+
+        def write(data: str, *args: object, **kwargs: object) -> bool:
+            if "doomed" in data:
+                # A message queued while this one was being delivered
+                inbox.push(behind.id, 3, _request("behind"))
+                return False
+            return True
+
+        mock_controller.write.side_effect = write
+
+        response = client.post("/tasks/send", json=_request("doomed"))
+
+        assert response.status_code == 500
+        assert task_store.get(behind.id).status == "working"
+        assert len(inbox) == 0
+
+    def test_ready_without_server_loop_leaves_queue(self, inbox, mock_controller):
+        create_a2a_router(
+            mock_controller,
+            "claude",
+            8100,
+            "\n",
+            "synapse-claude-8100",
+            inbox=inbox,
+        )
+        queued = task_store.create(SendMessageRequest(**_request("queued")).message)
+        inbox.push(queued.id, 3, _request("queued"))
+
+        self._become_ready(mock_controller)
+
+        assert task_store.get(queued.id).status == "submitted"
+        mock_controller.write.assert_not_called()
+
+    def test_full_inbox_answers_409(self, mock_controller):
+        app = FastAPI()
+        app.include_router(
+            create_a2a_router(
+                mock_controller,
+                "claude",
+                8100,
+                "\n",
+                "synapse-claude-8100",
+                inbox=AgentInbox("synapse-claude-8100", max_depth=1),
+            )
+        )
+        client = TestClient(app)
+        self._send(client, "first")
+        self._send(client, "queued")
+
+        response = client.post("/tasks/send", json=_request("overflow"))
+        assert response.status_code == 409
+        assert response.headers["Retry-After"] == "2"
+
+    def test_restart_restores_queued_tasks(self, tmp_path, mock_controller, client):
+        db_path = str(tmp_path / "inbox.db")
+        app = FastAPI()
+        app.include_router(
+            create_a2a_router(
+                mock_controller,
+                "claude",
+                8100,
+                "\n",
+                "synapse-claude-8100",
+                inbox=AgentInbox("synapse-claude-8100", db_path=db_path),
+            )
+        )
+        before = TestClient(app)
+        self._send(before, "first")
+        queued = self._send(before, "survives restart")
+
+        with task_store._lock:
+            task_store._tasks.clear()
+        restarted = MagicMock()
+        restarted.agent_ready = True
+        restarted.get_context.return_value = ""
+        restarted_app = FastAPI()
+        restarted_app.include_router(
+            create_a2a_router(
+                restarted,
+                "claude",
+                8100,
+                "\n",
+                "synapse-claude-8100",
+                inbox=AgentInbox("synapse-claude-8100", db_path=db_path),
+            )
+        )
+
+        task = task_store.get(queued["id"])
+        assert task is not None
+        assert task.status == "submitted"
+
+        # Startup binds the server loop before any request arrives
+        with TestClient(restarted_app):
+            self._become_ready(restarted)
+            self._wait_for_status(queued["id"], "working")
+
+
+class TestCoalescing:
+    @pytest.fixture
+    def mock_controller(self):
+        controller = MagicMock()
+        controller.status = "READY"
+        controller.agent_ready = True
+        controller.get_context.return_value = ""
+        return controller
+
+    @pytest.fixture
+    def client(self, mock_controller):
+        app = FastAPI()
+        app.include_router(
+            create_a2a_router(
+                mock_controller,
+                "claude",
+                8100,
+                "\n",
+                "synapse-claude-8100",
+                inbox=AgentInbox("synapse-claude-8100"),
+                coalesce_window_ms=50,
+            )
+        )
+        # Keep one event loop for the whole test so the delayed drain runs
+        with TestClient(app) as client:
+            yield client
+
+    @staticmethod
+    def _send(client: TestClient, text: str, mode: str, sender: str) -> dict:
+        request = _request(text)
+        request["metadata"] = {
+            "response_mode": mode,
+            "sender": {"sender_id": sender},
+        }
+        response = client.post("/tasks/send", json=request)
+        assert response.status_code == 200
+        return response.json()["task"]
+
+    @staticmethod
+    def _wait_for_write(mock_controller: MagicMock, calls: int = 1) -> None:
+        deadline = time.monotonic() + 2.0
+        while mock_controller.write.call_count < calls:
+            assert time.monotonic() < deadline, "no PTY write"
+            time.sleep(0.01)
+
+    def test_burst_is_injected_once_and_completed_together(
+        self, client, mock_controller
+    ):
+        tasks = [
+            self._send(client, "build done", "notify", "synapse-codex-8120"),
+            self._send(client, "tests done", "silent", "synapse-gemini-8110"),
+            self._send(client, "lint done", "silent", "synapse-codex-8121"),
+        ]
+        assert all(task["status"] == "submitted" for task in tasks)
+
+        self._wait_for_write(mock_controller)
+        time.sleep(0.1)
+        assert mock_controller.write.call_count == 1
+        written = mock_controller.write.call_args[0][0]
+        assert written.split("\n\n") == [
+            "A2A: [From: synapse-codex-8120] build done",
+            "A2A: [From: synapse-gemini-8110] tests done",
+            "A2A: [From: synapse-codex-8121] lint done",
+        ]
+        assert all(task_store.get(t["id"]).status == "working" for t in tasks)
+
+        callback = mock_controller.on_status_change.call_args_list[0][0][0]
+        callback("PROCESSING", "READY")
+        assert all(task_store.get(t["id"]).status == "completed" for t in tasks)
+
+    def test_wait_mode_is_not_coalesced(self, client, mock_controller):
+        task = self._send(client, "review this", "wait", "synapse-codex-8120")
+
+        assert task["status"] == "working"
+        mock_controller.write.assert_called_once()
+
+    def test_backlog_behind_working_task_is_batched(self, client, mock_controller):
+        self._send(client, "review this", "wait", "synapse-codex-8120")
+        queued = [
+            self._send(client, f"update {i}", "silent", "synapse-codex-8121")
+            for i in range(3)
+        ]
+        time.sleep(0.1)
+        assert mock_controller.write.call_count == 1
+
+        callback = mock_controller.on_status_change.call_args_list[0][0][0]
+        callback("PROCESSING", "READY")
+
+        self._wait_for_write(mock_controller, calls=2)
+        assert mock_controller.write.call_args[0][0].count("A2A: ") == 3
+        assert all(task_store.get(t["id"]).status == "working" for t in queued)
+
+    def test_long_batch_is_stored_to_file(self, tmp_path):
+        controller = MagicMock()
+        transport = PTYTransport(controller, LongMessageStore(tmp_path, threshold=80))
+
+        transport.deliver_batch(
+            [
+                TransportMessage(f"task-{i}", "x" * 40, sender_id="synapse-codex-8120")
+                for i in range(3)
+            ]
+        )
+
+        written = controller.write.call_args[0][0]
+        assert written.startswith("A2A: [LONG MESSAGE - FILE ATTACHED]")
+        stored = next(tmp_path.iterdir()).read_text()
+        assert stored.count("A2A: [From: synapse-codex-8120] ") == 3
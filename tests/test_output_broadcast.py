@@ -0,0 +1,135 @@
+"""Tests for sequenced PTY output fan-out (synapse.output_broadcast)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from synapse.output_broadcast import OutputBroadcaster
+
+
+def test_publish_assigns_increasing_sequence_numbers():
+    broadcaster = OutputBroadcaster()
+    subscription = broadcaster.subscribe()
+
+    assert broadcaster.publish("a") == 1
+    assert broadcaster.publish("") == 1  # empty deltas are not published
+    assert broadcaster.publish("b") == 2
+
+    assert [(d.seq, d.text) for d in subscription.drain()] == [(1, "a"), (2, "b")]
+    assert subscription.drain() == []
+
+
+def test_transform_is_applied_once_per_delta():
+    calls: list[str] = []
+
+    def upper(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    broadcaster = OutputBroadcaster(transform=upper)
+    first = broadcaster.subscribe()
+    second = broadcaster.subscribe()
+    broadcaster.publish("hi")
+
+    assert [d.text for d in first.drain()] == ["HI"]
+    assert [d.text for d in second.drain()] == ["HI"]
+    assert calls == ["hi"]
+
+
+def test_subscribe_without_after_skips_history():
+    broadcaster = OutputBroadcaster()
+    broadcaster.publish("old")
+
+    subscription = broadcaster.subscribe()
+
+    assert subscription.start_sequence == 1
+    assert not subscription.resumed
+    assert subscription.drain() == []
+
+
+def test_resume_replays_retained_deltas():
+    broadcaster = OutputBroadcaster()
+    for text in ("a", "b", "c"):
+        broadcaster.publish(text)
+
+    subscription = broadcaster.subscribe(after=1)
+
+    assert subscription.resumed
+    assert [d.raw for d in subscription.drain()] == ["b", "c"]
+
+
+def test_resume_fails_when_history_was_trimmed():
+    broadcaster = OutputBroadcaster(history_chars=4)
+    for text in ("aa", "bb", "cc"):
+        broadcaster.publish(text)
+
+    assert not broadcaster.subscribe(after=0).resumed
+    assert broadcaster.subscribe(after=1).resumed
+
+
+def test_resume_fails_for_sequence_from_another_process():
+    broadcaster = OutputBroadcaster()
+    broadcaster.publish("a")
+
+    subscription = broadcaster.subscribe(after=50)
+
+    assert not subscription.resumed
+    assert subscription.drain() == []
+
+
+def test_slow_subscriber_drops_oldest_deltas():
+    broadcaster = OutputBroadcaster(queue_size=2)
+    subscription = broadcaster.subscribe()
+    for text in ("a", "b", "c"):
+        broadcaster.publish(text)
+
+    assert [d.seq for d in subscription.drain()] == [2, 3]
+
+
+def test_closed_subscription_stops_receiving():
+    broadcaster = OutputBroadcaster()
+    with broadcaster.subscribe() as subscription:
+        assert broadcaster.subscriber_count == 1
+    broadcaster.publish("a")
+
+    assert broadcaster.subscriber_count == 0
+    assert subscription.drain() == []
+
+
+def test_wait_is_woken_by_publish_from_another_thread():
+    broadcaster = OutputBroadcaster()
+    subscription = broadcaster.subscribe()
+    timer = threading.Timer(0.05, broadcaster.publish, ("late",))
+    timer.start()
+
+    start = time.monotonic()
+    deltas = subscription.wait(timeout=5)
+    timer.join()
+
+    assert [d.raw for d in deltas] == ["late"]
+    assert time.monotonic() - start < 2
+
+
+def test_wake_ends_wait_without_output():
+    broadcaster = OutputBroadcaster()
+    subscription = broadcaster.subscribe()
+    timer = threading.Timer(0.05, subscription.wake)
+    timer.start()
+
+    start = time.monotonic()
+    assert subscription.wait(timeout=5) == []
+    timer.join()
+    assert time.monotonic() - start < 2
+
+
+def test_wait_async_is_woken_by_publish_from_another_thread():
+    async def run() -> list[str]:
+        broadcaster = OutputBroadcaster()
+        subscription = broadcaster.subscribe()
+        threading.Timer(0.05, broadcaster.publish, ("async",)).start()
+        deltas = await subscription.wait_async(timeout=5)
+        return [d.raw for d in deltas]
+
+    assert asyncio.run(run()) == ["async"]
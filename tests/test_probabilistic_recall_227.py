@@ -122,3 +122,29 @@ def test_history_manager_recall_searches_existing_history(tmp_path) -> None:
 
     assert len(recalled) == 1
     assert recalled[0]["task_id"] == "jwt-1"
+
+
+def test_select_recalled_observations_prefers_relevant_candidates() -> None:
+    """BM25 relevance from history search should raise recall probability."""
+    from synapse.probabilistic_recall import (
+        score_recall_candidate,
+        select_recalled_observations,
+    )
+
+    now = datetime(2026, 5, 7, tzinfo=timezone.utc)
+    base = {"timestamp": now.isoformat(), "metadata": {"encounter_count": 1}}
+    strong = {**base, "task_id": "strong", "relevance": 8.0}
+    weak = {**base, "task_id": "weak", "relevance": 1.0}
+
+    assert score_recall_candidate(strong, now=now, relevance=1.0) > (
+        score_recall_candidate(weak, now=now, relevance=0.125)
+    )
+
+    selected = select_recalled_observations(
+        [weak, strong],
+        now=now,
+        random_fn=lambda: 0.0,
+        noise_fn=lambda: 0.0,
+    )
+
+    assert [item["task_id"] for item in selected] == ["strong", "weak"]
@@ -229,3 +229,63 @@ class TestIncrementalDecoding:
         r = PtyRenderer(columns=80, rows=24)
         r.feed(b"hello\x1b[2;1Hworld")
         assert r.render()[1] == "world"
+
+
+class TestIncrementalRender:
+    def test_only_dirty_rows_are_rerendered(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"one\r\ntwo\r\nthree")
+        r.render()
+
+        rendered: list[int] = []
+        original = r._render_line
+
+        def spy(y: int) -> tuple[str, int]:
+            rendered.append(y)
+            return original(y)
+
+        r._render_line = spy  # type: ignore[method-assign]
+        r.feed(b"\x1b[2;1Hxyz")
+        lines = r.render()
+
+        assert rendered == [1]
+        assert lines[:3] == ["one", "xyz", "three"]
+
+    def test_render_text_is_cached_until_screen_changes(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"hello")
+        first = r.render_text()
+        assert r.render_text() is first
+        r.feed(b" world")
+        assert r.render_text().splitlines()[0] == "hello world"
+
+    def test_pop_changed_text_returns_changed_rows_once(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"a\r\nb\r\nc\r\nd\r\ne")
+        assert r.pop_changed_text() == "a\nb\nc\nd\ne"
+        assert r.pop_changed_text() == ""
+
+        r.feed(b"\x1b[3;1HC")
+        assert r.pop_changed_text() == "C"
+
+    def test_pop_changed_text_includes_context_rows(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"a\r\nb\r\nc\r\nd\r\ne")
+        r.pop_changed_text()
+
+        r.feed(b"\x1b[3;1HC")
+        assert r.pop_changed_text(context=1) == "b\nC\nd"
+
+    def test_rewriting_identical_text_is_not_a_change(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"\x1b[HWorking")
+        r.pop_changed_text()
+        r.feed(b"\x1b[HWorking")
+        assert r.pop_changed_text() == ""
+
+    def test_alt_screen_toggle_marks_screen_changed(self) -> None:
+        r = PtyRenderer(columns=80, rows=24)
+        r.feed(b"primary")
+        r.pop_changed_text()
+        r.feed(b"\x1b[?1049hoverlay")
+        assert "overlay" in r.pop_changed_text()
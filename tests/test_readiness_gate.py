@@ -1,12 +1,16 @@
 """Tests for Readiness Gate -- blocks task send until agent initialization is complete."""
 
+import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import httpx
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from synapse.a2a_compat import create_a2a_router
+from synapse.controller import TerminalController
 
 # Standard payload for sending a task message
 SEND_PAYLOAD = {
@@ -22,7 +26,7 @@ SEND_PAYLOAD = {
 def _make_controller(*, agent_ready: bool = True) -> MagicMock:
     """Create a mock controller with readiness gate support.
 
-    Uses a real threading.Event so that wait_until_ready() blocks
+    Uses a real threading.Event so that wait_until_ready_async() blocks
     correctly in the tests that exercise concurrent gate opening.
     """
     event = threading.Event()
@@ -37,6 +41,11 @@ def _make_controller(*, agent_ready: bool = True) -> MagicMock:
     ctrl.agent_ready = agent_ready
     ctrl.wait_until_ready = lambda timeout: event.wait(timeout=timeout)
 
+    async def _wait_until_ready_async(timeout: float) -> bool:
+        return await asyncio.to_thread(event.wait, timeout)
+
+    ctrl.wait_until_ready_async = _wait_until_ready_async
+
     # Keep the event accessible so tests can set/clear it dynamically
     ctrl._ready_event = event
 
@@ -146,7 +155,7 @@ class TestPriority5BypassesGate:
 
 
 class TestEventBlockThenUnblock:
-    """wait_until_ready() should block, then proceed when the gate opens."""
+    """wait_until_ready_async() should block, then proceed when the gate opens."""
 
     def test_gate_opens_mid_wait(self):
         ctrl = _make_controller(agent_ready=False)
@@ -167,6 +176,59 @@ class TestEventBlockThenUnblock:
             timer.cancel()
 
 
+class TestConcurrentWaiters:
+    """Senders waiting at the gate must not hold executor threads."""
+
+    def test_200_concurrent_sends_to_cold_agent(self):
+        ctrl = TerminalController(command="echo", agent_id=None, agent_type="test")
+        ctrl.status = "READY"
+        ctrl.write = MagicMock(return_value=True)
+        app = FastAPI()
+        app.include_router(create_a2a_router(ctrl, "test", 8000, "\n"))
+
+        async def run() -> tuple[list[httpx.Response], bool]:
+            # A pool the old to_thread() gate would have exhausted at once
+            executor = ThreadPoolExecutor(max_workers=4)
+            asyncio.get_running_loop().set_default_executor(executor)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                sends = [
+                    asyncio.create_task(client.post("/tasks/send", json=SEND_PAYLOAD))
+                    for _ in range(200)
+                ]
+                while len(ctrl._ready_waiters) < 200:
+                    await asyncio.sleep(0.01)
+                # Unrelated work still gets a thread while everyone waits
+                executor_free = await asyncio.wait_for(
+                    asyncio.to_thread(lambda: True), timeout=1.0
+                )
+                threading.Timer(0.05, ctrl._mark_agent_ready).start()
+                return await asyncio.gather(*sends), executor_free
+
+        responses, executor_free = asyncio.run(asyncio.wait_for(run(), 10))
+
+        assert executor_free
+        assert [r.status_code for r in responses] == [200] * 200
+        statuses = sorted(r.json()["task"]["status"] for r in responses)
+        assert statuses == ["submitted"] * 199 + ["working"]
+        ctrl.write.assert_called_once()
+        assert not ctrl._ready_waiters
+
+    def test_wait_times_out_with_asyncio_timeout_error(self):
+        """A timed-out wait returns False (asyncio.TimeoutError on 3.10 too)."""
+        ctrl = TerminalController(command="echo", agent_id=None, agent_type="test")
+
+        async def timed_out(awaitable, timeout):
+            awaitable.close()
+            raise asyncio.TimeoutError
+
+        with patch("synapse.controller.asyncio.wait_for", timed_out):
+            assert asyncio.run(ctrl.wait_until_ready_async(0.01)) is False
+        assert not ctrl._ready_waiters
+
+
 # ============================================================
 # Test: Reply messages bypass readiness gate
 # ============================================================
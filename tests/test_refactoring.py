@@ -136,7 +136,7 @@ class TestA2AClientWaitLogic:
         client = A2AClient()
 
         # Mock response sequence: working -> working -> completed
-        with patch("synapse.a2a_client.requests.get") as mock_get:
+        with patch("synapse.a2a_client.requests.Session.get") as mock_get:
             mock_responses = [
                 MagicMock(
                     json=lambda: {"id": "task1", "status": "working", "artifacts": []},
@@ -168,7 +168,7 @@ class TestA2AClientWaitLogic:
 
         client = A2AClient()
 
-        with patch("synapse.a2a_client.requests.get") as mock_get:
+        with patch("synapse.a2a_client.requests.Session.get") as mock_get:
             # Always return working status
             mock_get.return_value = MagicMock(
                 json=lambda: {"id": "task1", "status": "working", "artifacts": []},
@@ -190,7 +190,7 @@ class TestA2AClientWaitLogic:
 
         client = A2AClient()
 
-        with patch("synapse.a2a_client.requests.get") as mock_get:
+        with patch("synapse.a2a_client.requests.Session.get") as mock_get:
             mock_get.return_value = MagicMock(
                 json=lambda: {"id": "task1", "status": "failed", "artifacts": []},
                 raise_for_status=lambda: None,
@@ -211,7 +211,7 @@ class TestA2AClientWaitLogic:
 
         client = A2AClient()
 
-        with patch("synapse.a2a_client.requests.get") as mock_get:
+        with patch("synapse.a2a_client.requests.Session.get") as mock_get:
             mock_get.return_value = MagicMock(
                 json=lambda: {"id": "task1", "status": "canceled", "artifacts": []},
                 raise_for_status=lambda: None,
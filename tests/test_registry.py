@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 import textwrap
@@ -8,6 +9,7 @@ import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -454,7 +456,7 @@ def test_update_status_multiple_times(registry):
 
 
 def test_atomic_updates_use_registry_write_lock(registry):
-    """update_* operations should all run under registry-wide write lock."""
+    """Durable update_* operations run under the registry-wide write lock."""
     agent_id = "test_write_lock_updates"
     registry.register(agent_id, "claude", 8100, name="lock-agent")
 
@@ -468,10 +470,211 @@ def test_atomic_updates_use_registry_write_lock(registry):
 
     registry.registry_write_lock = fake_lock  # type: ignore[method-assign]
 
+    assert registry.update_name(agent_id, "lock-agent-renamed") is True
+    assert registry.update_session_id(agent_id, "conv-1") is True
+    assert entered == 2
+
+
+def test_volatile_updates_take_both_locks_without_write_behind(registry):
+    """Immediate volatile writes serialize like durable ones, plus the
+    per-agent lock; write-behind flushes take only the per-agent lock."""
+    agent_id = "test_volatile_lock_updates"
+    registry.register(agent_id, "claude", 8100)
+
+    global_entered = 0
+    agent_locks: list[str] = []
+
+    @contextmanager
+    def fake_global_lock():
+        nonlocal global_entered
+        global_entered += 1
+        yield
+
+    original_agent_lock = registry._agent_write_lock
+
+    @contextmanager
+    def tracking_agent_lock(aid):
+        agent_locks.append(aid)
+        with original_agent_lock(aid):
+            yield
+
+    registry.registry_write_lock = fake_global_lock  # type: ignore[method-assign]
+    registry._agent_write_lock = tracking_agent_lock  # type: ignore[method-assign]
+
     assert registry.update_status(agent_id, "READY") is True
     assert registry.update_transport(agent_id, "UDS→") is True
-    assert registry.update_name(agent_id, "lock-agent-renamed") is True
-    assert entered == 3
+    assert registry.update_current_task(agent_id, "do things") is True
+    assert registry.update_summary(agent_id, "summary") is True
+    assert global_entered == 4
+    assert agent_locks == [agent_id] * 4
+
+    registry.write_behind = True
+    assert registry.update_status(agent_id, "PROCESSING") is True
+    registry.flush()
+    assert global_entered == 4
+    assert agent_locks == [agent_id] * 5
+
+
+def test_unregister_removes_agent_lock_file(registry):
+    """Per-agent lock files do not accumulate across agent lifetimes."""
+    agent_id = "test_lock_cleanup"
+    registry.register(agent_id, "claude", 8100)
+    registry.update_status(agent_id, "READY")
+    lock_path = registry.registry_dir / f".{agent_id}.lock"
+    assert lock_path.exists()
+
+    registry.unregister(agent_id)
+
+    assert not lock_path.exists()
+
+
+def test_agent_lock_waiter_retries_after_unlink(registry):
+    """A waiter blocked on a lock file that unregister removed re-locks."""
+    agent_id = "test_lock_retry"
+    registry.register(agent_id, "claude", 8100)
+    lock_path = registry.registry_dir / f".{agent_id}.lock"
+    acquired = threading.Event()
+    inodes: list[int] = []
+
+    def waiter() -> None:
+        with registry._agent_write_lock(agent_id):
+            inodes.append(lock_path.stat().st_ino)
+            acquired.set()
+
+    with registry._agent_write_lock(agent_id):
+        stale_inode = lock_path.stat().st_ino
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.1)
+        assert not acquired.is_set()
+        lock_path.unlink()
+    thread.join(timeout=5)
+
+    assert acquired.is_set()
+    assert inodes == [lock_path.stat().st_ino]
+    assert inodes[0] != stale_inode
+
+
+def test_volatile_updates_skip_fsync(registry):
+    """Volatile fields are written without fsync; durable ones still fsync."""
+    agent_id = "test_volatile_fsync"
+    registry.register(agent_id, "claude", 8100)
+
+    with patch("synapse.registry.os.fsync") as mock_fsync:
+        registry.update_status(agent_id, "READY")
+        registry.update_transport(agent_id, None)
+        assert mock_fsync.call_count == 0
+        registry.update_tty_device(agent_id, "/dev/ttys001")
+        assert mock_fsync.call_count == 1
+    assert registry.get_agent(agent_id)["status"] == "READY"
+
+
+def test_write_behind_coalesces_updates(registry):
+    """Write-behind queues updates and applies them in a single write."""
+    agent_id = "synapse-claude-8100"
+    registry.register(agent_id, "claude", 8100)
+    registry.write_behind = True
+
+    with patch.object(
+        registry, "_write_json_atomic", wraps=registry._write_json_atomic
+    ) as mock_write:
+        for status in ("PROCESSING", "READY", "PROCESSING", "READY"):
+            assert registry.update_status(agent_id, status) is True
+        registry.update_transport(agent_id, "UDS→")
+        registry.flush()
+        assert mock_write.call_count == 1
+
+    info = registry.get_agent(agent_id)
+    assert info["status"] == "READY"
+    assert info["active_transport"] == "UDS→"
+
+
+def test_write_behind_background_flush_and_read_your_writes(registry):
+    """Queued updates land on disk without an explicit flush and are visible
+    to the writing registry immediately."""
+    agent_id = "synapse-claude-8100"
+    registry.register(agent_id, "claude", 8100)
+    registry.write_behind = True
+
+    registry.update_status(agent_id, "READY")
+    assert registry.get_agent(agent_id)["status"] == "READY"
+
+    registry.update_status(agent_id, "PROCESSING")
+    file_path = registry.registry_dir / f"{agent_id}.json"
+    deadline = time.time() + 2.0
+    while time.time() < deadline:
+        if json.loads(file_path.read_text())["status"] == "PROCESSING":
+            break
+        time.sleep(0.01)
+    assert json.loads(file_path.read_text())["status"] == "PROCESSING"
+
+
+def test_write_behind_unknown_agent_and_unregister(registry):
+    """Write-behind rejects unknown agents and never resurrects removed ones."""
+    registry.write_behind = True
+    assert registry.update_status("missing", "READY") is False
+
+    agent_id = "synapse-claude-8100"
+    registry.register(agent_id, "claude", 8100)
+    assert registry.update_status(agent_id, "READY") is True
+    registry.unregister(agent_id)
+    registry.flush()
+    assert not (registry.registry_dir / f"{agent_id}.json").exists()
+
+
+def test_write_for_unregistered_agent_leaves_no_lock_file(registry):
+    """A write that was waiting while unregister ran does not leave the lock
+    file it re-created behind."""
+    agent_id = "synapse-claude-8100"
+    registry.register(agent_id, "claude", 8100)
+    file_path = registry.registry_dir / f"{agent_id}.json"
+    lock_path = registry.registry_dir / f".{agent_id}.lock"
+    results: list[bool] = []
+
+    def writer() -> None:
+        results.append(
+            registry._rewrite_agent_file(
+                agent_id, [lambda data: data.update(status="READY")], durable=False
+            )
+        )
+
+    with registry._agent_write_lock(agent_id):
+        thread = threading.Thread(target=writer)
+        thread.start()
+        time.sleep(0.1)
+        # What unregister does while holding the per-agent lock.
+        file_path.unlink()
+        lock_path.unlink()
+    thread.join(timeout=5)
+
+    assert results == [False]
+    assert not lock_path.exists()
+    assert not file_path.exists()
+
+
+def test_volatile_update_checks_file_before_locking(registry):
+    """Updates for unknown agents return without touching any lock."""
+    registry.write_behind = False
+    with patch.object(registry, "registry_write_lock") as mock_lock:
+        assert registry.update_status("missing", "READY") is False
+        assert registry.update_transport("missing", "UDS→") is False
+    mock_lock.assert_not_called()
+    assert not (registry.registry_dir / ".missing.lock").exists()
+
+
+def test_durable_update_applies_pending_volatile_first(registry):
+    """A durable update never lets a queued status overwrite it afterwards."""
+    agent_id = "synapse-claude-8100"
+    registry.register(agent_id, "claude", 8100)
+    registry.write_behind = True
+
+    registry.update_status(agent_id, "READY")
+    registry.update_name(agent_id, "renamed")
+    registry.flush()
+
+    info = json.loads((registry.registry_dir / f"{agent_id}.json").read_text())
+    assert info["status"] == "READY"
+    assert info["name"] == "renamed"
 
 
 # ============================================================================
@@ -587,3 +790,203 @@ def test_update_session_id_nonexistent(registry):
     """update_session_id returns False for non-existent agent."""
     result = registry.update_session_id("nonexistent", "conv-123")
     assert result is False
+
+
+# ============================================================
+# Registry index (generation counter / secondary indexes)
+# ============================================================
+
+
+def test_generation_bumps_on_register_update_unregister(registry):
+    """Every registry change advances the generation counter."""
+    gen0 = registry.get_generation()
+    registry.register("synapse-claude-8100", "claude", 8100)
+    gen1 = registry.get_generation()
+    registry.update_status("synapse-claude-8100", "READY")
+    gen2 = registry.get_generation()
+    registry.unregister("synapse-claude-8100")
+    gen3 = registry.get_generation()
+
+    assert gen0 < gen1 < gen2 < gen3
+
+
+def test_generation_stable_without_changes(registry):
+    """Repeated reads do not advance the generation."""
+    registry.register("synapse-claude-8100", "claude", 8100)
+    gen = registry.get_generation()
+    registry.list_agents()
+    registry.list_agents()
+    assert registry.get_generation() == gen
+
+
+def test_volatile_writes_bump_generation(registry):
+    """Status and transport writes advance the generation like other writes."""
+    registry.register("synapse-claude-8100", "claude", 8100)
+    gen0 = registry.get_generation()
+    registry.update_status("synapse-claude-8100", "READY")
+    gen1 = registry.get_generation()
+    registry.write_behind = True
+    registry.update_transport("synapse-claude-8100", "UDS→")
+    registry.flush()
+    gen2 = registry.get_generation()
+
+    assert gen0 < gen1 < gen2
+    assert registry.list_agents()["synapse-claude-8100"]["active_transport"] == "UDS→"
+
+
+def test_unchanged_generation_skips_directory_scan(registry):
+    """Reads compare the generation and scan only once another writer moved it."""
+    registry.register("synapse-claude-8100", "claude", 8100, name="alpha")
+    registry.list_agents()
+
+    with patch("synapse.registry.os.scandir", wraps=os.scandir) as mock_scandir:
+        registry.list_agents()
+        registry.resolve_agent("alpha")
+        registry.get_generation()
+        assert registry.is_name_unique("beta")
+        # Our own writes keep this process' view current.
+        registry.update_status("synapse-claude-8100", "READY")
+        assert registry.list_agents()["synapse-claude-8100"]["status"] == "READY"
+        assert mock_scandir.call_count == 0
+
+        other = AgentRegistry()
+        other.registry_dir = registry.registry_dir
+        # A writer in another process does not share our reconcile state.
+        with patch("synapse.registry._INDEX_SYNCED", {}):
+            other.update_status("synapse-claude-8100", "PROCESSING")
+        status = registry.list_agents()["synapse-claude-8100"]["status"]
+        assert status == "PROCESSING"
+        assert mock_scandir.call_count == 1
+
+
+def test_external_edit_seen_after_rescan_interval(registry, monkeypatch):
+    """Files edited outside AgentRegistry show up on the periodic rescan."""
+    registry.register("synapse-claude-8100", "claude", 8100)
+    registry.list_agents()
+    path = registry.registry_dir / "synapse-claude-8100.json"
+    data = json.loads(path.read_text())
+    data["status"] = "READY"
+    path.write_text(json.dumps(data))
+
+    monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 60.0)
+    assert registry.list_agents()["synapse-claude-8100"]["status"] == "PROCESSING"
+    monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
+    assert registry.list_agents()["synapse-claude-8100"]["status"] == "READY"
+
+
+def test_index_picks_up_external_writes(registry, monkeypatch):
+    """JSON files written by other processes are reconciled into the index."""
+    monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
+    registry.register("synapse-claude-8100", "claude", 8100)
+    assert set(registry.list_agents()) == {"synapse-claude-8100"}
+
+    external = registry.registry_dir / "synapse-gemini-8110.json"
+    external.write_text(
+        json.dumps(
+            {"agent_id": "synapse-gemini-8110", "agent_type": "gemini", "port": 8110}
+        )
+    )
+    assert set(registry.list_agents()) == {
+        "synapse-claude-8100",
+        "synapse-gemini-8110",
+    }
+
+    external.unlink()
+    assert set(registry.list_agents()) == {"synapse-claude-8100"}
+
+
+def test_index_skips_corrupted_file_until_fixed(registry, monkeypatch):
+    """A corrupted file is skipped, then indexed once rewritten."""
+    monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
+    bad = registry.registry_dir / "synapse-codex-8120.json"
+    bad.write_text("{ not json")
+    assert registry.list_agents() == {}
+
+    bad.write_text(
+        json.dumps(
+            {"agent_id": "synapse-codex-8120", "agent_type": "codex", "port": 8120}
+        )
+    )
+    assert "synapse-codex-8120" in registry.list_agents()
+
+
+def test_list_agents_returns_copies(registry):
+    """Mutating a returned entry does not corrupt the cached snapshot."""
+    registry.register("synapse-claude-8100", "claude", 8100)
+    registry.list_agents()["synapse-claude-8100"]["status"] = "MUTATED"
+    assert registry.list_agents()["synapse-claude-8100"]["status"] == "PROCESSING"
+
+
+def test_index_shared_across_registry_instances(registry):
+    """A second registry on the same directory sees the same generation."""
+    registry.register("synapse-claude-8100", "claude", 8100, name="alpha")
+    other = AgentRegistry()
+    other.registry_dir = registry.registry_dir
+
+    assert other.get_generation() == registry.get_generation()
+    assert not other.is_name_unique("alpha")
+
+
+def test_resolve_agent_via_index(registry):
+    """resolve_agent honours name > definition id > id > type-port > type."""
+    registry.register("synapse-claude-8100", "claude", 8100, name="alpha")
+    registry.register("synapse-gemini-8110", "gemini", 8110)
+    registry.register("synapse-codex-8120", "codex", 8120)
+    registry.register("synapse-codex-8121", "codex", 8121)
+
+    with patch.object(registry, "get_live_agents", registry.list_agents):
+        assert registry.resolve_agent("alpha")["agent_id"] == "synapse-claude-8100"
+        assert registry.resolve_agent("gemini")["agent_id"] == "synapse-gemini-8110"
+        assert registry.resolve_agent("codex-8121")["agent_id"] == "synapse-codex-8121"
+        assert (
+            registry.resolve_agent("synapse-codex-8120")["agent_id"]
+            == "synapse-codex-8120"
+        )
+        assert registry.resolve_agent("codex") is None
+        assert registry.resolve_agent("missing") is None
+
+
+def test_resolve_agent_probes_only_the_match(registry, monkeypatch):
+    """Only the matched agent's PID is probed; a dead match is removed."""
+    # PIDs are patched into the files directly below.
+    monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
+    registry.register("synapse-claude-8100", "claude", 8100, name="alpha")
+    registry.register("synapse-gemini-8110", "gemini", 8110)
+    registry.register("synapse-gemini-8111", "gemini", 8111)
+    for agent_id, pid in (
+        ("synapse-claude-8100", 1001),
+        ("synapse-gemini-8110", 1002),
+        ("synapse-gemini-8111", 1003),
+    ):
+        path = registry.registry_dir / f"{agent_id}.json"
+        data = json.loads(path.read_text())
+        data["pid"] = pid
+        path.write_text(json.dumps(data))
+
+    with patch(
+        "synapse.registry.is_process_running", side_effect=lambda pid: pid != 1002
+    ) as mock_running:
+        assert registry.resolve_agent("alpha")["agent_id"] == "synapse-claude-8100"
+        assert [c.args for c in mock_running.call_args_list] == [(1001,)]
+
+        mock_running.reset_mock()
+        # Two gemini entries, one dead: the live one is unique after cleanup.
+        assert registry.resolve_agent("gemini")["agent_id"] == "synapse-gemini-8111"
+        assert sorted(c.args for c in mock_running.call_args_list)[:2] == [
+            (1002,),
+            (1003,),
+        ]
+    assert registry.get_agent("synapse-gemini-8110") is None
+
+
+def test_list_agents_falls_back_when_index_unavailable(registry):
+    """Index errors fall back to scanning the JSON files directly."""
+    registry.register("synapse-claude-8100", "claude", 8100, name="alpha")
+
+    with patch(
+        "synapse.registry._RegistryIndex.sync",
+        side_effect=sqlite3.OperationalError("database is locked"),
+    ):
+        assert set(registry.list_agents()) == {"synapse-claude-8100"}
+        assert registry.get_generation() is None
+        assert not registry.is_name_unique("alpha")
@@ -64,3 +64,89 @@ class TestRenderBufferCarriageReturn:
         ctrl._append_output("行1\r".encode())
         ctrl._append_output("\n行2".encode())
         assert ctrl.get_context() == "行1\n行2"
+
+    def test_backspace_overwrites_in_place(self):
+        """Backspace moves the cursor left so the next char overwrites."""
+        ctrl = _make_controller()
+        ctrl._append_output(b"abc\b\bX")
+        assert ctrl.get_context() == "aXc"
+
+    def test_newline_after_backspace_keeps_line_tail(self):
+        """A newline written mid-line commits the text left of the cursor."""
+        ctrl = _make_controller()
+        ctrl._append_output(b"abc\b\b\nZ")
+        assert ctrl.get_context() == "a\nZ"
+
+
+class TestOutputRingBuffer:
+    """Tests for the bounded raw/render buffers behind TerminalController."""
+
+    def test_output_buffer_keeps_most_recent_bytes(self):
+        from synapse.config import OUTPUT_BUFFER_MAX
+
+        ctrl = _make_controller()
+        for i in range(OUTPUT_BUFFER_MAX // 5):
+            ctrl._append_output(f"{i:04d}|".encode() * 3)
+        assert len(ctrl.output_buffer) == OUTPUT_BUFFER_MAX
+        assert ctrl.output_buffer.endswith(b"1999|1999|1999|")
+
+    def test_byte_ring_tail_is_contiguous_across_compaction(self):
+        from synapse.controller import _ByteRing
+
+        ring = _ByteRing(8)
+        expected = b""
+        for chunk in (b"abc", b"defg", b"hij", b"k", b"lmnopq", b"r"):
+            ring.append(chunk)
+            expected = (expected + chunk)[-8:]
+            assert ring.getvalue() == expected
+            assert bytes(ring.tail(3)) == expected[-3:]
+        ring.append(b"0123456789")
+        assert ring.getvalue() == b"23456789"
+
+    def test_render_buffer_is_bounded_in_characters(self):
+        from synapse.controller import _RenderBuffer
+
+        buf = _RenderBuffer(10)
+        for i in range(20):
+            buf.feed(f"行{i:02d}\n")
+        buf.feed("x" * 25)
+        value = buf.getvalue()
+        assert len(value) == 10
+        assert value == "x" * 10
+
+    def test_render_buffer_drops_partial_utf8_at_head(self):
+        from synapse.controller import _RenderBuffer
+
+        buf = _RenderBuffer(4)
+        buf.feed("ああああああ\n")
+        assert "�" not in buf.getvalue()
+        assert buf.getvalue().endswith("あ\n")
+
+    def test_output_offset_marks_output_since(self):
+        ctrl = _make_controller()
+        ctrl._append_output(b"old 1\nold 2\nprompt> ")
+        marker = ctrl.output_offset
+
+        ctrl._append_output(
+            b"hello\r\n\x1b[1mreply\x1b[0m line\nprogress 1\rprogress 2\nok"
+        )
+
+        assert ctrl.output_since(marker) == "prompt> hello\nreply line\nprogress 2\nok"
+        assert ctrl.get_context().endswith(ctrl.output_since(marker))
+        assert ctrl.output_since(ctrl.output_offset) == "ok"
+
+    def test_output_since_is_none_once_trimmed(self):
+        from synapse.controller import _RenderBuffer
+
+        buf = _RenderBuffer(40)
+        buf.feed("earlier task\n")
+        marker = buf.committed
+        buf.feed("line 0\n")
+        assert buf.since(marker) == "line 0\n"
+
+        # The marked output no longer fits in the context: no partial delta
+        for i in range(1, 20):
+            buf.feed(f"line {i}\n")
+        assert buf.committed == len("earlier task\n") + 10 * 7 + 10 * 8
+        assert buf.since(marker) is None
+        assert buf.since(buf.committed) == ""
@@ -33,7 +33,7 @@ def test_polls_sender_when_sender_task_and_endpoint_present():
 
     with (
         patch("synapse.a2a_client.Path.exists", return_value=False),
-        patch("synapse.a2a_client.requests.post") as mock_post,
+        patch("synapse.a2a_client.requests.Session.post") as mock_post,
         patch.object(
             client,
             "_wait_for_local_completion",
@@ -78,7 +78,7 @@ def test_polls_target_when_sender_endpoint_missing():
 
     with (
         patch("synapse.a2a_client.Path.exists", return_value=False),
-        patch("synapse.a2a_client.requests.post", side_effect=post_side_effect),
+        patch("synapse.a2a_client.requests.Session.post", side_effect=post_side_effect),
         patch.object(
             client,
             "_wait_for_local_completion",
@@ -108,7 +108,7 @@ def test_polls_target_when_no_sender_task_id():
     client = A2AClient()
 
     with (
-        patch("synapse.a2a_client.requests.post") as mock_post,
+        patch("synapse.a2a_client.requests.Session.post") as mock_post,
         patch.object(
             client,
             "_wait_for_local_completion",
@@ -139,7 +139,7 @@ def test_skip_polling_when_wait_disabled():
     client = A2AClient()
 
     with (
-        patch("synapse.a2a_client.requests.post") as mock_post,
+        patch("synapse.a2a_client.requests.Session.post") as mock_post,
         patch.object(client, "_wait_for_local_completion") as mock_wait,
     ):
         mock_post.return_value = DummyResponse(_task_payload("target-task"))
@@ -160,7 +160,7 @@ def test_warning_logged_on_polling_timeout():
     client = A2AClient()
 
     with (
-        patch("synapse.a2a_client.requests.post") as mock_post,
+        patch("synapse.a2a_client.requests.Session.post") as mock_post,
         patch.object(client, "_wait_for_local_completion", return_value=None),
         patch("synapse.a2a_client.logger.warning") as mock_warning,
     ):
@@ -165,7 +165,7 @@ class TestA2AClientSenderInfo:
 
         from synapse.a2a_client import A2AClient
 
-        with patch.object(requests, "post") as mock_post:
+        with patch.object(requests.Session, "post") as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "task": {"id": "task-123", "status": "working"}
@@ -200,7 +200,7 @@ class TestA2AClientSenderInfo:
 
         from synapse.a2a_client import A2AClient
 
-        with patch.object(requests, "post") as mock_post:
+        with patch.object(requests.Session, "post") as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "task": {"id": "task-123", "status": "working"}
@@ -1,6 +1,6 @@
 """Tests for Synapse A2A Server - endpoint compliance."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -159,3 +159,41 @@ class TestIntegration(TestServerApp):
         complete_response = client.get(f"/tasks/{task_id}")
         assert complete_response.json()["status"] == "completed"
         assert len(complete_response.json()["artifacts"]) > 0
+
+
+# ============================================================
+# Inbox Lifecycle Tests
+# ============================================================
+
+
+class TestAppInbox(TestServerApp):
+    """The app's agent inbox is isolated per test and closed on shutdown."""
+
+    def test_default_inbox_uses_configured_db_path(
+        self, mock_controller, mock_registry, tmp_path
+    ):
+        """Without an inbox argument the app opens SYNAPSE_INBOX_DB_PATH."""
+        from synapse.server import create_app
+
+        with patch("synapse.server.AgentInbox") as inbox_cls:
+            create_app(mock_controller, mock_registry, "test-agent-id", 8000)
+
+        inbox_cls.assert_called_once_with(
+            "test-agent-id", db_path=str(tmp_path / "inbox.db")
+        )
+
+    def test_inbox_is_closed_on_shutdown(self, mock_controller, mock_registry):
+        """The app serves the inbox it was given and closes it on shutdown."""
+        from synapse.inbox import AgentInbox
+        from synapse.server import create_app
+
+        inbox = AgentInbox("test-agent-id")
+        app = create_app(
+            mock_controller, mock_registry, "test-agent-id", 8000, inbox=inbox
+        )
+
+        with patch.object(inbox, "close", wraps=inbox.close) as close:
+            with TestClient(app) as client:
+                assert client.get("/status").json()["inbox"] == inbox.stats()
+                close.assert_not_called()
+            close.assert_called_once_with()
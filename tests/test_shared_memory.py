@@ -508,6 +508,83 @@ class TestSharedMemorySearch:
 
         assert [item["key"] for item in results] == ["private-auth-a"]
 
+    def test_search_ranks_key_matches_first(self, tmp_path):
+        """FTS search should rank a key hit above a content-only hit."""
+        from synapse.shared_memory import SharedMemory
+
+        mem = SharedMemory(db_path=str(tmp_path / "memory.db"))
+        mem.save("deploy-notes", "Mention caching once", "claude")
+        mem.save("caching", "Redis in front of the API", "claude")
+
+        results = mem.search("caching")
+
+        assert [item["key"] for item in results] == ["caching", "deploy-notes"]
+
+    def test_search_tracks_updates_and_deletes(self, memory):
+        """The full-text index should follow UPSERTs and deletes."""
+        memory.save("auth-pattern", "Use mutual TLS", "claude", tags=["network"])
+
+        assert memory.search("OAuth2") == []
+        assert [r["key"] for r in memory.search("mutual")] == ["auth-pattern"]
+        assert [r["key"] for r in memory.search("network")] == ["auth-pattern"]
+
+        memory.delete("auth-pattern")
+        assert memory.search("mutual") == []
+
+    def test_search_punctuation_falls_back_to_substring(self, memory):
+        """Queries without word characters should still match as substrings."""
+        memory.save("c-flags", "Pass -- before tool args", "claude")
+
+        assert [r["key"] for r in memory.search("--")] == ["c-flags"]
+
+    def test_search_matches_cjk_and_inner_substrings(self, memory):
+        """Japanese text and substrings inside a word should match."""
+        memory.save("auth-ja", "ユーザー認証はJWTを使う", "claude")
+        memory.save("token-refresh", "Refresh tokens every hour", "claude")
+
+        assert [r["key"] for r in memory.search("認証")] == ["auth-ja"]
+        assert [r["key"] for r in memory.search("ユーザー認証")] == ["auth-ja"]
+        assert [r["key"] for r in memory.search("JWT")] == ["auth-ja"]
+        assert [r["key"] for r in memory.search("fresh")] == ["token-refresh"]
+
+    def test_word_tokenized_index_is_rebuilt(self, tmp_path):
+        """An index built by the unicode61 tokenizer is replaced on open."""
+        from synapse.shared_memory import SharedMemory
+
+        db_path = str(tmp_path / "memory.db")
+        mem = SharedMemory(db_path=db_path)
+        mem.save("token-refresh", "Refresh tokens every hour", "claude")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE memories_fts")
+            conn.execute(
+                "CREATE VIRTUAL TABLE memories_fts USING fts5("
+                "key, content, tags, content='memories', content_rowid='rowid', "
+                "tokenize='unicode61')"
+            )
+            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+
+        reopened = SharedMemory(db_path=db_path)
+
+        assert [r["key"] for r in reopened.search("fresh")] == ["token-refresh"]
+
+    def test_existing_database_is_indexed_on_open(self, tmp_path):
+        """Databases created before the indexes existed are backfilled."""
+        from synapse.shared_memory import SharedMemory
+
+        db_path = str(tmp_path / "memory.db")
+        mem = SharedMemory(db_path=db_path)
+        mem.save("auth-pattern", "Use OAuth2", "claude", tags=["security"])
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE memories_fts")
+            conn.execute("DROP TABLE memory_tags")
+
+        reopened = SharedMemory(db_path=db_path)
+
+        assert [r["key"] for r in reopened.search("oauth2")] == ["auth-pattern"]
+        assert [r["key"] for r in reopened.list_memories(tags=["security"])] == [
+            "auth-pattern"
+        ]
+
 
 # ============================================================
 # TestSharedMemoryDelete - Delete operations
@@ -578,3 +655,23 @@ class TestSharedMemoryStats:
         assert "by_tag" in stats
         assert stats["by_tag"]["arch"] == 2
         assert stats["by_tag"]["test"] == 2
+
+    def test_tag_index_follows_updates_and_deletes(self, memory):
+        """Tag counts should reflect re-tagged and deleted memories."""
+        memory.save("key-c", "Content C", "synapse-claude-8100", tags=["ops"])
+        memory.delete("key-a")
+
+        stats = memory.stats()
+
+        assert stats["by_tag"] == {"test": 1, "ops": 1}
+
+    def test_rebuild_index(self, memory):
+        """rebuild_index() should restore indexes that drifted out of sync."""
+        with sqlite3.connect(memory.db_path) as conn:
+            conn.execute("DELETE FROM memory_tags")
+            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('delete-all')")
+
+        memory.rebuild_index()
+
+        assert memory.stats()["by_tag"] == {"arch": 2, "test": 2}
+        assert [r["key"] for r in memory.search("Content B")] == ["key-b"]
@@ -95,6 +95,11 @@ def _worker_register_same_name(
     """Child: race two registrations with the same custom name; exactly one
     must succeed (NameConflictError for the other)."""
     try:
+        # As in _worker_allocate: the winner's atexit unregister must not
+        # remove its entry before the loser checks the name.
+        import atexit
+
+        atexit.register = lambda *a, **kw: None  # type: ignore[assignment]
         barrier.wait(timeout=10)
         registry = AgentRegistry()
         registry.register(agent_id, agent_type, port, name=name)
@@ -141,9 +141,11 @@ class TestStatusListJsonViewUnification:
         )
 
     def test_status_and_list_json_share_current_task_and_uptime_fields(
-        self, temp_registry: AgentRegistry
+        self, temp_registry: AgentRegistry, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """The same agent should expose identical canonical JSON fields."""
+        # The entry is edited in place below; rescan on every read.
+        monkeypatch.setattr("synapse.config.REGISTRY_INDEX_RESCAN_INTERVAL", 0.0)
         agent_id = "synapse-codex-8122"
         now = 1777619000.0
         temp_registry.register(
@@ -75,13 +75,13 @@ class TestGetContextStripsAnsi:
         """get_context() should strip ANSI from render buffer content."""
         from unittest.mock import patch
 
-        from synapse.controller import TerminalController
+        from synapse.controller import TerminalController, _RenderBuffer
 
         with patch.object(TerminalController, "__init__", lambda self: None):
             ctrl = TerminalController.__new__(TerminalController)
             ctrl.lock = __import__("threading").Lock()
-            ctrl._render_buffer = ["\x1b[31mred\x1b[0m", " plain"]
-            ctrl._pending_cr = False
+            ctrl._render_buffer = _RenderBuffer(1000)
+            ctrl._render_buffer.feed("\x1b[31mred\x1b[0m plain")
 
             result = ctrl.get_context()
 
@@ -62,8 +62,9 @@ class TestSenderTaskIdInMetadata:
             mock_response.raise_for_status = MagicMock()
             return mock_response
 
-        with patch("synapse.a2a_client.requests") as mock_requests:
-            mock_requests.post = mock_post
+        with patch("synapse.a2a_client.http_pool.get_session") as mock_get_session:
+            mock_session = mock_get_session.return_value
+            mock_session.post = mock_post
 
             client = A2AClient()
 
@@ -101,13 +102,14 @@ class TestSenderTaskIdInMetadata:
 
         from synapse.a2a_client import A2AClient
 
-        with patch("synapse.a2a_client.requests") as mock_requests:
+        with patch("synapse.a2a_client.http_pool.get_session") as mock_get_session:
+            mock_session = mock_get_session.return_value
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "task": {"id": "receiver-task", "status": "working"}
             }
             mock_response.raise_for_status = MagicMock()
-            mock_requests.post.return_value = mock_response
+            mock_session.post.return_value = mock_response
 
             client = A2AClient()
 
@@ -122,10 +124,10 @@ class TestSenderTaskIdInMetadata:
             )
 
             # Verify the request was made
-            assert mock_requests.post.called
+            assert mock_session.post.called
 
             # Check that sender_task_id is NOT in metadata
-            call_args = mock_requests.post.call_args
+            call_args = mock_session.post.call_args
             payload = call_args.kwargs.get("json") or call_args[1].get("json")
 
             assert "metadata" in payload
@@ -143,13 +145,14 @@ class TestSenderTaskIdInMetadata:
         # Count tasks before
         initial_count = len(task_store._tasks)
 
-        with patch("synapse.a2a_client.requests") as mock_requests:
+        with patch("synapse.a2a_client.http_pool.get_session") as mock_get_session:
+            mock_session = mock_get_session.return_value
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "task": {"id": "receiver-task", "status": "working"}
             }
             mock_response.raise_for_status = MagicMock()
-            mock_requests.post.return_value = mock_response
+            mock_session.post.return_value = mock_response
 
             client = A2AClient()
 
@@ -162,7 +165,7 @@ class TestSenderTaskIdInMetadata:
             )
 
             # Verify no sender_task_id in metadata
-            call_args = mock_requests.post.call_args
+            call_args = mock_session.post.call_args
             payload = call_args.kwargs.get("json") or call_args[1].get("json")
             assert "sender_task_id" not in payload["metadata"], (
                 "sender_task_id should NOT be included when response_mode='silent'"
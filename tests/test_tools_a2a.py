@@ -3,6 +3,7 @@
 import argparse
 import json
 import os
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -970,6 +971,11 @@ class TestCmdSend:
 # ============================================================
 
 
+def _fake_broadcast_tasks(message, endpoints, *args, **kwargs):
+    """Stand-in for A2AClient.create_broadcast_tasks."""
+    return "parent-task", [f"child-{i}" for i in range(len(endpoints))]
+
+
 class TestCmdBroadcast:
     """Test cmd_broadcast() function."""
 
@@ -1023,6 +1029,7 @@ class TestCmdBroadcast:
         mock_registry_cls.return_value = mock_registry
 
         mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
         mock_client.send_to_local.return_value = MagicMock(
             id="task-123", status="working", artifacts=[]
         )
@@ -1118,6 +1125,7 @@ class TestCmdBroadcast:
         mock_registry_cls.return_value = mock_registry
 
         mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
         mock_client.send_to_local.return_value = MagicMock(
             id="task-456", status="working", artifacts=[]
         )
@@ -1178,6 +1186,7 @@ class TestCmdBroadcast:
         mock_registry_cls.return_value = mock_registry
 
         mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
         mock_client.send_to_local.side_effect = [
             MagicMock(id="task-123", status="completed", artifacts=[]),
             None,
@@ -1201,6 +1210,68 @@ class TestCmdBroadcast:
         assert "Failed: 1" in captured.out
         assert mock_record_history.call_count == 1
 
+    @patch("synapse.tools.a2a._record_sent_message")
+    @patch("synapse.tools.a2a.A2AClient")
+    @patch("synapse.tools.a2a.is_port_open", return_value=True)
+    @patch("synapse.tools.a2a.is_process_running", return_value=True)
+    @patch("synapse.tools.a2a.build_sender_info")
+    @patch("synapse.tools.a2a.AgentRegistry")
+    @patch("synapse.tools.a2a.Path.cwd")
+    def test_cmd_broadcast_fails_child_tasks_of_failed_sends(
+        self,
+        mock_cwd,
+        mock_registry_cls,
+        mock_sender,
+        mock_running,
+        mock_port,
+        mock_client_cls,
+        mock_record_history,
+    ):
+        """Failed or raising sends mark their child task failed."""
+        mock_cwd.return_value = Path("/work/project")
+        sender_info = {"sender_endpoint": "http://localhost:8199"}
+        mock_sender.return_value = sender_info
+        mock_registry = MagicMock()
+        mock_registry.list_agents.return_value = {
+            f"synapse-claude-{port}": {
+                "agent_id": f"synapse-claude-{port}",
+                "agent_type": "claude",
+                "port": port,
+                "pid": port,
+                "endpoint": f"http://localhost:{port}",
+                "working_dir": "/work/project",
+            }
+            for port in (8100, 8110, 8120)
+        }
+        mock_registry_cls.return_value = mock_registry
+
+        def send(**kwargs):
+            if kwargs["endpoint"].endswith("8100"):
+                raise RuntimeError("boom")
+            if kwargs["endpoint"].endswith("8110"):
+                return None
+            return MagicMock(id="task-ok", status="working", artifacts=[])
+
+        mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
+        mock_client.send_to_local.side_effect = send
+        mock_client_cls.return_value = mock_client
+
+        args = argparse.Namespace(
+            message="hello team", priority=1, sender=None, response_mode="notify"
+        )
+
+        with pytest.raises(SystemExit):
+            cmd_broadcast(args)
+
+        failed = {
+            c.args[0]: c.args[1] for c in mock_client.fail_sender_task.call_args_list
+        }
+        assert set(failed) == {"child-0", "child-1"}
+        assert "boom" in failed["child-0"]
+        for c in mock_client.fail_sender_task.call_args_list:
+            assert c.args[2] == sender_info
+
     @patch("synapse.tools.a2a._record_sent_message")
     @patch("synapse.tools.a2a.A2AClient")
     @patch("synapse.tools.a2a.is_port_open", return_value=True)
@@ -1234,6 +1305,7 @@ class TestCmdBroadcast:
         mock_registry_cls.return_value = mock_registry
 
         mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
         mock_client.send_to_local.return_value = MagicMock(
             id="task-123", status="completed", artifacts=[]
         )
@@ -1253,6 +1325,113 @@ class TestCmdBroadcast:
         call_kwargs = mock_client.send_to_local.call_args.kwargs
         assert call_kwargs["response_mode"] == "wait"
 
+    @staticmethod
+    def _registry(count, working_dir="/work/project"):
+        mock_registry = MagicMock()
+        mock_registry.list_agents.return_value = {
+            f"synapse-claude-{8100 + i}": {
+                "agent_id": f"synapse-claude-{8100 + i}",
+                "agent_type": "claude",
+                "port": 8100 + i,
+                "pid": 1000 + i,
+                "endpoint": f"http://localhost:{8100 + i}",
+                "working_dir": working_dir,
+            }
+            for i in range(count)
+        }
+        return mock_registry
+
+    @patch("synapse.tools.a2a._record_sent_message")
+    @patch("synapse.tools.a2a.A2AClient")
+    @patch("synapse.tools.a2a.is_port_open", return_value=True)
+    @patch("synapse.tools.a2a.is_process_running")
+    @patch("synapse.tools.a2a.build_sender_info", return_value={})
+    @patch("synapse.tools.a2a.AgentRegistry")
+    @patch("synapse.tools.a2a.Path.cwd")
+    def test_cmd_broadcast_child_task_per_live_recipient(
+        self,
+        mock_cwd,
+        mock_registry_cls,
+        mock_sender,
+        mock_running,
+        mock_port,
+        mock_client_cls,
+        mock_record_history,
+        capsys,
+    ):
+        """Only live recipients get a child task, passed as sender_task_id."""
+        mock_cwd.return_value = Path("/work/project")
+        mock_registry_cls.return_value = self._registry(3)
+        mock_running.side_effect = lambda pid: pid != 1001
+
+        mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
+        mock_client.send_to_local.side_effect = lambda **kwargs: MagicMock(
+            id=f"task-{kwargs['target_agent_id']}"
+        )
+        mock_client_cls.return_value = mock_client
+
+        args = argparse.Namespace(
+            message="hello team", priority=1, sender=None, response_mode="notify"
+        )
+
+        with pytest.raises(SystemExit):
+            cmd_broadcast(args)
+
+        endpoints = mock_client.create_broadcast_tasks.call_args.args[1]
+        assert endpoints == ["http://localhost:8100", "http://localhost:8102"]
+        sent = {
+            c.kwargs["endpoint"]: c.kwargs["sender_task_id"]
+            for c in mock_client.send_to_local.call_args_list
+        }
+        assert sent == {
+            "http://localhost:8100": "child-0",
+            "http://localhost:8102": "child-1",
+        }
+        out = capsys.readouterr().out
+        assert "synapse-claude-8101: failed (process 1001 is no longer running)" in out
+        assert "Sent: 2" in out
+
+    @patch("synapse.tools.a2a._record_sent_message")
+    @patch("synapse.tools.a2a.A2AClient")
+    @patch("synapse.tools.a2a.is_port_open", return_value=True)
+    @patch("synapse.tools.a2a.is_process_running", return_value=True)
+    @patch("synapse.tools.a2a.build_sender_info", return_value={})
+    @patch("synapse.tools.a2a.AgentRegistry")
+    @patch("synapse.tools.a2a.Path.cwd")
+    def test_cmd_broadcast_sends_concurrently(
+        self,
+        mock_cwd,
+        mock_registry_cls,
+        mock_sender,
+        mock_running,
+        mock_port,
+        mock_client_cls,
+        mock_record_history,
+    ):
+        """Sends overlap: a barrier only opens if all recipients are in flight."""
+        mock_cwd.return_value = Path("/work/project")
+        mock_registry_cls.return_value = self._registry(4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def send(**kwargs):
+            barrier.wait()
+            return MagicMock(id=f"task-{kwargs['target_agent_id']}")
+
+        mock_client = MagicMock()
+        mock_client.create_broadcast_tasks.side_effect = _fake_broadcast_tasks
+        mock_client.send_to_local.side_effect = send
+        mock_client_cls.return_value = mock_client
+
+        args = argparse.Namespace(
+            message="hello team", priority=1, sender=None, response_mode="notify"
+        )
+
+        cmd_broadcast(args)
+
+        assert mock_client.send_to_local.call_count == 4
+        assert mock_record_history.call_count == 4
+
 
 # ============================================================
 # main Function Tests
@@ -1,14 +1,17 @@
 """Tests for webhook notifications module."""
 
 import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from synapse import http_pool
 from synapse.webhooks import (
     WebhookConfig,
     WebhookDelivery,
+    WebhookDispatcher,
     WebhookEvent,
     WebhookRegistry,
     compute_signature,
@@ -201,6 +204,25 @@ class TestDeliverWebhook:
             assert delivery.success is False
             assert delivery.error == "Request timed out"
 
+    def test_does_not_pool_a_client_on_a_short_lived_loop(self):
+        webhook = WebhookConfig(url="https://example.com/hook")
+        event = WebhookEvent(event_type="task.completed", payload={"task_id": "123"})
+        clients = []
+
+        async def post(client, *args, **kwargs):
+            clients.append(client)
+            response = MagicMock()
+            response.status_code = 200
+            response.text = "OK"
+            return response
+
+        with patch("httpx.AsyncClient.post", autospec=True, side_effect=post):
+            asyncio.run(deliver_webhook(webhook, event))
+
+        assert len(clients) == 1
+        assert clients[0].is_closed
+        assert not http_pool._async_clients
+
     def test_includes_signature_when_secret_set(self):
         webhook = WebhookConfig(url="https://example.com/hook", secret="my-secret")
         event = WebhookEvent(event_type="task.completed", payload={"task_id": "123"})
@@ -318,3 +340,163 @@ class TestDeliveryRecording:
         # Should keep only last 100
         recent = registry.get_recent_deliveries(limit=200)
         assert len(recent) == 100
+
+
+def _response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "OK" if status_code < 400 else "Error"
+    return response
+
+
+class TestWebhookDispatcher:
+    """Tests for the webhook delivery worker."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = WebhookRegistry()
+        registry.register("https://example.com/hook", events=["task.completed"])
+        return registry
+
+    @pytest.fixture
+    def dispatcher(self, registry):
+        dispatcher = WebhookDispatcher(registry=registry, retry_delays=(0.01,))
+        yield dispatcher
+        dispatcher.close()
+
+    def test_delivers_from_sync_threads_on_one_worker(self, dispatcher, registry):
+        loops = set()
+
+        async def post(client, url, **kwargs):
+            loops.add(asyncio.get_running_loop())
+            return _response(200)
+
+        with patch("httpx.AsyncClient.post", new=post):
+            senders = [
+                threading.Thread(
+                    target=dispatcher.submit,
+                    args=("task.completed", {"task_id": str(i)}),
+                )
+                for i in range(5)
+            ]
+            for sender in senders:
+                sender.start()
+            for sender in senders:
+                sender.join()
+            assert dispatcher.flush(timeout=5)
+
+        assert len(loops) == 1
+        deliveries = registry.get_recent_deliveries()
+        assert len(deliveries) == 5
+        assert all(d.success for d in deliveries)
+
+    def test_unsubscribed_event_is_not_queued(self, dispatcher):
+        assert dispatcher.submit("task.failed", {"task_id": "1"}) == 0
+        assert dispatcher.stats()["pending"] == 0
+
+    def test_concurrency_per_url_is_limited(self, registry):
+        dispatcher = WebhookDispatcher(registry=registry, per_url_limit=2)
+        active = peak = 0
+
+        async def post(client, url, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return _response(200)
+
+        try:
+            with patch("httpx.AsyncClient.post", new=post):
+                for i in range(6):
+                    dispatcher.submit("task.completed", {"task_id": str(i)})
+                assert dispatcher.flush(timeout=5)
+        finally:
+            dispatcher.close()
+
+        assert peak == 2
+        assert len(registry.get_recent_deliveries()) == 6
+
+    def test_failed_attempt_is_retried_after_backoff(self, dispatcher, registry):
+        responses = iter([_response(500), _response(200)])
+
+        async def post(client, url, **kwargs):
+            return next(responses)
+
+        with patch("httpx.AsyncClient.post", new=post):
+            dispatcher.submit("task.completed", {"task_id": "1"})
+            assert dispatcher.flush(timeout=5)
+
+        delivery = registry.get_recent_deliveries()[0]
+        assert delivery.success is True
+        assert delivery.attempts == 2
+
+    def test_submit_drops_beyond_max_pending(self, registry):
+        dispatcher = WebhookDispatcher(registry=registry, max_pending=1)
+        release = threading.Event()
+
+        async def post(client, url, **kwargs):
+            await asyncio.to_thread(release.wait, 5)
+            return _response(200)
+
+        try:
+            with patch("httpx.AsyncClient.post", new=post):
+                assert dispatcher.submit("task.completed", {"task_id": "1"}) == 1
+                assert dispatcher.submit("task.completed", {"task_id": "2"}) == 0
+                assert dispatcher.stats()["dropped"] == 1
+                release.set()
+                assert dispatcher.flush(timeout=5)
+        finally:
+            dispatcher.close()
+
+    def test_outbox_resumes_pending_deliveries_after_restart(self, tmp_path):
+        db_path = str(tmp_path / "outbox.db")
+        registry = WebhookRegistry()
+        registry.register(
+            "https://example.com/hook", events=["task.completed"], secret="s3cret"
+        )
+        before = WebhookDispatcher(
+            registry=registry,
+            db_path=db_path,
+            owner="synapse-claude-8100",
+            retry_delays=(60.0,),
+        )
+
+        async def failing(client, url, **kwargs):
+            return _response(503)
+
+        with patch("httpx.AsyncClient.post", new=failing):
+            before.submit("task.completed", {"task_id": "1"})
+            assert not before.flush(timeout=0.2)
+        before.close()
+
+        sent = []
+
+        async def succeeding(client, url, **kwargs):
+            sent.append(kwargs)
+            return _response(200)
+
+        after_registry = WebhookRegistry()
+        with patch("httpx.AsyncClient.post", new=succeeding):
+            other = WebhookDispatcher(
+                registry=after_registry, db_path=db_path, owner="synapse-codex-8120"
+            )
+            assert other.stats()["pending"] == 0
+            other.close()
+
+            after = WebhookDispatcher(
+                registry=after_registry, db_path=db_path, owner="synapse-claude-8100"
+            )
+            assert after.flush(timeout=5)
+            after.close()
+
+        assert len(sent) == 1
+        assert sent[0]["headers"]["X-Synapse-Signature"].startswith("sha256=")
+        delivery = after_registry.get_recent_deliveries()[0]
+        assert delivery.success is True
+        assert delivery.attempts == 2
+        assert delivery.event.payload == {"task_id": "1"}
+
+        reopened = WebhookDispatcher(db_path=db_path, owner="synapse-claude-8100")
+        assert reopened.stats()["pending"] == 0
+        reopened.close()
@@ -591,6 +591,30 @@ async def test_poll_task_completion_returns_on_completed(monkeypatch):
     assert call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_poll_task_completion_long_polls_then_falls_back(monkeypatch):
+    """/wait is used first; a 404 from it switches to plain GET polling."""
+    import httpx
+
+    urls: list[str] = []
+
+    async def _mock_get(self, url, **kwargs):
+        urls.append(url)
+        if url.endswith("/wait"):
+            return httpx.Response(404, request=httpx.Request("GET", url))
+        data = {"task": {"id": "t1", "status": {"state": "completed"}}}
+        return httpx.Response(200, json=data, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", _mock_get)
+
+    status, _ = await _poll_task_completion("http://localhost:8100", "t1")
+    assert status == "completed"
+    assert urls == [
+        "http://localhost:8100/tasks/t1/wait",
+        "http://localhost:8100/tasks/t1",
+    ]
+
+
 # ---------------------------------------------------------------------------
 # 13. 409 retry in _send_workflow_request
 # ---------------------------------------------------------------------------